@@ -0,0 +1,308 @@
+import io
+import os
+import json
+import shutil
+import hashlib
+import inspect
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext, redirect_stdout
+
+import pandas as pd
+import matplotlib as mpl
+import matplotlib.font_manager as fm
+from matplotlib.figure import Figure
+from PIL import Image
+
+import armazem_canal
+import perfil_render
+
+# Número de processos usados para renderizar os gráficos de um canal: perfil_render.VARIAVEL_WORKERS_GRAFICOS,
+# definida pelo main.py (--workers-graficos); sem ela, um processo por CPU.
+
+# Cache de PNGs compartilhado por todos os canais, endereçado pelo conteúdo das entradas de cada gráfico.
+# Desligado por padrão: só é usado quando o main.py recebe --cache-graficos-mb N (limite em MB; 0 desliga),
+# que chega aqui por perfil_render.VARIAVEL_LIMITE_CACHE_GRAFICOS.
+PASTA_CACHE = 'cache_graficos'
+LIMITE_CACHE_PADRAO_MB = 0
+NOME_MANIFESTO = 'manifesto.json'
+
+
+def numero_workers(quantidade_tarefas):
+    valor = os.environ.get(perfil_render.VARIAVEL_WORKERS_GRAFICOS)
+    workers = int(valor) if valor else (os.cpu_count() or 1)
+    return max(1, min(workers, quantidade_tarefas))
+
+
+def limite_cache_bytes():
+    valor = os.environ.get(perfil_render.VARIAVEL_LIMITE_CACHE_GRAFICOS)
+    megabytes = int(valor) if valor else LIMITE_CACHE_PADRAO_MB
+    return max(0, megabytes) * 1024 * 1024
+
+
+# ---------------------------------------------------------------------------
+# Chave de cada gráfico: código da função + STYLE_CONFIG + argumentos + fatias de dados lidas
+# ---------------------------------------------------------------------------
+
+def serializar(valor):
+    """Representação estável de configurações e argumentos simples (sem endereços de memória)."""
+    if isinstance(valor, dict):
+        return '{' + ','.join(f'{serializar(k)}:{serializar(v)}' for k, v in sorted(valor.items(), key=lambda item: str(item[0]))) + '}'
+    if isinstance(valor, (list, tuple, pd.Index)):
+        return '[' + ','.join(serializar(v) for v in valor) + ']'
+    if isinstance(valor, fm.FontProperties):
+        return f'FontProperties({valor.get_file() or valor.get_fontconfig_pattern()})'
+    if isinstance(valor, (pd.DataFrame, pd.Series)):
+        # Dados entram na chave pelas fatias declaradas, não pelos argumentos
+        return 'dados'
+    return repr(valor)
+
+
+def nomes_referenciados(codigo):
+    nomes = set(codigo.co_names)
+    for constante in codigo.co_consts:
+        if inspect.iscode(constante):
+            nomes |= nomes_referenciados(constante)
+    return nomes
+
+
+def eh_modulo_do_projeto(modulo, funcao):
+    arquivo = getattr(modulo, '__file__', None)
+    return bool(arquivo) and os.path.dirname(os.path.abspath(arquivo)) == os.path.dirname(os.path.abspath(inspect.getfile(funcao)))
+
+
+def versao_codigo(funcao, vistas=None):
+    """
+    Código-fonte da função e, recursivamente, das funções e constantes do mesmo módulo que ela usa
+    (helpers de formatação, mapas de ícones...) e dos módulos do projeto que ela chama: mudar
+    qualquer um deles invalida o gráfico.
+    """
+    vistas = set() if vistas is None else vistas
+    vistas.add(funcao.__qualname__)
+    partes = [f'{funcao.__module__}.{funcao.__qualname__}', inspect.getsource(funcao)]
+    for nome in sorted(nomes_referenciados(funcao.__code__)):
+        if nome in vistas or nome not in funcao.__globals__:
+            continue
+        alvo = funcao.__globals__[nome]
+        if inspect.isfunction(alvo) and alvo.__module__ == funcao.__module__:
+            partes.append(versao_codigo(alvo, vistas))
+        elif inspect.ismodule(alvo) and eh_modulo_do_projeto(alvo, funcao):
+            # Módulos do próprio projeto usados pelo gráfico (ex.: cards_big_number) entram inteiros
+            vistas.add(nome)
+            partes.append(inspect.getsource(alvo))
+        elif isinstance(alvo, (dict, list, tuple, str, int, float)):
+            vistas.add(nome)
+            partes.append(f'{nome}={serializar(alvo)}')
+    return '\n'.join(partes)
+
+
+def hash_arquivo(caminho):
+    if not os.path.exists(caminho):
+        return 'ausente'
+    sha = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(1024 * 1024), b''):
+            sha.update(bloco)
+    return sha.hexdigest()
+
+
+def hash_fatia(fatia, artista, tabela_4_1):
+    """
+    Impressão digital de uma fatia de dados declarada por um gráfico:
+        'tabela:<nome>'   tabela do canal, no arquivo que armazem_canal.ler_tabela leria (feather ou CSV)
+        'aba:<nome>'      aba da tabela 4.1 já carregada
+        'arquivo:<nome>'  arquivo avulso da pasta do canal (ex.: sub.txt)
+    """
+    tipo, nome = fatia.split(':', 1)
+    if tipo == 'tabela':
+        if armazem_canal.armazem_atualizado(artista, nome):
+            return 'feather:' + hash_arquivo(armazem_canal.caminho_tabela(artista, nome))
+        return 'csv:' + hash_arquivo(armazem_canal.caminho_csv(artista, nome))
+    if tipo == 'aba':
+        if tabela_4_1 is None or nome not in tabela_4_1:
+            return 'ausente'
+        df = tabela_4_1[nome]
+        sha = hashlib.sha256(serializar([list(df.columns), [str(t) for t in df.dtypes]]).encode('utf-8'))
+        sha.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+        return sha.hexdigest()
+    if tipo == 'arquivo':
+        return hash_arquivo(f'dados_full/{artista}/{nome}')
+    raise ValueError(f"fatia desconhecida: {fatia}")
+
+
+def chave_tarefa(tarefa, estilo, hashes_fatias):
+    funcao, argumentos, fatias = tarefa
+    sha = hashlib.sha256()
+    sha.update(mpl.__version__.encode('utf-8'))
+    sha.update(versao_codigo(funcao).encode('utf-8'))
+    sha.update(serializar(estilo).encode('utf-8'))
+    sha.update(serializar([a for a in argumentos if not isinstance(a, dict) or not any(isinstance(v, pd.DataFrame) for v in a.values())]).encode('utf-8'))
+    for fatia in fatias:
+        sha.update(f'{fatia}={hashes_fatias[fatia]}'.encode('utf-8'))
+    return sha.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Cache em disco com descarte LRU
+# ---------------------------------------------------------------------------
+
+def restaurar_do_cache(chave):
+    """Copia os PNGs da entrada para os destinos originais e devolve a saída impressa; None se não houver entrada."""
+    pasta = os.path.join(PASTA_CACHE, chave)
+    manifesto = os.path.join(pasta, NOME_MANIFESTO)
+    try:
+        with open(manifesto, 'r', encoding='utf-8') as f:
+            entrada = json.load(f)
+        for i, destino in enumerate(entrada['arquivos']):
+            os.makedirs(os.path.dirname(destino) or '.', exist_ok=True)
+            shutil.copyfile(os.path.join(pasta, f'{i}.png'), destino)
+        os.utime(manifesto)  # marca o último uso para o descarte LRU
+    except (OSError, ValueError, KeyError):
+        # Entrada ausente, incompleta ou descartada por outro processo no meio do caminho: renderiza de novo
+        return None
+    return entrada['saida']
+
+
+def gravar_no_cache(chave, arquivos, saida):
+    """Grava a entrada numa pasta temporária e a publica com um rename, seguro para vários canais em paralelo."""
+    destino = os.path.join(PASTA_CACHE, chave)
+    if os.path.exists(destino):
+        return
+    temporaria = os.path.join(PASTA_CACHE, f'.tmp-{chave}-{os.getpid()}')
+    try:
+        os.makedirs(temporaria, exist_ok=True)
+        for i, arquivo in enumerate(arquivos):
+            shutil.copyfile(arquivo, os.path.join(temporaria, f'{i}.png'))
+        with open(os.path.join(temporaria, NOME_MANIFESTO), 'w', encoding='utf-8') as f:
+            json.dump({'arquivos': arquivos, 'saida': saida}, f, ensure_ascii=False)
+        os.rename(temporaria, destino)
+    except OSError:
+        shutil.rmtree(temporaria, ignore_errors=True)
+
+
+def limitar_cache(limite_bytes):
+    """Descarta as entradas usadas há mais tempo até o cache (de todos os canais) caber no limite."""
+    if not os.path.isdir(PASTA_CACHE):
+        return
+    entradas = []
+    for nome in os.listdir(PASTA_CACHE):
+        pasta = os.path.join(PASTA_CACHE, nome)
+        manifesto = os.path.join(pasta, NOME_MANIFESTO)
+        if nome.startswith('.') or not os.path.exists(manifesto):
+            continue
+        try:
+            tamanho = sum(e.stat().st_size for e in os.scandir(pasta))
+            entradas.append((os.path.getmtime(manifesto), tamanho, pasta))
+        except OSError:
+            continue
+
+    total = sum(tamanho for _, tamanho, _ in entradas)
+    for _, tamanho, pasta in sorted(entradas):
+        if total <= limite_bytes:
+            break
+        shutil.rmtree(pasta, ignore_errors=True)
+        total -= tamanho
+
+
+@contextmanager
+def registrar_pngs():
+    """
+    Anota os arquivos gravados enquanto a tarefa roda, pelo savefig do matplotlib ou direto pelo
+    Pillow (cards): são eles que vão para o cache. Só é usado com o cache ligado. Comparar a pasta
+    plots/ antes e depois não serviria: as tarefas do canal rodam ao mesmo tempo e gravam na mesma pasta.
+    """
+    gravados = []
+    savefig_original, save_original = Figure.savefig, Image.Image.save
+
+    def anotar(destino):
+        if isinstance(destino, (str, os.PathLike)):
+            gravados.append(os.path.normpath(os.fspath(destino)))
+
+    def savefig(fig, fname, *args, **kwargs):
+        anotar(fname)
+        return savefig_original(fig, fname, *args, **kwargs)
+
+    def save(imagem, fp, *args, **kwargs):
+        anotar(fp)
+        return save_original(imagem, fp, *args, **kwargs)
+
+    Figure.savefig, Image.Image.save = savefig, save
+    try:
+        yield gravados
+    finally:
+        Figure.savefig, Image.Image.save = savefig_original, save_original
+
+
+# ---------------------------------------------------------------------------
+# Execução
+# ---------------------------------------------------------------------------
+
+def executar_tarefa(tarefa, anotar_pngs=False):
+    """
+    Roda uma tarefa e devolve o que ela imprimiu, para o processo principal exibir em ordem, e os PNGs
+    que gravou. Sem anotar_pngs (cache desligado), o savefig e o save não são trocados e a lista vem vazia.
+    """
+    funcao, argumentos = tarefa[:2]
+    saida = io.StringIO()
+    with redirect_stdout(saida), (registrar_pngs() if anotar_pngs else nullcontext([])) as gravados:
+        funcao(*argumentos)
+    return saida.getvalue(), list(dict.fromkeys(gravados))
+
+
+def renderizar_graficos(tarefas, artista, tabela_4_1=None, estilo=None, inicializar_worker=None):
+    """
+    Renderiza os gráficos de um canal. Cada tarefa é uma tupla (função, argumentos, fatias): a função
+    grava os próprios PNGs, sem depender das outras, e fatias lista os dados que ela lê (ver hash_fatia).
+
+    Antes de renderizar, cada tarefa ganha uma chave com o código da função, o STYLE_CONFIG (estilo),
+    os argumentos simples e o conteúdo das fatias. Se a chave já está no cache, os PNGs são copiados
+    de lá em vez de redesenhados; só as tarefas com alguma entrada alterada vão para a renderização.
+
+    Com mais de um worker, essas tarefas são distribuídas num pool de processos; inicializar_worker
+    (fontes e rcParams do matplotlib) roda uma única vez em cada processo. A saída de cada tarefa
+    é impressa na ordem da lista, como no modo sequencial.
+    """
+    limite = limite_cache_bytes()
+    saidas = [None] * len(tarefas)
+    chaves = [None] * len(tarefas)
+    if limite:
+        hashes_fatias = {}
+        for _, _, fatias in tarefas:
+            for fatia in fatias:
+                if fatia not in hashes_fatias:
+                    hashes_fatias[fatia] = hash_fatia(fatia, artista, tabela_4_1)
+        for i, tarefa in enumerate(tarefas):
+            chaves[i] = chave_tarefa(tarefa, estilo, hashes_fatias)
+            saidas[i] = restaurar_do_cache(chaves[i])
+
+    pendentes = [i for i, saida in enumerate(saidas) if saida is None]
+    if limite and len(pendentes) < len(tarefas):
+        print(f"♻️  {len(tarefas) - len(pendentes)} of {len(tarefas)} charts reused from cache for '{artista}'")
+
+    def concluir(i, resultado):
+        saida, gravados = resultado
+        print(saida, end='')
+        # Tarefas que falharam antes de gravar qualquer PNG não entram no cache e são tentadas de novo
+        if limite and gravados:
+            gravar_no_cache(chaves[i], gravados, saida)
+        saidas[i] = saida
+
+    executar = functools.partial(executar_tarefa, anotar_pngs=bool(limite))
+    workers = numero_workers(len(pendentes))
+    if workers == 1:
+        for i in range(len(tarefas)):
+            if saidas[i] is None:
+                concluir(i, executar(tarefas[i]))
+            else:
+                print(saidas[i], end='')
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=inicializar_worker) as executor:
+            resultados = executor.map(executar, [tarefas[i] for i in pendentes])
+            for i in range(len(tarefas)):
+                if saidas[i] is None:
+                    concluir(i, next(resultados))
+                else:
+                    print(saidas[i], end='')
+
+    if limite:
+        limitar_cache(limite)
@@ -2,1408 +2,250 @@ import os
 import sys
 import json
 import pandas as pd
-from pptx import Presentation
-from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN
-from pptx.util import Inches, Pt, Cm
-from pptx.enum.shapes import MSO_CONNECTOR
 import re  
-import docx
-
-
-def extrair_conteudo_markdown(caminho_do_arquivo):
-    """
-    Versão final e mais completa da função para extrair APENAS OS BLOCOS DE TEXTO.
-    Suporta três padrões de título:
-    1. ### 1. Título
-    2. **1. Título**
-    3. 1. Título
-
-    Args:
-      caminho_do_arquivo: O caminho para o arquivo .txt.
-
-    Returns:
-      Uma lista de strings, onde cada string é um bloco de texto de uma seção.
-    """
-    try:
-        with open(caminho_do_arquivo, 'r', encoding='latin-1') as file:
-            conteudo = file.read()
-    except FileNotFoundError:
-        print(f"Erro: Arquivo não encontrado no caminho: {caminho_do_arquivo}")
-        return []
-    except Exception as e:
-        print(f"Ocorreu um erro inesperado: {e}")
-        return []
-
-    # Regex Final: Unifica os 3 padrões.
-    # A principal mudança é tornar o prefixo (### ou **) opcional com (?:...)?
-    padrao = re.compile(
-        # --- Início da Linha do Título ---
-        r"^(?:###\s+|\*\*\s*)?"           # Grupo Opcional: Encontra '### ' OU '** ' (ou nada).
-        r"(\d+\.\s+.*?)"                  # Grupo 1: Captura o número e o texto do título (será descartado).
-        r"(?:\*\*|$)"                     # Encontra o '**' final OU o fim da linha.
-        # --- Fim da Linha do Título ---
-        r"[\r\n]+"                        # Corresponde a uma ou mais quebras de linha.
-        r"([\s\S]*?)"                     # Grupo 2: Captura o Bloco de Texto (o que queremos).
-        # --- Lookahead para o Fim do Bloco ---
-        r"(?=^(?:###\s+|\*\*\s*)?\d+\.|\Z)", # Para a captura quando encontrar o início de QUALQUER um 
-                                          # dos 3 padrões de título ou o fim do arquivo.
-        re.MULTILINE
-    )
-
-    matches = padrao.findall(conteudo)
-
-    # Cria a lista final pegando apenas o segundo elemento (o texto) de cada tupla.
-    textos_extraidos = [texto.strip() for titulo, texto in matches]
-    
-    return textos_extraidos
-
-
-
-def analisar_documento_word(caminho_arquivo):
-    """
-    Lê o conteúdo de um arquivo .docx, extrai o texto e o divide em seções de
-    forma robusta, separando corretamente o título do conteúdo.
-
-    Args:
-        caminho_arquivo (str): O caminho completo para o arquivo .docx.
-
-    Returns:
-        dict: Um dicionário com os títulos das seções como chaves e o texto
-              correspondente como valor. Retorna um erro se o arquivo não for encontrado.
-    """
-    if not os.path.exists(caminho_arquivo):
-        return {"erro": f"Arquivo não encontrado: {caminho_arquivo}"}
-
-    try:
-        documento = docx.Document(caminho_arquivo)
-        # Junta todos os parágrafos não vazios em um único texto
-        paragrafos = [p.text for p in documento.paragraphs if p.text.strip()]
-        texto_completo = "\n".join(paragrafos)
-
-        # Divide o texto em blocos usando o padrão "número. espaço" como delimitador
-        # A expressão `(?=\d\.\s)` garante que o delimitador seja mantido no início de cada bloco.
-        blocos = re.split(r'(?=\d\.\s)', texto_completo)
-
-        dados_extraidos = {}
-        for bloco in blocos:
-            bloco_limpo = bloco.strip()
-            if not bloco_limpo:
-                continue
-
-            # Separa o bloco na primeira quebra de linha para isolar o título
-            partes = bloco_limpo.split('\n', 1)
-            titulo_completo = partes[0].strip()
-            
-            # Remove o prefixo numérico (ex: "1. ") para criar uma chave limpa
-            chave = re.sub(r'^\d\.\s*', '', titulo_completo)
-            
-            # O conteúdo é o restante do bloco
-            conteudo = partes[1].strip() if len(partes) > 1 else ""
-            
-            dados_extraidos[chave] = conteudo
-            
-        return dados_extraidos
-    except Exception as e:
-        return {"erro": f"Falha ao ler o arquivo .docx: {e}"}
+import narrativas
+from motor_apresentacao import cabecalho, construir_apresentacao, grafico, imagem, linha, recurso, texto
+
+
+SLIDES = [
+    # CAPA
+    {
+        'fundo': 'image35.png',
+        'elementos': [
+            recurso('image3.png', 1.42, 1.21, 2.89, 2.06),
+            texto('Relatório Mensal', 1.04, 11.28, 25.2, 3.68, 'capa_titulo'),
+            texto('{mes_foco}', 1.04, 13.75, 13.31, 1.28, 'capa_subtitulo'),
+            linha(1.34, 15.61, 17, 15.61, 'FFFFFF'),
+            texto('{artist}', 1.04, 16.57, 31.98, 1.54, 'capa_artista'),
+        ],
+    },
+    # DIAGNÓSTICO
+    {
+        'fundo': 'image27.png',
+        'elementos': [
+            cabecalho('Slide Editável', 7.12),
+            texto('Texto', 1.21, 2.89, 11.01, 1.64, 'corpo', quebrar=True, ajustar=True),
+        ],
+    },
+    # RESUMO
+    {
+        'fundo': 'image15.png',
+        'elementos': [
+            cabecalho('Resumo da Análise', 11.32),
+            texto("*Os índices em '%' são relativos à média do semestre.", 0.5, 18.34, 11, 0.77, 'nota_media', quebrar=True, ajustar=True),
+            grafico('4a - Card_VISUALIZAÇÕES_v2.png', 3.43, 1.96, 8.97, 8.91),
+            grafico('4b - Card_RECEITA_v2.png', 12.45, 1.96, 8.97, 8.91),
+            grafico('4c - Card_INSCRITOS_v2.png', 21.42, 1.96, 8.97, 8.91),
+            grafico('4d - Card_RPM_v2.png', 3.43, 10.08, 8.97, 8.91),
+            grafico('4e - Card_IMPRESSÕES_v2.png', 12.45, 10.08, 8.97, 8.91),
+            grafico('4f - Card_WATCHTIME_(HORAS)_v2.png', 21.42, 10.08, 8.97, 8.91),
+        ],
+    },
+    # MÉTRICAS VOD AVANÇADAS
+    {
+        'fundo': 'image7.png',
+        'elementos': [
+            cabecalho("Métricas Gerais VOD's", 13.1),
+            grafico('1 - Métricas_VOD_Avancada.png', 0, 3.16, 33.92, 13.64),
+        ],
+    },
+    # MÉTRICAS LIVES AVANÇADAS
+    {
+        'fundo': 'image7.png',
+        'elementos': [
+            cabecalho('Métricas Gerais Lives', 13.1),
+            grafico('2 - Métricas_Lives_Avancada.png', 0, 3.16, 33.92, 13.64),
+        ],
+    },
+    # MÉTRICAS SHORTS AVANÇADAS
+    {
+        'fundo': 'image7.png',
+        'elementos': [
+            cabecalho('Métricas Gerais Shorts', 13.1),
+            grafico('3 - Métricas_Shorts_Avancada.png', 0, 3.16, 33.92, 13.64),
+        ],
+    },
+    # ANALISE INICIAL
+    {
+        'fundo': 'image7.png',
+        'elementos': [
+            cabecalho('Análise Inicial', 8.7),
+            texto('Texto', 1.21, 2.89, 11.01, 1.64, 'corpo', quebrar=True, ajustar=True),
+            grafico('6 - Análise_Inicial.png', 12.74, 3.04, 20.5, 11.93),
+            grafico('5 - Publicados.png', 12.7, -0.36, 19.49, 4.44),
+            grafico('7 - Watchtime.png', 12.7, 14.1, 19.49, 5.42),
+            texto("*Dados referentes apenas a lives e VOD's", 12.74, 14.15, 11, 0.73, 'nota', quebrar=True, ajustar=True),
+        ],
+    },
+    # MONETIZAÇÃO VELHO NOVO
+    {
+        'fundo': 'image15.png',
+        'elementos': [
+            cabecalho('Receita Velho x Novo', 12.23),
+            texto('Texto', 1.21, 2.89, 11.01, 1.64, 'corpo', quebrar=True, ajustar=True),
+            grafico('8 - Monetizacao_v2.png', 12.49, 3.62, 21.4, 12.28),
+            texto("*Dados referentes apenas a lives e VOD's", 12.49, 15.9, 11, 0.73, 'nota', quebrar=True, ajustar=True),
+        ],
+    },
+    # Views VELHO NOVO
+    {
+        'fundo': 'image15.png',
+        'elementos': [
+            cabecalho('Views Velho x Novo', 12.23),
+            texto('Texto', 1.21, 2.89, 11.01, 1.64, 'corpo', quebrar=True, ajustar=True),
+            grafico('19 - Views_Novo_vs_Velho.png', 12.49, 3.62, 21.4, 12.28),
+        ],
+    },
+    # MONETIZAÇÃO POR FORMATOS
+    {
+        'fundo': 'image7.png',
+        'elementos': [
+            cabecalho('Monetização por Formatos', 15.45),
+            texto('Texto', 1.21, 2.89, 11.01, 1.64, 'corpo', quebrar=True, ajustar=True),
+            grafico('9 - Monetização por formatos.png', 12.49, 3.62, 21.4, 12.28),
+        ],
+    },
+    # CONVERSÃO
+    {
+        'fundo': 'image15.png',
+        'elementos': [
+            cabecalho('Conversão', 7.07),
+            texto('Texto', 1.21, 2.89, 11.01, 1.64, 'corpo', quebrar=True, ajustar=True),
+            grafico('10 - Conversao.png', 12.49, 3.62, 21.4, 12.28),
+            texto("*Dados referentes apenas a lives e VOD's", 12.49, 15.9, 11, 0.73, 'nota', quebrar=True, ajustar=True),
+        ],
+    },
+    # QUALIDADE VOD
+    {
+        'fundo': 'image7.png',
+        'elementos': [
+            cabecalho("Qualidade VOD's", 10.18),
+            texto('Texto', 1.21, 2.89, 11.01, 1.64, 'corpo', quebrar=True, ajustar=True),
+            grafico('11 - Qualidade_Vod.png', 14.51, -0.11, 17.06, 9.61),
+            grafico('15 - Engajamento_VOD.png', 14.51, 9.32, 17.06, 10.24),
+            texto('*Dados de porcentagem entre parenteses são a porcentagem média assistida', 0, 18.38, 13.71, 0.68, 'nota', quebrar=True, ajustar=True),
+        ],
+    },
+    {
+        'fundo': 'image7.png',
+        'elementos': [
+            cabecalho('Qualidade Lives', 9.72),
+            texto('Texto', 1.21, 2.89, 11.01, 1.64, 'corpo', quebrar=True, ajustar=True),
+            grafico('12 - Qualidade_Live.png', 14.51, -0.11, 17.06, 9.61),
+            grafico('16 - Engajamento_Live.png', 14.51, 9.32, 17.06, 10.24),
+            texto('*Dados de porcentagem entre parenteses são a porcentagem média assistida', 0, 18.38, 13.71, 0.68, 'nota', quebrar=True, ajustar=True),
+        ],
+    },
+    # QUALIDADE SHORTS
+    {
+        'fundo': 'image7.png',
+        'elementos': [
+            cabecalho('Qualidade Shorts', 9.72),
+            texto('Texto', 1.21, 2.89, 11.01, 1.64, 'corpo', quebrar=True, ajustar=True),
+            grafico('12.5 - Qualidade_Shorts.png', 14.51, -0.11, 17.06, 9.61),
+            grafico('16.5 - Engajamento_Shorts.png', 14.51, 9.32, 17.06, 10.24),
+            texto('*Dados de porcentagem entre parenteses são a porcentagem média assistida', 0, 18.38, 13.71, 0.68, 'nota', quebrar=True, ajustar=True),
+        ],
+    },
+    # COMUNIDADE
+    {
+        'fundo': 'image7.png',
+        'elementos': [
+            cabecalho('Comunidade', 9.72),
+            texto('Texto', 1.21, 2.89, 11.01, 1.64, 'corpo', quebrar=True, ajustar=True),
+            grafico('17 - Comunidade.png', 12.49, 3.62, 21.4, 12.28),
+        ],
+    },
+    # ORIGEM DO TRÁFEGO
+    {
+        'fundo': 'image15.png',
+        'elementos': [
+            cabecalho('Origem do Tráfego', 11.06),
+            texto('Texto', 1.21, 2.89, 11.01, 1.64, 'corpo', quebrar=True, ajustar=True),
+            grafico('13 - Origem_do_trafego.png', 12.49, 3.62, 21.4, 12.28),
+            texto("*Dados referentes apenas a lives e VOD's", 12.49, 15.9, 11, 0.73, 'nota', quebrar=True, ajustar=True),
+        ],
+    },
+    # CRESCIMENTO
+    {
+        'fundo': 'image15.png',
+        'elementos': [
+            cabecalho('Crescimento de Inscritos', 14.69),
+            texto('Texto', 1.21, 2.89, 11.01, 1.64, 'corpo', quebrar=True, ajustar=True),
+            grafico('14 - Inscricoes_por_Tipo_de_Conteudo.png', 12.49, 1.52, 21.4, 12.28),
+            grafico('18 - Tabela de Inscritos.png', 14.01, 12.96, 18.35, 6.56),
+        ],
+    },
+    # Cluster - Quantidade de Conteúdos
+    {
+        'fundo': 'image15.png',
+        'elementos': [
+            cabecalho('Cluster - Quantidade de Conteúdos', 20.23, largura=25),
+            texto('{textos[0]}', 1.21, 2.89, 11, 15, 'corpo', quebrar=True),
+            imagem('{graficos}grafico_publicacoes_{artista}.png', 12.49, 3.62, 21.4, 12.28),
+        ],
+    },
+    # Cluster - Visualizações
+    {
+        'fundo': 'image15.png',
+        'elementos': [
+            cabecalho('Cluster - Visualizações', 12.23, largura=25),
+            texto('{textos[1]}', 1.21, 2.89, 11, 15, 'corpo', quebrar=True),
+            imagem('{graficos}grafico_visualizacoes_{artista}.png', 12.49, 3.62, 21.4, 12.28),
+        ],
+    },
+    # Cluster - Receita Estimada
+    {
+        'fundo': 'image15.png',
+        'elementos': [
+            cabecalho('Cluster - Receita Estimada', 14.23, largura=25),
+            texto('{textos[2]}', 1.21, 2.89, 11, 15, 'corpo', quebrar=True),
+            imagem('{graficos}grafico_receita_{artista}.png', 12.49, 3.62, 21.4, 12.28),
+        ],
+    },
+    # Cluster - Média de Visualização
+    {
+        'fundo': 'image15.png',
+        'elementos': [
+            cabecalho('Cluster - Média de Visualização', 18.23, largura=25),
+            texto('{textos[3]}', 1.21, 2.89, 11, 15, 'corpo', quebrar=True),
+            imagem('{graficos}grafico_media_visualizacoes_{artista}.png', 12.49, 3.62, 21.4, 12.28),
+        ],
+    },
+    # Cluster - Média de Receita
+    {
+        'fundo': 'image15.png',
+        'elementos': [
+            cabecalho('Cluster - Média de Receita', 14.23, largura=25),
+            texto('{textos[4]}', 1.21, 2.89, 11, 15, 'corpo', quebrar=True),
+            imagem('{graficos}grafico_media_receita_{artista}.png', 12.49, 3.62, 21.4, 12.28),
+        ],
+    },
+    # DUVIDAS
+    {
+        'fundo': 'image31.png',
+        'elementos': [
+            texto('Dúvidas?', 8.54, 7.26, 16.83, 4.53, 'destaque'),
+        ],
+    },
+    # OBRIGADO
+    {
+        'fundo': 'image32.png',
+        'elementos': [
+            recurso('image3.png', 1.42, 1.21, 2.89, 2.06),
+            texto('Obrigada!', 0.98, 7.8, 26.39, 4.53, 'secao'),
+            texto('@1bigmedia\nfacebook/onebigmedia\nyoutube.com/onebigmedia\n', 1.95, 14.45, 14.34, 1.95, 'rotulo_branco', quebrar=True, entrelinha=26.6),
+            recurso('image34.png', 1.42, 14.88, 0.67, 0.67),
+            recurso('image28.png', 1.42, 15.79, 0.67, 0.67),
+            recurso('image30.png', 1.37, 16.65, 0.77, 0.74),
+        ],
+    },
+]
 
 
 def create_apresentation(artista, artist, mes_foco, textos_extraidos, graficos_path):
-    prs = Presentation()
-
-    # SLIDE CAPA ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-
-    # Definir o tamanho do slide para widescreen (16:9)
-    prs.slide_width = Inches(13.333)  # 13.333in é o equivalente a 16:9 em widescreen
-    prs.slide_height = Inches(7.5)  # Altura proporcional para o tamanho widescreen
-
-    # Caminho para a imagem de fundo do slide de capa
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image35.png'
-
-    # Adicionar um slide de capa
-    slide_layout = prs.slide_layouts[5]  # Escolhendo um layout de slide em branco
-    slide = prs.slides.add_slide(slide_layout)
-
-    # Adicionar a imagem de fundo
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    # Adicionar a imagem
-    image_path = 'resources/Imagens Template Relatório Mensal/image3.png'
-    slide.shapes.add_picture(image_path, Cm(1.42), Cm(1.21), width=Cm(2.89), height=Cm(2.06))
-
-    # Adicionar a primeira caixa de texto (título)
-    textbox_title = slide.shapes.add_textbox(Cm(1.04), Cm(11.28), Cm(25.2), Cm(3.68))
-    text_frame_title = textbox_title.text_frame
-    p_title = text_frame_title.paragraphs[0]
-    run_title = p_title.add_run()
-    run_title.text = "Relatório Mensal"
-
-    # Configuração da fonte do título
-    font_title = run_title.font
-    font_title.size = Pt(56)
-    font_title.bold = True
-    font_title.name = 'DM Sans'
-    font_title.color.rgb = RGBColor(255, 255, 255)  # Cor do título em formato RGB hexadecimal
-
-    # Adicionar a segunda caixa de texto (subtítulo)
-    textbox_subtitle = slide.shapes.add_textbox(Cm(1.04), Cm(13.75), Cm(13.31), Cm(1.28))
-    text_frame_subtitle = textbox_subtitle.text_frame
-    p_subtitle = text_frame_subtitle.paragraphs[0]
-    run_subtitle = p_subtitle.add_run()
-    run_subtitle.text = mes_foco
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(1.34), Cm(15.61), Cm(17), Cm(15.61))
-
-    # Formatar a linha (opcional)
-    line_shape.line.color.rgb = RGBColor(255, 255, 255)  # Cor da linha em azul escuro
-    line_shape.line.width = Pt(3)  # Espessura da linha
-
-    # Configuração da fonte do subtítulo
-    font_subtitle = run_subtitle.font
-    font_subtitle.size = Pt(24)
-    font_subtitle.bold = True
-    font_subtitle.name = 'DM Sans'
-    font_subtitle.color.rgb = RGBColor(255, 255, 255)  # Cor do subtítulo em formato RGB hexadecimal (#ffffff)
-
-    # Adicionar a caixa de artista
-    textbox_artist = slide.shapes.add_textbox(Cm(1.04), Cm(16.57), Cm(31.98), Cm(1.54))
-    text_frame_artist = textbox_artist.text_frame
-    p_artista = text_frame_artist.paragraphs[0]
-    run_artist = p_artista.add_run()
-    run_artist.text = artist
-
-    # Configuração da fonte do subtítulo
-    font_artist = run_artist.font
-    font_artist.size = Pt(30)
-    font_artist.bold = True
-    font_artist.name = 'DM Sans'
-    font_artist.color.rgb = RGBColor(255, 255, 255)  # Cor do subtítulo em formato RGB hexadecimal (#ffffff)
-   
-
-    #SLIDE DIAGNÓSTICO ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-
-    slide_layout = prs.slide_layouts[5]  # Escolhendo um layout de slide em branco
-    slide = prs.slides.add_slide(slide_layout)
-
-    # Caminho para a imagem de fundo do novo slide
-    background_image_path_1 = 'resources/Imagens Template Relatório Mensal/image27.png'
-
-    # Adicionar a imagem de fundo do novo slide
-    slide.shapes.add_picture(background_image_path_1, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    # Adicionar a primeira caixa de texto do novo slide
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(18), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Slide Editável"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)  # Cor do texto em azul escuro
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(7.12), Cm(2.1))
-
-    # Formatar a linha (opcional)
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)  # Cor da linha em azul escuro
-    line_shape.line.width = Pt(3)  # Espessura da linha
-
-    # Adicionar a imagem
-    logo_path = f'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_third = slide.shapes.add_textbox(Cm(1.21), Cm(2.89), Cm(11.01), Cm(1.64))
-    text_frame_third = textbox_third.text_frame
-    text_frame_third.word_wrap = True
-    text_frame_third.auto_size = True
-    p_third = text_frame_third.paragraphs[0]
-    run_third = p_third.add_run()
-    run_third.text = "Texto" #arquivo[arquivo['Tópicos'] == 'Diagnóstico']['Textos'].iloc[0]
-    font_third = run_third.font
-    font_third.size = Pt(14)
-    font_third.name = 'DM Sans'
-    font_third.color.rgb = RGBColor(0, 0, 0)  # Cor do texto em preto
-
-
-    # SLIDE RESUMO ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-
-    slide_layout = prs.slide_layouts[5]  # Escolhendo um layout de slide em branco
-    slide = prs.slides.add_slide(slide_layout)
-
-    # Caminho para a imagem de fundo do novo slide
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image15.png'
-
-    # Adicionar a imagem de fundo do novo slide
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    # Adicionar a primeira caixa de texto do novo slide
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(18), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Resumo da Análise"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)  # Cor do texto em azul escuro
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(11.32), Cm(2.1))
-
-    # Formatar a linha (opcional)
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)  # Cor da linha em azul escuro
-    line_shape.line.width = Pt(3)  # Espessura da linha
-
-    # Adicionar a imagem
-    logo_path = f'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_fourth = slide.shapes.add_textbox(Cm(0.50), Cm(18.34), Cm(11), Cm(0.77))
-    text_frame_fourth = textbox_fourth.text_frame
-    text_frame_fourth.word_wrap = True
-    text_frame_fourth.auto_size = True
-    p_fourth = text_frame_fourth.paragraphs[0]
-    run_fourth = p_fourth.add_run()
-    run_fourth.text = "*Os índices em '%' são relativos à média do semestre." 
-    font_fourth = run_fourth.font
-    font_fourth.size = Pt(11)
-    font_fourth.name = 'DM Sans'
-    font_fourth.bold = False
-    font_fourth.color.rgb = RGBColor(25, 46, 104)  # Cor do texto em preto
-
-
-    # Adicionar a imagem
-    image_path = f'dados_full/{artista}/plots/4a - Card_VISUALIZAÇÕES_v2.png'
-    slide.shapes.add_picture(image_path, Cm(3.43), Cm(1.96), width=Cm(8.97), height=Cm(8.91))
-
-    image_path = f'dados_full/{artista}/plots/4b - Card_RECEITA_v2.png'
-    slide.shapes.add_picture(image_path, Cm(12.45), Cm(1.96), width=Cm(8.97), height=Cm(8.91))
-
-    image_path = f'dados_full/{artista}/plots/4c - Card_INSCRITOS_v2.png'
-    slide.shapes.add_picture(image_path, Cm(21.42), Cm(1.96), width=Cm(8.97), height=Cm(8.91))
-
-    image_path = f'dados_full/{artista}/plots/4d - Card_RPM_v2.png'
-    slide.shapes.add_picture(image_path, Cm(3.43), Cm(10.08), width=Cm(8.97), height=Cm(8.91))
-
-    image_path = f'dados_full/{artista}/plots/4e - Card_IMPRESSÕES_v2.png'
-    slide.shapes.add_picture(image_path, Cm(12.45), Cm(10.08), width=Cm(8.97), height=Cm(8.91))
-
-    image_path = f'dados_full/{artista}/plots/4f - Card_WATCHTIME_(HORAS)_v2.png'
-    slide.shapes.add_picture(image_path, Cm(21.42), Cm(10.08), width=Cm(8.97), height=Cm(8.91))
-
-
-    #SLIDE MÉTRICAS VOD AVANÇADAS ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-
-    # Adicionar um novo slide para 'Receita'
-    slide_layout = prs.slide_layouts[5]  # Escolhendo um layout de slide em branco
-    slide = prs.slides.add_slide(slide_layout)
-
-    # Caminho para a imagem de fundo do novo slide
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image7.png'
-
-    # Adicionar a imagem de fundo do novo slide
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    # Adicionar a primeira caixa de texto do novo slide
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(18), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Métricas Gerais VOD's"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)  # Cor do texto em azul escuro
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(13.1), Cm(2.1))
-
-    # Formatar a linha (opcional)
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)  # Cor da linha em azul escuro
-    line_shape.line.width = Pt(3)  # Espessura da linha
-
-    # Adicionar a imagem
-    logo_path = f'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    # Adicionar a imagem
-    image_path = f'dados_full/{artista}/plots/1 - Métricas_VOD_Avancada.png'
-    slide.shapes.add_picture(image_path, Cm(0), Cm(3.16), width=Cm(33.92), height=Cm(13.64))
-
-
-    #SLIDE MÉTRICAS LIVES AVANÇADAS ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-
-    # Adicionar um novo slide para 'Receita'
-    slide_layout = prs.slide_layouts[5]  # Escolhendo um layout de slide em branco
-    slide = prs.slides.add_slide(slide_layout)
-
-    # Caminho para a imagem de fundo do novo slide
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image7.png'
-
-    # Adicionar a imagem de fundo do novo slide
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    # Adicionar a primeira caixa de texto do novo slide
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(18), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Métricas Gerais Lives"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)  # Cor do texto em azul escuro
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(13.1), Cm(2.1))
-
-    # Formatar a linha (opcional)
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)  # Cor da linha em azul escuro
-    line_shape.line.width = Pt(3)  # Espessura da linha
-
-    # Adicionar a imagem
-    logo_path = f'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    # Adicionar a imagem
-    image_path = f'dados_full/{artista}/plots/2 - Métricas_Lives_Avancada.png'
-    slide.shapes.add_picture(image_path, Cm(0), Cm(3.16), width=Cm(33.92), height=Cm(13.64))
-
-
-    #SLIDE MÉTRICAS SHORTS AVANÇADAS ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-
-    # Adicionar um novo slide para 'Receita'
-    slide_layout = prs.slide_layouts[5]  # Escolhendo um layout de slide em branco
-    slide = prs.slides.add_slide(slide_layout)
-
-    # Caminho para a imagem de fundo do novo slide
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image7.png'
-
-    # Adicionar a imagem de fundo do novo slide
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    # Adicionar a primeira caixa de texto do novo slide
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(18), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Métricas Gerais Shorts"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)  # Cor do texto em azul escuro
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(13.1), Cm(2.1))
-
-    # Formatar a linha (opcional)
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)  # Cor da linha em azul escuro
-    line_shape.line.width = Pt(3)  # Espessura da linha
-
-    # Adicionar a imagem
-    logo_path = f'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    # Adicionar a imagem
-    image_path = f'dados_full/{artista}/plots/3 - Métricas_Shorts_Avancada.png'
-    slide.shapes.add_picture(image_path, Cm(0), Cm(3.16), width=Cm(33.92), height=Cm(13.64))
-
-
-    # SLIDE ANALISE INICIAL ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-
-    # Adicionar um novo slide para 'Análise Inicial'
-    slide_layout = prs.slide_layouts[5]  # Escolhendo um layout de slide em branco
-    slide = prs.slides.add_slide(slide_layout)
-
-    # Caminho para a imagem de fundo do novo slide
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image7.png'
-
-    # Adicionar a imagem de fundo do novo slide
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    # Adicionar a primeira caixa de texto do novo slide
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(18), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Análise Inicial"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)  # Cor do texto em azul escuro
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(8.7), Cm(2.1))
-
-    # Formatar a linha (opcional)
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)  # Cor da linha em azul escuro
-    line_shape.line.width = Pt(3)  # Espessura da linha
-
-    # Adicionar a imagem
-    logo_path = f'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_third = slide.shapes.add_textbox(Cm(1.21), Cm(2.89), Cm(11.01), Cm(1.64))
-    text_frame_third = textbox_third.text_frame
-    text_frame_third.word_wrap = True
-    text_frame_third.auto_size = True
-    p_third = text_frame_third.paragraphs[0]
-    run_third = p_third.add_run()
-    run_third.text = "Texto" #arquivo[arquivo['Tópicos'] == 'Análise Inicial']['Textos'].iloc[0]
-    font_third = run_third.font
-    font_third.size = Pt(14)
-    font_third.name = 'DM Sans'
-    font_third.color.rgb = RGBColor(0, 0, 0)  # Cor do texto em preto
-
-    # Adicionar a imagem
-    image_path = f'dados_full/{artista}/plots/6 - Análise_Inicial.png'
-    slide.shapes.add_picture(image_path, Cm(12.74), Cm(3.04), width=Cm(20.5), height=Cm(11.93))
-
-    image_path_3 = f'dados_full/{artista}/plots/5 - Publicados.png'
-    slide.shapes.add_picture(image_path_3, Cm(12.7), Cm(-0.36), width=Cm(19.49), height=Cm(4.44))
-
-    image_path_2 = f'dados_full/{artista}/plots/7 - Watchtime.png'
-    slide.shapes.add_picture(image_path_2, Cm(12.7), Cm(14.1), width=Cm(19.49), height=Cm(5.42))
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_fourth = slide.shapes.add_textbox(Cm(12.74), Cm(14.15), Cm(11), Cm(0.73))
-    text_frame_fourth = textbox_fourth.text_frame
-    text_frame_fourth.word_wrap = True
-    text_frame_fourth.auto_size = True
-    p_fourth = text_frame_fourth.paragraphs[0]
-    run_fourth = p_fourth.add_run()
-    run_fourth.text = "*Dados referentes apenas a lives e VOD's" 
-    font_fourth = run_fourth.font
-    font_fourth.size = Pt(10)
-    font_fourth.name = 'DM Sans'
-    font_fourth.bold = False
-    font_fourth.color.rgb = RGBColor(25, 46, 104)  # Cor do texto em preto
-
-
-    # SLIDE MONETIZAÇÃO VELHO NOVO ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-
-    # Adicionar um novo slide para 'Monetização'
-    slide_layout = prs.slide_layouts[5]  # Escolhendo um layout de slide em branco
-    slide = prs.slides.add_slide(slide_layout)
-
-    # Caminho para a imagem de fundo do novo slide
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image15.png'
-
-    # Adicionar a imagem de fundo do novo slide
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    # Adicionar a primeira caixa de texto do novo slide
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(18), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Receita Velho x Novo"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)  # Cor do texto em azul escuro
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(12.23), Cm(2.1))
-
-    # Formatar a linha (opcional)
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)  # Cor da linha em azul escuro
-    line_shape.line.width = Pt(3)  # Espessura da linha
-
-    # Adicionar a imagem
-    logo_path = f'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_third = slide.shapes.add_textbox(Cm(1.21), Cm(2.89), Cm(11.01), Cm(1.64))
-    text_frame_third = textbox_third.text_frame
-    text_frame_third.word_wrap = True
-    text_frame_third.auto_size = True
-    p_third = text_frame_third.paragraphs[0]
-    run_third = p_third.add_run()
-    run_third.text = "Texto" #arquivo[arquivo['Tópicos'] == 'Monetização Velho x Novo']['Textos'].iloc[0]
-    font_third = run_third.font
-    font_third.size = Pt(14)
-    font_third.name = 'DM Sans'
-    font_third.color.rgb = RGBColor(0, 0, 0)  # Cor do texto em preto
-
-    # Adicionar a imagem
-    image_path = f'dados_full/{artista}/plots/8 - Monetizacao_v2.png'
-    slide.shapes.add_picture(image_path, Cm(12.49), Cm(3.62), width=Cm(21.4), height=Cm(12.28))
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_fourth = slide.shapes.add_textbox(Cm(12.49), Cm(15.9), Cm(11), Cm(0.73))
-    text_frame_fourth = textbox_fourth.text_frame
-    text_frame_fourth.word_wrap = True
-    text_frame_fourth.auto_size = True
-    p_fourth = text_frame_fourth.paragraphs[0]
-    run_fourth = p_fourth.add_run()
-    run_fourth.text = "*Dados referentes apenas a lives e VOD's" 
-    font_fourth = run_fourth.font
-    font_fourth.size = Pt(10)
-    font_fourth.name = 'DM Sans'
-    font_fourth.bold = False
-    font_fourth.color.rgb = RGBColor(25, 46, 104)  # Cor do texto em preto
-
-
-    # SLIDE Views VELHO NOVO ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-
-    # Adicionar um novo slide para 'Views'
-    slide_layout = prs.slide_layouts[5]  # Escolhendo um layout de slide em branco
-    slide = prs.slides.add_slide(slide_layout)
-
-    # Caminho para a imagem de fundo do novo slide
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image15.png'
-
-    # Adicionar a imagem de fundo do novo slide
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    # Adicionar a primeira caixa de texto do novo slide
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(18), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Views Velho x Novo"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)  # Cor do texto em azul escuro
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(12.23), Cm(2.1))
-
-    # Formatar a linha (opcional)
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)  # Cor da linha em azul escuro
-    line_shape.line.width = Pt(3)  # Espessura da linha
-
-    # Adicionar a imagem
-    logo_path = f'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_third = slide.shapes.add_textbox(Cm(1.21), Cm(2.89), Cm(11.01), Cm(1.64))
-    text_frame_third = textbox_third.text_frame
-    text_frame_third.word_wrap = True
-    text_frame_third.auto_size = True
-    p_third = text_frame_third.paragraphs[0]
-    run_third = p_third.add_run()
-    run_third.text = "Texto" #arquivo[arquivo['Tópicos'] == 'Monetização Velho x Novo']['Textos'].iloc[0]
-    font_third = run_third.font
-    font_third.size = Pt(14)
-    font_third.name = 'DM Sans'
-    font_third.color.rgb = RGBColor(0, 0, 0)  # Cor do texto em preto
-
-    # Adicionar a imagem
-    image_path = f'dados_full/{artista}/plots/19 - Views_Novo_vs_Velho.png'
-    slide.shapes.add_picture(image_path, Cm(12.49), Cm(3.62), width=Cm(21.4), height=Cm(12.28))
-
-
-    # SLIDE MONETIZAÇÃO POR FORMATOS ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-
-    # Adicionar um novo slide para 'Monetização'
-    slide_layout = prs.slide_layouts[5]  # Escolhendo um layout de slide em branco
-    slide = prs.slides.add_slide(slide_layout)
-
-    # Caminho para a imagem de fundo do novo slide
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image7.png'
-
-    # Adicionar a imagem de fundo do novo slide
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    # Adicionar a primeira caixa de texto do novo slide
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(18), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Monetização por Formatos"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)  # Cor do texto em azul escuro
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(15.45), Cm(2.1))
-
-    # Formatar a linha (opcional)
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)  # Cor da linha em azul escuro
-    line_shape.line.width = Pt(3)  # Espessura da linha
-
-    # Adicionar a imagem
-    logo_path = f'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_third = slide.shapes.add_textbox(Cm(1.21), Cm(2.89), Cm(11.01), Cm(1.64))
-    text_frame_third = textbox_third.text_frame
-    text_frame_third.word_wrap = True
-    text_frame_third.auto_size = True
-    p_third = text_frame_third.paragraphs[0]
-    run_third = p_third.add_run()
-    run_third.text = "Texto" #arquivo[arquivo['Tópicos'] == 'Monetização por Formatos']['Textos'].iloc[0]
-    font_third = run_third.font
-    font_third.size = Pt(14)
-    font_third.name = 'DM Sans'
-    font_third.color.rgb = RGBColor(0, 0, 0)  # Cor do texto em preto
-
-    # Adicionar a imagem
-    image_path = f'dados_full/{artista}/plots/9 - Monetização por formatos.png'
-    slide.shapes.add_picture(image_path, Cm(12.49), Cm(3.62), width=Cm(21.4), height=Cm(12.28))
-
-   
-    # SLIDE CONVERSÃO ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-
-    # Adicionar um novo slide para 'Conversão'
-    slide_layout = prs.slide_layouts[5]  # Escolhendo um layout de slide em branco
-    slide = prs.slides.add_slide(slide_layout)
-
-    # Caminho para a imagem de fundo do novo slide
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image15.png'
-
-    # Adicionar a imagem de fundo do novo slide
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    # Adicionar a primeira caixa de texto do novo slide
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(18), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Conversão"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)  # Cor do texto em azul escuro
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(7.07), Cm(2.1))
-
-    # Formatar a linha (opcional)
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)  # Cor da linha em azul escuro
-    line_shape.line.width = Pt(3)  # Espessura da linha
-
-    # Adicionar a imagem
-    logo_path = f'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_third = slide.shapes.add_textbox(Cm(1.21), Cm(2.89), Cm(11.01), Cm(1.64))
-    text_frame_third = textbox_third.text_frame
-    text_frame_third.word_wrap = True
-    text_frame_third.auto_size = True
-    p_third = text_frame_third.paragraphs[0]
-    run_third = p_third.add_run()
-    run_third.text = "Texto" #arquivo[arquivo['Tópicos'] == 'Conversão']['Textos'].iloc[0]
-    font_third = run_third.font
-    font_third.size = Pt(14)
-    font_third.name = 'DM Sans'
-    font_third.color.rgb = RGBColor(0, 0, 0)  # Cor do texto em preto
-
-    # Adicionar a imagem
-    image_path = f'dados_full/{artista}/plots/10 - Conversao.png'
-    slide.shapes.add_picture(image_path, Cm(12.49), Cm(3.62), width=Cm(21.4), height=Cm(12.28))
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_fourth = slide.shapes.add_textbox(Cm(12.49), Cm(15.9), Cm(11), Cm(0.73))
-    text_frame_fourth = textbox_fourth.text_frame
-    text_frame_fourth.word_wrap = True
-    text_frame_fourth.auto_size = True
-    p_fourth = text_frame_fourth.paragraphs[0]
-    run_fourth = p_fourth.add_run()
-    run_fourth.text = "*Dados referentes apenas a lives e VOD's" 
-    font_fourth = run_fourth.font
-    font_fourth.size = Pt(10)
-    font_fourth.name = 'DM Sans'
-    font_fourth.bold = False
-    font_fourth.color.rgb = RGBColor(25, 46, 104)  # Cor do texto em preto
-
-
-    # SLIDE QUALIDADE VOD ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-
-    # Adicionar um novo slide para 'Qualidade'
-    slide_layout = prs.slide_layouts[5]  # Escolhendo um layout de slide em branco
-    slide = prs.slides.add_slide(slide_layout)
-
-    # Caminho para a imagem de fundo do novo slide
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image7.png'
-
-    # Adicionar a imagem de fundo do novo slide
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    # Adicionar a primeira caixa de texto do novo slide
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(18), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Qualidade VOD's"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)  # Cor do texto em azul escuro
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(10.18), Cm(2.1))
-
-    # Formatar a linha (opcional)
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)  # Cor da linha em azul escuro
-    line_shape.line.width = Pt(3)  # Espessura da linha
-
-    # Adicionar a imagem
-    logo_path = f'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_third = slide.shapes.add_textbox(Cm(1.21), Cm(2.89), Cm(11.01), Cm(1.64))
-    text_frame_third = textbox_third.text_frame
-    text_frame_third.word_wrap = True
-    text_frame_third.auto_size = True
-    p_third = text_frame_third.paragraphs[0]
-    run_third = p_third.add_run()
-    run_third.text = "Texto" #arquivo[arquivo['Tópicos'] == "Qualidade VOD's"]['Textos'].iloc[0]
-    font_third = run_third.font
-    font_third.size = Pt(14)
-    font_third.name = 'DM Sans'
-    font_third.color.rgb = RGBColor(0, 0, 0)  # Cor do texto em preto
-    
-    # Adicionar a imagem
-    image_path = f'dados_full/{artista}/plots/11 - Qualidade_Vod.png'
-    slide.shapes.add_picture(image_path, Cm(14.51), Cm(-0.11), width=Cm(17.06), height=Cm(9.61))
-
-    # Adicionar a imagem
-    image_path = f'dados_full/{artista}/plots/15 - Engajamento_VOD.png'
-    slide.shapes.add_picture(image_path, Cm(14.51), Cm(9.32), width=Cm(17.06), height=Cm(10.24))
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_fourth = slide.shapes.add_textbox(Cm(0), Cm(18.38), Cm(13.71), Cm(0.68))
-    text_frame_fourth = textbox_fourth.text_frame
-    text_frame_fourth.word_wrap = True
-    text_frame_fourth.auto_size = True
-    p_fourth = text_frame_fourth.paragraphs[0]
-    run_fourth = p_fourth.add_run()
-    run_fourth.text = "*Dados de porcentagem entre parenteses são a porcentagem média assistida" 
-    font_fourth = run_fourth.font
-    font_fourth.size = Pt(10)
-    font_fourth.name = 'DM Sans'
-    font_fourth.bold = False
-    font_fourth.color.rgb = RGBColor(25, 46, 104)  # Cor do texto em preto
-
-
-    # Adicionar um novo slide para 'Qualidade'
-    slide_layout = prs.slide_layouts[5]  # Escolhendo um layout de slide em branco
-    slide = prs.slides.add_slide(slide_layout)
-
-    # Caminho para a imagem de fundo do novo slide
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image7.png'
-
-    # Adicionar a imagem de fundo do novo slide
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    # Adicionar a primeira caixa de texto do novo slide
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(18), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Qualidade Lives"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)  # Cor do texto em azul escuro
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(9.72), Cm(2.1))
-
-    # Formatar a linha (opcional)
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)  # Cor da linha em azul escuro
-    line_shape.line.width = Pt(3)  # Espessura da linha
-
-    # Adicionar a imagem
-    logo_path = f'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_third = slide.shapes.add_textbox(Cm(1.21), Cm(2.89), Cm(11.01), Cm(1.64))
-    text_frame_third = textbox_third.text_frame
-    text_frame_third.word_wrap = True
-    text_frame_third.auto_size = True
-    p_third = text_frame_third.paragraphs[0]
-    run_third = p_third.add_run()
-    run_third.text = "Texto" #arquivo[arquivo['Tópicos'] == 'Qualidade Lives']['Textos'].iloc[0]
-    font_third = run_third.font
-    font_third.size = Pt(14)
-    font_third.name = 'DM Sans'
-    font_third.color.rgb = RGBColor(0, 0, 0)  # Cor do texto em preto
-
-    # Adicionar a imagem
-    image_path = f'dados_full/{artista}/plots/12 - Qualidade_Live.png'
-    slide.shapes.add_picture(image_path, Cm(14.51), Cm(-0.11), width=Cm(17.06), height=Cm(9.61))
-
-    # Adicionar a imagem
-    image_path = f'dados_full/{artista}/plots/16 - Engajamento_Live.png'
-    slide.shapes.add_picture(image_path, Cm(14.51), Cm(9.32), width=Cm(17.06), height=Cm(10.24))
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_fourth = slide.shapes.add_textbox(Cm(0), Cm(18.38), Cm(13.71), Cm(0.68))
-    text_frame_fourth = textbox_fourth.text_frame
-    text_frame_fourth.word_wrap = True
-    text_frame_fourth.auto_size = True
-    p_fourth = text_frame_fourth.paragraphs[0]
-    run_fourth = p_fourth.add_run()
-    run_fourth.text = "*Dados de porcentagem entre parenteses são a porcentagem média assistida" 
-    font_fourth = run_fourth.font
-    font_fourth.size = Pt(10)
-    font_fourth.name = 'DM Sans'
-    font_fourth.bold = False
-    font_fourth.color.rgb = RGBColor(25, 46, 104)  # Cor do texto em preto
-
-
-    # SLIDE QUALIDADE SHORTS ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-
-    # Adicionar um novo slide para 'Qualidade'
-    slide_layout = prs.slide_layouts[5]  # Escolhendo um layout de slide em branco
-    slide = prs.slides.add_slide(slide_layout)
-
-    # Caminho para a imagem de fundo do novo slide
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image7.png'
-
-    # Adicionar a imagem de fundo do novo slide
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    # Adicionar a primeira caixa de texto do novo slide
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(18), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Qualidade Shorts"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)  # Cor do texto em azul escuro
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(9.72), Cm(2.1))
-
-    # Formatar a linha (opcional)
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)  # Cor da linha em azul escuro
-    line_shape.line.width = Pt(3)  # Espessura da linha
-
-    # Adicionar a imagem
-    logo_path = f'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_third = slide.shapes.add_textbox(Cm(1.21), Cm(2.89), Cm(11.01), Cm(1.64))
-    text_frame_third = textbox_third.text_frame
-    text_frame_third.word_wrap = True
-    text_frame_third.auto_size = True
-    p_third = text_frame_third.paragraphs[0]
-    run_third = p_third.add_run()
-    run_third.text = "Texto" #arquivo[arquivo['Tópicos'] == 'Qualidade Lives']['Textos'].iloc[0]
-    font_third = run_third.font
-    font_third.size = Pt(14)
-    font_third.name = 'DM Sans'
-    font_third.color.rgb = RGBColor(0, 0, 0)  # Cor do texto em preto
-
-    # Adicionar a imagem
-    image_path = f'dados_full/{artista}/plots/12.5 - Qualidade_Shorts.png'
-    slide.shapes.add_picture(image_path, Cm(14.51), Cm(-0.11), width=Cm(17.06), height=Cm(9.61))
-
-    # Adicionar a imagem
-    image_path = f'dados_full/{artista}/plots/16.5 - Engajamento_Shorts.png'
-    slide.shapes.add_picture(image_path, Cm(14.51), Cm(9.32), width=Cm(17.06), height=Cm(10.24))
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_fourth = slide.shapes.add_textbox(Cm(0), Cm(18.38), Cm(13.71), Cm(0.68))
-    text_frame_fourth = textbox_fourth.text_frame
-    text_frame_fourth.word_wrap = True
-    text_frame_fourth.auto_size = True
-    p_fourth = text_frame_fourth.paragraphs[0]
-    run_fourth = p_fourth.add_run()
-    run_fourth.text = "*Dados de porcentagem entre parenteses são a porcentagem média assistida" 
-    font_fourth = run_fourth.font
-    font_fourth.size = Pt(10)
-    font_fourth.name = 'DM Sans'
-    font_fourth.bold = False
-    font_fourth.color.rgb = RGBColor(25, 46, 104)  # Cor do texto em preto
-
-
-    # SLIDE COMUNIDADE ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-
-    # Adicionar um novo slide para 'Comunidade'
-    slide_layout = prs.slide_layouts[5]  # Escolhendo um layout de slide em branco
-    slide = prs.slides.add_slide(slide_layout)
-
-    # Caminho para a imagem de fundo do novo slide
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image7.png'
-
-    # Adicionar a imagem de fundo do novo slide
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    # Adicionar a primeira caixa de texto do novo slide
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(18), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Comunidade"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)  # Cor do texto em azul escuro
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(9.72), Cm(2.1))
-
-    # Formatar a linha (opcional)
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)  # Cor da linha em azul escuro
-    line_shape.line.width = Pt(3)  # Espessura da linha
-
-    # Adicionar a imagem
-    logo_path = f'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_third = slide.shapes.add_textbox(Cm(1.21), Cm(2.89), Cm(11.01), Cm(1.64))
-    text_frame_third = textbox_third.text_frame
-    text_frame_third.word_wrap = True
-    text_frame_third.auto_size = True
-    p_third = text_frame_third.paragraphs[0]
-    run_third = p_third.add_run()
-    run_third.text = "Texto" #arquivo[arquivo['Tópicos'] == 'Qualidade Lives']['Textos'].iloc[0]
-    font_third = run_third.font
-    font_third.size = Pt(14)
-    font_third.name = 'DM Sans'
-    font_third.color.rgb = RGBColor(0, 0, 0)  # Cor do texto em preto
-
-    # Adicionar a imagem
-    image_path = f'dados_full/{artista}/plots/17 - Comunidade.png'
-    slide.shapes.add_picture(image_path, Cm(12.49), Cm(3.62), width=Cm(21.4), height=Cm(12.28))
-
-
-    #SLIDE ORIGEM DO TRÁFEGO ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-
-    # Adicionar um novo slide para 'Receita'
-    slide_layout = prs.slide_layouts[5]  # Escolhendo um layout de slide em branco
-    slide = prs.slides.add_slide(slide_layout)
-
-    # Caminho para a imagem de fundo do novo slide
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image15.png'
-
-    # Adicionar a imagem de fundo do novo slide
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    # Adicionar a primeira caixa de texto do novo slide
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(18), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Origem do Tráfego"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)  # Cor do texto em azul escuro
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(11.06), Cm(2.1))
-
-    # Formatar a linha (opcional)
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)  # Cor da linha em azul escuro
-    line_shape.line.width = Pt(3)  # Espessura da linha
-
-    # Adicionar a imagem
-    logo_path = f'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_third = slide.shapes.add_textbox(Cm(1.21), Cm(2.89), Cm(11.01), Cm(1.64))
-    text_frame_third = textbox_third.text_frame
-    text_frame_third.word_wrap = True
-    text_frame_third.auto_size = True
-    p_third = text_frame_third.paragraphs[0]
-    run_third = p_third.add_run()
-    run_third.text = "Texto" #arquivo[arquivo['Tópicos'] == 'Monetização Velho x Novo']['Textos'].iloc[0]
-    font_third = run_third.font
-    font_third.size = Pt(14)
-    font_third.name = 'DM Sans'
-    font_third.color.rgb = RGBColor(0, 0, 0)  # Cor do texto em preto
-
-    # Adicionar a imagem
-    image_path = f'dados_full/{artista}/plots/13 - Origem_do_trafego.png'
-    slide.shapes.add_picture(image_path, Cm(12.49), Cm(3.62), width=Cm(21.4), height=Cm(12.28))
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_fourth = slide.shapes.add_textbox(Cm(12.49), Cm(15.9), Cm(11), Cm(0.73))
-    text_frame_fourth = textbox_fourth.text_frame
-    text_frame_fourth.word_wrap = True
-    text_frame_fourth.auto_size = True
-    p_fourth = text_frame_fourth.paragraphs[0]
-    run_fourth = p_fourth.add_run()
-    run_fourth.text = "*Dados referentes apenas a lives e VOD's" 
-    font_fourth = run_fourth.font
-    font_fourth.size = Pt(10)
-    font_fourth.name = 'DM Sans'
-    font_fourth.bold = False
-    font_fourth.color.rgb = RGBColor(25, 46, 104)  # Cor do texto em preto
-
-    #SLIDE CRESCIMENTO ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-
-    # Adicionar um novo slide para 'Crescimento'
-    slide_layout = prs.slide_layouts[5]  # Escolhendo um layout de slide em branco
-    slide = prs.slides.add_slide(slide_layout)
-
-    # Caminho para a imagem de fundo do novo slide
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image15.png'
-
-    # Adicionar a imagem de fundo do novo slide
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    # Adicionar a primeira caixa de texto do novo slide
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(18), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Crescimento de Inscritos"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)  # Cor do texto em azul escuro
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(14.69), Cm(2.1))
-
-    # Formatar a linha (opcional)
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)  # Cor da linha em azul escuro
-    line_shape.line.width = Pt(3)  # Espessura da linha
-
-    # Adicionar a imagem
-    logo_path = f'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    # Adicionar a terceira caixa de texto do novo slide
-    textbox_third = slide.shapes.add_textbox(Cm(1.21), Cm(2.89), Cm(11.01), Cm(1.64))
-    text_frame_third = textbox_third.text_frame
-    text_frame_third.word_wrap = True
-    text_frame_third.auto_size = True
-    p_third = text_frame_third.paragraphs[0]
-    run_third = p_third.add_run()
-    run_third.text = "Texto" #arquivo[arquivo['Tópicos'] == 'Crescimento']['Textos'].iloc[0]
-    font_third = run_third.font
-    font_third.size = Pt(14)
-    font_third.name = 'DM Sans'
-    font_third.color.rgb = RGBColor(0, 0, 0)  # Cor do texto em preto
-
-    # Adicionar a imagem
-    image_path = f'dados_full/{artista}/plots/14 - Inscricoes_por_Tipo_de_Conteudo.png'
-    slide.shapes.add_picture(image_path, Cm(12.49), Cm(1.52), width=Cm(21.4), height=Cm(12.28))
-
-    # Adicionar a imagem
-    image_path = f'dados_full/{artista}/plots/18 - Tabela de Inscritos.png'
-    slide.shapes.add_picture(image_path, Cm(14.01), Cm(12.96), width=Cm(18.35), height=Cm(6.56))
-
-    ###################################################################################
-    # SLIDE Cluster - Quantidade de Conteúdos #
-    ###################################################################################
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image15.png'
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(25), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Cluster - Quantidade de Conteúdos"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(20.23), Cm(2.1))
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)
-    line_shape.line.width = Pt(3)
-
-    logo_path = 'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    textbox_third = slide.shapes.add_textbox(Cm(1.21), Cm(2.89), Cm(11), Cm(15)) # Aumentei o tamanho da caixa de texto
-    text_frame_third = textbox_third.text_frame
-    text_frame_third.word_wrap = True
-    p_third = text_frame_third.paragraphs[0]
-    run_third = p_third.add_run()
-    
-    # [NOVO] Pega o texto do dicionário. Usa get() para evitar erros se a chave não existir.
-    run_third.text = textos_extraidos[0]
-    
-    font_third = run_third.font
-    font_third.size = Pt(14)
-    font_third.name = 'DM Sans'
-    font_third.color.rgb = RGBColor(0, 0, 0)
-
-    # Adicionar a imagem
-    image_path = f'{graficos_path}grafico_publicacoes_{artista}.png'
-    slide.shapes.add_picture(image_path, Cm(12.49), Cm(3.62), width=Cm(21.4), height=Cm(12.28))
-
-    
-    ###################################################################################
-    # SLIDE Cluster - Visualizações #
-    ###################################################################################
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image15.png'
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(25), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Cluster - Visualizações"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(12.23), Cm(2.1))
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)
-    line_shape.line.width = Pt(3)
-
-    logo_path = 'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    textbox_third = slide.shapes.add_textbox(Cm(1.21), Cm(2.89), Cm(11), Cm(15))
-    text_frame_third = textbox_third.text_frame
-    text_frame_third.word_wrap = True
-    p_third = text_frame_third.paragraphs[0]
-    run_third = p_third.add_run()
-
-    # [NOVO] Pega o texto do dicionário.
-    run_third.text = textos_extraidos[1]
-
-    font_third = run_third.font
-    font_third.size = Pt(14)
-    font_third.name = 'DM Sans'
-    font_third.color.rgb = RGBColor(0, 0, 0)
-
-    # Adicionar a imagem
-    image_path = f'{graficos_path}grafico_visualizacoes_{artista}.png'
-    slide.shapes.add_picture(image_path, Cm(12.49), Cm(3.62), width=Cm(21.4), height=Cm(12.28))
-
-
-    ###################################################################################
-    # SLIDE Cluster - Receita Estimada #
-    ###################################################################################
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image15.png'
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(25), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Cluster - Receita Estimada"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(14.23), Cm(2.1))
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)
-    line_shape.line.width = Pt(3)
-
-    logo_path = 'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    textbox_third = slide.shapes.add_textbox(Cm(1.21), Cm(2.89), Cm(11), Cm(15))
-    text_frame_third = textbox_third.text_frame
-    text_frame_third.word_wrap = True
-    p_third = text_frame_third.paragraphs[0]
-    run_third = p_third.add_run()
-    
-    # [NOVO] Pega o texto do dicionário.
-    run_third.text = textos_extraidos[2]
-
-    font_third = run_third.font
-    font_third.size = Pt(14)
-    font_third.name = 'DM Sans'
-    font_third.color.rgb = RGBColor(0, 0, 0)
-
-    # Adicionar a imagem
-    image_path = f'{graficos_path}grafico_receita_{artista}.png'
-    slide.shapes.add_picture(image_path, Cm(12.49), Cm(3.62), width=Cm(21.4), height=Cm(12.28))
-
-
-    ###################################################################################
-    # SLIDE Cluster - Média de Visualização #
-    ###################################################################################
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image15.png'
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(25), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Cluster - Média de Visualização"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(18.23), Cm(2.1))
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)
-    line_shape.line.width = Pt(3)
-
-    logo_path = 'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    textbox_third = slide.shapes.add_textbox(Cm(1.21), Cm(2.89), Cm(11), Cm(15))
-    text_frame_third = textbox_third.text_frame
-    text_frame_third.word_wrap = True
-    p_third = text_frame_third.paragraphs[0]
-    run_third = p_third.add_run()
-    
-    # [NOVO] Pega o texto do dicionário.
-    run_third.text = textos_extraidos[3]
-
-    font_third = run_third.font
-    font_third.size = Pt(14)
-    font_third.name = 'DM Sans'
-    font_third.color.rgb = RGBColor(0, 0, 0)
-
-    # Adicionar a imagem
-
-    image_path = f'{graficos_path}grafico_media_visualizacoes_{artista}.png'
-    slide.shapes.add_picture(image_path, Cm(12.49), Cm(3.62), width=Cm(21.4), height=Cm(12.28))
-
-
-    ###################################################################################
-    # SLIDE Cluster - Média de Receita #
-    ###################################################################################
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    background_image_path = 'resources/Imagens Template Relatório Mensal/image15.png'
-    slide.shapes.add_picture(background_image_path, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    textbox_first = slide.shapes.add_textbox(Cm(1.21), Cm(0.42), Cm(25), Cm(1.54))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Cluster - Média de Receita"
-    font_first = run_first.font
-    font_first.size = Pt(30)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)
-
-    line_shape = slide.shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(-0.01), Cm(2.1), Cm(14.23), Cm(2.1))
-    line_shape.line.color.rgb = RGBColor(49, 87, 247)
-    line_shape.line.width = Pt(3)
-
-    logo_path = 'resources/Imagens Template Relatório Mensal/image1.png'
-    slide.shapes.add_picture(logo_path, Cm(0.53), Cm(0.77), width=Cm(0.63), height=Cm(0.83))
-
-    textbox_third = slide.shapes.add_textbox(Cm(1.21), Cm(2.89), Cm(11), Cm(15))
-    text_frame_third = textbox_third.text_frame
-    text_frame_third.word_wrap = True
-    p_third = text_frame_third.paragraphs[0]
-    run_third = p_third.add_run()
-    
-    # [NOVO] Pega o texto do dicionário.
-    run_third.text = textos_extraidos[4]
-    
-    font_third = run_third.font
-    font_third.size = Pt(14)
-    font_third.name = 'DM Sans'
-    font_third.color.rgb = RGBColor(0, 0, 0)
-
-    # Adicionar a imagem
-    
-    image_path = f'{graficos_path}grafico_media_receita_{artista}.png'
-    slide.shapes.add_picture(image_path, Cm(12.49), Cm(3.62), width=Cm(21.4), height=Cm(12.28))
-
-
-    #SLIDE DUVIDAS ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-
-    slide_layout = prs.slide_layouts[5]  # Escolhendo um layout de slide em branco
-    slide = prs.slides.add_slide(slide_layout)
-
-    # Caminho para a imagem de fundo do novo slide
-    background_image_path_1 = 'resources/Imagens Template Relatório Mensal/image31.png'
-
-    # Adicionar a imagem de fundo do novo slide
-    slide.shapes.add_picture(background_image_path_1, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    # Adicionar a primeira caixa de texto do novo slide
-    textbox_first = slide.shapes.add_textbox(Cm(8.54), Cm(7.26), Cm(16.83), Cm(4.53))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Dúvidas?"
-    font_first = run_first.font
-    font_first.size = Pt(100)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(49, 87, 247)  # Cor do texto em azul escuro
-
-    #SLIDE OBRIGADO ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-
-    slide_layout = prs.slide_layouts[5]  # Escolhendo um layout de slide em branco
-    slide = prs.slides.add_slide(slide_layout)
-
-    # Caminho para a imagem de fundo do novo slide
-    background_image_path_1 = 'resources/Imagens Template Relatório Mensal/image32.png'
-
-    # Adicionar a imagem de fundo do novo slide
-    slide.shapes.add_picture(background_image_path_1, 0, 0, width=prs.slide_width, height=prs.slide_height)
-
-    # Adicionar a imagem
-    image_path = 'resources/Imagens Template Relatório Mensal/image3.png'
-    slide.shapes.add_picture(image_path, Cm(1.42), Cm(1.21), width=Cm(2.89), height=Cm(2.06))
-    
-    # Adicionar a primeira caixa de texto do novo slide
-    textbox_first = slide.shapes.add_textbox(Cm(0.98), Cm(7.8), Cm(26.39), Cm(4.53))
-    text_frame_first = textbox_first.text_frame
-    p_first = text_frame_first.paragraphs[0]
-    run_first = p_first.add_run()
-    run_first.text = "Obrigada!"
-    font_first = run_first.font
-    font_first.size = Pt(50)
-    font_first.bold = True
-    font_first.name = 'DM Sans'
-    font_first.color.rgb = RGBColor(255, 255, 255)  # Cor do texto em branco
-
-    # Adicionar a segunda caixa de texto do novo slide
-    textbox_second = slide.shapes.add_textbox(Cm(1.95), Cm(14.45), Cm(14.34), Cm(1.95))
-    text_frame_second = textbox_second.text_frame
-    text_frame_second.word_wrap = True
-    p_second = text_frame_second.paragraphs[0]
-    run_second = p_second.add_run()
-    run_second.text = "@1bigmedia\n" + "facebook/onebigmedia\n" + "youtube.com/onebigmedia\n"
-    font_second = run_second.font
-    font_second.size = Pt(14)
-    font_second.bold = True
-    font_second.name = 'DM Sans'
-    font_second.color.rgb = RGBColor(255, 255, 255)  # Cor do texto em branco
-    p_second.line_spacing = Pt(26.6)
-
-    insta_path = f'resources/Imagens Template Relatório Mensal/image34.png'
-    slide.shapes.add_picture(insta_path, Cm(1.42), Cm(14.88), width=Cm(0.67), height=Cm(0.67))
-
-    facebook_path = f'resources/Imagens Template Relatório Mensal/image28.png'
-    slide.shapes.add_picture(facebook_path, Cm(1.42), Cm(15.79), width=Cm(0.67), height=Cm(0.67))
-
-    youtube_path = f'resources/Imagens Template Relatório Mensal/image30.png'
-    slide.shapes.add_picture(youtube_path, Cm(1.37), Cm(16.65), width=Cm(0.77), height=Cm(0.74))
-
-
-    # Salvar a apresentação
-    prs.save(f'export_teste/Overview Mensal {mes_foco} {artist}.pptx')
+    contexto = {'artista': artista, 'artist': artist, 'mes_foco': mes_foco, 'textos': textos_extraidos, 'graficos': graficos_path}
+    construir_apresentacao(SLIDES, contexto, 'export_teste/Overview Mensal {mes_foco} {artist}.pptx')
 
 
 # (Certifique-se de que 'import sys' está no topo)
@@ -1418,19 +260,17 @@ def run(artista_para_processar_tupla): # <-- MUDANÇA: Recebe a tupla (nome_arqu
 
     mes_foco = "Setembro 2025" # Mantenha ou ajuste conforme necessário
 
-    # Caminho para o arquivo .txt (verifique se este caminho ainda é o correto)
-    caminho_docx = rf'C:\Users\samuj\OneDrive\Área de Trabalho\1bmg\projeto_cluster_API\relatorios_api/{artista_arquivo}/exports/analise_narrativa_{artista_arquivo}.txt'
-    # Caminho para os gráficos (verifique se este caminho ainda é o correto)
-    graficos_path = rf'C:\Users\samuj\OneDrive\Área de Trabalho\1bmg\projeto_cluster_API\relatorios_api/{artista_arquivo}/exports/' # Ajuste se necessário
+    # Narrativa e gráficos do cluster ficam em <pasta das narrativas>/<artista>/exports (main.py --pasta-narrativas)
+    graficos_path = narrativas.pasta_exports(artista_arquivo)
 
     print(f"Gerando apresentação 'cluster' para: {artista_display}")
     
     try:
         # A lógica interna da sua função run original vai aqui,
         # usando 'artista_arquivo' para caminhos e 'artista_display' para textos na apresentação
-        textos_extraidos = extrair_conteudo_markdown(caminho_docx)
+        textos_extraidos = narrativas.textos_do_artista(artista_arquivo)
         if not textos_extraidos:
-             print(f"AVISO: Não foi possível extrair textos do markdown para {artista_arquivo}. Verifique o arquivo: {caminho_docx}")
+             print(f"AVISO: Não foi possível extrair textos da narrativa para {artista_arquivo}. Verifique a pasta: {graficos_path}")
              # Decide se quer continuar sem os textos ou parar
              # return # Descomente para parar se os textos forem essenciais
              textos_extraidos = ["Texto não encontrado"] * 5 # Ou use placeholders
@@ -0,0 +1,219 @@
+import os
+import sys
+import glob
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+
+import metricas_etapas
+
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+# Armazém colunar por canal: uma tabela Feather (sem compressão, para permitir memory-map)
+# para cada CSV de dados_full/{artista}/, já com os tipos convertidos.
+PASTA_ARMAZEM = 'armazem'
+
+COLUNA_MES = 'Data'
+COLUNAS_DURACAO = ['Duração média da visualização']
+COLUNAS_PUBLICACAO = ['Horário de publicação do vídeo', 'Horário de publicação da postagem']
+
+# Abas da tabela 4.1 entregues pelo report à etapa de gráficos
+ABAS_TABELA_4_1 = ['Resultado', 'Desvio', 'Mês Anterior']
+
+# Leituras simultâneas dos arquivos mensais; o Feather e o parser de CSV liberam o GIL
+MAX_LEITURAS_PARALELAS = 8
+
+
+def caminho_csv(artista, nome_tabela):
+    return f'dados_full/{artista}/{nome_tabela}.csv'
+
+
+def caminho_tabela(artista, nome_tabela):
+    return f'dados_full/{artista}/{PASTA_ARMAZEM}/{nome_tabela}.feather'
+
+
+def caminho_tabela_4_1(artista):
+    return f'dados_full/{artista}/{PASTA_ARMAZEM}/tabela_4.1.pkl'
+
+
+def caminho_excel_4_1(artista):
+    return f'exports_tabelas/tabela_4.1_{artista}.xlsx'
+
+
+def converter_meses(coluna: pd.Series) -> pd.Series:
+    """
+    Converte a coluna 'Data' para período mensal. A linha 'Total' dos exports vira NaT,
+    mantendo a mesma posição da linha no CSV.
+    """
+    datas = pd.to_datetime(coluna, format='%Y-%m', errors='coerce')
+    faltantes = datas.isna() & coluna.notna()
+    if faltantes.any():
+        datas[faltantes] = pd.to_datetime(coluna[faltantes], format='%Y-%m-%d', errors='coerce')
+    return datas.dt.to_period('M')
+
+
+def tipar_tabela(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aplica os tipos do armazém: meses como período, durações em segundos,
+    porcentagens como float e horários de publicação como datetime.
+    """
+    df = df.copy()
+    if COLUNA_MES in df.columns and not pd.api.types.is_numeric_dtype(df[COLUNA_MES]):
+        df[COLUNA_MES] = converter_meses(df[COLUNA_MES])
+
+    for coluna in COLUNAS_DURACAO:
+        if coluna in df.columns and not pd.api.types.is_numeric_dtype(df[coluna]):
+            df[coluna] = pd.to_timedelta(df[coluna], errors='coerce').dt.total_seconds()
+
+    for coluna in df.columns:
+        if coluna.endswith('(%)'):
+            df[coluna] = pd.to_numeric(df[coluna], errors='coerce').astype(float)
+
+    for coluna in COLUNAS_PUBLICACAO:
+        if coluna in df.columns:
+            df[coluna] = pd.to_datetime(df[coluna], format='%b %d, %Y', errors='coerce')
+    return df
+
+
+def gravar_armazem(artista):
+    """
+    Lê uma única vez os CSVs tratados do artista e grava a versão tipada de cada um no armazém.
+    Deve ser chamado ao final do tratamento, que é a última etapa a reescrever os CSVs.
+    """
+    if feather is None:
+        print("Aviso: pyarrow não instalado. O armazém colunar não será gravado e as etapas seguintes lerão os CSVs.")
+        return
+
+    pasta = f'dados_full/{artista}/{PASTA_ARMAZEM}'
+    os.makedirs(pasta, exist_ok=True)
+    for arquivo in sorted(glob.glob(f'dados_full/{artista}/*.csv')):
+        nome_tabela = os.path.splitext(os.path.basename(arquivo))[0]
+        try:
+            df = tipar_tabela(pd.read_csv(arquivo))
+        except pd.errors.EmptyDataError:
+            continue
+        destino = caminho_tabela(artista, nome_tabela)
+        temporario = destino + '.tmp'
+        feather.write_feather(df, temporario, compression='uncompressed')
+        os.replace(temporario, destino)
+        # O pyarrow grava em C++, fora do open do Python que o metricas_etapas acompanha
+        metricas_etapas.anotar_arquivo(destino, gravado=True)
+
+
+def armazem_atualizado(artista, nome_tabela):
+    """O armazém só é usado se não houver CSV mais novo que ele (ex.: CSV editado à mão)."""
+    destino = caminho_tabela(artista, nome_tabela)
+    if feather is None or not os.path.exists(destino):
+        return False
+    origem = caminho_csv(artista, nome_tabela)
+    return not os.path.exists(origem) or os.path.getmtime(origem) <= os.path.getmtime(destino)
+
+
+def ler_tabela(artista, nome_tabela) -> pd.DataFrame:
+    """
+    Retorna a tabela tipada do artista. Lê do armazém via memory-map quando ele está atualizado;
+    caso contrário, cai para o CSV e aplica os mesmos tipos.
+    """
+    if armazem_atualizado(artista, nome_tabela):
+        caminho = caminho_tabela(artista, nome_tabela)
+        metricas_etapas.anotar_arquivo(caminho)
+        return feather.read_table(caminho, memory_map=True).to_pandas()
+    return tipar_tabela(pd.read_csv(caminho_csv(artista, nome_tabela)))
+
+
+def ler_tabelas_mensais(artista, tipos, quantidade_arquivos) -> pd.DataFrame:
+    """
+    Lê numa única chamada os arquivos mensais {tipo}_01..{tipo}_NN de todos os tipos
+    (ex.: videos, lives e shorts), em paralelo. Arquivos que não existem são ignorados.
+
+    Retorna um único DataFrame com as linhas de todos os arquivos, na ordem tipo -> arquivo,
+    precedidas das colunas 'Tipo' e 'Arquivo' (número do arquivo, de 1 a quantidade_arquivos).
+    Os tipos já vêm do armazém: 'Data' como período e durações em segundos.
+    """
+    chaves = [
+        (tipo, numero) for tipo in tipos for numero in range(1, quantidade_arquivos + 1)
+        if os.path.exists(caminho_csv(artista, f'{tipo}_{numero:02d}'))
+    ]
+    if not chaves:
+        return pd.DataFrame()
+
+    with ThreadPoolExecutor(max_workers=min(MAX_LEITURAS_PARALELAS, len(chaves))) as executor:
+        tabelas = list(executor.map(lambda chave: ler_tabela(artista, f'{chave[0]}_{chave[1]:02d}'), chaves))
+
+    mensais = pd.concat(tabelas, keys=chaves, names=['Tipo', 'Arquivo'])
+    return mensais.reset_index(level=['Tipo', 'Arquivo']).reset_index(drop=True)
+
+
+def separar_tipo(mensais: pd.DataFrame, tipo) -> pd.DataFrame:
+    """
+    Linhas de um tipo de ler_tabelas_mensais, sem a coluna 'Tipo' e sem as colunas que só
+    existem nos arquivos de outros tipos. Vazio se o tipo não tiver nenhum arquivo.
+    """
+    if mensais.empty:
+        return pd.DataFrame()
+    linhas = mensais[mensais['Tipo'] == tipo]
+    if linhas.empty:
+        return pd.DataFrame()
+    return linhas.drop(columns='Tipo').dropna(axis=1, how='all').reset_index(drop=True)
+
+
+def gravar_tabela_4_1(artista, abas: dict):
+    """
+    Grava as abas da tabela 4.1 para a etapa de gráficos, no mesmo layout em que seriam lidas
+    do Excel (métrica na primeira coluna, cabeçalhos como texto), mas com os tipos e valores
+    exatos do report. Deve ser chamado logo depois de gravar o xlsx, que segue como entrega.
+    """
+    layout = {}
+    for nome_aba, df in abas.items():
+        df = df.reset_index()
+        if abas[nome_aba].index.name is None:
+            df = df.rename(columns={'index': 'Unnamed: 0'})
+        df.columns = [str(coluna) for coluna in df.columns]
+        layout[nome_aba] = df
+
+    destino = caminho_tabela_4_1(artista)
+    os.makedirs(os.path.dirname(destino), exist_ok=True)
+    temporario = destino + '.tmp'
+    pd.to_pickle(layout, temporario)
+    os.replace(temporario, destino)
+
+
+def carregar_tabela_4_1(artista) -> dict:
+    """
+    Carrega de uma vez as abas da tabela 4.1 (aba -> DataFrame). Usa o arquivo gravado pelo report;
+    se ele não existir ou o xlsx for mais novo (ex.: editado à mão), lê todas as abas do xlsx numa única leitura.
+    """
+    destino = caminho_tabela_4_1(artista)
+    excel = caminho_excel_4_1(artista)
+    if os.path.exists(destino) and (not os.path.exists(excel) or os.path.getmtime(excel) <= os.path.getmtime(destino)):
+        return pd.read_pickle(destino)
+    return pd.read_excel(excel, sheet_name=ABAS_TABELA_4_1)
+
+
+def remover_linha_total(df: pd.DataFrame) -> pd.DataFrame:
+    """Remove a linha 'Total' dos exports (primeira linha, com mês NaT no armazém)."""
+    if not df.empty and COLUNA_MES in df.columns and pd.isna(df[COLUNA_MES].iloc[0]):
+        return df.drop(df.index[0])
+    return df
+
+
+def exportar_csv_debug(artista):
+    """Despeja as tabelas tipadas do armazém em dados_full/{artista}/armazem/csv/ para conferência."""
+    pasta = f'dados_full/{artista}/{PASTA_ARMAZEM}/csv'
+    os.makedirs(pasta, exist_ok=True)
+    for arquivo in sorted(glob.glob(f'dados_full/{artista}/{PASTA_ARMAZEM}/*.feather')):
+        nome_tabela = os.path.splitext(os.path.basename(arquivo))[0]
+        ler_tabela(artista, nome_tabela).to_csv(f'{pasta}/{nome_tabela}.csv', index=False)
+
+
+if __name__ == '__main__':
+    # Uso: python armazem_canal.py <artista> [--csv]
+    if len(sys.argv) < 2:
+        print("Erro: Nenhum artista fornecido.")
+        sys.exit(1)
+
+    gravar_armazem(sys.argv[1])
+    if '--csv' in sys.argv[2:]:
+        exportar_csv_debug(sys.argv[1])
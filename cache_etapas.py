@@ -0,0 +1,247 @@
+import os
+import ast
+import glob
+import json
+import hashlib
+
+import perfil_render
+import narrativas
+
+# Arquivo de estado gravado dentro da pasta de cada artista (um por canal, seguro para os workers)
+NOME_ARQUIVO_ESTADO = '.estado_etapas.json'
+
+# Entradas lidas por cada grupo. Os grupos formam uma cadeia (1 -> 2 -> 3 -> 4 -> 5):
+# se um grupo precisa rodar, todos os seguintes rodam também.
+ENTRADAS_POR_GRUPO = {
+    'grupo_1_extracao': ['dados_full/{artista}/raw_data/*.zip'],
+    'grupo_2_tratamento': ['dados_full/{artista}/*.csv'],
+    'grupo_3_report': ['dados_full/{artista}/*.csv', 'dados_full/{artista}/armazem/*.feather', 'dados_full/{artista}/sub.txt'],
+    'grupo_4_graficos': ['exports_tabelas/tabela_4.1_{artista}.xlsx', 'dados_full/{artista}/armazem/tabela_4.1.pkl', 'dados_full/{artista}/*.csv', 'dados_full/{artista}/armazem/*.feather', 'dados_full/{artista}/sub.txt'],
+    'grupo_5_apresentacao': [
+        'dados_full/{artista}/plots/*.png', 'comparacoes.json',
+        # Dados dos gráficos nativos (--graficos-nativos)
+        'dados_full/{artista}/armazem/tabela_4.1.pkl', 'dados_full/{artista}/armazem/origem_*.feather',
+    ],
+}
+
+# Grupos cuja saída depende do perfil de renderização (--perfil-render): trocar o perfil refaz esses grupos
+GRUPOS_COM_PERFIL_RENDER = {'grupo_4_graficos', 'grupo_5_apresentacao'}
+
+# Saídas que precisam existir para que uma etapa possa ser considerada atualizada
+SAIDAS_POR_GRUPO = {
+    'grupo_1_extracao': ['dados_full/{artista}/*.csv'],
+    'grupo_3_report': ['exports_tabelas/tabela_4.1_{artista}.xlsx'],
+    'grupo_4_graficos': ['dados_full/{artista}/plots/*.png'],
+}
+
+# PNGs que cada script de gráficos grava em dados_full/{artista}/plots: a etapa só está atualizada com todos
+# eles presentes. Scripts fora desta lista caem no SAIDAS_POR_GRUPO (qualquer PNG).
+GRAFICOS_POR_SCRIPT = {
+    'gerar_graficos.py': [
+        '1 - Métricas_VOD_Avancada.png', '2 - Métricas_Lives_Avancada.png', '3 - Métricas_Shorts_Avancada.png',
+        '4a - Card_VISUALIZAÇÕES_v2.png', '4b - Card_RECEITA_v2.png', '4c - Card_INSCRITOS_v2.png',
+        '4d - Card_RPM_v2.png', '4e - Card_IMPRESSÕES_v2.png', '4f - Card_WATCHTIME_(HORAS)_v2.png',
+        '5 - Publicados.png', '6 - Análise_Inicial.png', '7 - Watchtime.png', '8 - Monetizacao_v2.png',
+        '9 - Monetização por formatos.png', '10 - Conversao.png', '11 - Qualidade_Vod.png', '12 - Qualidade_Live.png',
+        '12.5 - Qualidade_Shorts.png', '13 - Origem_do_trafego.png', '14 - Inscricoes_por_Tipo_de_Conteudo.png',
+        '15 - Engajamento_Vod.png', '16 - Engajamento_Live.png', '16.5 - Engajamento_Shorts.png',
+        '17 - Comunidade.png', '18 - Tabela de Inscritos.png', '19 - Views_Novo_vs_Velho.png',
+    ],
+    'gerar_graficos_ingles.py': [
+        '1 - Metrics_VOD_Advanced.png', '2 - Metrics_Lives_Advanced.png', '3 - Metrics_Shorts_Advanced.png',
+        '4a - Card_VIEWS_v2.png', '4b - Card_REVENUE_v2.png', '4c - Card_SUBSCRIBERS_v2.png',
+        '4d - Card_RPM_v2.png', '4e - Card_IMPRESSIONS_v2.png', '4f - Card_WATCHTIME_(HOURS)_v2.png',
+        '5 - Published.png', '6 - Initial_Analysis.png', '7 - Watchtime.png', '8 - Monetization_v2.png',
+        '9 - Monetization by formats.png', '10 - Conversion.png', '11 - Quality_Vod.png', '12 - Quality_Live.png',
+        '12.5 - Quality_Shorts.png', '13 - Traffic_Source.png', '14 - Subscribers_by_Content_Type.png',
+        '15 - Engagement_Vod.png', '16 - Engagement_Live.png', '16.5 - Engagement_Shorts.png',
+        '17 - Community.png', '18 - Subscribers Table.png', '19 - Views_New_vs_Old.png',
+    ],
+}
+
+# Deck gravado por cada tipo de apresentação (o mesmo teste 'tipo in script' do main.py), antes do sufixo
+# do perfil: {nome} é o nome de display do artista (comparacoes.json) e o mês fica em aberto
+DECKS_POR_APRESENTACAO = {
+    'report': 'export_teste/Report Mensal * [0-9][0-9][0-9][0-9] {nome}.pptx',
+    'cluster': 'export_teste/Overview Mensal * [0-9][0-9][0-9][0-9] {nome}.pptx',
+    'midias': 'export_teste/Overview Mensal * [0-9][0-9][0-9][0-9] {nome}.pptx',
+}
+
+# Módulos do projeto importados por cada script, com o mtime do script quando foi lido
+_imports_em_cache = {}
+
+
+def caminho_estado(artista):
+    return f'dados_full/{artista}/{NOME_ARQUIVO_ESTADO}'
+
+
+def carregar_estado(artista):
+    """Lê o estado da última execução bem-sucedida de cada etapa do artista."""
+    try:
+        with open(caminho_estado(artista), 'r', encoding='utf-8') as f:
+            estado = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        estado = {}
+    estado.setdefault('etapas', {})
+    estado.setdefault('hashes', {})
+    return estado
+
+
+def salvar_estado(artista, estado):
+    caminho = caminho_estado(artista)
+    if not os.path.isdir(os.path.dirname(caminho)):
+        return
+    temporario = caminho + '.tmp'
+    with open(temporario, 'w', encoding='utf-8') as f:
+        json.dump(estado, f, ensure_ascii=False, indent=2)
+    os.replace(temporario, caminho)
+
+
+def hash_arquivo(caminho, estado):
+    """
+    Retorna o SHA-256 do arquivo. O hash fica guardado no estado junto com tamanho e mtime,
+    então arquivos que não mudaram desde a última execução não são lidos de novo.
+    """
+    info = os.stat(caminho)
+    chave = os.path.normpath(caminho)
+    em_cache = estado['hashes'].get(chave)
+    if em_cache and em_cache[0] == info.st_size and em_cache[1] == info.st_mtime_ns:
+        return em_cache[2]
+
+    sha = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(1024 * 1024), b''):
+            sha.update(bloco)
+    digest = sha.hexdigest()
+    estado['hashes'][chave] = [info.st_size, info.st_mtime_ns, digest]
+    return digest
+
+
+def expandir_padroes(padroes, artista):
+    arquivos = []
+    for padrao in padroes:
+        arquivos.extend(glob.glob(padrao.format(artista=artista)))
+    return sorted(set(os.path.normpath(a) for a in arquivos))
+
+
+def modulos_importados(caminho):
+    """Nomes importados (import x / from x import y) no arquivo, lidos uma vez enquanto ele não mudar."""
+    try:
+        mtime = os.stat(caminho).st_mtime_ns
+        em_cache = _imports_em_cache.get(caminho)
+        if em_cache and em_cache[0] == mtime:
+            return em_cache[1]
+        with open(caminho, 'rb') as f:
+            arvore = ast.parse(f.read())
+    except (OSError, SyntaxError, ValueError):
+        return []
+    nomes = []
+    for no in ast.walk(arvore):
+        if isinstance(no, ast.Import):
+            nomes.extend(alias.name.split('.')[0] for alias in no.names)
+        elif isinstance(no, ast.ImportFrom) and not no.level and no.module:
+            nomes.append(no.module.split('.')[0])
+    _imports_em_cache[caminho] = (mtime, nomes)
+    return nomes
+
+
+def modulos_do_projeto(script):
+    """
+    Arquivos .py do projeto (da pasta do script) que o script importa, direta ou indiretamente:
+    mudar um deles muda a saída da etapa tanto quanto mudar o próprio script.
+    """
+    pasta = os.path.dirname(script)
+    encontrados = {os.path.normpath(script)}
+    pendentes = [script]
+    while pendentes:
+        for nome in modulos_importados(pendentes.pop()):
+            caminho = os.path.normpath(os.path.join(pasta, nome + '.py'))
+            if caminho not in encontrados and os.path.isfile(caminho):
+                encontrados.add(caminho)
+                pendentes.append(caminho)
+    encontrados.discard(os.path.normpath(script))
+    return sorted(encontrados)
+
+
+def calcular_fingerprint(script, grupo, artista, config_artista, estado):
+    """
+    Combina o hash do próprio script e dos módulos do projeto que ele importa, a entrada do artista no config.json, o perfil de renderização
+    (só nos grupos que dependem dele), a escolha dos gráficos nativos e o dpi das imagens nas apresentações e o
+    conteúdo de todos os arquivos de entrada do grupo em uma única impressão digital.
+    """
+    sha = hashlib.sha256()
+    sha.update(script.encode('utf-8'))
+    if os.path.exists(script):
+        sha.update(hash_arquivo(script, estado).encode('utf-8'))
+    for modulo in modulos_do_projeto(script):
+        sha.update(modulo.encode('utf-8'))
+        sha.update(hash_arquivo(modulo, estado).encode('utf-8'))
+    sha.update(json.dumps(config_artista, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+    if grupo in GRUPOS_COM_PERFIL_RENDER:
+        sha.update(perfil_render.nome_perfil().encode('utf-8'))
+    if grupo == 'grupo_5_apresentacao':
+        sha.update(str(perfil_render.graficos_nativos()).encode('utf-8'))
+        sha.update(str(perfil_render.dpi_apresentacao()).encode('utf-8'))
+    arquivos = expandir_padroes(ENTRADAS_POR_GRUPO.get(grupo, []), artista)
+    if grupo == 'grupo_5_apresentacao':
+        # Narrativas e gráficos do cluster, fora da árvore do projeto (--pasta-narrativas)
+        arquivos += narrativas.arquivos_de_entrada(artista)
+    for arquivo in arquivos:
+        if os.path.basename(arquivo) == NOME_ARQUIVO_ESTADO:
+            continue
+        sha.update(arquivo.encode('utf-8'))
+        sha.update(hash_arquivo(arquivo, estado).encode('utf-8'))
+    return sha.hexdigest()
+
+
+def nome_display(artista):
+    """Nome do artista nos decks, lido do comparacoes.json como os scripts de apresentação fazem."""
+    try:
+        with open('comparacoes.json', encoding='latin-1') as json_file:
+            return json.load(json_file).get(artista, artista)
+    except (OSError, ValueError):
+        return artista
+
+
+def padrao_deck(script, artista):
+    """Padrão (glob) do .pptx que a apresentação script grava para o artista, ou None se o tipo não é conhecido."""
+    for tipo, padrao in DECKS_POR_APRESENTACAO.items():
+        if tipo in os.path.basename(script):
+            return perfil_render.caminho_apresentacao(padrao.format(nome=glob.escape(nome_display(artista))))
+    return None
+
+
+def saidas_presentes(script, grupo, artista, registro):
+    graficos = GRAFICOS_POR_SCRIPT.get(os.path.basename(script)) if grupo == 'grupo_4_graficos' else None
+    if graficos is not None:
+        return all(os.path.exists(f'dados_full/{artista}/plots/{nome}') for nome in graficos)
+    if grupo == 'grupo_5_apresentacao' and padrao_deck(script, artista):
+        # O deck que a última execução bem-sucedida gravou
+        return bool(registro.get('deck')) and os.path.exists(registro['deck'])
+    for padrao in SAIDAS_POR_GRUPO.get(grupo, []):
+        if not glob.glob(padrao.format(artista=artista)):
+            return False
+    return True
+
+
+def etapa_atualizada(script, grupo, artista, config_artista, estado):
+    """True quando as entradas não mudaram desde a última execução bem-sucedida da etapa."""
+    registro = estado['etapas'].get(f'{grupo}:{script}')
+    if not registro or not saidas_presentes(script, grupo, artista, registro):
+        return False
+    return registro.get('fingerprint') == calcular_fingerprint(script, grupo, artista, config_artista, estado)
+
+
+def registrar_sucesso(script, grupo, artista, config_artista, estado):
+    """
+    Grava a impressão digital calculada DEPOIS da execução: etapas como o tratamento
+    reescrevem os próprios CSVs de entrada, e é esse estado final que a próxima execução vai encontrar.
+    Nas apresentações, guarda também o deck mais recente do artista, que precisa continuar existindo.
+    """
+    registro = {'fingerprint': calcular_fingerprint(script, grupo, artista, config_artista, estado)}
+    padrao = padrao_deck(script, artista) if grupo == 'grupo_5_apresentacao' else None
+    if padrao:
+        decks = glob.glob(padrao)
+        registro['deck'] = os.path.normpath(max(decks, key=os.path.getmtime)) if decks else None
+    estado['etapas'][f'{grupo}:{script}'] = registro
+    salvar_estado(artista, estado)
@@ -0,0 +1,157 @@
+from functools import lru_cache
+
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+# Renderizador dos cards de big number (4a-4f) direto com Pillow: o card só tem texto,
+# retângulos arredondados e badges de variação, então não precisa de uma figura do matplotlib.
+# As coordenadas dos configs (value_x_pos etc.) continuam sendo frações da área do card,
+# como no eixo do matplotlib que ele substitui.
+
+FONTE_NEGRITO = 'resources/Fonts/DMSans-Bold.ttf'
+FONTE_REGULAR = 'resources/Fonts/DMSans-Regular.ttf'
+
+BRAND_COLORS = {
+    'azulEscuro': "#142544", 'azulPrimario': "#3157F7", 'roxo': "#8140FA",
+    'amareloMarcaTexto': "#E2FC51", 'branco': "#FFFFFF", 'cinzaClaro': "#E8E8E9",
+    'positive_text': '#16a34a', 'positive_bg': '#f0fdf4',
+    'negative_text': '#dc2626', 'negative_bg': '#fef2f2',
+}
+COR_BORDA_CARD = '#e5e7eb'
+
+# Mesma geometria da figura antiga: 5x5 polegadas, eixo nas margens padrão do matplotlib
+# (esquerda 0.125, direita 0.9, base 0.11, topo 0.88) e 0.1 polegada de folga no recorte justo
+TAMANHO_FIGURA_POL = 5
+MARGENS_EIXO = {'esquerda': 0.125, 'direita': 0.9, 'base': 0.11, 'topo': 0.88}
+FOLGA_RECORTE_POL = 0.1
+
+# Tamanhos em pontos, como eram passados ao matplotlib
+TAMANHO_TITULO = 18
+TAMANHO_VALOR_PRINCIPAL = 40
+TAMANHO_LINHA = 14
+TAMANHO_BADGE = 10
+
+# Fator de superamostragem dos cantos arredondados
+SUPERAMOSTRAGEM = 4
+
+
+@lru_cache(maxsize=None)
+def carregar_fonte(caminho, tamanho_px):
+    return ImageFont.truetype(caminho, tamanho_px)
+
+
+def misturar(cor, fundo, alpha):
+    """Cor com transparência aplicada sobre um fundo opaco (os badges ficam sempre sobre o card branco)."""
+    frente, atras = ImageColor.getrgb(cor), ImageColor.getrgb(fundo)
+    return tuple(round(alpha * f + (1 - alpha) * a) for f, a in zip(frente, atras)) + (255,)
+
+
+def retangulo_arredondado(imagem, caixa, raio, preenchimento, contorno, largura):
+    """
+    Retângulo arredondado com cantos suavizados. O Pillow desenha sem antialiasing, então só os quatro
+    cantos são redesenhados em resolução maior e reduzidos; o resto do retângulo não precisa disso.
+    """
+    x0, y0, x1, y1 = (round(v) for v in caixa)
+    raio = round(raio)
+    ImageDraw.Draw(imagem).rounded_rectangle([x0, y0, x1, y1], radius=raio, fill=preenchimento, outline=contorno, width=largura)
+
+    s = SUPERAMOSTRAGEM
+    lado = raio + largura + 1
+    for canto_x, canto_y in ((x0, y0), (x1 + 1 - lado, y0), (x0, y1 + 1 - lado), (x1 + 1 - lado, y1 + 1 - lado)):
+        recorte = (canto_x, canto_y, canto_x + lado, canto_y + lado)
+        ladrilho = imagem.crop(recorte).resize((lado * s, lado * s), Image.NEAREST)
+        ImageDraw.Draw(ladrilho).rounded_rectangle(
+            [(x0 - canto_x) * s, (y0 - canto_y) * s, (x1 + 1 - canto_x) * s - 1, (y1 + 1 - canto_y) * s - 1],
+            radius=raio * s, fill=preenchimento, outline=contorno, width=largura * s,
+        )
+        imagem.paste(ladrilho.reduce(s), recorte[:2])
+
+
+def cores_variante(variant):
+    if variant == 'primary':
+        return BRAND_COLORS['azulPrimario'], BRAND_COLORS['azulPrimario']
+    if variant == 'secondary':
+        return BRAND_COLORS['roxo'], BRAND_COLORS['roxo']
+    if variant == 'accent':
+        return BRAND_COLORS['amareloMarcaTexto'], BRAND_COLORS['azulEscuro']
+    return BRAND_COLORS['azulEscuro'], BRAND_COLORS['azulEscuro']
+
+
+def criar_big_number_card(config, output_filename, dpi=300, recortar=True, pil_kwargs=None):
+    """
+    Desenha um card de métrica e grava o PNG (fundo transparente).
+
+    config usa as mesmas chaves de antes: title, mainValue, variant e breakdown, uma lista de
+    itens com label, value e, opcionalmente, value_x_pos (padrão 0.35), change e changeType
+    ('positive' ou 'negative'). Com recortar=True o PNG é cortado na área do card mais a folga,
+    como o bbox_inches='tight' fazia; senão, sai com a figura inteira.
+    """
+    px_por_ponto = dpi / 72
+    lado_figura = TAMANHO_FIGURA_POL * dpi
+    largura_eixo = (MARGENS_EIXO['direita'] - MARGENS_EIXO['esquerda']) * lado_figura
+    altura_eixo = (MARGENS_EIXO['topo'] - MARGENS_EIXO['base']) * lado_figura
+    if recortar:
+        folga = FOLGA_RECORTE_POL * dpi
+        origem_x, origem_y = folga, folga
+        tamanho = (round(largura_eixo + 2 * folga), round(altura_eixo + 2 * folga))
+    else:
+        origem_x = MARGENS_EIXO['esquerda'] * lado_figura
+        origem_y = (1 - MARGENS_EIXO['topo']) * lado_figura
+        tamanho = (round(lado_figura), round(lado_figura))
+
+    def ponto(x, y):
+        """Coordenada do card (0-1, y para cima) em pixels da imagem."""
+        return origem_x + x * largura_eixo, origem_y + (1 - y) * altura_eixo
+
+    def fonte(caminho, tamanho_pt):
+        return carregar_fonte(caminho, round(tamanho_pt * px_por_ponto))
+
+    accent_color, title_color = cores_variante(config.get('variant', 'default'))
+    negrito_linha, regular_linha = fonte(FONTE_NEGRITO, TAMANHO_LINHA), fonte(FONTE_REGULAR, TAMANHO_LINHA)
+    negrito_badge = fonte(FONTE_NEGRITO, TAMANHO_BADGE)
+
+    # Textos e badges de cada linha do detalhamento
+    textos, badges = [], []
+    y_pos = 0.48
+    for item in config['breakdown']:
+        textos.append((ponto(0.15, y_pos), f"{item['label']}:", regular_linha, BRAND_COLORS['azulEscuro'], 'lm'))
+        textos.append((ponto(item.get('value_x_pos', 0.35), y_pos), item['value'], negrito_linha, BRAND_COLORS['azulPrimario'], 'lm'))
+        if 'change' in item:
+            is_positive = item['changeType'] == 'positive'
+            cor_texto = BRAND_COLORS['positive_text'] if is_positive else BRAND_COLORS['negative_text']
+            cor_fundo = BRAND_COLORS['positive_bg'] if is_positive else BRAND_COLORS['negative_bg']
+            icon = '↑' if is_positive else '↓'
+            centro = ponto(0.85, y_pos)
+            texto_badge = f"{icon} {item['change']}"
+            textos.append((centro, texto_badge, negrito_badge, cor_texto, 'mm'))
+            badges.append((centro, texto_badge, cor_texto, cor_fundo))
+        y_pos -= 0.12
+
+    # Formas: card, faixa de destaque por cima dos cantos superiores e badges
+    imagem = Image.new('RGBA', tamanho, (0, 0, 0, 0))
+    (x0, y0), (x1, y1) = ponto(0.05, 0.95), ponto(0.95, 0.05)
+    retangulo_arredondado(
+        imagem, (x0, y0, x1, y1), 0.04 * largura_eixo, BRAND_COLORS['branco'],
+        COR_BORDA_CARD, max(1, round(1.0 * px_por_ponto)),
+    )
+    (fx0, fy0), (fx1, fy1) = ponto(0.05, 0.95), ponto(0.95, 0.91)
+    ImageDraw.Draw(imagem).rectangle([round(fx0), round(fy0), round(fx1), round(fy1)], fill=accent_color)
+
+    subida, descida = negrito_badge.getmetrics()
+    folga_badge = 0.4 * TAMANHO_BADGE * px_por_ponto
+    for (cx, cy), texto_badge, cor_texto, cor_fundo in badges:
+        meia_largura = negrito_badge.getlength(texto_badge) / 2 + folga_badge
+        meia_altura = (subida + descida) / 2 + folga_badge
+        retangulo_arredondado(
+            imagem, (cx - meia_largura, cy - meia_altura, cx + meia_largura, cy + meia_altura), folga_badge,
+            misturar(cor_fundo, BRAND_COLORS['branco'], 0.7), misturar(cor_texto, BRAND_COLORS['branco'], 0.7),
+            max(1, round(0.5 * px_por_ponto)),
+        )
+
+    # Textos por cima, já suavizados pelo FreeType
+    desenho = ImageDraw.Draw(imagem)
+    desenho.text(ponto(0.5, 0.85), config['title'], font=fonte(FONTE_NEGRITO, TAMANHO_TITULO), fill=title_color, anchor='mm')
+    desenho.text(ponto(0.5, 0.70), config['mainValue'], font=fonte(FONTE_NEGRITO, TAMANHO_VALOR_PRINCIPAL), fill=BRAND_COLORS['azulEscuro'], anchor='mm')
+    for posicao, texto, fonte_texto, cor, ancora in textos:
+        desenho.text(posicao, texto, font=fonte_texto, fill=cor, anchor=ancora)
+
+    imagem.save(output_filename, format='png', dpi=(dpi, dpi), **(pil_kwargs or {}))
@@ -5,6 +5,8 @@ import zipfile
 import re
 from collections import Counter
 
+from ingestao_zip import extrair_membro_para
+
 # --- CONFIGURAÇÃO DE IDIOMAS E PALAVRAS-CHAVE ---
 # O script usará estas palavras para adivinhar o idioma dos arquivos.
 CONFIG = {
@@ -115,7 +117,6 @@ def identificar_arquivos_zip(artista):
     arquivos_processados = 0
     for arq_zip_path in arquivos_zip_path:
         nome_arq_zip = os.path.basename(arq_zip_path)
-        path_extracao = os.path.dirname(arq_zip_path)
         sucesso = False
 
         with zipfile.ZipFile(arq_zip_path, "r") as zip_ref:
@@ -126,28 +127,24 @@ def identificar_arquivos_zip(artista):
             if mes_antigo and nome_arq_zip.startswith(f"{date_keyword} {mes_antigo}"):
                 if sufixo in OLDEST_MONTH_MAP:
                     novo_nome = OLDEST_MONTH_MAP[sufixo]
-                    zip_ref.extractall(path_extracao)
-                    os.rename(os.path.join(path_extracao, cfg['table_data_name']), f"dados_full/{artista}/{novo_nome}")
+                    extrair_membro_para(zip_ref, cfg['table_data_name'], f"dados_full/{artista}/{novo_nome}")
                     sucesso = True
             
             # Mês recente
             elif mes_recente and nome_arq_zip.startswith(f"{date_keyword} {mes_recente}"):
                 if sufixo in NEWEST_MONTH_MAP:
                     novo_nome = NEWEST_MONTH_MAP[sufixo]
-                    zip_ref.extractall(path_extracao)
-                    os.rename(os.path.join(path_extracao, cfg['table_data_name']), f"dados_full/{artista}/{novo_nome}")
+                    extrair_membro_para(zip_ref, cfg['table_data_name'], f"dados_full/{artista}/{novo_nome}")
                     sucesso = True
 
             # Outros arquivos (usando as keywords do idioma detectado)
             elif nome_arq_zip.startswith(cfg['keywords'][1]): # Traffic/Origem/Fuente
                 novo_nome = 'origem_lives.csv' if nome_arq_zip.endswith('(1).zip') else 'origem_vods.csv'
-                zip_ref.extractall(path_extracao)
-                os.rename(os.path.join(path_extracao, cfg['chart_data_name']), f"dados_full/{artista}/{novo_nome}")
+                extrair_membro_para(zip_ref, cfg['chart_data_name'], f"dados_full/{artista}/{novo_nome}")
                 sucesso = True
 
             elif nome_arq_zip.startswith(cfg['keywords'][2]): # Post/Postar/Publicaci
-                zip_ref.extractall(path_extracao)
-                os.rename(os.path.join(path_extracao, cfg['table_data_name']), f"dados_full/{artista}/comunidade.csv")
+                extrair_membro_para(zip_ref, cfg['table_data_name'], f"dados_full/{artista}/comunidade.csv")
                 sucesso = True
 
         if sucesso:
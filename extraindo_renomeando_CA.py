@@ -4,6 +4,8 @@ import glob
 import zipfile
 import re
 
+from ingestao_zip import extrair_membro_para
+
 
 def remover_csv_antigos(artista):
     # (código idêntico ao anterior)
@@ -47,7 +49,6 @@ def identificar_arquivos_zip(artista):
 
     for arq_zip_path in arquivos_zip_path:
         nome_arq_zip = os.path.basename(arq_zip_path)
-        path_extracao = os.path.dirname(arq_zip_path)
         sucesso = False
 
         with zipfile.ZipFile(arq_zip_path, "r") as zip_ref:
@@ -61,39 +62,34 @@ def identificar_arquivos_zip(artista):
 
                 if chave_mes_arquivo in mapa_meses:
                     sufixo = mapa_meses[chave_mes_arquivo]
-                    zip_ref.extractall(path_extracao)
-                    
                     if nome_arq_zip.endswith('(1).zip'):
-                        os.rename(os.path.join(path_extracao, "Dados da tabela.csv"), f"dados_full/{artista}/lives{sufixo}.csv")
+                        extrair_membro_para(zip_ref, "Dados da tabela.csv", f"dados_full/{artista}/lives{sufixo}.csv")
                     elif nome_arq_zip.endswith('(2).zip'):
-                        os.rename(os.path.join(path_extracao, "Dados da tabela.csv"), f"dados_full/{artista}/shorts{sufixo}.csv")
+                        extrair_membro_para(zip_ref, "Dados da tabela.csv", f"dados_full/{artista}/shorts{sufixo}.csv")
                     else:
-                        os.rename(os.path.join(path_extracao, "Dados da tabela.csv"), f"dados_full/{artista}/videos{sufixo}.csv")
+                        extrair_membro_para(zip_ref, "Dados da tabela.csv", f"dados_full/{artista}/videos{sufixo}.csv")
                     sucesso = True
             
             # --- Bloco 2: Arquivos 'Data' (lógica dinâmica) ---
             elif prefixo_data and nome_arq_zip.startswith(prefixo_data):
-                zip_ref.extractall(path_extracao)
                 if nome_arq_zip.endswith('(1).zip'):
-                    os.rename(os.path.join(path_extracao, "Dados da tabela.csv"), f"dados_full/{artista}/videos.csv")
+                    extrair_membro_para(zip_ref, "Dados da tabela.csv", f"dados_full/{artista}/videos.csv")
                 elif nome_arq_zip.endswith('(2).zip'):
-                    os.rename(os.path.join(path_extracao, "Dados da tabela.csv"), f"dados_full/{artista}/lives.csv")
+                    extrair_membro_para(zip_ref, "Dados da tabela.csv", f"dados_full/{artista}/lives.csv")
                 elif nome_arq_zip.endswith('(3).zip'):
-                    os.rename(os.path.join(path_extracao, "Dados da tabela.csv"), f"dados_full/{artista}/shorts.csv")
+                    extrair_membro_para(zip_ref, "Dados da tabela.csv", f"dados_full/{artista}/shorts.csv")
                 else:
-                    os.rename(os.path.join(path_extracao, "Dados da tabela.csv"), f"dados_full/{artista}/total.csv")
+                    extrair_membro_para(zip_ref, "Dados da tabela.csv", f"dados_full/{artista}/total.csv")
                 sucesso = True
 
             # --- Bloco 3: Outros arquivos com nomes fixos ---
             elif nome_arq_zip.startswith('Origem'):
-                zip_ref.extractall(path_extracao)
                 nome_final = 'origem_lives.csv' if nome_arq_zip.endswith('(1).zip') else 'origem_vods.csv'
-                os.rename(os.path.join(path_extracao, "Dados do gráfico.csv"), f"dados_full/{artista}/{nome_final}")
+                extrair_membro_para(zip_ref, "Dados do gráfico.csv", f"dados_full/{artista}/{nome_final}")
                 sucesso = True
 
             elif nome_arq_zip.startswith('Postar'):
-                zip_ref.extractall(path_extracao)
-                os.rename(os.path.join(path_extracao, "Dados da tabela.csv"), f"dados_full/{artista}/comunidade.csv")
+                extrair_membro_para(zip_ref, "Dados da tabela.csv", f"dados_full/{artista}/comunidade.csv")
                 sucesso = True
         
         if sucesso:
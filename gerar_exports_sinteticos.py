@@ -0,0 +1,522 @@
+import os
+import io
+import sys
+import csv
+import glob
+import json
+import zipfile
+import argparse
+import contextlib
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import tratamento
+import tratamento_CA
+import extraindo_renomeando
+from extraindo_renomeando import CONFIG as CONFIG_IDIOMAS
+
+# Gera exports sintéticos do YouTube Studio (os .zip de raw_data/) para N canais, no mesmo layout que
+# as macros baixam, para medir o fluxo completo sem dados de clientes:
+#   - padrão: 4 relatórios "Data" do mês antigo + 18 do mês recente, 2 de origem do tráfego e 1 de postagens,
+#     com os nomes em português, inglês ou espanhol;
+#   - CA: relatórios "Data" e um "Conteúdo" por mês (vídeos, lives e shorts), só em português.
+# Os cabeçalhos das tabelas são sempre os do tratamento (em português), que é o que as etapas seguintes leem.
+# Também grava o sub.txt de cada canal e um config e um exports só com os canais gerados, em arquivos
+# separados (config_sintetico.json e exports_sintetico.txt): o config.json e o exports.txt do projeto
+# não são alterados. Para rodar o fluxo com eles, copie-os por cima dos originais em uma cópia do projeto.
+#
+# O run() do extraindo_renomeando.py não extrai os .zip (nos canais padrão, a extração é feita fora do
+# main.py), então, nos canais padrão, o gerador já extrai os CSVs com o identificar_arquivos_zip do próprio
+# extraindo_renomeando (--sem-extracao deixa só os .zip). Os canais CA são extraídos pela etapa 1 do main.py.
+#
+# Uso: python gerar_exports_sinteticos.py 200 --workers 8
+
+PREFIXO_PADRAO = 'sintetico'
+SEMENTE_PADRAO = 2025
+
+# Início do nome de cada .zip, por idioma: relatórios por data, origem do tráfego e postagens
+# (precisam começar com as palavras-chave do extraindo_renomeando)
+PREFIXOS_ZIP = {
+    'pt': ('Data', 'Origem do tráfego', 'Postar'),
+    'en': ('Date', 'Traffic source', 'Post'),
+    'es': ('Fecha', 'Fuente de tráfico', 'Publicación'),
+}
+NOME_TOTAIS = {'pt': 'Totais.csv', 'en': 'Totals.csv', 'es': 'Totales.csv'}
+
+TIPOS_CONTEUDO = ['videos', 'lives', 'shorts']
+# Ordem dos sufixos (1), (2)... nos relatórios do mês recente (ver NEWEST_MONTH_MAP) e no CA
+TIPOS_POR_SUFIXO_RECENTE = ['videos', 'lives', 'shorts']
+# Duração média assistida (s), tamanho médio do conteúdo (s) e RPM (USD) de cada tipo
+DURACAO_ASSISTIDA_S = {'videos': (90, 420), 'lives': (300, 1500), 'shorts': (12, 40)}
+TAMANHO_CONTEUDO_S = {'videos': (240, 1500), 'lives': (1800, 7200), 'shorts': (15, 59)}
+RPM_USD = {'videos': (0.6, 4.0), 'lives': (0.8, 5.0), 'shorts': (0.03, 0.25)}
+PUBLICACOES_MES = {'videos': (2, 30), 'lives': (0, 12), 'shorts': (0, 60)}
+
+ORIGENS = [
+    'Recursos de navegação', 'Vídeos sugeridos', 'Feed dos Shorts', 'Externa', 'Notificações',
+    'Pesquisa do YouTube', 'Playlists', 'Publicidade no YouTube', 'Páginas do canal',
+    'Direta ou desconhecida', 'Outros recursos do YouTube', 'Hashtags',
+]
+COLUNAS_COMUNIDADE = [
+    'ID da postagem', 'Texto da postagem', 'Horário de publicação da postagem', 'Impressões da postagem',
+    '"Gostei" da postagem', 'Respostas à postagem', 'Média de "Gostei" da postagem (%)', 'Marcações',
+]
+
+# Os horários de publicação vêm com o mês abreviado em inglês em todos os idiomas ('%b %d, %Y')
+MESES_INGLES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+PALAVRAS_TITULO = [
+    'Louvor', 'Ao vivo', 'Culto', 'Especial', 'Reação', 'Clipe oficial', 'Bastidores', 'Entrevista',
+    'Resumo', 'Gols', 'Análise', 'Notícias', 'Episódio', 'Parte', 'Tutorial', 'Desafio', 'Melhores momentos',
+]
+FRASES_POSTAGEM = [
+    'Obrigado pelo carinho de sempre!', 'Vídeo novo amanhã às 18h, ativa o sininho.',
+    'Qual música vocês querem na próxima live?', 'Deixa nos comentários, vamos ler todos.',
+    'Bastidores da gravação, "em breve" no canal.', 'Enquete: vídeo longo ou shorts?',
+    'Hoje tem live, 20h, não percam', 'Agradecemos a todos, que Deus abençoe.',
+]
+CARACTERES_ID = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_'
+
+CONFIG_POR_LAYOUT = {
+    'padrao': {"grupo_4_graficos": "gerar_graficos.py", "grupo_5_apresentacao": ["apresentacao_report.py", "apresentacao_cluster.py"]},
+    'ingles': {"grupo_4_graficos": "gerar_graficos_ingles.py", "grupo_5_apresentacao": ["apresentacao_report_ingles.py", "apresentacao_cluster_ingles.py"]},
+    'CA': {"tipo_processamento": "CA", "grupo_4_graficos": "gerar_graficos.py", "grupo_5_apresentacao": ["apresentacao_report.py", "apresentacao_cluster.py"]},
+}
+
+
+def periodo_dos_exports(mes_referencia):
+    """Meses do relatório: o mês antigo e os 6 da janela (mais antigo primeiro), e o último dia do período."""
+    meses = pd.period_range(end=mes_referencia, periods=7, freq='M')
+    return {'meses': meses, 'fim': meses[-1].end_time.strftime('%Y-%m-%d')}
+
+
+def nome_zip(prefixo, inicio, fim, canal, numero=0):
+    """Nome que o navegador dá ao download: repetições do mesmo relatório ganham ' (n)' no final."""
+    sufixo = f' ({numero})' if numero else ''
+    return f"{prefixo} {inicio}_{fim} {canal}{sufixo}.zip"
+
+
+def texto_csv(colunas, linhas):
+    saida = io.StringIO()
+    escritor = csv.writer(saida, lineterminator='\n')
+    escritor.writerow(colunas)
+    escritor.writerows(linhas)
+    return saida.getvalue()
+
+
+def gravar_zip(pasta, nome, membros):
+    # Os nomes dos membros vão em NFC, como nos zips baixados do Studio (é a forma que o extraindo_renomeando_CA
+    # procura); o CONFIG do extraindo_renomeando escreve 'gráfico' em NFD, e o ingestao_zip.localizar_membro
+    # aceita as duas formas. Data fixa nos membros: a mesma semente gera zips idênticos byte a byte.
+    with zipfile.ZipFile(os.path.join(pasta, nome), 'w', compression=zipfile.ZIP_DEFLATED) as zip_ref:
+        for nome_membro, conteudo in membros.items():
+            info = zipfile.ZipInfo(unicodedata.normalize('NFC', nome_membro), date_time=(1980, 1, 1, 0, 0, 0))
+            zip_ref.writestr(info, conteudo.encode('utf-8'), compress_type=zipfile.ZIP_DEFLATED)
+
+
+def formatar(coluna, valor):
+    """Valor no formato do CSV do Studio para a coluna."""
+    if valor is None or (isinstance(valor, float) and np.isnan(valor)):
+        return ''
+    if coluna == 'Duração média da visualização':
+        segundos = int(round(valor))
+        return f"{segundos // 3600}:{segundos % 3600 // 60:02d}:{segundos % 60:02d}"
+    if '(USD)' in coluna:
+        return f"{valor:.3f}"
+    if coluna.endswith('(%)'):
+        return f"{valor:.2f}"
+    if coluna == 'Tempo de exibição (horas)':
+        return f"{valor:.4f}"
+    return str(int(round(valor)))
+
+
+def metricas_de_conteudo(rng, visualizacoes, tipo, escala):
+    """
+    Métricas de um tipo de conteúdo a partir das visualizações de cada linha (mês ou vídeo), com as
+    taxas do canal (escala) e uma variação pequena por linha. Todas as colunas são arrays.
+    """
+    v = np.asarray(visualizacoes, dtype=float)
+    ruido = lambda: rng.uniform(0.85, 1.15, v.shape)
+    duracao = escala['duracao'][tipo] * ruido()
+    rpm = escala['rpm'][tipo] * ruido()
+    ctr = escala['ctr'] * ruido()
+    inscritos = v * escala['inscricao'] * ruido()
+    return {
+        'Visualizações': v,
+        'Espectadores únicos': v * rng.uniform(0.45, 0.75, v.shape),
+        'Comentários adicionados': rng.poisson(v * 0.002).astype(float),
+        'Compartilhamentos': rng.poisson(v * 0.0015).astype(float),
+        'Marcações "Gostei"': rng.poisson(v * 0.03).astype(float),
+        'RPM (USD)': rpm,
+        'Receita estimada (USD)': v / 1000 * rpm,
+        'Taxa de cliques de impressões (%)': ctr,
+        # Parte das visualizações não vem de impressões (externas, notificações)
+        'Impressões': np.round(v * 0.6 * 100 / ctr),
+        'Inscritos': np.round(inscritos - v * escala['cancelamento']),
+        'Porcentagem visualizada média (%)': np.minimum(100 * duracao / escala['tamanho'][tipo], 100),
+        'Tempo de exibição (horas)': v * duracao / 3600,
+        'Duração média da visualização': duracao,
+    }
+
+
+def total_das_linhas(metricas):
+    """Linha 'Total': soma das contagens e médias ponderadas pelas visualizações nas taxas."""
+    v = metricas['Visualizações'].sum()
+    total = {coluna: valores.sum() for coluna, valores in metricas.items()}
+    if v > 0:
+        for coluna in [c for c in metricas if c.endswith('(%)')]:
+            pesos = np.where(metricas[coluna] > 0, metricas['Visualizações'], 0)
+            total[coluna] = (metricas[coluna] * pesos).sum() / max(pesos.sum(), 1)
+        total['RPM (USD)'] = total['Receita estimada (USD)'] / v * 1000
+        total['Duração média da visualização'] = total['Tempo de exibição (horas)'] * 3600 / v
+    return total
+
+
+def somar_tipos(por_tipo):
+    """Métricas do canal inteiro (total.csv) a partir das de cada tipo, mês a mês."""
+    colunas = por_tipo['videos'].keys()
+    soma = {coluna: sum(por_tipo[tipo][coluna] for tipo in TIPOS_CONTEUDO) for coluna in colunas}
+    v = np.maximum(soma['Visualizações'], 1)
+    for coluna in ('Taxa de cliques de impressões (%)', 'Porcentagem visualizada média (%)'):
+        soma[coluna] = sum(por_tipo[tipo][coluna] * por_tipo[tipo]['Visualizações'] for tipo in TIPOS_CONTEUDO) / v
+    soma['RPM (USD)'] = soma['Receita estimada (USD)'] / v * 1000
+    soma['Duração média da visualização'] = soma['Tempo de exibição (horas)'] * 3600 / v
+    return soma
+
+
+def linhas_por_mes(colunas, meses, metricas, monetizado):
+    """Linhas de um relatório por data: 'Total' e depois um mês por linha, do mais recente para o mais antigo."""
+    colunas = [c for c in colunas if monetizado or '(USD)' not in c]
+    total = total_das_linhas(metricas)
+    linhas = [['Total'] + [formatar(c, total.get(c)) for c in colunas[1:]]]
+    for i in range(len(meses) - 1, -1, -1):
+        if metricas['Visualizações'][i] <= 0:
+            continue
+        linhas.append([str(meses[i])] + [formatar(c, metricas[c][i] if c in metricas else None) for c in colunas[1:]])
+    return colunas, linhas
+
+
+def grafico_diario(rng, meses, visualizacoes):
+    """'Dados do gráfico' dos relatórios por data: as visualizações de cada mês espalhadas pelos dias."""
+    linhas = []
+    for mes, total in zip(meses, visualizacoes):
+        dias = pd.date_range(mes.start_time, mes.end_time.normalize(), freq='D')
+        pesos = rng.dirichlet(np.full(len(dias), 8.0))
+        linhas.extend([dia.strftime('%Y-%m-%d'), int(round(total * peso))] for dia, peso in zip(dias, pesos))
+    return texto_csv(['Data', 'Visualizações'], linhas)
+
+
+def totais(colunas, linhas):
+    return texto_csv(colunas, [linhas[0]])
+
+
+def montar_escala(rng):
+    """Tamanho e taxas do canal: visualizações mensais em log-normal, de canais pequenos a muito grandes."""
+    visualizacoes_mes = float(np.clip(rng.lognormal(np.log(300_000), 1.6), 2_000, 400_000_000))
+    participacao = rng.dirichlet([6.0, 1.5, 3.0])
+    if rng.random() < 0.35:  # canal sem lives
+        participacao = np.array([participacao[0] + participacao[1], 0.0, participacao[2]])
+    return {
+        'visualizacoes_mes': visualizacoes_mes,
+        'participacao': dict(zip(TIPOS_CONTEUDO, participacao)),
+        'tendencia': rng.normal(0.0, 0.06),
+        'duracao': {tipo: rng.uniform(*DURACAO_ASSISTIDA_S[tipo]) for tipo in TIPOS_CONTEUDO},
+        'tamanho': {tipo: rng.uniform(*TAMANHO_CONTEUDO_S[tipo]) for tipo in TIPOS_CONTEUDO},
+        'rpm': {tipo: rng.uniform(*RPM_USD[tipo]) for tipo in TIPOS_CONTEUDO},
+        'publicacoes': {tipo: rng.uniform(*PUBLICACOES_MES[tipo]) if participacao[i] > 0 else 0.0 for i, tipo in enumerate(TIPOS_CONTEUDO)},
+        'ctr': rng.uniform(1.5, 9.0),
+        'inscricao': rng.uniform(0.0005, 0.004),
+        'cancelamento': rng.uniform(0.0001, 0.0008),
+        'fracao_nova': rng.uniform(0.25, 0.6),
+        'decaimento': rng.uniform(0.15, 0.5),
+        # Canais fora do Programa de Parcerias não têm as colunas de receita no export
+        'monetizado': rng.random() > 0.15,
+    }
+
+
+def series_do_canal(rng, escala, quantidade_meses):
+    """Visualizações e métricas mensais de cada tipo, com tendência e sazonalidade aleatórias."""
+    passos = np.arange(quantidade_meses) - (quantidade_meses - 1)
+    curva = escala['visualizacoes_mes'] * np.exp(escala['tendencia'] * passos) * rng.lognormal(0, 0.12, quantidade_meses)
+    por_tipo = {}
+    for tipo in TIPOS_CONTEUDO:
+        visualizacoes = np.round(curva * escala['participacao'][tipo] * rng.lognormal(0, 0.1, quantidade_meses))
+        metricas = metricas_de_conteudo(rng, visualizacoes, tipo, escala)
+        metricas['Vídeos publicados'] = rng.poisson(escala['publicacoes'][tipo], quantidade_meses).astype(float)
+        por_tipo[tipo] = metricas
+    return por_tipo
+
+
+def data_publicacao(rng, mes):
+    dia = int(rng.integers(1, mes.days_in_month + 1))
+    return f"{MESES_INGLES[mes.month - 1]} {dia}, {mes.year}"
+
+
+def identificador(rng, tamanho):
+    return ''.join(CARACTERES_ID[i] for i in rng.integers(0, len(CARACTERES_ID), tamanho))
+
+
+def comunidade(rng, escala, meses):
+    """Postagens da comunidade; parte delas tem texto com várias linhas, vírgulas e aspas, como no Studio."""
+    linhas = []
+    for _ in range(int(rng.poisson(rng.uniform(0, 25)))):
+        frases = rng.choice(FRASES_POSTAGEM, size=int(rng.integers(1, 4)))
+        texto = ('\n' if rng.random() < 0.4 else ' ').join(frases)
+        impressoes = int(rng.lognormal(np.log(escala['visualizacoes_mes'] / 50 + 10), 0.6))
+        gostei = int(impressoes * rng.uniform(0.005, 0.05))
+        linhas.append([
+            'Ugkx' + identificador(rng, 32), texto, data_publicacao(rng, meses[int(rng.integers(1, len(meses)))]),
+            impressoes, gostei, int(gostei * rng.uniform(0.01, 0.2)), f"{rng.uniform(85, 99.5):.2f}", 0,
+        ])
+    total = ['Total', '', '', sum(l[3] for l in linhas), sum(l[4] for l in linhas), sum(l[5] for l in linhas), '', 0]
+    return linhas, total
+
+
+def metricas_da_comunidade(postagens, meses):
+    """Colunas de postagem do total.csv (impressões, "Gostei" e respostas por mês)."""
+    por_mes = {str(mes): [0, 0, 0] for mes in meses}
+    rotulos = {f"{MESES_INGLES[mes.month - 1]}{mes.year}": str(mes) for mes in meses}
+    for postagem in postagens:
+        mes_abreviado, _, ano = postagem[2].split(' ')
+        mes = rotulos.get(f"{mes_abreviado}{ano}")
+        if mes:
+            por_mes[mes][0] += postagem[3]
+            por_mes[mes][1] += postagem[4]
+            por_mes[mes][2] += postagem[5]
+    valores = np.array([por_mes[str(mes)] for mes in meses], dtype=float)
+    return {
+        'Impressões da postagem': valores[:, 0],
+        '"Gostei" da postagem': valores[:, 1],
+        'Respostas à postagem': valores[:, 2],
+        'Média de "Gostei" da postagem (%)': np.where(valores[:, 1] > 0, 95.0, 0.0),
+    }
+
+
+def metricas_do_total(rng, por_tipo, postagens, meses):
+    metricas = somar_tipos(por_tipo)
+    inscritos = metricas['Inscritos']
+    perdidas = np.round(np.abs(inscritos) * rng.uniform(0.1, 0.4, len(meses)) + 1)
+    metricas.update({
+        'Inscrições obtidas': inscritos + perdidas,
+        'Inscrições perdidas': perdidas,
+        'CPM (USD)': metricas['RPM (USD)'] * rng.uniform(1.8, 2.4),
+        'CPM baseado em exibição (USD)': metricas['RPM (USD)'] * rng.uniform(2.0, 2.8),
+    })
+    metricas.update(metricas_da_comunidade(postagens, meses))
+    return metricas
+
+
+def exports_de_origem(rng, pasta, idioma, canal, por_tipo, meses, inicio, fim):
+    """Origem do tráfego dos VODs (sem sufixo) e das lives ((1)): tabela por origem e gráfico por mês."""
+    cfg = CONFIG_IDIOMAS[idioma]
+    for numero, tipo in enumerate(['videos', 'lives']):
+        presentes = [o for o in ORIGENS if o in ORIGENS[:3] or rng.random() < 0.8]
+        grafico, por_origem = [], dict.fromkeys(presentes, 0)
+        for mes, total in zip(meses[1:], por_tipo[tipo]['Visualizações'][1:]):
+            if total <= 0:
+                continue
+            for origem, peso in zip(presentes, rng.dirichlet(np.full(len(presentes), 1.2))):
+                grafico.append([str(mes), origem, int(round(total * peso))])
+                por_origem[origem] += int(round(total * peso))
+        tabela = texto_csv(['Origem do tráfego', 'Visualizações'], [[o, n] for o, n in por_origem.items() if n])
+        gravar_zip(pasta, nome_zip(PREFIXOS_ZIP[idioma][1], inicio, fim, canal, numero), {
+            cfg['table_data_name']: tabela,
+            cfg['chart_data_name']: texto_csv(['Data', 'Origem do tráfego', 'Visualizações'], grafico),
+            NOME_TOTAIS[idioma]: texto_csv(['Visualizações'], [[sum(por_origem.values())]]),
+        })
+
+
+def export_de_postagens(pasta, idioma, canal, postagens, total, inicio, fim):
+    cfg = CONFIG_IDIOMAS[idioma]
+    tabela = texto_csv(COLUNAS_COMUNIDADE, [total] + postagens)
+    gravar_zip(pasta, nome_zip(PREFIXOS_ZIP[idioma][2], inicio, fim, canal), {
+        cfg['table_data_name']: tabela,
+        cfg['chart_data_name']: texto_csv(['Data', 'Impressões da postagem'], [[p[2], p[3]] for p in postagens]),
+        NOME_TOTAIS[idioma]: texto_csv(COLUNAS_COMUNIDADE, [total]),
+    })
+
+
+def export_por_data(rng, pasta, idioma, canal, inicio, fim, numero, colunas, meses, metricas, escala):
+    cfg = CONFIG_IDIOMAS[idioma]
+    colunas, linhas = linhas_por_mes(colunas, meses, metricas, escala['monetizado'])
+    gravar_zip(pasta, nome_zip(PREFIXOS_ZIP[idioma][0], inicio, fim, canal, numero), {
+        cfg['table_data_name']: texto_csv(colunas, linhas),
+        cfg['chart_data_name']: grafico_diario(rng, meses, metricas['Visualizações']),
+        NOME_TOTAIS[idioma]: totais(colunas, linhas),
+    })
+
+
+def layout_padrao(rng, pasta, idioma, canal, escala, periodo):
+    """Os 22 relatórios "Data" (4 do mês antigo e 18 do mês recente), mais origem do tráfego e postagens."""
+    meses, fim = periodo['meses'], periodo['fim']
+    inicio_antigo, inicio_recente = meses[0].start_time.strftime('%Y-%m-%d'), meses[1].start_time.strftime('%Y-%m-%d')
+    por_tipo = series_do_canal(rng, escala, len(meses))
+    postagens, total_postagens = comunidade(rng, escala, meses)
+
+    # Mês antigo: total, vídeos, lives e shorts mês a mês
+    export_por_data(rng, pasta, idioma, canal, inicio_antigo, fim, 0, tratamento.total_colunas, meses, metricas_do_total(rng, por_tipo, postagens, meses), escala)
+    for numero, tipo in enumerate(TIPOS_CONTEUDO, start=1):
+        export_por_data(rng, pasta, idioma, canal, inicio_antigo, fim, numero, tratamento.conteudo_total_colunas, meses, por_tipo[tipo], escala)
+
+    # Mês recente: para cada mês da janela, o desempenho do que foi publicado nele (vídeos, lives, shorts)
+    janela = meses[1:]
+    numero = 0
+    for k in range(len(janela)):
+        for tipo in TIPOS_POR_SUFIXO_RECENTE:
+            idade = np.arange(len(janela)) - k
+            fator = np.where(idade >= 0, escala['fracao_nova'] * (1 - escala['decaimento']) ** np.maximum(idade, 0), 0)
+            visualizacoes = np.round(por_tipo[tipo]['Visualizações'][1:] * fator)
+            metricas = metricas_de_conteudo(rng, visualizacoes, tipo, escala)
+            export_por_data(rng, pasta, idioma, canal, inicio_recente, fim, numero, tratamento.conteudo_colunas, janela, metricas, escala)
+            numero += 1
+
+    exports_de_origem(rng, pasta, idioma, canal, por_tipo, meses, inicio_recente, fim)
+    export_de_postagens(pasta, idioma, canal, postagens, total_postagens, inicio_recente, fim)
+    return por_tipo
+
+
+def layout_ca(rng, pasta, canal, escala, periodo):
+    """Relatórios "Data" (total, vídeos, lives e shorts) e um "Conteúdo" por tipo para cada mês da janela."""
+    meses, fim = periodo['meses'], periodo['fim']
+    inicio = meses[0].start_time.strftime('%Y-%m-%d')
+    por_tipo = series_do_canal(rng, escala, len(meses))
+    postagens, total_postagens = comunidade(rng, escala, meses)
+
+    export_por_data(rng, pasta, 'pt', canal, inicio, fim, 0, tratamento_CA.total_colunas, meses, metricas_do_total(rng, por_tipo, postagens, meses), escala)
+    for numero, tipo in enumerate(TIPOS_CONTEUDO, start=1):
+        export_por_data(rng, pasta, 'pt', canal, inicio, fim, numero, tratamento_CA.conteudo_total_colunas, meses, por_tipo[tipo], escala)
+
+    # Vídeos publicados antes da janela continuam com visualizações, como no Studio
+    catalogo = {tipo: [] for tipo in TIPOS_CONTEUDO}
+    colunas = [c for c in tratamento_CA.conteudo_colunas if escala['monetizado'] or '(USD)' not in c]
+    for i, mes in enumerate(meses[1:], start=1):
+        mes_inicio, mes_fim = mes.start_time.strftime('%Y-%m-%d'), mes.end_time.strftime('%Y-%m-%d')
+        for numero, tipo in enumerate(TIPOS_POR_SUFIXO_RECENTE):
+            for _ in range(min(int(por_tipo[tipo]['Vídeos publicados'][i]), 200)):
+                catalogo[tipo].append([
+                    identificador(rng, 11), ' - '.join(rng.choice(PALAVRAS_TITULO, size=2)),
+                    data_publicacao(rng, mes), int(escala['tamanho'][tipo] * rng.uniform(0.5, 1.5)),
+                ])
+            videos = catalogo[tipo][-300:]
+            total_mes = por_tipo[tipo]['Visualizações'][i]
+            pesos = rng.dirichlet(np.full(len(videos), 0.7)) if videos else np.array([])
+            metricas = metricas_de_conteudo(rng, np.round(total_mes * pesos), tipo, escala)
+            total = total_das_linhas(metricas)
+            linhas = [['Total', '', '', ''] + [formatar(c, total.get(c)) for c in colunas[4:]]]
+            for j, video in enumerate(videos):
+                linhas.append(video + [formatar(c, metricas[c][j]) for c in colunas[4:]])
+            gravar_zip(pasta, nome_zip('Conteúdo', mes_inicio, mes_fim, canal, numero), {
+                'Dados da tabela.csv': texto_csv(colunas, linhas),
+                'Dados do gráfico.csv': texto_csv(['Data', 'Visualizações'], [[mes_inicio, int(total_mes)]]),
+                'Totais.csv': texto_csv(colunas, linhas[:1]),
+            })
+
+    exports_de_origem(rng, pasta, 'pt', canal, por_tipo, meses, inicio, fim)
+    export_de_postagens(pasta, 'pt', canal, postagens, total_postagens, inicio, fim)
+    return por_tipo
+
+
+def gerar_canal(indice, opcoes):
+    """Gera raw_data/ e sub.txt de um canal. Retorna (nome, entrada do config.json, layout e idioma)."""
+    rng = np.random.default_rng([opcoes['semente'], indice])
+    canal = f"{opcoes['prefixo']}{indice:04d}"
+    sorteio = rng.random()
+    if sorteio < opcoes['fracao_ca']:
+        layout, idioma = 'CA', 'pt'
+    elif sorteio < opcoes['fracao_ca'] + opcoes['fracao_en']:
+        layout, idioma = 'ingles', 'en'
+    elif sorteio < opcoes['fracao_ca'] + opcoes['fracao_en'] + opcoes['fracao_es']:
+        layout, idioma = 'padrao', 'es'
+    else:
+        layout, idioma = 'padrao', 'pt'
+
+    pasta = os.path.join('dados_full', canal, 'raw_data')
+    os.makedirs(pasta, exist_ok=True)
+    for antigo in glob.glob(os.path.join(pasta, '*.zip')):
+        os.remove(antigo)
+
+    escala = montar_escala(rng)
+    periodo = periodo_dos_exports(opcoes['mes_referencia'])
+    if layout == 'CA':
+        por_tipo = layout_ca(rng, pasta, canal, escala, periodo)
+    else:
+        por_tipo = layout_padrao(rng, pasta, idioma, canal, escala, periodo)
+        if opcoes['extrair']:
+            with contextlib.redirect_stdout(io.StringIO()):
+                extraindo_renomeando.remover_csv_antigos(canal)
+                extraindo_renomeando.identificar_arquivos_zip(canal)
+
+    # Inscritos ao fim do período, no formato copiado do Studio ("1.234.567")
+    inscritos = int(escala['visualizacoes_mes'] * rng.uniform(0.5, 3.0) + sum(por_tipo[t]['Inscritos'].sum() for t in TIPOS_CONTEUDO))
+    with open(os.path.join('dados_full', canal, 'sub.txt'), 'w', encoding='utf-8') as f:
+        f.write(f"{max(inscritos, 100):,}".replace(',', '.') + '\n')
+
+    entrada = json.loads(json.dumps(CONFIG_POR_LAYOUT[layout]))
+    if layout == 'padrao' and rng.random() < opcoes['fracao_midias']:
+        entrada['grupo_5_apresentacao'].append('apresentacao_midias.py')
+    return canal, entrada, 'CA' if layout == 'CA' else idioma
+
+
+def _gerar_canal_em_worker(argumentos):
+    return gerar_canal(*argumentos)
+
+
+def gravar_configuracao(canais, caminho_config, caminho_exports):
+    """Grava o config (só os canais gerados) e o exports com a lista deles, sem tocar nos arquivos do projeto."""
+    with open(caminho_config, 'w', encoding='utf-8') as f:
+        json.dump({'artistas': canais}, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    with open(caminho_exports, 'w', encoding='utf-8') as f:
+        f.writelines(f"{canal}\n" for canal in canais)
+
+
+def parse_argumentos():
+    parser = argparse.ArgumentParser(description="Gera exports sintéticos do YouTube Studio (raw_data/*.zip) para testes de carga do fluxo.")
+    parser.add_argument('canais', type=int, help="Quantidade de canais a gerar.")
+    parser.add_argument('--prefixo', default=PREFIXO_PADRAO, help=f"Prefixo do nome dos canais ({PREFIXO_PADRAO}0000, {PREFIXO_PADRAO}0001...). Padrão: {PREFIXO_PADRAO}.")
+    parser.add_argument('--semente', type=int, default=SEMENTE_PADRAO, help=f"Semente dos dados; a mesma semente gera os mesmos arquivos. Padrão: {SEMENTE_PADRAO}.")
+    parser.add_argument('--mes-referencia', default=None, help="Mês mais recente dos exports (AAAA-MM). Padrão: o mês anterior ao atual.")
+    parser.add_argument('--fracao-ca', type=float, default=0.06, help="Fração dos canais no layout CA. Padrão: 0.06.")
+    parser.add_argument('--fracao-en', type=float, default=0.03, help="Fração dos canais com os exports em inglês. Padrão: 0.03.")
+    parser.add_argument('--fracao-es', type=float, default=0.02, help="Fração dos canais com os exports em espanhol. Padrão: 0.02.")
+    parser.add_argument('--fracao-midias', type=float, default=0.2, help="Fração dos canais padrão que também geram a apresentação de mídias. Padrão: 0.2.")
+    parser.add_argument('--workers', type=int, default=1, help="Canais gerados em paralelo. Padrão: 1.")
+    parser.add_argument('--config', default='config_sintetico.json', help="Config gravado com os canais gerados. Padrão: config_sintetico.json.")
+    parser.add_argument('--exports', default='exports_sintetico.txt', help="Lista dos canais gerados, no formato do exports.txt. Padrão: exports_sintetico.txt.")
+    parser.add_argument('--sem-extracao', action='store_true', help="Só grava os .zip, sem extrair os CSVs dos canais padrão.")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_argumentos()
+    for caminho in (args.config, args.exports):
+        if os.path.basename(caminho) in ('config.json', 'exports.txt'):
+            print(f"Erro: '{caminho}' é um arquivo do projeto; escolha outro destino.")
+            sys.exit(1)
+    mes_referencia = pd.Period(args.mes_referencia, freq='M') if args.mes_referencia else pd.Period.now('M') - 1
+    opcoes = {
+        'prefixo': args.prefixo, 'semente': args.semente, 'mes_referencia': mes_referencia,
+        'fracao_ca': args.fracao_ca, 'fracao_en': args.fracao_en, 'fracao_es': args.fracao_es, 'fracao_midias': args.fracao_midias,
+        'extrair': not args.sem_extracao,
+    }
+    tarefas = [(indice, opcoes) for indice in range(args.canais)]
+    print(f"Gerando {args.canais} canais sintéticos até {mes_referencia} em dados_full/...")
+    if args.workers > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            gerados = list(executor.map(_gerar_canal_em_worker, tarefas, chunksize=8))
+    else:
+        gerados = [gerar_canal(*tarefa) for tarefa in tarefas]
+
+    canais = {canal: entrada for canal, entrada, _ in gerados}
+    gravar_configuracao(canais, args.config, args.exports)
+    layouts = {}
+    for _, _, layout in gerados:
+        layouts[layout] = layouts.get(layout, 0) + 1
+    print(f"Pronto: {len(canais)} canais ({', '.join(f'{n} {l}' for l, n in sorted(layouts.items()))}).")
+    print(f"Canais gravados em '{args.config}' e '{args.exports}'.")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,7 +7,6 @@ import matplotlib.font_manager as fm
 import warnings
 warnings.filterwarnings('ignore')
 import seaborn as sns
-sns.set_style('whitegrid')
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
@@ -17,16 +16,30 @@ from matplotlib.ticker import MaxNLocator, FuncFormatter
 from datetime import datetime,date
 from openpyxl import load_workbook
 
+import armazem_canal
+import periodo_canal
+import agendador_graficos
+import perfil_render
+import cards_big_number
+import tabela_imagem
 
 
-try:
-    mpl.rcParams["font.family"] = "DM Sans"
-    font_path = "resources/Fonts/DMSans-Bold.ttf"
-    dm_sans_bold = fm.FontProperties(fname=font_path)
-except Exception as e:
-    print(f"⚠️ Aviso: Fonte 'DM Sans' não encontrada. Usando fonte padrão. Erro: {e}")
-    mpl.rcParams["font.family"] = "sans-serif"
-    dm_sans_bold = fm.FontProperties(weight='bold')
+
+def configurar_estilo():
+    """Estilo do seaborn e fonte DM Sans nos rcParams. Roda no import e uma vez em cada worker do pool de gráficos."""
+    sns.set_style('whitegrid')
+    try:
+        mpl.rcParams["font.family"] = "DM Sans"
+        font_path = "resources/Fonts/DMSans-Bold.ttf"
+        return fm.FontProperties(fname=font_path)
+    except Exception as e:
+        print(f"⚠️ Aviso: Fonte 'DM Sans' não encontrada. Usando fonte padrão. Erro: {e}")
+        mpl.rcParams["font.family"] = "sans-serif"
+        return fm.FontProperties(weight='bold')
+
+
+dm_sans_bold = configurar_estilo()
+PERFIL_RENDER = perfil_render.perfil_atual()
 
 
 STYLE_CONFIG = {
@@ -57,7 +70,9 @@ STYLE_CONFIG = {
         'fontproperties': dm_sans_bold,
         'size': 14
     },
-    'dpi': 300, 'transparent': True,
+    # dpi, bbox e compressão do PNG vêm do perfil de renderização (final ou draft)
+    'dpi': PERFIL_RENDER['dpi'], 'bbox_inches': PERFIL_RENDER['bbox_inches'],
+    'pil_kwargs': PERFIL_RENDER['pil_kwargs'], 'transparent': True,
     'figsize_wide': (12, 7), 'figsize_standard': (10, 6),
     'figsize_table_metricas': (14, 7), 'figsize_table_small': (12, 4)
 }
@@ -238,57 +253,36 @@ def format_for_table(value):
     return str(int(value))
 
 
+def salvar_tabela(grade, output_filename, figsize):
+    """Desenha a grade com o motor de tabelas em Pillow (tabela_imagem), no dpi e recorte do perfil de renderização."""
+    tabela_imagem.desenhar_tabela(
+        grade, output_filename, figsize, dpi=STYLE_CONFIG['dpi'],
+        recortar=STYLE_CONFIG['bbox_inches'] == 'tight', pil_kwargs=STYLE_CONFIG['pil_kwargs'],
+    )
+
+
 def gerar_tabela_metricas_avancada(artista, tipo_conteudo, nome_arquivo, plot_index):
     """
     Versão final e corrigida que gera a tabela de métricas com controle de fonte funcional.
     """
     try:
         # --- 1. CARREGAMENTO E PREPARAÇÃO DOS DADOS (sem alterações) ---
-        data = pd.read_csv(f'dados_full/{artista}/{nome_arquivo}'); data.drop(0, inplace=True)
-        def time_to_seconds(time_str):
-            if isinstance(time_str, str) and ':' in time_str:
-                parts = time_str.split(':')
-                try:
-                    if len(parts) == 3: return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-                    elif len(parts) == 2: return int(parts[0]) * 60 + int(parts[1])
-                except (ValueError, IndexError): return 0
-            return 0
-        data['Duração média da visualização'] = data['Duração média da visualização'].apply(time_to_seconds)
-        data["Data"] = pd.to_datetime(data['Data']); data.sort_values('Data', ascending=True, inplace=True, ignore_index=True)
+        data = armazem_canal.ler_tabela(artista, os.path.splitext(nome_arquivo)[0]); data.drop(0, inplace=True)
+        # No armazém a duração já está em segundos e 'Data' é período mensal
+        data['Duração média da visualização'] = data['Duração média da visualização'].fillna(0)
+        data["Data"] = data['Data'].dt.to_timestamp(); data.sort_values('Data', ascending=True, inplace=True, ignore_index=True)
         if len(data) >= 7: data = data.tail(7)
         data.reset_index(drop=True, inplace=True); data["Mes"] = data.Data.apply(lambda i: i.strftime("%b"))
         ordem_colunas = ['Mes', 'Vídeos publicados', 'Impressões', 'Taxa de cliques de impressões (%)', 'Visualizações', 'Duração média da visualização', 'Porcentagem visualizada média (%)', 'Inscritos', 'RPM (USD)', 'Receita estimada (USD)']; df_full = data[ordem_colunas].copy().set_index('Mes').T; df_display = df_full.iloc[:, 1:]
 
-        # --- 2. CRIAÇÃO DA TABELA ---
-        fig, ax = plt.subplots(figsize=(16, 7)); ax.axis('off')
-        
-        tabela = ax.table(
-            cellText=[[''] * len(df_display.columns)] * len(df_display.index),
-            rowLabels=df_display.index, colLabels=df_display.columns,
-            loc='center', cellLoc='right'
-        )
-        tabela.auto_set_font_size(False) # Impede o ajuste automático
-        tabela.scale(1, 3) # Ajusta a altura das células
-
-        # --- 3. ESTILIZAÇÃO E PREENCHIMENTO (LÓGICA CORRIGIDA) ---
-        for (row, col_display), cell in tabela.get_celld().items():
-            col_full = col_display + 1; cell.set_edgecolor('none')
-            
-            # Pega as propriedades de fonte do STYLE_CONFIG
-            font_properties = STYLE_CONFIG['table_font_props']
-            
-            if row == 0: # Cabeçalho
-                cell.set_text_props(**font_properties, color='white', ha='center')
-                cell.set_facecolor('#3157F7'); cell.set_height(0.12)
-            elif col_display == -1: # Coluna de Métricas
-                cell.set_text_props(**font_properties, ha='left', va='center', color='#142544')
-                cell.get_text().set_text(f"  {df_display.index[row-1]}")
-                cell.set_facecolor('#F0F4FF'); cell.set_edgecolor('#E5E7EB'); cell.set_linewidth(1); cell.set_width(0.35)
-            else: # Células de Dados
-                cell.set_facecolor('#FFFFFF' if row % 2 != 0 else '#F0F4FF')
-                metric_name = df_full.index[row-1]; current_value = df_full.iloc[row-1, col_full]; prev_value = df_full.iloc[row-1, col_full - 1]
+        # --- 2. GRADE ESTILIZADA (formatação, tendência e cor de cada célula) ---
+        linhas = []
+        for row, metric_name in enumerate(df_full.index):
+            celulas = []
+            for col_full in range(1, len(df_full.columns)):
+                current_value = df_full.iloc[row, col_full]; prev_value = df_full.iloc[row, col_full - 1]
                 trend = get_trend(current_value, prev_value)
-                
+
                 display_val = ""
                 if pd.notna(current_value):
                     if metric_name in ["Impressões", "Visualizações", "Inscritos", "Vídeos publicados"]: display_val = custom_format(current_value)
@@ -296,25 +290,20 @@ def gerar_tabela_metricas_avancada(artista, tipo_conteudo, nome_arquivo, plot_in
                     elif metric_name == "Receita estimada (USD)": display_val = format_currency(current_value)
                     else: display_val = dec_format(current_value)
                     if metric_name in ["Taxa de cliques de impressões (%)", "Porcentagem visualizada média (%)"]: display_val += "%"
-                
-                icon = ''; color = STYLE_CONFIG['colors']['text_dark']
-                if trend == "up": icon = '↑ '; color = STYLE_CONFIG['colors']['positive']
-                elif trend == "down": icon = '↓ '; color = STYLE_CONFIG['colors']['negative']
-                
-                cell.get_text().set_text(f"{icon}{display_val}")
-                # APLICA AS PROPRIEDADES CORRETAMENTE
-                cell.get_text().set_font_properties(font_properties['fontproperties'])
-                cell.get_text().set_size(font_properties['size'])
-                cell.get_text().set_color(color)
 
-        fig.suptitle("", y=0.5, **STYLE_CONFIG['font_props_title'])
-        plt.tight_layout(rect=[0, 0, 1, 0.95])
-        
-        plt.savefig(
-            f'dados_full/{artista}/plots/{plot_index} - Métricas_{tipo_conteudo}_Avancada.png', 
-            dpi=STYLE_CONFIG['dpi'], bbox_inches='tight', pad_inches=0.1, transparent=STYLE_CONFIG['transparent']
-        )
-        plt.close(fig)
+                color = STYLE_CONFIG['colors']['text_dark']
+                if trend == "up": color = STYLE_CONFIG['colors']['positive']
+                elif trend == "down": color = STYLE_CONFIG['colors']['negative']
+                celulas.append(tabela_imagem.celula(display_val, color, trend))
+            linhas.append({'rotulo': metric_name, 'celulas': celulas})
+
+        # --- 3. DESENHO DA TABELA ---
+        grade = {
+            'colunas': list(df_display.columns), 'linhas': linhas,
+            'cor_cabecalho': '#3157F7', 'cor_texto_rotulo': '#142544', 'zebra': ('#FFFFFF', '#F0F4FF'),
+            'escala_altura': 3, 'altura_cabecalho': 0.12, 'topo': 0.95,
+        }
+        salvar_tabela(grade, f'dados_full/{artista}/plots/{plot_index} - Métricas_{tipo_conteudo}_Avancada.png', figsize=(16, 7))
     except Exception as e:
         print(f"❌ Erro em gerar_tabela_metricas_avancada para '{artista}' ({tipo_conteudo}): {e}")
                 
@@ -332,58 +321,22 @@ def formatar_numero_card(value):
 
 def criar_big_number_card(config, output_filename):
     """
-    Cria uma imagem de um card de métrica, agora com posicionamento de valor personalizável.
+    Cria a imagem de um card de métrica com o renderizador Pillow (cards_big_number), no dpi e recorte do perfil de renderização.
     """
-    BRAND_COLORS = {
-        'azulEscuro': "#142544", 'azulPrimario': "#3157F7", 'roxo': "#8140FA",
-        'amareloMarcaTexto': "#E2FC51", 'branco': "#FFFFFF", 'cinzaClaro': "#E8E8E9",
-        'positive_text': '#16a34a', 'positive_bg': '#f0fdf4',
-        'negative_text': '#dc2626', 'negative_bg': '#fef2f2',
-    }
-    variant = config.get('variant', 'default')
-    if variant == 'primary': accent_color, title_color = BRAND_COLORS['azulPrimario'], BRAND_COLORS['azulPrimario']
-    elif variant == 'secondary': accent_color, title_color = BRAND_COLORS['roxo'], BRAND_COLORS['roxo']
-    elif variant == 'accent': accent_color, title_color = BRAND_COLORS['amareloMarcaTexto'], BRAND_COLORS['azulEscuro']
-    else: accent_color, title_color = BRAND_COLORS['azulEscuro'], BRAND_COLORS['azulEscuro']
-
-    fig, ax = plt.subplots(figsize=(5, 5)); fig.set_facecolor('#f0f2f5'); ax.axis('off')
-    ax.add_patch(mpatches.FancyBboxPatch((0.05, 0.05), 0.9, 0.9, facecolor='#d1d5db', edgecolor='none', boxstyle="round,pad=0,rounding_size=0.04", transform=ax.transAxes, alpha=0.5))
-    ax.add_patch(mpatches.FancyBboxPatch((0.05, 0.05), 0.9, 0.9, facecolor=BRAND_COLORS['branco'], edgecolor='#e5e7eb', boxstyle="round,pad=0,rounding_size=0.04", transform=ax.transAxes))
-    ax.add_patch(mpatches.Rectangle((0.05, 0.91), 0.9, 0.04, facecolor=accent_color, transform=ax.transAxes, clip_on=False, zorder=2))
-    ax.text(0.5, 0.85, config['title'], ha='center', va='center', fontsize=18, fontproperties=STYLE_CONFIG['font_bold'], color=title_color, transform=ax.transAxes)
-    ax.text(0.5, 0.70, config['mainValue'], ha='center', va='center', fontsize=40, fontproperties=STYLE_CONFIG['font_bold'], color=BRAND_COLORS['azulEscuro'], transform=ax.transAxes)
-    
-    y_pos = 0.48
-    for item in config['breakdown']:
-        ax.text(0.15, y_pos, f"{item['label']}:", ha='left', va='center', fontsize=14, color=BRAND_COLORS['azulEscuro'], transform=ax.transAxes)
-        
-        # --- ALTERAÇÃO APLICADA AQUI ---
-        # Pega a posição personalizada se ela existir, senão usa o padrão 0.35
-        valor_x_pos = item.get('value_x_pos', 0.35)
-        ax.text(valor_x_pos, y_pos, item['value'], ha='left', va='center', fontsize=14, fontproperties=STYLE_CONFIG['font_bold'], color=BRAND_COLORS['azulPrimario'], transform=ax.transAxes)
-        
-        if 'change' in item:
-            is_positive = item['changeType'] == 'positive'
-            badge_color_text = BRAND_COLORS['positive_text'] if is_positive else BRAND_COLORS['negative_text']
-            badge_color_bg = BRAND_COLORS['positive_bg'] if is_positive else BRAND_COLORS['negative_bg']
-            icon = '↑' if is_positive else '↓'
-            badge_text = f"{icon} {item['change']}"
-            text_box = ax.text(0.85, y_pos, badge_text, ha='center', va='center', fontsize=10, color=badge_color_text, fontproperties=STYLE_CONFIG['font_bold'], transform=ax.transAxes)
-            text_box.set_bbox(dict(facecolor=badge_color_bg, edgecolor=badge_color_text, boxstyle='round,pad=0.4', alpha=0.7, linewidth=0.5))
-        
-        y_pos -= 0.12
+    cards_big_number.criar_big_number_card(
+        config, output_filename, dpi=STYLE_CONFIG['dpi'],
+        recortar=STYLE_CONFIG['bbox_inches'] == 'tight', pil_kwargs=STYLE_CONFIG['pil_kwargs'],
+    )
 
-    plt.savefig(output_filename, dpi=300, bbox_inches='tight', transparent = True); plt.close(fig)
 
-
-def gerar_cards_detalhados(artista, file_path):
+def gerar_cards_detalhados(artista, tabela_4_1):
     """
     Função principal que lê os dados e adiciona uma configuração de posição
     personalizada para o card de Inscritos.
     """
     try:
-        data = pd.read_excel(file_path, sheet_name='Resultado')
-        data2 = pd.read_excel(file_path, sheet_name='Desvio')
+        data = tabela_4_1['Resultado'].copy()
+        data2 = tabela_4_1['Desvio'].copy()
         
         metricas_config = [
             {'title': 'VISUALIZAÇÕES', 'variant': 'primary', 'total': (data.iloc[8, 7] + data.iloc[9, 7] + data.iloc[10, 7]), 'formatter': formatar_numero_card, 'plot_index': '4a', 
@@ -462,13 +415,13 @@ def gerar_cards_detalhados(artista, file_path):
         print(f"❌ Erro em gerar_cards_detalhados para '{artista}': {e}")
         
 
-def publicated_table(artista, file_path):
+def publicated_table(artista, tabela_4_1):
     """
     Gera a tabela de vídeos publicados com design avançado, mas sem os indicadores de tendência (setas).
     """
     try:
         # --- 1. CARREGAMENTO E PREPARAÇÃO DOS DADOS ---
-        df_full_data = pd.read_excel(file_path.format(artista=artista), sheet_name='Resultado', index_col=0)
+        df_full_data = tabela_4_1['Resultado'].set_index('Data')
         
         # Seleciona apenas as linhas de Vídeos e Lives
         df = df_full_data.iloc[11:13].copy()
@@ -479,70 +432,31 @@ def publicated_table(artista, file_path):
         
         df.columns = pd.to_datetime(df.columns).strftime('%b')
 
-        # --- 2. CRIAÇÃO DA TABELA VAZIA ---
-        fig, ax = plt.subplots(figsize=(10, 2.5)) # Tamanho otimizado para 2 linhas
-        ax.axis('off')
-        
-        tabela = ax.table(
-            cellText=[[''] * len(df.columns)] * len(df.index), # Células vazias
-            rowLabels=df.index,
-            colLabels=df.columns,
-            loc='center',
-            cellLoc='right' # Alinha o texto à direita
-        )
-        tabela.auto_set_font_size(False)
-        tabela.scale(1, 2.5) # Ajusta a altura das células
-
-        # --- 3. ESTILIZAÇÃO E PREENCHIMENTO ---
-        for (row, col), cell in tabela.get_celld().items():
-            cell.set_edgecolor('none')
-
-            # Estilo do Cabeçalho
-            if row == 0:
-                cell.set_text_props(ha='center', color='white', **STYLE_CONFIG['table_font_props'])
-                cell.set_facecolor(STYLE_CONFIG['colors']['primary_blue'])
-                cell.set_height(0.2)
-            # Estilo da Coluna de Métricas
-            elif col == -1:
-                cell.set_text_props(ha='left', va='center', color=STYLE_CONFIG['colors']['text_dark'], **STYLE_CONFIG['table_font_props'])
-                cell.get_text().set_text(f"  {df.index[row-1]}")
-                cell.set_facecolor('#F0F4FF')
-                cell.set_edgecolor('#E5E7EB')
-                cell.set_linewidth(1)
-                cell.set_width(0.4)
-            # Estilo das Células de Dados
-            else:
-                cell.set_facecolor('#FFFFFF' if row % 2 != 0 else '#F0F4FF')
-                
-                current_value = df.iloc[row-1, col]
+        # --- 2. GRADE ESTILIZADA (sem indicadores de tendência) ---
+        linhas = []
+        for row, rotulo in enumerate(df.index):
+            celulas = []
+            for col in range(len(df.columns)):
+                current_value = df.iloc[row, col]
                 display_val = f"{int(current_value)}" if pd.notna(current_value) else '-'
-                
-                # ALTERAÇÃO: A lógica de ícone e tendência foi removida daqui.
-                # O texto é definido diretamente, sem as setas.
-                cell.get_text().set_text(display_val)
-                cell.get_text().set_color(STYLE_CONFIG['colors']['text_dark']) # Cor única para todos os dados
-                cell.get_text().set_font_properties(STYLE_CONFIG['table_font_props']['fontproperties'])
-                cell.get_text().set_size(STYLE_CONFIG['table_font_props']['size'])
-
-        fig.suptitle('', y=0.5, **STYLE_CONFIG['font_props_title'])
-        plt.tight_layout(rect=[0, 0, 1, 1])
-        
-        plt.savefig(
-            f'dados_full/{artista}/plots/5 - Publicados.png', 
-            dpi=STYLE_CONFIG['dpi'], 
-            bbox_inches='tight',
-            pad_inches=0.1,
-            transparent=STYLE_CONFIG['transparent']
-        )
-        plt.close(fig)
+                celulas.append(tabela_imagem.celula(display_val, STYLE_CONFIG['colors']['text_dark']))
+            linhas.append({'rotulo': rotulo, 'celulas': celulas})
+
+        # --- 3. DESENHO DA TABELA ---
+        grade = {
+            'colunas': list(df.columns), 'linhas': linhas,
+            'cor_cabecalho': STYLE_CONFIG['colors']['primary_blue'], 'cor_texto_rotulo': STYLE_CONFIG['colors']['text_dark'],
+            'zebra': ('#FFFFFF', '#F0F4FF'), 'escala_altura': 2.5, 'altura_cabecalho': 0.2, 'topo': 1,
+        }
+        salvar_tabela(grade, f'dados_full/{artista}/plots/5 - Publicados.png', figsize=(10, 2.5))
         
     except Exception as e:
         print(f"❌ Erro em publicated_table para '{artista}': {e}")
 
 
-def analyze_initial_updated(artista, file_path):
+def analyze_initial_updated(artista, tabela_4_1):
     try:
-        df = pd.read_excel(file_path, sheet_name='Resultado'); 
+        df = tabela_4_1['Resultado'].copy(); 
         meses_com_media = pd.to_datetime(df.columns[1:], errors='coerce'); 
         visualizacoes = df.iloc[7, 1:].values; 
         receita_total = df.iloc[0, 1:].values
@@ -571,20 +485,20 @@ def analyze_initial_updated(artista, file_path):
         ax2.legend(handles=[linha_visualizacao], loc='upper right')
 
         plt.title('Receita x Visualização', **STYLE_CONFIG['font_props_title']); plt.tight_layout(); 
-        plt.savefig(f'dados_full/{artista}/plots/6 - Análise_Inicial.png', dpi=STYLE_CONFIG['dpi'], transparent=STYLE_CONFIG['transparent'], bbox_inches='tight'); 
+        plt.savefig(f'dados_full/{artista}/plots/6 - Análise_Inicial.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], transparent=STYLE_CONFIG['transparent'], bbox_inches=STYLE_CONFIG['bbox_inches']); 
         plt.close(fig)
 
     except Exception as e: print(f"❌ Erro em analyze_initial_updated para '{artista}': {e}")
 
 
-def watch_table(artista, file_path):
+def watch_table(artista, tabela_4_1):
     """
     Gera a tabela de WatchTime, CPM e Taxa de Preenchimento com o design unificado
     e a formatação de dados corrigida.
     """
     try:
         # --- 1. CARREGAMENTO E PREPARAÇÃO DOS DADOS ---
-        df = pd.read_excel(file_path.format(artista=artista), sheet_name="Resultado")
+        df = tabela_4_1['Resultado'].copy()
         
         # Define as linhas a serem selecionadas
         ROW_TAXA_PREENCHIMENTO = 62 
@@ -598,87 +512,44 @@ def watch_table(artista, file_path):
         
         df_watch.columns = pd.to_datetime(df_watch.columns, errors='coerce').strftime('%b')
 
-        # --- 2. CRIAÇÃO DA TABELA VAZIA ---
-        fig, ax = plt.subplots(figsize=(10, 3)) 
-        ax.axis('off')
-        
-        tabela = ax.table(
-            cellText=[[''] * len(df_watch.columns)] * len(df_watch.index),
-            rowLabels=df_watch.index,
-            colLabels=df_watch.columns,
-            loc='center',
-            cellLoc='right'
-        )
-        tabela.auto_set_font_size(False)
-        tabela.scale(1, 2.8)
-
-        # --- 3. ESTILIZAÇÃO E PREENCHIMENTO CÉLULA POR CÉLULA ---
-        for (row, col), cell in tabela.get_celld().items():
-            cell.set_edgecolor('none')
-
-            # Estilo do Cabeçalho
-            if row == 0:
-                cell.set_text_props(ha='center', color='white', **STYLE_CONFIG['table_font_props'])
-                cell.set_facecolor(STYLE_CONFIG['colors']['primary_blue'])
-                cell.set_height(0.18)
-            # Estilo da Coluna de Métricas
-            elif col == -1:
-                cell.set_text_props(ha='left', va='center', color=STYLE_CONFIG['colors']['text_dark'], **STYLE_CONFIG['table_font_props'])
-                cell.get_text().set_text(f"  {df_watch.index[row-1]}")
-                cell.set_facecolor('#F0F4FF')
-                cell.set_edgecolor('#E5E7EB')
-                cell.set_linewidth(1)
-                cell.set_width(0.4)
-            # Estilo das Células de Dados
-            else:
-                cell.set_facecolor('#FFFFFF' if row % 2 != 0 else '#F0F4FF')
-                
-                metric_name = df_watch.index[row-1]
-                current_value = df_watch.iloc[row-1, col]
-                
-                # Formatação contextual do texto da célula
-                display_val = ""
+        # --- 2. GRADE ESTILIZADA (formatação contextual por métrica) ---
+        linhas = []
+        for row, metric_name in enumerate(df_watch.index):
+            celulas = []
+            for col in range(len(df_watch.columns)):
+                current_value = df_watch.iloc[row, col]
                 if pd.notna(current_value):
-                    # CORREÇÃO APLICADA AQUI:
-                    # Verifica o nome da métrica para aplicar a formatação correta.
                     if "Watch Time Total" in metric_name: # Corresponde a "WatchTime"
                         display_val = f"{float(current_value):,.0f} h".replace(",", ".")
                     elif "CPM" in metric_name:
                         display_val = f"${dec_format(current_value)}"
-                    else: # A terceira métrica (Taxa de Preenchimento) será formatada como porcentagem
+                    else: # A terceira métrica (Taxa de Preenchimento) é formatada como porcentagem
                         display_val = f"{dec_format(current_value)}%"
                 else:
                     display_val = '-'
-                
-                # Define o texto com cor e fonte padronizadas
-                cell.get_text().set_text(display_val)
-                cell.get_text().set_color(STYLE_CONFIG['colors']['text_dark'])
-                cell.get_text().set_font_properties(STYLE_CONFIG['table_font_props']['fontproperties'])
-                cell.get_text().set_size(STYLE_CONFIG['table_font_props']['size'])
-
-        fig.suptitle("", y=0.5, **STYLE_CONFIG['font_props_title'])
-        plt.tight_layout(rect=[0, 0, 1, 1])
-        
-        plt.savefig(
-            f"dados_full/{artista}/plots/7 - Watchtime.png", 
-            transparent=STYLE_CONFIG['transparent'], 
-            bbox_inches="tight", 
-            dpi=STYLE_CONFIG['dpi']
-        )
-        plt.close(fig)
+                celulas.append(tabela_imagem.celula(display_val, STYLE_CONFIG['colors']['text_dark']))
+            linhas.append({'rotulo': metric_name, 'celulas': celulas})
+
+        # --- 3. DESENHO DA TABELA ---
+        grade = {
+            'colunas': list(df_watch.columns), 'linhas': linhas,
+            'cor_cabecalho': STYLE_CONFIG['colors']['primary_blue'], 'cor_texto_rotulo': STYLE_CONFIG['colors']['text_dark'],
+            'zebra': ('#FFFFFF', '#F0F4FF'), 'escala_altura': 2.8, 'altura_cabecalho': 0.18, 'topo': 1,
+        }
+        salvar_tabela(grade, f"dados_full/{artista}/plots/7 - Watchtime.png", figsize=(10, 3))
 
     except Exception as e:
         print(f"❌ Erro em watch_table para '{artista}': {e}")
 
 
-def monetization_graph(artista, file_path):
+def monetization_graph(artista, tabela_4_1):
     """
     Gera o gráfico de monetização com posicionamento vertical garantido para os rótulos,
     evitando sobreposição.
     """
     try:
         # --- 1. CARREGAMENTO DOS DADOS (sem alterações) ---
-        df = pd.read_excel(file_path, sheet_name="Resultado")
+        df = tabela_4_1['Resultado'].copy()
         meses = pd.to_datetime(df.columns[2:], errors='coerce').dropna().to_series().dt.strftime('%b')
         receita_vod_velho = df.iloc[58, 2:].astype(float)
         receita_vod_novo = df.iloc[55, 2:].astype(float)
@@ -742,19 +613,19 @@ def monetization_graph(artista, file_path):
         fig.legend(handles=lines + lines2, labels=labels + labels2, loc='upper center', bbox_to_anchor=(0.5, 0.03), ncol=len(labels + labels2), prop={'size': 9})
         
         fig.tight_layout(rect=[0, 0, 1, 0.95])
-        plt.savefig(f'dados_full/{artista}/plots/8 - Monetizacao_v2.png', dpi=STYLE_CONFIG['dpi'], transparent=STYLE_CONFIG['transparent'], bbox_inches='tight')
+        plt.savefig(f'dados_full/{artista}/plots/8 - Monetizacao_v2.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], transparent=STYLE_CONFIG['transparent'], bbox_inches=STYLE_CONFIG['bbox_inches'])
         plt.close(fig)
 
     except Exception as e:
         print(f"❌ Erro em monetization_graph para '{artista}': {e}")
 
 
-def revenue_per_type_chart(artista, file_path):
+def revenue_per_type_chart(artista, tabela_4_1):
     """
     Gera o gráfico de RPM e Receita, agora com bordas cinzas nas linhas de receita.
     """
     try:
-        df = pd.read_excel(file_path, sheet_name="Resultado")
+        df = tabela_4_1['Resultado'].copy()
         meses = pd.to_datetime(df.columns[2:], errors='coerce').dropna().to_series().dt.strftime('%b')
         rpm_vod_novo = df.iloc[21, 2:].astype(float)
         rpm_live_novo = df.iloc[22, 2:].astype(float)
@@ -814,20 +685,20 @@ def revenue_per_type_chart(artista, file_path):
         fig.legend(handles=lines + lines2, labels=labels + labels2, loc='upper center', bbox_to_anchor=(0.5, 0.03), ncol=len(labels + labels2), prop={'size': 9})
 
         plt.tight_layout(rect=[0, 0, 1, 0.95]) # Ajusta para dar espaço à legenda
-        plt.savefig(f'dados_full/{artista}/plots/9 - Monetização por formatos.png', dpi=STYLE_CONFIG['dpi'], transparent=STYLE_CONFIG['transparent'], bbox_inches='tight')
+        plt.savefig(f'dados_full/{artista}/plots/9 - Monetização por formatos.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], transparent=STYLE_CONFIG['transparent'], bbox_inches=STYLE_CONFIG['bbox_inches'])
         plt.close(fig)
 
     except Exception as e:
         print(f"❌ Erro em revenue_per_type_chart para '{artista}': {e}")
 
 
-def conversion_graph(artista, file_path):
+def conversion_graph(artista, tabela_4_1):
     """
     Gera o gráfico de Conversão (CTR vs Views) com o novo design padronizado.
     """
     try:
         # --- 1. CARREGAMENTO E PREPARAÇÃO DOS DADOS ---
-        df = pd.read_excel(file_path, sheet_name='Resultado')
+        df = tabela_4_1['Resultado'].copy()
         meses = pd.to_datetime(df.columns[2:], errors='coerce').dropna()
         
         # Garante que os dados numéricos sejam lidos corretamente
@@ -888,20 +759,20 @@ def conversion_graph(artista, file_path):
         fig.legend(handles=lines + lines2, labels=labels + labels2, loc='upper center', bbox_to_anchor=(0.5, 0.03), ncol=5, prop={'size': 9})
 
         plt.tight_layout(rect=[0, 0, 1, 0.95])
-        plt.savefig(f'dados_full/{artista}/plots/10 - Conversao.png', dpi=STYLE_CONFIG['dpi'], transparent=STYLE_CONFIG['transparent'], bbox_inches='tight')
+        plt.savefig(f'dados_full/{artista}/plots/10 - Conversao.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], transparent=STYLE_CONFIG['transparent'], bbox_inches=STYLE_CONFIG['bbox_inches'])
         plt.close(fig)
         
     except Exception as e:
         print(f"❌ Erro ao gerar o gráfico 'conversion_graph': {e}")
 
 
-def gerar_grafico_views(artista, file_path):
+def gerar_grafico_views(artista, tabela_4_1):
     """
     Cria um gráfico de visualizações com rótulos de dados que não se sobrepõem.
     """
     try:
         # --- 1. CARREGAMENTO DOS DADOS ---
-        df = pd.read_excel(file_path, sheet_name="Resultado")
+        df = tabela_4_1['Resultado'].copy()
         meses = pd.to_datetime(df.columns[2:], errors='coerce').dropna().to_series().dt.strftime('%b')
         
         idx_views_vod_novo = 80; idx_views_lives_novo = 81; idx_views_shorts_novo = 82
@@ -972,20 +843,20 @@ def gerar_grafico_views(artista, file_path):
         lines, labels = ax1.get_legend_handles_labels(); lines2, labels2 = ax2.get_legend_handles_labels()
         fig.legend(handles=lines + lines2, labels=labels + labels2, loc='upper center', bbox_to_anchor=(0.5, 0.03), ncol=4, prop={'size': 9})
         fig.tight_layout(rect=[0, 0, 1, 0.95])
-        plt.savefig(f'dados_full/{artista}/plots/19 - Views_Novo_vs_Velho.png', dpi=STYLE_CONFIG['dpi'], transparent=STYLE_CONFIG['transparent'], bbox_inches='tight')
+        plt.savefig(f'dados_full/{artista}/plots/19 - Views_Novo_vs_Velho.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], transparent=STYLE_CONFIG['transparent'], bbox_inches=STYLE_CONFIG['bbox_inches'])
         plt.close(fig)
         
     except Exception as e:
         print(f"❌ Erro em gerar_grafico_views para '{artista}': {e}")
 
 
-def gerar_grafico_qualidade(artista, file_path, tipo_conteudo, plot_index):
+def gerar_grafico_qualidade(artista, tabela_4_1, tipo_conteudo, plot_index):
     """
     Gera o gráfico de qualidade, com background em todos os rótulos de dados das barras.
     Se o tipo for 'shorts', exibe os valores de tempo em segundos.
     """
     try:
-        df = pd.read_excel(file_path, sheet_name='Resultado')
+        df = tabela_4_1['Resultado'].copy()
         
         meses = df.columns[2:].to_list()
         
@@ -1063,15 +934,15 @@ def gerar_grafico_qualidade(artista, file_path, tipo_conteudo, plot_index):
         
         fig.suptitle(title, x=0.035, ha='left', **STYLE_CONFIG['font_props_subtitle'], y=0.73, rotation=90)       
         plt.tight_layout(rect=[1, 1, 1, 0.96])
-        fig.savefig(f'dados_full/{artista}/plots/{plot_index} - Qualidade_{tipo_conteudo.capitalize()}.png', dpi=STYLE_CONFIG['dpi'], bbox_inches="tight", transparent=STYLE_CONFIG['transparent'])
+        fig.savefig(f'dados_full/{artista}/plots/{plot_index} - Qualidade_{tipo_conteudo.capitalize()}.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], bbox_inches=STYLE_CONFIG['bbox_inches'], transparent=STYLE_CONFIG['transparent'])
         plt.close(fig)
         
     except Exception as e:
         print(f"❌ Erro em gerar_grafico_qualidade para '{artista}' ({tipo_conteudo}): {e}")
         
 
-def dfOrigem(nomeArquivo1, nomeArquivo2):
-    df1 = pd.read_csv(nomeArquivo1 + ".csv"); df2 = pd.read_csv(nomeArquivo2 + ".csv"); df = pd.concat([df1, df2], ignore_index=True); df['Data'] = pd.to_datetime(df['Data']); df.sort_values('Data', inplace=True); df["Mês"] = df['Data'].dt.strftime('%Y-%m'); df = df[['Origem do tráfego', 'Visualizações', 'Mês']].groupby(by=['Mês', 'Origem do tráfego']).sum().reset_index(); origensImportantes = ("Recursos de navegação","Vídeos sugeridos","Páginas do canal","Externa","Notificações","Pesquisa do YouTube","Playlists","Publicidade no YouTube"); b = df[~df['Origem do tráfego'].isin(origensImportantes)].groupby(by=['Mês']).sum(numeric_only=True); b["Origem do tráfego"] = 'Outros'; b.reset_index(inplace=True); df = pd.concat([b, df[df['Origem do tráfego'].isin(origensImportantes)]]); total = df.groupby('Origem do tráfego')['Visualizações'].sum().sort_values(ascending=False).index.tolist(); df = df.pivot(index="Mês", columns="Origem do tráfego", values="Visualizações").fillna(0); df = df.reset_index().sort_values(by="Mês").reset_index(drop=True)
+def dfOrigem(artista, nomeTabela1, nomeTabela2):
+    df1 = armazem_canal.ler_tabela(artista, nomeTabela1); df2 = armazem_canal.ler_tabela(artista, nomeTabela2); df = pd.concat([df1, df2], ignore_index=True); df.sort_values('Data', inplace=True); df["Mês"] = df['Data'].dt.strftime('%Y-%m'); df = df[['Origem do tráfego', 'Visualizações', 'Mês']].groupby(by=['Mês', 'Origem do tráfego']).sum().reset_index(); origensImportantes = ("Recursos de navegação","Vídeos sugeridos","Páginas do canal","Externa","Notificações","Pesquisa do YouTube","Playlists","Publicidade no YouTube"); b = df[~df['Origem do tráfego'].isin(origensImportantes)].groupby(by=['Mês']).sum(numeric_only=True); b["Origem do tráfego"] = 'Outros'; b.reset_index(inplace=True); df = pd.concat([b, df[df['Origem do tráfego'].isin(origensImportantes)]]); total = df.groupby('Origem do tráfego')['Visualizações'].sum().sort_values(ascending=False).index.tolist(); df = df.pivot(index="Mês", columns="Origem do tráfego", values="Visualizações").fillna(0); df = df.reset_index().sort_values(by="Mês").reset_index(drop=True)
     return df, total
 
 
@@ -1081,18 +952,25 @@ def traficSorce_graph(df, x_labels, total, title, color_map, artista):
         for n, origem in enumerate(total):
             if origem in df.columns: y_values = df[origem].values; ax.bar(x=x_labels, height=y_values, color=color_map[n % len(color_map)], bottom=bottom, label=origem); bottom += y_values
         ax.legend(loc='upper left', bbox_to_anchor=(1, 1)); ax.yaxis.set_major_formatter(FuncFormatter(formatar_eixo_numeros)); ax.set_title(title.title(), **STYLE_CONFIG['font_props_title']); ax.tick_params(axis='x', rotation=45); ax.set_ylabel('Visualizações', **STYLE_CONFIG['font_props_label']); plt.tight_layout()
-        plt.savefig(f'dados_full/{artista}/plots/13 - Origem_do_trafego.png', dpi=STYLE_CONFIG['dpi'], transparent=STYLE_CONFIG['transparent']); plt.close(fig)
+        plt.savefig(f'dados_full/{artista}/plots/13 - Origem_do_trafego.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], transparent=STYLE_CONFIG['transparent']); plt.close(fig)
     except Exception as e: print(f"❌ Erro em traficSorce_graph para '{artista}': {e}")
     
     
-def subscription_growth(artista, file_path):
+def gerar_grafico_origem_trafego(artista):
+    try:
+        semestralOrigem, total = dfOrigem(artista, 'origem_lives', 'origem_vods')
+        traficSorce_graph(semestralOrigem, semestralOrigem['Mês'], total, 'Views by Traffic Source', plt.cm.get_cmap('tab20').colors, artista)
+    except Exception as e: print(f"❌ Error generating Traffic Source chart for '{artista}': {e}")
+
+
+def subscription_growth(artista, tabela_4_1):
     """
     Gera o gráfico de crescimento de inscrições com espaçamento ajustado,
     rótulos com background e posicionamento vertical aprimorado.
     """
     try:
         # --- 1. CARREGAMENTO E PREPARAÇÃO DOS DADOS (sem alterações) ---
-        df = pd.read_excel(file_path, sheet_name="Resultado")
+        df = tabela_4_1['Resultado'].copy()
         meses = pd.to_datetime(df.columns[2:], errors='coerce').dropna().to_series().dt.strftime('%b')
         insc_novo_vod = df.iloc[41, 2:].astype(float)
         insc_novo_live = df.iloc[42, 2:].astype(float)
@@ -1167,19 +1045,19 @@ def subscription_growth(artista, file_path):
         
         fig.legend(loc='upper right', bbox_to_anchor=(0.95, 0.03), ncol=7)
         plt.tight_layout(rect=[0, 0, 0.9, 1])
-        plt.savefig(f'dados_full/{artista}/plots/14 - Inscricoes_por_Tipo_de_Conteudo.png', dpi=STYLE_CONFIG['dpi'], transparent=STYLE_CONFIG['transparent'], bbox_inches='tight')
+        plt.savefig(f'dados_full/{artista}/plots/14 - Inscricoes_por_Tipo_de_Conteudo.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], transparent=STYLE_CONFIG['transparent'], bbox_inches=STYLE_CONFIG['bbox_inches'])
         plt.close(fig)
         
     except Exception as e:
         print(f"❌ Erro em subscription_growth para '{artista}': {e}")
 
 
-def gerar_grafico_engajamento_tipo(artista, file_path, tipo_conteudo, plot_index):
+def gerar_grafico_engajamento_tipo(artista, tabela_4_1, tipo_conteudo, plot_index):
     """
     Gera o gráfico de engajamento com cores de barra padronizadas e uma linha estilizada.
     """
     try:
-        df = pd.read_excel(file_path, sheet_name='Resultado')
+        df = tabela_4_1['Resultado'].copy()
         meses = pd.to_datetime(df.columns[2:], errors='coerce').dropna()
         
         if tipo_conteudo == 'vod':
@@ -1233,35 +1111,26 @@ def gerar_grafico_engajamento_tipo(artista, file_path, tipo_conteudo, plot_index
         plt.subplots_adjust(left=0.15)
         fig.legend(loc='upper right', bbox_to_anchor=(0.95, 0.95), ncol=2)
 
-        plt.savefig(f'dados_full/{artista}/plots/{plot_index} - Engajamento_{tipo_conteudo.capitalize()}.png', dpi=STYLE_CONFIG['dpi'], transparent=STYLE_CONFIG['transparent'], bbox_inches='tight')
+        plt.savefig(f'dados_full/{artista}/plots/{plot_index} - Engajamento_{tipo_conteudo.capitalize()}.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], transparent=STYLE_CONFIG['transparent'], bbox_inches=STYLE_CONFIG['bbox_inches'])
         plt.close(fig)
         
     except Exception as e:
         print(f"❌ Erro em gerar_grafico_engajamento_tipo para '{artista}': {e}")
 
 
-def gerar_grafico_comunidade(artista):
+def gerar_grafico_comunidade(artista, contexto):
     """
     Gera um gráfico de barras e linha para analisar publicações e impressões da comunidade.
-    A função usa a data mais recente do arquivo 'total.csv' como referência para
-    filtrar os últimos 6 meses de dados.
+    A janela dos últimos 6 meses vem do contexto de período do canal (periodo_canal).
     """
     try:
         # --- 1. Carregar e Preparar Dados (total.csv) ---
-        data_meses = pd.read_csv(f'dados_full/{artista}/total.csv').drop(0)
-        data_meses["Data"] = pd.to_datetime(data_meses["Data"])
+        data_meses = armazem_canal.ler_tabela(artista, 'total').drop(0)
+        data_meses["Data"] = data_meses["Data"].dt.to_timestamp()
 
-        # --- 2. Lógica para Definir o Período de 6 Meses ---
-        
-        # *** CORREÇÃO DEFINITIVA APLICADA AQUI ***
-        # Encontra a data mais recente (que o pandas interpreta como o dia 1 do mês)
-        data_mais_recente_inicio_mes = data_meses["Data"].max()
-        # Ajusta a data para ser o ÚLTIMO dia do mês, garantindo que todo o mês seja incluído.
-        data_mais_recente = data_mais_recente_inicio_mes + pd.offsets.MonthEnd(0)
-        
-        # Define o limite inferior da janela de 6 meses
-        primeiro_dia_mes_recente = data_mais_recente.replace(day=1)
-        data_limite_inferior = primeiro_dia_mes_recente - pd.DateOffset(months=5)
+        # --- 2. Período de 6 Meses (primeiro e último dia da janela de análise) ---
+        data_limite_inferior = contexto['inicio_janela']
+        data_mais_recente = contexto['fim_janela']
 
         # Filtra os dados de 'total.csv' para o período desejado
         data_meses_filtrada = data_meses[
@@ -1270,10 +1139,7 @@ def gerar_grafico_comunidade(artista):
         ].copy()
 
         # --- 3. Carregar e Preparar Dados (comunidade.csv) ---
-        data_comu = pd.read_csv(f'dados_full/{artista}/comunidade.csv')
-        data_comu["Horário de publicação da postagem"] = pd.to_datetime(
-            data_comu["Horário de publicação da postagem"], errors="coerce"
-        )
+        data_comu = armazem_canal.ler_tabela(artista, 'comunidade')
         data_comu.dropna(subset=["Horário de publicação da postagem"], inplace=True)
 
         # Filtra os dados de 'comunidade.csv' para o mesmo período
@@ -1332,7 +1198,7 @@ def gerar_grafico_comunidade(artista):
         plt.tight_layout(rect=[0, 0.1, 1, 1])
         
         # Exemplo para exibir o gráfico. Descomente se precisar.
-        plt.savefig(f'dados_full/{artista}/plots/17 - Comunidade.png', dpi=STYLE_CONFIG['dpi'], transparent=STYLE_CONFIG['transparent'], bbox_inches='tight')
+        plt.savefig(f'dados_full/{artista}/plots/17 - Comunidade.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], transparent=STYLE_CONFIG['transparent'], bbox_inches=STYLE_CONFIG['bbox_inches'])
         plt.close(fig)
 
     except Exception as e:
@@ -1346,8 +1212,8 @@ def gerar_tabela_inscritos_avancada(artista):
      """
      try:
          # --- 1. CARREGAMENTO E PREPARAÇÃO DOS DADOS ---
-         df_full = pd.read_csv(f'dados_full/{artista}/total.csv').drop(0)
-         df_full["Data"] = pd.to_datetime(df_full["Data"])
+         df_full = armazem_canal.ler_tabela(artista, 'total').drop(0)
+         df_full["Data"] = df_full["Data"].dt.to_timestamp()
          df_full.sort_values('Data', ascending=True, inplace=True, ignore_index=True)
 
          if len(df_full) >= 7:
@@ -1382,40 +1248,19 @@ def gerar_tabela_inscritos_avancada(artista):
          }).T
          df_full_trend.columns = pd.to_datetime(df_full['Data']).dt.strftime('%b')
 
-         # --- 3. CRIAÇÃO E ESTILIZAÇÃO DA TABELA ---
-         fig, ax = plt.subplots(figsize=(12, 4.5))
-         ax.axis('off')
-
-         tabela = ax.table(
-             cellText=[[''] * len(df_display.columns)] * len(df_display.index),
-             rowLabels=df_display.index, colLabels=df_display.columns,
-             loc='center', cellLoc='right'
-         )
-         tabela.auto_set_font_size(False); tabela.scale(1, 2.8)
-
-         # Ponto-chave da alteração: extrair a tendência de Inscritos Totais
-         # para usá-la na lógica da métrica % de Crescimento
+         # --- 3. GRADE ESTILIZADA ---
+         # Ponto-chave: a tendência de Inscritos Totais é usada na métrica % de Crescimento
          total_inscritos_trend = get_trend(df_full_trend.iloc[0, -1], df_full_trend.iloc[0, -2])
 
-         for (row, col_display), cell in tabela.get_celld().items():
-             col_full = col_display + 1
-             cell.set_edgecolor('none')
-             if row == 0:
-                 cell.set_text_props(ha='center', color='white', **STYLE_CONFIG['table_font_props']); cell.set_facecolor(STYLE_CONFIG['colors']['primary_blue'])
-             elif col_display == -1:
-                 cell.set_text_props(ha='left', va='center', color=STYLE_CONFIG['colors']['text_dark'], **STYLE_CONFIG['table_font_props']); cell.get_text().set_text(f"  {df_display.index[row-1]}"); cell.set_facecolor('#F0F4FF'); cell.set_edgecolor('#E5E7EB'); cell.set_linewidth(1); cell.set_width(0.4)
-             else:
-                 cell.set_facecolor('#FFFFFF' if row % 2 == 0 else '#F0F4FF')
-                 metric_name = df_full_trend.index[row-1]; current_value = df_full_trend.iloc[row-1, col_full]; prev_value = df_full_trend.iloc[row-1, col_full - 1]
-                 trend = get_trend(current_value, prev_value); color = STYLE_CONFIG['colors']['text_dark']
-                 
-                 # --- ALTERAÇÃO APLICADA AQUI ---
-                 # Define a tendência a ser usada para a cor e o ícone
-                 trend_to_use = trend
-                 if metric_name == "% de Crescimento":
-                    trend_to_use = total_inscritos_trend
+         linhas = []
+         for row, metric_name in enumerate(df_full_trend.index):
+             celulas = []
+             for col_full in range(1, len(df_full_trend.columns)):
+                 current_value = df_full_trend.iloc[row, col_full]; prev_value = df_full_trend.iloc[row, col_full - 1]
+                 trend_to_use = total_inscritos_trend if metric_name == "% de Crescimento" else get_trend(current_value, prev_value)
 
                  # Lógica para definir a cor
+                 color = STYLE_CONFIG['colors']['text_dark']
                  if metric_name == "Inscritos Perdidos":
                      if trend_to_use == "up": color = STYLE_CONFIG['colors']['negative']
                      elif trend_to_use == "down": color = STYLE_CONFIG['colors']['positive']
@@ -1423,25 +1268,21 @@ def gerar_tabela_inscritos_avancada(artista):
                      color = STYLE_CONFIG['colors']['positive']
                  elif trend_to_use == "down":
                      color = STYLE_CONFIG['colors']['negative']
-                  
-                 # Lógica para definir o ícone
-                 icon = ''
-                 if trend_to_use == "up": icon = '↑ '
-                 elif trend_to_use == "down": icon = '↓ '
-                  
+
                  display_val = ""
                  if pd.notna(current_value):
                      if metric_name == "% de Crescimento": display_val = f"{current_value:,.2f}%".replace(",", "X").replace(".", ",").replace("X", ".")
                      else: display_val = f"{int(current_value):,}".replace(",", ".")
-                  
-                 cell.get_text().set_text(f"{icon}{display_val}")
-                 cell.get_text().set_color(color); cell.get_text().set_font_properties(STYLE_CONFIG['table_font_props']['fontproperties']); cell.get_text().set_size(STYLE_CONFIG['table_font_props']['size'])
+                 celulas.append(tabela_imagem.celula(display_val, color, trend_to_use))
+             linhas.append({'rotulo': metric_name, 'celulas': celulas})
 
-         fig.suptitle("", y=0.5, **STYLE_CONFIG['font_props_title'])
-         plt.tight_layout(rect=[0, 0, 1, 1])
-          
-         plt.savefig(f'dados_full/{artista}/plots/18 - Tabela de Inscritos.png', transparent=STYLE_CONFIG['transparent'], bbox_inches="tight", dpi=STYLE_CONFIG['dpi'])
-         plt.close(fig)
+         # --- 4. DESENHO DA TABELA ---
+         grade = {
+             'colunas': list(df_display.columns), 'linhas': linhas,
+             'cor_cabecalho': STYLE_CONFIG['colors']['primary_blue'], 'cor_texto_rotulo': STYLE_CONFIG['colors']['text_dark'],
+             'zebra': ('#F0F4FF', '#FFFFFF'), 'escala_altura': 2.8, 'altura_cabecalho': None, 'topo': 1,
+         }
+         salvar_tabela(grade, f'dados_full/{artista}/plots/18 - Tabela de Inscritos.png', figsize=(12, 4.5))
 
      except Exception as e:
          print(f"Erro em gerar_tabela_inscritos_avancada para '{artista}': {e}")
@@ -1451,33 +1292,41 @@ def run(artista):
     # O loop 'for' e a chamada 'buscar_lista_artistas' foram REMOVIDOS.
     # 'artista' agora é recebido como argumento.
     print(f"\n--- Generating reports for: {artista} ---")
+    contexto = periodo_canal.carregar_contexto_periodo(artista)
     os.makedirs(f'dados_full/{artista}/plots', exist_ok=True)
-    file_path_4_1 = f'exports_tabelas/tabela_4.1_{artista}.xlsx'
-
-    gerar_tabela_metricas_avancada(artista, 'VOD', 'videos.csv', 1)
-    gerar_tabela_metricas_avancada(artista, 'Lives', 'lives.csv', 2)
-    gerar_tabela_metricas_avancada(artista, 'Shorts', 'shorts.csv', 3)
-    gerar_cards_detalhados(artista, file_path_4_1)
-    publicated_table(artista, file_path_4_1)
-    analyze_initial_updated(artista, file_path_4_1)
-    watch_table(artista, file_path_4_1)
-    monetization_graph(artista, file_path_4_1)
-    revenue_per_type_chart(artista, file_path_4_1)
-    conversion_graph(artista, file_path_4_1)
-    gerar_grafico_qualidade(artista, file_path_4_1, 'vod', 11)
-    gerar_grafico_qualidade(artista, file_path_4_1, 'live', 12)
-    gerar_grafico_qualidade(artista, file_path_4_1, 'shorts', 12.5)
+    # Tabela 4.1 carregada uma única vez para todos os gráficos (valores exatos do report, sem reler o Excel)
     try:
-        semestralOrigem, total = dfOrigem(f'dados_full/{artista}/origem_lives', f'dados_full/{artista}/origem_vods')
-        traficSorce_graph(semestralOrigem, semestralOrigem['Mês'], total, 'Views by Traffic Source', plt.cm.get_cmap('tab20').colors, artista)
-    except Exception as e: print(f"❌ Error generating Traffic Source chart for '{artista}': {e}")
-    subscription_growth(artista, file_path_4_1)
-    gerar_grafico_engajamento_tipo(artista, file_path_4_1, 'vod', 15)
-    gerar_grafico_engajamento_tipo(artista, file_path_4_1, 'live', 16)
-    gerar_grafico_engajamento_tipo(artista, file_path_4_1, 'shorts', 16.5)
-    gerar_grafico_comunidade(artista)
-    gerar_tabela_inscritos_avancada(artista)
-    gerar_grafico_views(artista, file_path_4_1)
+        tabela_4_1 = armazem_canal.carregar_tabela_4_1(artista)
+    except Exception as e:
+        print(f"❌ Error loading table 4.1 for '{artista}': {e}")
+        tabela_4_1 = None
+
+    # Cada gráfico grava os próprios PNGs e não depende dos outros: rodam em paralelo num pool de processos.
+    # O último item declara as fatias de dados que o gráfico lê; sem mudança nelas, o PNG vem do cache.
+    tarefas = [
+        (gerar_tabela_metricas_avancada, (artista, 'VOD', 'videos.csv', 1), ('tabela:videos',)),
+        (gerar_tabela_metricas_avancada, (artista, 'Lives', 'lives.csv', 2), ('tabela:lives',)),
+        (gerar_tabela_metricas_avancada, (artista, 'Shorts', 'shorts.csv', 3), ('tabela:shorts',)),
+        (gerar_cards_detalhados, (artista, tabela_4_1), ('aba:Resultado', 'aba:Desvio')),
+        (publicated_table, (artista, tabela_4_1), ('aba:Resultado',)),
+        (analyze_initial_updated, (artista, tabela_4_1), ('aba:Resultado',)),
+        (watch_table, (artista, tabela_4_1), ('aba:Resultado',)),
+        (monetization_graph, (artista, tabela_4_1), ('aba:Resultado',)),
+        (revenue_per_type_chart, (artista, tabela_4_1), ('aba:Resultado',)),
+        (conversion_graph, (artista, tabela_4_1), ('aba:Resultado',)),
+        (gerar_grafico_qualidade, (artista, tabela_4_1, 'vod', 11), ('aba:Resultado',)),
+        (gerar_grafico_qualidade, (artista, tabela_4_1, 'live', 12), ('aba:Resultado',)),
+        (gerar_grafico_qualidade, (artista, tabela_4_1, 'shorts', 12.5), ('aba:Resultado',)),
+        (gerar_grafico_origem_trafego, (artista,), ('tabela:origem_lives', 'tabela:origem_vods')),
+        (subscription_growth, (artista, tabela_4_1), ('aba:Resultado',)),
+        (gerar_grafico_engajamento_tipo, (artista, tabela_4_1, 'vod', 15), ('aba:Resultado',)),
+        (gerar_grafico_engajamento_tipo, (artista, tabela_4_1, 'live', 16), ('aba:Resultado',)),
+        (gerar_grafico_engajamento_tipo, (artista, tabela_4_1, 'shorts', 16.5), ('aba:Resultado',)),
+        (gerar_grafico_comunidade, (artista, contexto), ('tabela:total', 'tabela:comunidade')),
+        (gerar_tabela_inscritos_avancada, (artista,), ('tabela:total', 'arquivo:sub.txt')),
+        (gerar_grafico_views, (artista, tabela_4_1), ('aba:Resultado',)),
+    ]
+    agendador_graficos.renderizar_graficos(tarefas, artista, tabela_4_1, estilo=STYLE_CONFIG, inicializar_worker=configurar_estilo)
     
     # Corrigindo o print que daria erro de encoding
     print(f"OK - Reports for '{artista}' completed.")
@@ -7,7 +7,6 @@ import matplotlib.font_manager as fm
 import warnings
 warnings.filterwarnings('ignore')
 import seaborn as sns
-sns.set_style('whitegrid')
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
@@ -17,16 +16,30 @@ from matplotlib.ticker import MaxNLocator, FuncFormatter
 from datetime import datetime,date
 from openpyxl import load_workbook
 
+import armazem_canal
+import periodo_canal
+import agendador_graficos
+import perfil_render
+import cards_big_number
+import tabela_imagem
 
 
-try:
-    mpl.rcParams["font.family"] = "DM Sans"
-    font_path = "resources/Fonts/DMSans-Bold.ttf"
-    dm_sans_bold = fm.FontProperties(fname=font_path)
-except Exception as e:
-    print(f"⚠️ Warning: 'DM Sans' font not found. Using default font. Error: {e}")
-    mpl.rcParams["font.family"] = "sans-serif"
-    dm_sans_bold = fm.FontProperties(weight='bold')
+
+def configurar_estilo():
+    """Estilo do seaborn e fonte DM Sans nos rcParams. Roda no import e uma vez em cada worker do pool de gráficos."""
+    sns.set_style('whitegrid')
+    try:
+        mpl.rcParams["font.family"] = "DM Sans"
+        font_path = "resources/Fonts/DMSans-Bold.ttf"
+        return fm.FontProperties(fname=font_path)
+    except Exception as e:
+        print(f"⚠️ Warning: 'DM Sans' font not found. Using default font. Error: {e}")
+        mpl.rcParams["font.family"] = "sans-serif"
+        return fm.FontProperties(weight='bold')
+
+
+dm_sans_bold = configurar_estilo()
+PERFIL_RENDER = perfil_render.perfil_atual()
 
 
 STYLE_CONFIG = {
@@ -56,7 +69,9 @@ STYLE_CONFIG = {
         'fontproperties': dm_sans_bold,
         'size': 14
     },
-    'dpi': 300, 'transparent': True,
+    # dpi, bbox e compressão do PNG vêm do perfil de renderização (final ou draft)
+    'dpi': PERFIL_RENDER['dpi'], 'bbox_inches': PERFIL_RENDER['bbox_inches'],
+    'pil_kwargs': PERFIL_RENDER['pil_kwargs'], 'transparent': True,
     'figsize_wide': (12, 7), 'figsize_standard': (10, 6),
     'figsize_table_metricas': (14, 7), 'figsize_table_small': (12, 4)
 }
@@ -226,69 +241,47 @@ def format_for_table(value):
     return str(int(value))
 
 
+def salvar_tabela(grade, output_filename, figsize):
+    """Draws the grid with the Pillow table engine (tabela_imagem), using the render profile dpi and cropping."""
+    tabela_imagem.desenhar_tabela(
+        grade, output_filename, figsize, dpi=STYLE_CONFIG['dpi'],
+        recortar=STYLE_CONFIG['bbox_inches'] == 'tight', pil_kwargs=STYLE_CONFIG['pil_kwargs'],
+    )
+
+
 def gerar_tabela_metricas_avancada(artista, tipo_conteudo, nome_arquivo, plot_index):
     """
     Final and corrected version that generates the metrics table with functional font control.
     """
     try:
         # --- 1. DATA LOADING AND PREPARATION (COLUMN NAMES IN PORTUGUESE) ---
-        data = pd.read_csv(f'dados_full/{artista}/{nome_arquivo}'); data.drop(0, inplace=True)
-        def time_to_seconds(time_str):
-            if isinstance(time_str, str) and ':' in time_str:
-                parts = time_str.split(':')
-                try:
-                    if len(parts) == 3: return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-                    elif len(parts) == 2: return int(parts[0]) * 60 + int(parts[1])
-                except (ValueError, IndexError): return 0
-            return 0
-        data['Duração média da visualização'] = data['Duração média da visualização'].apply(time_to_seconds)
-        data["Data"] = pd.to_datetime(data['Data']); data.sort_values('Data', ascending=True, inplace=True, ignore_index=True)
+        data = armazem_canal.ler_tabela(artista, os.path.splitext(nome_arquivo)[0]); data.drop(0, inplace=True)
+        # In the store, duration is already in seconds and 'Data' is a monthly period
+        data['Duração média da visualização'] = data['Duração média da visualização'].fillna(0)
+        data["Data"] = data['Data'].dt.to_timestamp(); data.sort_values('Data', ascending=True, inplace=True, ignore_index=True)
         if len(data) >= 7: data = data.tail(7)
         data.reset_index(drop=True, inplace=True); data["Mes"] = data.Data.apply(lambda i: i.strftime("%b"))
         ordem_colunas = ['Mes', 'Vídeos publicados', 'Impressões', 'Taxa de cliques de impressões (%)', 'Visualizações', 'Duração média da visualização', 'Porcentagem visualizada média (%)', 'Inscritos', 'RPM (USD)', 'Receita estimada (USD)']; df_full = data[ordem_colunas].copy().set_index('Mes').T; df_display = df_full.iloc[:, 1:]
 
-        # --- 2. TABLE CREATION ---
-        fig, ax = plt.subplots(figsize=(16, 7)); ax.axis('off')
-
-        tabela = ax.table(
-            cellText=[[''] * len(df_display.columns)] * len(df_display.index),
-            rowLabels=df_display.index, colLabels=df_display.columns,
-            loc='center', cellLoc='right'
-        )
-        tabela.auto_set_font_size(False) # Prevents automatic adjustment
-        tabela.scale(1, 3) # Adjusts cell height
-
-        # --- 3. STYLING AND FILLING (CORRECTED LOGIC) ---
-        for (row, col_display), cell in tabela.get_celld().items():
-            col_full = col_display + 1; cell.set_edgecolor('none')
-
-            # Gets font properties from STYLE_CONFIG
-            font_properties = STYLE_CONFIG['table_font_props']
-
-            if row == 0: # Header
-                cell.set_text_props(**font_properties, color='white', ha='center')
-                cell.set_facecolor('#3157F7'); cell.set_height(0.12)
-            elif col_display == -1: # Metrics Column
-                cell.set_text_props(**font_properties, ha='left', va='center', color='#142544')
-                # Display metric names in English for the table row labels
-                english_metric_names = {
-                    'Vídeos publicados': 'Published videos',
-                    'Impressões': 'Impressions',
-                    'Taxa de cliques de impressões (%)': 'Impressions click-through rate (%)',
-                    'Visualizações': 'Views',
-                    'Duração média da visualização': 'Average view duration',
-                    'Porcentagem visualizada média (%)': 'Average percentage viewed (%)',
-                    'Inscritos': 'Subscribers',
-                    'RPM (USD)': 'RPM (USD)',
-                    'Receita estimada (USD)': 'Estimated revenue (USD)'
-                }
-                original_metric_name = df_full.index[row-1]
-                display_metric_name = english_metric_names.get(original_metric_name, original_metric_name) # Fallback to original if not found
-                cell.get_text().set_text(f"  {display_metric_name}")
-                cell.set_facecolor('#F0F4FF'); cell.set_edgecolor('#E5E7EB'); cell.set_linewidth(1); cell.set_width(0.35)
-            else: # Data Cells
-                cell.set_facecolor('#FFFFFF' if row % 2 != 0 else '#F0F4FF')
-                metric_name = df_full.index[row-1]; current_value = df_full.iloc[row-1, col_full]; prev_value = df_full.iloc[row-1, col_full - 1]
+        # Display metric names in English for the table row labels
+        english_metric_names = {
+            'Vídeos publicados': 'Published videos',
+            'Impressões': 'Impressions',
+            'Taxa de cliques de impressões (%)': 'Impressions click-through rate (%)',
+            'Visualizações': 'Views',
+            'Duração média da visualização': 'Average view duration',
+            'Porcentagem visualizada média (%)': 'Average percentage viewed (%)',
+            'Inscritos': 'Subscribers',
+            'RPM (USD)': 'RPM (USD)',
+            'Receita estimada (USD)': 'Estimated revenue (USD)'
+        }
+
+        # --- 2. STYLED GRID (formatting, trend and color of each cell) ---
+        linhas = []
+        for row, metric_name in enumerate(df_full.index):
+            celulas = []
+            for col_full in range(1, len(df_full.columns)):
+                current_value = df_full.iloc[row, col_full]; prev_value = df_full.iloc[row, col_full - 1]
                 trend = get_trend(current_value, prev_value)
 
                 display_val = ""
@@ -300,24 +293,20 @@ def gerar_tabela_metricas_avancada(artista, tipo_conteudo, nome_arquivo, plot_in
                     else: display_val = dec_format(current_value)
                     if metric_name in ["Taxa de cliques de impressões (%)", "Porcentagem visualizada média (%)"]: display_val += "%"
 
-                icon = ''; color = STYLE_CONFIG['colors']['text_dark']
-                if trend == "up": icon = '↑ '; color = STYLE_CONFIG['colors']['positive']
-                elif trend == "down": icon = '↓ '; color = STYLE_CONFIG['colors']['negative']
-
-                cell.get_text().set_text(f"{icon}{display_val}")
-                # APPLIES PROPERTIES CORRECTLY
-                cell.get_text().set_font_properties(font_properties['fontproperties'])
-                cell.get_text().set_size(font_properties['size'])
-                cell.get_text().set_color(color)
-
-        fig.suptitle("", y=0.5, **STYLE_CONFIG['font_props_title'])
-        plt.tight_layout(rect=[0, 0, 1, 0.95])
-
-        plt.savefig(
-            f'dados_full/{artista}/plots/{plot_index} - Metrics_{tipo_conteudo}_Advanced.png',
-            dpi=STYLE_CONFIG['dpi'], bbox_inches='tight', pad_inches=0.1, transparent=STYLE_CONFIG['transparent']
-        )
-        plt.close(fig)
+                color = STYLE_CONFIG['colors']['text_dark']
+                if trend == "up": color = STYLE_CONFIG['colors']['positive']
+                elif trend == "down": color = STYLE_CONFIG['colors']['negative']
+                celulas.append(tabela_imagem.celula(display_val, color, trend))
+            # Fallback to original name if not found
+            linhas.append({'rotulo': english_metric_names.get(metric_name, metric_name), 'celulas': celulas})
+
+        # --- 3. TABLE DRAWING ---
+        grade = {
+            'colunas': list(df_display.columns), 'linhas': linhas,
+            'cor_cabecalho': '#3157F7', 'cor_texto_rotulo': '#142544', 'zebra': ('#FFFFFF', '#F0F4FF'),
+            'escala_altura': 3, 'altura_cabecalho': 0.12, 'topo': 0.95,
+        }
+        salvar_tabela(grade, f'dados_full/{artista}/plots/{plot_index} - Metrics_{tipo_conteudo}_Advanced.png', figsize=(16, 7))
     except Exception as e:
         print(f"❌ Error in gerar_tabela_metricas_avancada for '{artista}' ({tipo_conteudo}): {e}")
 
@@ -335,58 +324,22 @@ def formatar_numero_card(value):
 
 def criar_big_number_card(config, output_filename):
     """
-    Creates an image of a metric card, now with customizable value positioning.
+    Creates the image of a metric card with the Pillow renderer (cards_big_number), using the render profile dpi and cropping.
     """
-    BRAND_COLORS = {
-        'azulEscuro': "#142544", 'azulPrimario': "#3157F7", 'roxo': "#8140FA",
-        'amareloMarcaTexto': "#E2FC51", 'branco': "#FFFFFF", 'cinzaClaro': "#E8E8E9",
-        'positive_text': '#16a34a', 'positive_bg': '#f0fdf4',
-        'negative_text': '#dc2626', 'negative_bg': '#fef2f2',
-    }
-    variant = config.get('variant', 'default')
-    if variant == 'primary': accent_color, title_color = BRAND_COLORS['azulPrimario'], BRAND_COLORS['azulPrimario']
-    elif variant == 'secondary': accent_color, title_color = BRAND_COLORS['roxo'], BRAND_COLORS['roxo']
-    elif variant == 'accent': accent_color, title_color = BRAND_COLORS['amareloMarcaTexto'], BRAND_COLORS['azulEscuro']
-    else: accent_color, title_color = BRAND_COLORS['azulEscuro'], BRAND_COLORS['azulEscuro']
-
-    fig, ax = plt.subplots(figsize=(5, 5)); fig.set_facecolor('#f0f2f5'); ax.axis('off')
-    ax.add_patch(mpatches.FancyBboxPatch((0.05, 0.05), 0.9, 0.9, facecolor='#d1d5db', edgecolor='none', boxstyle="round,pad=0,rounding_size=0.04", transform=ax.transAxes, alpha=0.5))
-    ax.add_patch(mpatches.FancyBboxPatch((0.05, 0.05), 0.9, 0.9, facecolor=BRAND_COLORS['branco'], edgecolor='#e5e7eb', boxstyle="round,pad=0,rounding_size=0.04", transform=ax.transAxes))
-    ax.add_patch(mpatches.Rectangle((0.05, 0.91), 0.9, 0.04, facecolor=accent_color, transform=ax.transAxes, clip_on=False, zorder=2))
-    ax.text(0.5, 0.85, config['title'], ha='center', va='center', fontsize=18, fontproperties=STYLE_CONFIG['font_bold'], color=title_color, transform=ax.transAxes)
-    ax.text(0.5, 0.70, config['mainValue'], ha='center', va='center', fontsize=40, fontproperties=STYLE_CONFIG['font_bold'], color=BRAND_COLORS['azulEscuro'], transform=ax.transAxes)
-
-    y_pos = 0.48
-    for item in config['breakdown']:
-        ax.text(0.15, y_pos, f"{item['label']}:", ha='left', va='center', fontsize=14, color=BRAND_COLORS['azulEscuro'], transform=ax.transAxes)
-
-        # --- ALTERATION APPLIED HERE ---
-        # Gets the custom position if it exists, otherwise uses the default 0.35
-        valor_x_pos = item.get('value_x_pos', 0.35)
-        ax.text(valor_x_pos, y_pos, item['value'], ha='left', va='center', fontsize=14, fontproperties=STYLE_CONFIG['font_bold'], color=BRAND_COLORS['azulPrimario'], transform=ax.transAxes)
-
-        if 'change' in item:
-            is_positive = item['changeType'] == 'positive'
-            badge_color_text = BRAND_COLORS['positive_text'] if is_positive else BRAND_COLORS['negative_text']
-            badge_color_bg = BRAND_COLORS['positive_bg'] if is_positive else BRAND_COLORS['negative_bg']
-            icon = '↑' if is_positive else '↓'
-            badge_text = f"{icon} {item['change']}"
-            text_box = ax.text(0.85, y_pos, badge_text, ha='center', va='center', fontsize=10, color=badge_color_text, fontproperties=STYLE_CONFIG['font_bold'], transform=ax.transAxes)
-            text_box.set_bbox(dict(facecolor=badge_color_bg, edgecolor=badge_color_text, boxstyle='round,pad=0.4', alpha=0.7, linewidth=0.5))
-
-        y_pos -= 0.12
+    cards_big_number.criar_big_number_card(
+        config, output_filename, dpi=STYLE_CONFIG['dpi'],
+        recortar=STYLE_CONFIG['bbox_inches'] == 'tight', pil_kwargs=STYLE_CONFIG['pil_kwargs'],
+    )
 
-    plt.savefig(output_filename, dpi=300, bbox_inches='tight', transparent = True); plt.close(fig)
 
-
-def gerar_cards_detalhados(artista, file_path):
+def gerar_cards_detalhados(artista, tabela_4_1):
     """
     Main function that reads the data and adds a custom position configuration
     for the Subscribers card.
     """
     try:
-        data = pd.read_excel(file_path, sheet_name='Resultado')
-        data2 = pd.read_excel(file_path, sheet_name='Desvio')
+        data = tabela_4_1['Resultado'].copy()
+        data2 = tabela_4_1['Desvio'].copy()
 
         metricas_config = [
             {'title': 'VIEWS', 'variant': 'primary', 'total': (data.iloc[8, 7] + data.iloc[9, 7] + data.iloc[10, 7]), 'formatter': formatar_numero_card, 'plot_index': '4a',
@@ -467,21 +420,21 @@ def gerar_cards_detalhados(artista, file_path):
 
 def gerar_tabela_metricas(artista, tipo_conteudo, nome_arquivo, plot_index):
     try:
-        data = pd.read_csv(f'dados_full/{artista}/{nome_arquivo}'); data.drop(0, inplace=True); data['Duração média da visualização'] = data['Duração média da visualização'].apply(lambda x: int(x[-5:-3]) * 60 + int(x[-2:]) if isinstance(x, str) else x); data["Data"] = data['Data'].apply(lambda i: datetime.strptime(i, '%Y-%m')); data.sort_values('Data', ascending=True, inplace=True, ignore_index=True); data["Mes"] = data.Data.apply(lambda i: i.strftime("%b"))
+        data = armazem_canal.ler_tabela(artista, os.path.splitext(nome_arquivo)[0]); data.drop(0, inplace=True); data["Data"] = data['Data'].dt.to_timestamp(); data.sort_values('Data', ascending=True, inplace=True, ignore_index=True); data["Mes"] = data.Data.apply(lambda i: i.strftime("%b"))
         nova_ordem_colunas = ['Mes', 'Vídeos publicados', 'Impressões', 'Taxa de cliques de impressões (%)', 'Visualizações', 'Duração média da visualização', 'Porcentagem visualizada média (%)', 'Inscritos', 'RPM (USD)', 'Receita estimada (USD)']; df = data[nova_ordem_colunas].copy().set_index('Mes').T
         pct_change_df = df.T.pct_change().iloc[1:]; colors = [[STYLE_CONFIG['colors']['positive'] if val >= 0 else STYLE_CONFIG['colors']['negative'] for val in row] for row in pct_change_df.values.T]; df.drop(df.columns[0], axis=1, inplace=True); alpha = 0.4; to_rgba = lambda hex_color: (*tuple(int(hex_color.lstrip('#')[i:i+2], 16) / 255 for i in (0, 2, 4)), alpha); cell_colors = [list(map(to_rgba, row)) for row in colors]; X = np.array(df).tolist()
         X[0] = [str(int(float(val))) if not pd.isna(val) else '0' for val in X[0]]; X[1] = [custom_format(val) for val in X[1]]; X[2] = [dec_format(val) for val in X[2]]; X[3] = [custom_format(val) for val in X[3]]; X[4] = [f"{dec_format(round(float(val) / 60, 2))} min" for val in X[4]]; X[5] = [dec_format(val) for val in X[5]]; X[6] = [custom_format(val) if not pd.isna(val) else '0' for val in X[6]]; X[7] = [f"${dec_format(val)}" for val in X[7]]; X[8] = [f"${dec_format(val)}" for val in X[8]]
-        fig, ax = plt.subplots(figsize=STYLE_CONFIG['figsize_table_metricas']); ax.set_title(f"Growth Metrics ({tipo_conteudo.capitalize()})", **STYLE_CONFIG['font_props_title'], y=1.1); ax.axis('off'); tabela = ax.table(cellText=X, colLabels=df.columns, loc='center', cellColours=cell_colors, rowLabels=df.index); tabela.scale(1, 3.5); tabela.set_fontsize(20); fig.savefig(f'dados_full/{artista}/plots/{plot_index} - Metrics {tipo_conteudo.capitalize()}.png', transparent=STYLE_CONFIG['transparent'], bbox_inches='tight', dpi=STYLE_CONFIG['dpi']); plt.close(fig)
+        fig, ax = plt.subplots(figsize=STYLE_CONFIG['figsize_table_metricas']); ax.set_title(f"Growth Metrics ({tipo_conteudo.capitalize()})", **STYLE_CONFIG['font_props_title'], y=1.1); ax.axis('off'); tabela = ax.table(cellText=X, colLabels=df.columns, loc='center', cellColours=cell_colors, rowLabels=df.index); tabela.scale(1, 3.5); tabela.set_fontsize(20); fig.savefig(f'dados_full/{artista}/plots/{plot_index} - Metrics {tipo_conteudo.capitalize()}.png', transparent=STYLE_CONFIG['transparent'], bbox_inches=STYLE_CONFIG['bbox_inches'], dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs']); plt.close(fig)
     except Exception as e: print(f"❌ Error in gerar_tabela_metricas for '{artista}' ({tipo_conteudo}): {e}")
 
 
-def publicated_table(artista, file_path):
+def publicated_table(artista, tabela_4_1):
     """
     Generates the published videos table with advanced design, but without trend indicators (arrows).
     """
     try:
         # --- 1. DATA LOADING AND PREPARATION ---
-        df_full_data = pd.read_excel(file_path.format(artista=artista), sheet_name='Resultado', index_col=0)
+        df_full_data = tabela_4_1['Resultado'].set_index('Data')
 
         # Selects only the Video and Live rows
         # The row labels are not read from the file but hardcoded for display purposes.
@@ -494,70 +447,31 @@ def publicated_table(artista, file_path):
         # Column names (months) are kept as they are.
         df.columns = pd.to_datetime(df.columns).strftime('%b')
 
-        # --- 2. EMPTY TABLE CREATION ---
-        fig, ax = plt.subplots(figsize=(10, 2.5)) # Optimized size for 2 rows
-        ax.axis('off')
-
-        tabela = ax.table(
-            cellText=[[''] * len(df.columns)] * len(df.index), # Empty cells
-            rowLabels=['Published Videos', 'Published Lives'], # Hardcoded English labels for display
-            colLabels=df.columns,
-            loc='center',
-            cellLoc='right' # Aligns text to the right
-        )
-        tabela.auto_set_font_size(False)
-        tabela.scale(1, 2.5) # Adjusts cell height
-
-        # --- 3. STYLING AND FILLING ---
-        for (row, col), cell in tabela.get_celld().items():
-            cell.set_edgecolor('none')
-
-            # Header Style
-            if row == 0:
-                cell.set_text_props(ha='center', color='white', **STYLE_CONFIG['table_font_props'])
-                cell.set_facecolor(STYLE_CONFIG['colors']['primary_blue'])
-                cell.set_height(0.2)
-            # Metrics Column Style
-            elif col == -1:
-                cell.set_text_props(ha='left', va='center', color=STYLE_CONFIG['colors']['text_dark'], **STYLE_CONFIG['table_font_props'])
-                cell.get_text().set_text(f"  {['Published Videos', 'Published Lives'][row-1]}") # English labels for display
-                cell.set_facecolor('#F0F4FF')
-                cell.set_edgecolor('#E5E7EB')
-                cell.set_linewidth(1)
-                cell.set_width(0.4)
-            # Data Cells Style
-            else:
-                cell.set_facecolor('#FFFFFF' if row % 2 != 0 else '#F0F4FF')
-
-                current_value = df.iloc[row-1, col]
+        # --- 2. STYLED GRID (no trend indicators) ---
+        linhas = []
+        for row, rotulo in enumerate(['Published Videos', 'Published Lives']): # Hardcoded English labels for display
+            celulas = []
+            for col in range(len(df.columns)):
+                current_value = df.iloc[row, col]
                 display_val = f"{int(current_value)}" if pd.notna(current_value) else '-'
-
-                # CHANGE: Icon and trend logic removed from here.
-                # The text is set directly, without arrows.
-                cell.get_text().set_text(display_val)
-                cell.get_text().set_color(STYLE_CONFIG['colors']['text_dark']) # Single color for all data
-                cell.get_text().set_font_properties(STYLE_CONFIG['table_font_props']['fontproperties'])
-                cell.get_text().set_size(STYLE_CONFIG['table_font_props']['size'])
-
-        fig.suptitle('', y=0.5, **STYLE_CONFIG['font_props_title'])
-        plt.tight_layout(rect=[0, 0, 1, 1])
-
-        plt.savefig(
-            f'dados_full/{artista}/plots/5 - Published.png',
-            dpi=STYLE_CONFIG['dpi'],
-            bbox_inches='tight',
-            pad_inches=0.1,
-            transparent=STYLE_CONFIG['transparent']
-        )
-        plt.close(fig)
+                celulas.append(tabela_imagem.celula(display_val, STYLE_CONFIG['colors']['text_dark']))
+            linhas.append({'rotulo': rotulo, 'celulas': celulas})
+
+        # --- 3. TABLE DRAWING ---
+        grade = {
+            'colunas': list(df.columns), 'linhas': linhas,
+            'cor_cabecalho': STYLE_CONFIG['colors']['primary_blue'], 'cor_texto_rotulo': STYLE_CONFIG['colors']['text_dark'],
+            'zebra': ('#FFFFFF', '#F0F4FF'), 'escala_altura': 2.5, 'altura_cabecalho': 0.2, 'topo': 1,
+        }
+        salvar_tabela(grade, f'dados_full/{artista}/plots/5 - Published.png', figsize=(10, 2.5))
 
     except Exception as e:
         print(f"❌ Error in publicated_table for '{artista}': {e}")
 
 
-def analyze_initial_updated(artista, file_path):
+def analyze_initial_updated(artista, tabela_4_1):
     try:
-        df = pd.read_excel(file_path, sheet_name='Resultado');
+        df = tabela_4_1['Resultado'].copy();
         meses_com_media = pd.to_datetime(df.columns[1:], errors='coerce');
         # Column names kept in Portuguese as per file
         visualizacoes = df.iloc[7, 1:].values;
@@ -587,20 +501,20 @@ def analyze_initial_updated(artista, file_path):
         ax2.legend(handles=[linha_visualizacao], loc='upper right')
 
         plt.title('Revenue x Views', **STYLE_CONFIG['font_props_title']); plt.tight_layout();
-        plt.savefig(f'dados_full/{artista}/plots/6 - Initial_Analysis.png', dpi=STYLE_CONFIG['dpi'], transparent=STYLE_CONFIG['transparent'], bbox_inches='tight');
+        plt.savefig(f'dados_full/{artista}/plots/6 - Initial_Analysis.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], transparent=STYLE_CONFIG['transparent'], bbox_inches=STYLE_CONFIG['bbox_inches']);
         plt.close(fig)
 
     except Exception as e: print(f"❌ Error in analyze_initial_updated for '{artista}': {e}")
 
 
-def watch_table(artista, file_path):
+def watch_table(artista, tabela_4_1):
     """
     Gera a tabela de WatchTime, CPM e Taxa de Preenchimento com o design unificado
     e a formatação de dados corrigida.
     """
     try:
         # --- 1. CARREGAMENTO E PREPARAÇÃO DOS DADOS ---
-        df = pd.read_excel(file_path.format(artista=artista), sheet_name="Resultado")
+        df = tabela_4_1['Resultado'].copy()
         
         # Define as linhas a serem selecionadas
         ROW_TAXA_PREENCHIMENTO = 62 
@@ -614,87 +528,44 @@ def watch_table(artista, file_path):
         
         df_watch.columns = pd.to_datetime(df_watch.columns, errors='coerce').strftime('%b')
 
-        # --- 2. CRIAÇÃO DA TABELA VAZIA ---
-        fig, ax = plt.subplots(figsize=(10, 3)) 
-        ax.axis('off')
-        
-        tabela = ax.table(
-            cellText=[[''] * len(df_watch.columns)] * len(df_watch.index),
-            rowLabels=['Total WatchTime', 'CPM (USD)', 'Fill Rate'],
-            colLabels=df_watch.columns,
-            loc='center',
-            cellLoc='right'
-        )
-        tabela.auto_set_font_size(False)
-        tabela.scale(1, 2.8)
-
-        # --- 3. ESTILIZAÇÃO E PREENCHIMENTO CÉLULA POR CÉLULA ---
-        for (row, col), cell in tabela.get_celld().items():
-            cell.set_edgecolor('none')
-
-            # Estilo do Cabeçalho
-            if row == 0:
-                cell.set_text_props(ha='center', color='white', **STYLE_CONFIG['table_font_props'])
-                cell.set_facecolor(STYLE_CONFIG['colors']['primary_blue'])
-                cell.set_height(0.18)
-            # Estilo da Coluna de Métricas
-            elif col == -1:
-                cell.set_text_props(ha='left', va='center', color=STYLE_CONFIG['colors']['text_dark'], **STYLE_CONFIG['table_font_props'])
-                cell.get_text().set_text(f"  {['Total WatchTime', 'CPM (USD)', 'Fill Rate'][row-1]}")
-                cell.set_facecolor('#F0F4FF')
-                cell.set_edgecolor('#E5E7EB')
-                cell.set_linewidth(1)
-                cell.set_width(0.4)
-            # Estilo das Células de Dados
-            else:
-                cell.set_facecolor('#FFFFFF' if row % 2 != 0 else '#F0F4FF')
-                
-                metric_name = df_watch.index[row-1]
-                current_value = df_watch.iloc[row-1, col]
-                
-                # Formatação contextual do texto da célula
-                display_val = ""
+        # --- 2. GRADE ESTILIZADA (formatação contextual por métrica) ---
+        linhas = []
+        for row, (metric_name, rotulo) in enumerate(zip(df_watch.index, ['Total WatchTime', 'CPM (USD)', 'Fill Rate'])):
+            celulas = []
+            for col in range(len(df_watch.columns)):
+                current_value = df_watch.iloc[row, col]
                 if pd.notna(current_value):
-                    # CORREÇÃO APLICADA AQUI:
-                    # Verifica o nome da métrica para aplicar a formatação correta.
                     if "Watch Time Total" in metric_name: # Corresponde a "WatchTime"
                         display_val = f"{float(current_value):,.0f} h".replace(",", ".")
                     elif "CPM" in metric_name:
                         display_val = f"${dec_format(current_value)}"
-                    else: # A terceira métrica (Taxa de Preenchimento) será formatada como porcentagem
+                    else: # A terceira métrica (Taxa de Preenchimento) é formatada como porcentagem
                         display_val = f"{dec_format(current_value)}%"
                 else:
                     display_val = '-'
-                
-                # Define o texto com cor e fonte padronizadas
-                cell.get_text().set_text(display_val)
-                cell.get_text().set_color(STYLE_CONFIG['colors']['text_dark'])
-                cell.get_text().set_font_properties(STYLE_CONFIG['table_font_props']['fontproperties'])
-                cell.get_text().set_size(STYLE_CONFIG['table_font_props']['size'])
-
-        fig.suptitle("", y=0.5, **STYLE_CONFIG['font_props_title'])
-        plt.tight_layout(rect=[0, 0, 1, 1])
-        
-        plt.savefig(
-            f"dados_full/{artista}/plots/7 - Watchtime.png", 
-            transparent=STYLE_CONFIG['transparent'], 
-            bbox_inches="tight", 
-            dpi=STYLE_CONFIG['dpi']
-        )
-        plt.close(fig)
+                celulas.append(tabela_imagem.celula(display_val, STYLE_CONFIG['colors']['text_dark']))
+            linhas.append({'rotulo': rotulo, 'celulas': celulas})
+
+        # --- 3. DESENHO DA TABELA ---
+        grade = {
+            'colunas': list(df_watch.columns), 'linhas': linhas,
+            'cor_cabecalho': STYLE_CONFIG['colors']['primary_blue'], 'cor_texto_rotulo': STYLE_CONFIG['colors']['text_dark'],
+            'zebra': ('#FFFFFF', '#F0F4FF'), 'escala_altura': 2.8, 'altura_cabecalho': 0.18, 'topo': 1,
+        }
+        salvar_tabela(grade, f"dados_full/{artista}/plots/7 - Watchtime.png", figsize=(10, 3))
 
     except Exception as e:
         print(f"❌ Erro em watch_table para '{artista}': {e}")
 
 
-def monetization_graph(artista, file_path):
+def monetization_graph(artista, tabela_4_1):
     """
     Generates the monetization graph with guaranteed vertical positioning for labels,
     avoiding overlap.
     """
     try:
         # --- 1. DATA LOADING (column names in Portuguese) ---
-        df = pd.read_excel(file_path, sheet_name="Resultado")
+        df = tabela_4_1['Resultado'].copy()
         meses = pd.to_datetime(df.columns[2:], errors='coerce').dropna().to_series().dt.strftime('%b')
         receita_vod_velho = df.iloc[58, 2:].astype(float)
         receita_vod_novo = df.iloc[55, 2:].astype(float)
@@ -758,19 +629,19 @@ def monetization_graph(artista, file_path):
         fig.legend(handles=lines + lines2, labels=labels + labels2, loc='upper center', bbox_to_anchor=(0.5, 0.03), ncol=len(labels + labels2), prop={'size': 9})
 
         fig.tight_layout(rect=[0, 0, 1, 0.95])
-        plt.savefig(f'dados_full/{artista}/plots/8 - Monetization_v2.png', dpi=STYLE_CONFIG['dpi'], transparent=STYLE_CONFIG['transparent'], bbox_inches='tight')
+        plt.savefig(f'dados_full/{artista}/plots/8 - Monetization_v2.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], transparent=STYLE_CONFIG['transparent'], bbox_inches=STYLE_CONFIG['bbox_inches'])
         plt.close(fig)
 
     except Exception as e:
         print(f"❌ Error in monetization_graph for '{artista}': {e}")
 
 
-def revenue_per_type_chart(artista, file_path):
+def revenue_per_type_chart(artista, tabela_4_1):
     """
     Generates the RPM and Revenue chart, now with gray borders on the revenue lines.
     """
     try:
-        df = pd.read_excel(file_path, sheet_name="Resultado")
+        df = tabela_4_1['Resultado'].copy()
         meses = pd.to_datetime(df.columns[2:], errors='coerce').dropna().to_series().dt.strftime('%b')
         # Column names kept in Portuguese as per file
         rpm_vod_novo = df.iloc[21, 2:].astype(float)
@@ -831,19 +702,19 @@ def revenue_per_type_chart(artista, file_path):
         fig.legend(handles=lines + lines2, labels=labels + labels2, loc='upper center', bbox_to_anchor=(0.5, 0.03), ncol=len(labels + labels2), prop={'size': 9})
 
         plt.tight_layout(rect=[0, 0, 1, 0.95]) # Adjusts to make space for the legend
-        plt.savefig(f'dados_full/{artista}/plots/9 - Monetization by formats.png', dpi=STYLE_CONFIG['dpi'], transparent=STYLE_CONFIG['transparent'], bbox_inches='tight')
+        plt.savefig(f'dados_full/{artista}/plots/9 - Monetization by formats.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], transparent=STYLE_CONFIG['transparent'], bbox_inches=STYLE_CONFIG['bbox_inches'])
         plt.close(fig)
 
     except Exception as e:
         print(f"❌ Error in revenue_per_type_chart for '{artista}': {e}")
 
 
-def conversion_graph(artista, file_path):
+def conversion_graph(artista, tabela_4_1):
     """
     Generates the Conversion (CTR vs Views) chart with the new standardized design.
     """
     try:
-        df = pd.read_excel(file_path, sheet_name='Resultado')
+        df = tabela_4_1['Resultado'].copy()
         meses = pd.to_datetime(df.columns[2:], errors='coerce').dropna()
 
         # Ensures numerical data is read correctly
@@ -905,20 +776,20 @@ def conversion_graph(artista, file_path):
         fig.legend(handles=lines + lines2, labels=labels + labels2, loc='upper center', bbox_to_anchor=(0.5, 0.03), ncol=5, prop={'size': 9})
 
         plt.tight_layout(rect=[0, 0, 1, 0.95])
-        plt.savefig(f'dados_full/{artista}/plots/10 - Conversion.png', dpi=STYLE_CONFIG['dpi'], transparent=STYLE_CONFIG['transparent'], bbox_inches='tight')
+        plt.savefig(f'dados_full/{artista}/plots/10 - Conversion.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], transparent=STYLE_CONFIG['transparent'], bbox_inches=STYLE_CONFIG['bbox_inches'])
         plt.close(fig)
 
     except Exception as e:
         print(f"❌ Error generating 'conversion_graph' chart: {e}")
 
 
-def gerar_grafico_views(artista, file_path):
+def gerar_grafico_views(artista, tabela_4_1):
     """
     Creates a views chart with non-overlapping data labels.
     """
     try:
         # --- 1. DATA LOADING (column names in Portuguese) ---
-        df = pd.read_excel(file_path, sheet_name="Resultado")
+        df = tabela_4_1['Resultado'].copy()
         meses = pd.to_datetime(df.columns[2:], errors='coerce').dropna().to_series().dt.strftime('%b')
 
         idx_views_vod_novo = 80; idx_views_lives_novo = 81; idx_views_shorts_novo = 82
@@ -989,19 +860,19 @@ def gerar_grafico_views(artista, file_path):
         lines, labels = ax1.get_legend_handles_labels(); lines2, labels2 = ax2.get_legend_handles_labels()
         fig.legend(handles=lines + lines2, labels=labels + labels2, loc='upper center', bbox_to_anchor=(0.5, 0.03), ncol=4, prop={'size': 9})
         fig.tight_layout(rect=[0, 0, 1, 0.95])
-        plt.savefig(f'dados_full/{artista}/plots/19 - Views_New_vs_Old.png', dpi=STYLE_CONFIG['dpi'], transparent=STYLE_CONFIG['transparent'], bbox_inches='tight')
+        plt.savefig(f'dados_full/{artista}/plots/19 - Views_New_vs_Old.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], transparent=STYLE_CONFIG['transparent'], bbox_inches=STYLE_CONFIG['bbox_inches'])
         plt.close(fig)
 
     except Exception as e:
         print(f"❌ Error in gerar_grafico_views for '{artista}': {e}")
 
 
-def gerar_grafico_qualidade(artista, file_path, tipo_conteudo, plot_index):
+def gerar_grafico_qualidade(artista, tabela_4_1, tipo_conteudo, plot_index):
     """
     Generates the quality chart, with backgrounds on all data labels of the bars.
     """
     try:
-        df = pd.read_excel(file_path, sheet_name='Resultado')
+        df = tabela_4_1['Resultado'].copy()
 
         meses = df.columns[2:].to_list()
 
@@ -1069,15 +940,15 @@ def gerar_grafico_qualidade(artista, file_path, tipo_conteudo, plot_index):
 
         fig.suptitle(title, x=0.035, ha='left', **STYLE_CONFIG['font_props_subtitle'], y=0.73, rotation=90)
         plt.tight_layout(rect=[1, 1, 1, 0.96])
-        fig.savefig(f'dados_full/{artista}/plots/{plot_index} - Quality_{tipo_conteudo.capitalize()}.png', dpi=STYLE_CONFIG['dpi'], bbox_inches="tight", transparent=STYLE_CONFIG['transparent'])
+        fig.savefig(f'dados_full/{artista}/plots/{plot_index} - Quality_{tipo_conteudo.capitalize()}.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], bbox_inches=STYLE_CONFIG['bbox_inches'], transparent=STYLE_CONFIG['transparent'])
         plt.close(fig)
 
     except Exception as e:
         print(f"❌ Error in gerar_grafico_qualidade for '{artista}' ({tipo_conteudo}): {e}")
 
 
-def dfOrigem(nomeArquivo1, nomeArquivo2):
-    df1 = pd.read_csv(nomeArquivo1 + ".csv"); df2 = pd.read_csv(nomeArquivo2 + ".csv"); df = pd.concat([df1, df2], ignore_index=True); df['Data'] = pd.to_datetime(df['Data']); df.sort_values('Data', inplace=True); df["Mês"] = df['Data'].dt.strftime('%Y-%m');
+def dfOrigem(artista, nomeTabela1, nomeTabela2):
+    df1 = armazem_canal.ler_tabela(artista, nomeTabela1); df2 = armazem_canal.ler_tabela(artista, nomeTabela2); df = pd.concat([df1, df2], ignore_index=True); df.sort_values('Data', inplace=True); df["Mês"] = df['Data'].dt.strftime('%Y-%m');
     # Keep original Portuguese column names for filtering and grouping
     origensImportantes = ("Recursos de navegação","Vídeos sugeridos","Páginas do canal","Externa","Notificações","Pesquisa do YouTube","Playlists","Publicidade no YouTube");
     df = df[['Origem do tráfego', 'Visualizações', 'Mês']].groupby(by=['Mês', 'Origem do tráfego']).sum().reset_index();
@@ -1112,18 +983,25 @@ def traficSorce_graph(df, x_labels, total, title, color_map, artista):
                 ax.bar(x=x_labels, height=y_values, color=color_map[n % len(color_map)], bottom=bottom, label=display_label);
                 bottom += y_values
         ax.legend(loc='upper left', bbox_to_anchor=(1, 1)); ax.yaxis.set_major_formatter(FuncFormatter(formatar_eixo_numeros)); ax.set_title(title.title(), **STYLE_CONFIG['font_props_title']); ax.tick_params(axis='x', rotation=45); ax.set_ylabel('Views', **STYLE_CONFIG['font_props_label']); plt.tight_layout()
-        plt.savefig(f'dados_full/{artista}/plots/13 - Traffic_Source.png', dpi=STYLE_CONFIG['dpi'], transparent=STYLE_CONFIG['transparent']); plt.close(fig)
+        plt.savefig(f'dados_full/{artista}/plots/13 - Traffic_Source.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], transparent=STYLE_CONFIG['transparent']); plt.close(fig)
     except Exception as e: print(f"❌ Error in traficSorce_graph for '{artista}': {e}")
 
 
-def subscription_growth(artista, file_path):
+def gerar_grafico_origem_trafego(artista):
+    try:
+        semestralOrigem, total = dfOrigem(artista, 'origem_lives', 'origem_vods')
+        traficSorce_graph(semestralOrigem, semestralOrigem['Mês'], total, 'Views by Traffic Source', plt.cm.get_cmap('tab20').colors, artista)
+    except Exception as e: print(f"❌ Error generating Traffic Source chart for '{artista}': {e}")
+
+
+def subscription_growth(artista, tabela_4_1):
     """
     Generates the subscription growth chart with adjusted spacing,
     labels with background, and improved vertical positioning.
     """
     try:
         # --- 1. DATA LOADING AND PREPARATION (column names in Portuguese) ---
-        df = pd.read_excel(file_path, sheet_name="Resultado")
+        df = tabela_4_1['Resultado'].copy()
         meses = pd.to_datetime(df.columns[2:], errors='coerce').dropna().to_series().dt.strftime('%b')
         # Original Portuguese column names for data extraction
         insc_novo_vod = df.iloc[41, 2:].astype(float)
@@ -1199,19 +1077,19 @@ def subscription_growth(artista, file_path):
 
         fig.legend(loc='upper right', bbox_to_anchor=(0.95, 0.03), ncol=7)
         plt.tight_layout(rect=[0, 0, 0.9, 1])
-        plt.savefig(f'dados_full/{artista}/plots/14 - Subscribers_by_Content_Type.png', dpi=STYLE_CONFIG['dpi'], transparent=STYLE_CONFIG['transparent'], bbox_inches='tight')
+        plt.savefig(f'dados_full/{artista}/plots/14 - Subscribers_by_Content_Type.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], transparent=STYLE_CONFIG['transparent'], bbox_inches=STYLE_CONFIG['bbox_inches'])
         plt.close(fig)
 
     except Exception as e:
         print(f"❌ Error in subscription_growth for '{artista}': {e}")
 
 
-def gerar_grafico_engajamento_tipo(artista, file_path, tipo_conteudo, plot_index):
+def gerar_grafico_engajamento_tipo(artista, tabela_4_1, tipo_conteudo, plot_index):
     """
     Gera o gráfico de engajamento com cores de barra padronizadas e uma linha estilizada.
     """
     try:
-        df = pd.read_excel(file_path, sheet_name='Resultado')
+        df = tabela_4_1['Resultado'].copy()
         meses = pd.to_datetime(df.columns[2:], errors='coerce').dropna()
 
         if tipo_conteudo == 'vod':
@@ -1266,33 +1144,26 @@ def gerar_grafico_engajamento_tipo(artista, file_path, tipo_conteudo, plot_index
         plt.subplots_adjust(left=0.15)
         fig.legend(loc='upper right', bbox_to_anchor=(0.95, 0.95), ncol=2)
 
-        plt.savefig(f'dados_full/{artista}/plots/{plot_index} - Engagement_{tipo_conteudo.capitalize()}.png', dpi=STYLE_CONFIG['dpi'], transparent=STYLE_CONFIG['transparent'], bbox_inches='tight')
+        plt.savefig(f'dados_full/{artista}/plots/{plot_index} - Engagement_{tipo_conteudo.capitalize()}.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], transparent=STYLE_CONFIG['transparent'], bbox_inches=STYLE_CONFIG['bbox_inches'])
         plt.close(fig)
 
     except Exception as e:
         print(f"❌ Error in gerar_grafico_engajamento_tipo for '{artista}': {e}")
 
 
-def generate_comunity_chart(artista):
+def generate_comunity_chart(artista, contexto):
     """
     Generates a bar and line chart to analyze community posts and impressions.
-    The function uses the most recent date from the 'total.csv' file as a reference
-    to filter the last 6 months of data.
+    The 6-month window comes from the channel's period context (periodo_canal).
     """
     try:
         # --- 1. Load and Prepare Data (total.csv) ---
-        data_meses = pd.read_csv(f'dados_full/{artista}/total.csv').drop(0)
-        data_meses["Data"] = pd.to_datetime(data_meses["Data"])
-
-        # --- 2. Logic to Define the 6-Month Period ---
-        # Find the latest date (which pandas interprets as the 1st of the month)
-        latest_date_start_of_month = data_meses["Data"].max()
-        # Adjust the date to be the LAST day of that month to ensure the whole month is included.
-        latest_date = latest_date_start_of_month + pd.offsets.MonthEnd(0)
-        
-        # Define the lower bound of the 6-month window
-        first_day_of_latest_month = latest_date.replace(day=1)
-        lower_bound_date = first_day_of_latest_month - pd.DateOffset(months=5)
+        data_meses = armazem_canal.ler_tabela(artista, 'total').drop(0)
+        data_meses["Data"] = data_meses["Data"].dt.to_timestamp()
+
+        # --- 2. 6-Month Period (first and last day of the analysis window) ---
+        lower_bound_date = contexto['inicio_janela']
+        latest_date = contexto['fim_janela']
 
         # Filter the 'total.csv' data for the desired period
         data_meses_filtrada = data_meses[
@@ -1301,10 +1172,7 @@ def generate_comunity_chart(artista):
         ].copy()
 
         # --- 3. Load and Prepare Data (comunidade.csv) ---
-        data_comu = pd.read_csv(f'dados_full/{artista}/comunidade.csv')
-        data_comu["Horário de publicação da postagem"] = pd.to_datetime(
-            data_comu["Horário de publicação da postagem"], errors="coerce"
-        )
+        data_comu = armazem_canal.ler_tabela(artista, 'comunidade')
         data_comu.dropna(subset=["Horário de publicação da postagem"], inplace=True)
 
         # Filter the 'comunidade.csv' data for the same period
@@ -1375,7 +1243,7 @@ def generate_comunity_chart(artista):
         plt.tight_layout(rect=[0, 0.1, 1, 1])
         
         # Save the chart (uncomment to use)
-        plt.savefig(f'dados_full/{artista}/plots/17 - Community.png', dpi=STYLE_CONFIG['dpi'], transparent=STYLE_CONFIG['transparent'], bbox_inches='tight');
+        plt.savefig(f'dados_full/{artista}/plots/17 - Community.png', dpi=STYLE_CONFIG['dpi'], pil_kwargs=STYLE_CONFIG['pil_kwargs'], transparent=STYLE_CONFIG['transparent'], bbox_inches=STYLE_CONFIG['bbox_inches']);
         plt.close(fig)
 
     except Exception as e:
@@ -1390,8 +1258,8 @@ def gerar_tabela_inscritos_avancada(artista):
     """
     try:
         # --- 1. DATA LOADING AND PREPARATION ---
-        df_full = pd.read_csv(f'dados_full/{artista}/total.csv').drop(0)
-        df_full["Data"] = pd.to_datetime(df_full["Data"])
+        df_full = armazem_canal.ler_tabela(artista, 'total').drop(0)
+        df_full["Data"] = df_full["Data"].dt.to_timestamp()
         df_full.sort_values('Data', ascending=True, inplace=True, ignore_index=True)
 
         if len(df_full) >= 7:
@@ -1431,39 +1299,18 @@ def gerar_tabela_inscritos_avancada(artista):
         }).T
         df_full_trend.columns = pd.to_datetime(df_full['Data']).dt.strftime('%b') # Keep original column names for months
 
-        # --- 3. TABLE CREATION AND STYLIZATION ---
-        fig, ax = plt.subplots(figsize=(12, 4.5))
-        ax.axis('off')
-
-        tabela = ax.table(
-            cellText=[[''] * len(df_display.columns)] * len(df_display.index),
-            rowLabels=df_display.index, # These are already English from df_display
-            colLabels=df_display.columns,
-            loc='center', cellLoc='right'
-        )
-        tabela.auto_set_font_size(False); tabela.scale(1, 2.8)
-
-        for (row, col_display), cell in tabela.get_celld().items():
-            col_full = col_display + 1
-            cell.set_edgecolor('none')
-            if row == 0: # Header row
-                cell.set_text_props(ha='center', color='white', **STYLE_CONFIG['table_font_props']); cell.set_facecolor(STYLE_CONFIG['colors']['primary_blue'])
-            elif col_display == -1: # Row labels column (metric names)
-                cell.set_text_props(ha='left', va='center', color=STYLE_CONFIG['colors']['text_dark'], **STYLE_CONFIG['table_font_props']);
-                # The row labels (df_display.index) are already English, use them directly
-                display_row_label = df_display.index[row-1]
-                cell.get_text().set_text(f"  {display_row_label}");
-                cell.set_facecolor('#F0F4FF'); cell.set_edgecolor('#E5E7EB'); cell.set_linewidth(1); cell.set_width(0.4)
-            else: # Data cells
-                cell.set_facecolor('#FFFFFF' if row % 2 == 0 else '#F0F4FF')
-
-                # Use the English metric name from df_full_trend's index for logic and display
-                metric_name_for_logic = df_full_trend.index[row-1]
-                current_value = df_full_trend.iloc[row-1, col_full];
-                # Ensure prev_value is accessed safely, especially for the first data column
-                prev_value = df_full_trend.iloc[row-1, col_full - 1] if col_full - 1 >= 0 else None
-
-                trend = get_trend(current_value, prev_value); # get_trend handles None
+        # --- 3. STYLED GRID ---
+        linhas = []
+        # The row labels (df_display.index) are already English, use them directly
+        for row, display_row_label in enumerate(df_display.index):
+            # Use the English metric name from df_full_trend's index for logic and display
+            metric_name_for_logic = df_full_trend.index[row]
+            celulas = []
+            for col_full in range(1, len(df_full_trend.columns)):
+                current_value = df_full_trend.iloc[row, col_full]
+                prev_value = df_full_trend.iloc[row, col_full - 1]
+
+                trend = get_trend(current_value, prev_value)
                 color = STYLE_CONFIG['colors']['text_dark']
 
                 # CORRECTED: Use English metric names for color logic
@@ -1474,24 +1321,22 @@ def gerar_tabela_inscritos_avancada(artista):
                      if trend == "up": color = STYLE_CONFIG['colors']['positive'] # Up is positive
                      elif trend == "down": color = STYLE_CONFIG['colors']['negative'] # Down is negative
 
-                icon = ''
-                if trend == "up": icon = '↑ '
-                elif trend == "down": icon = '↓ '
-
                 display_val = ""
                 if pd.notna(current_value):
                     if metric_name_for_logic == "Growth (%)": display_val = f"{current_value:,.2f}%".replace(",", "X").replace(".", ",").replace("X", ".")
                     else: display_val = f"{int(current_value):,}".replace(",", ".")
 
-                # The icon is added to the final text
-                cell.get_text().set_text(f"{icon}{display_val}")
-                cell.get_text().set_color(color); cell.get_text().set_font_properties(STYLE_CONFIG['table_font_props']['fontproperties']); cell.get_text().set_size(STYLE_CONFIG['table_font_props']['size'])
-
-        fig.suptitle("", y=0.5, **STYLE_CONFIG['font_props_title']) # Title remains empty as before
-        plt.tight_layout(rect=[0, 0, 1, 1])
+                # The arrow icon comes from the trend
+                celulas.append(tabela_imagem.celula(display_val, color, trend))
+            linhas.append({'rotulo': display_row_label, 'celulas': celulas})
 
-        plt.savefig(f'dados_full/{artista}/plots/18 - Subscribers Table.png', transparent=STYLE_CONFIG['transparent'], bbox_inches="tight", dpi=STYLE_CONFIG['dpi'])
-        plt.close(fig)
+        # --- 4. TABLE DRAWING ---
+        grade = {
+            'colunas': list(df_display.columns), 'linhas': linhas,
+            'cor_cabecalho': STYLE_CONFIG['colors']['primary_blue'], 'cor_texto_rotulo': STYLE_CONFIG['colors']['text_dark'],
+            'zebra': ('#F0F4FF', '#FFFFFF'), 'escala_altura': 2.8, 'altura_cabecalho': None, 'topo': 1,
+        }
+        salvar_tabela(grade, f'dados_full/{artista}/plots/18 - Subscribers Table.png', figsize=(12, 4.5))
 
     except Exception as e:
         print(f" Error in generate_advanced_subscriber_table for '{artista}': {e}") # Translated error message
@@ -1499,33 +1344,41 @@ def gerar_tabela_inscritos_avancada(artista):
 
 def run(artista):     
     print(f"\n--- Generating reports for: {artista} ---")
+    contexto = periodo_canal.carregar_contexto_periodo(artista)
     os.makedirs(f'dados_full/{artista}/plots', exist_ok=True)
-    file_path_4_1 = f'exports_tabelas/tabela_4.1_{artista}.xlsx'
-    
-    gerar_tabela_metricas_avancada(artista, 'VOD', 'videos.csv', 1)
-    gerar_tabela_metricas_avancada(artista, 'Lives', 'lives.csv', 2)
-    gerar_tabela_metricas_avancada(artista, 'Shorts', 'shorts.csv', 3)
-    gerar_cards_detalhados(artista, file_path_4_1)
-    publicated_table(artista, file_path_4_1)
-    analyze_initial_updated(artista, file_path_4_1)
-    watch_table(artista, file_path_4_1)
-    monetization_graph(artista, file_path_4_1)
-    revenue_per_type_chart(artista, file_path_4_1)
-    conversion_graph(artista, file_path_4_1)
-    gerar_grafico_qualidade(artista, file_path_4_1, 'vod', 11)
-    gerar_grafico_qualidade(artista, file_path_4_1, 'live', 12)
-    gerar_grafico_qualidade(artista, file_path_4_1, 'shorts', 12.5)
+    # Tabela 4.1 carregada uma única vez para todos os gráficos (valores exatos do report, sem reler o Excel)
     try:
-        semestralOrigem, total = dfOrigem(f'dados_full/{artista}/origem_lives', f'dados_full/{artista}/origem_vods')
-        traficSorce_graph(semestralOrigem, semestralOrigem['Mês'], total, 'Views by Traffic Source', plt.cm.get_cmap('tab20').colors, artista)
-    except Exception as e: print(f"❌ Error generating Traffic Source chart for '{artista}': {e}")
-    subscription_growth(artista, file_path_4_1)
-    gerar_grafico_engajamento_tipo(artista, file_path_4_1, 'vod', 15)
-    gerar_grafico_engajamento_tipo(artista, file_path_4_1, 'live', 16)
-    gerar_grafico_engajamento_tipo(artista, file_path_4_1, 'shorts', 16.5)
-    generate_comunity_chart(artista)
-    gerar_tabela_inscritos_avancada(artista)
-    gerar_grafico_views(artista, file_path_4_1)
+        tabela_4_1 = armazem_canal.carregar_tabela_4_1(artista)
+    except Exception as e:
+        print(f"❌ Error loading table 4.1 for '{artista}': {e}")
+        tabela_4_1 = None
+    
+    # Cada gráfico grava os próprios PNGs e não depende dos outros: rodam em paralelo num pool de processos.
+    # O último item declara as fatias de dados que o gráfico lê; sem mudança nelas, o PNG vem do cache.
+    tarefas = [
+        (gerar_tabela_metricas_avancada, (artista, 'VOD', 'videos.csv', 1), ('tabela:videos',)),
+        (gerar_tabela_metricas_avancada, (artista, 'Lives', 'lives.csv', 2), ('tabela:lives',)),
+        (gerar_tabela_metricas_avancada, (artista, 'Shorts', 'shorts.csv', 3), ('tabela:shorts',)),
+        (gerar_cards_detalhados, (artista, tabela_4_1), ('aba:Resultado', 'aba:Desvio')),
+        (publicated_table, (artista, tabela_4_1), ('aba:Resultado',)),
+        (analyze_initial_updated, (artista, tabela_4_1), ('aba:Resultado',)),
+        (watch_table, (artista, tabela_4_1), ('aba:Resultado',)),
+        (monetization_graph, (artista, tabela_4_1), ('aba:Resultado',)),
+        (revenue_per_type_chart, (artista, tabela_4_1), ('aba:Resultado',)),
+        (conversion_graph, (artista, tabela_4_1), ('aba:Resultado',)),
+        (gerar_grafico_qualidade, (artista, tabela_4_1, 'vod', 11), ('aba:Resultado',)),
+        (gerar_grafico_qualidade, (artista, tabela_4_1, 'live', 12), ('aba:Resultado',)),
+        (gerar_grafico_qualidade, (artista, tabela_4_1, 'shorts', 12.5), ('aba:Resultado',)),
+        (gerar_grafico_origem_trafego, (artista,), ('tabela:origem_lives', 'tabela:origem_vods')),
+        (subscription_growth, (artista, tabela_4_1), ('aba:Resultado',)),
+        (gerar_grafico_engajamento_tipo, (artista, tabela_4_1, 'vod', 15), ('aba:Resultado',)),
+        (gerar_grafico_engajamento_tipo, (artista, tabela_4_1, 'live', 16), ('aba:Resultado',)),
+        (gerar_grafico_engajamento_tipo, (artista, tabela_4_1, 'shorts', 16.5), ('aba:Resultado',)),
+        (generate_comunity_chart, (artista, contexto), ('tabela:total', 'tabela:comunidade')),
+        (gerar_tabela_inscritos_avancada, (artista,), ('tabela:total', 'arquivo:sub.txt')),
+        (gerar_grafico_views, (artista, tabela_4_1), ('aba:Resultado',)),
+    ]
+    agendador_graficos.renderizar_graficos(tarefas, artista, tabela_4_1, estilo=STYLE_CONFIG, inicializar_worker=configurar_estilo)
 
     # Corrigindo o print com emoji
     print(f"OK - Reports for '{artista}' completed.")
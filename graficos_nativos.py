@@ -0,0 +1,384 @@
+import os
+
+import pandas as pd
+from pptx.chart.axis import ValueAxis
+from pptx.chart.data import CategoryChartData
+from pptx.dml.color import RGBColor
+from pptx.enum.chart import XL_CHART_TYPE, XL_LABEL_POSITION, XL_LEGEND_POSITION, XL_MARKER_STYLE
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.util import Pt
+
+import armazem_canal
+
+# Gráficos nativos do PowerPoint para as séries mensais simples (monetização, receita por formato,
+# conversão, views novo x velho, inscrições e origem do tráfego). Em vez de embutir o PNG do
+# matplotlib, a apresentação recebe o XML do gráfico montado a partir da tabela 4.1 (e das tabelas
+# de origem do tráfego), com os dados editáveis no próprio PowerPoint. Ligado pelo main.py
+# (--graficos-nativos); sem ele, os slides continuam com os PNGs.
+#
+# Cada gráfico é descrito como um dict: título, categorias (meses), séries de barras e séries de
+# linha, que vão para um eixo secundário à direita, como o twinx dos gráficos em PNG. O PowerPoint
+# não tem barras agrupadas e empilhadas ao mesmo tempo: os pares novo/velho de cada tipo de
+# conteúdo, lado a lado nos PNGs, viram uma única coluna empilhada por mês.
+
+FONTE = 'DM Sans'
+COR_TITULO = '1F2937'
+COR_GRADE = 'E5E7EB'
+
+# Mesmas cores do STYLE_CONFIG e dos chart_colors de gerar_graficos.py
+CORES = {
+    'vod': '4F46E5', 'live': '3157F7', 'shorts': 'E2FC51', 'shorts_claro': 'F1FEA8',
+    'secondary_blue': 'C7D2FE', 'accent_purple': 'A78BFA', 'primary_purple': '7C3AED',
+    'primary_blue': '4F46E5', 'primary_yellow': 'E2FC51', 'positive': '10B981', 'verde': '22C55E',
+    'vod_velho': '3157F7', 'vod_novo': '6B7FFF', 'lives_velho': 'EF4444', 'lives_novo': 'FCA5A5',
+}
+# Início da paleta tab20 do matplotlib, usada na origem do tráfego
+CORES_ORIGEM = ['1F77B4', 'AEC7E8', 'FF7F0E', 'FFBB78', '2CA02C', '98DF8A', 'D62728', 'FF9896', '9467BD', 'C5B0D5']
+
+# Formatos do Excel; a terceira seção vazia esconde os rótulos dos meses zerados
+FORMATO_MIL = '[>=1000000]0.0,,"M";[>=1000]0.0,"K";0'
+FORMATO_ROTULO_MIL = '[>=1000000]0.0,,"M";[>=1000]0.0,"K";#'
+FORMATO_DOLAR = '"$"#,##0;-"$"#,##0;'
+FORMATO_DOLAR_CENTAVOS = '"$"0.00;-"$"0.00;'
+FORMATO_PERCENTUAL = '0.0"%";-0.0"%";'
+
+# Ids dos eixos secundários (os primários são os que o python-pptx gera)
+EIXO_X_SECUNDARIO = 50010
+EIXO_Y_SECUNDARIO = 50020
+
+ORIGENS_IMPORTANTES = (
+    "Recursos de navegação", "Vídeos sugeridos", "Páginas do canal", "Externa", "Notificações",
+    "Pesquisa do YouTube", "Playlists", "Publicidade no YouTube",
+)
+ORIGENS_INGLES = {
+    "Recursos de navegação": "Browse features", "Vídeos sugeridos": "Suggested videos",
+    "Páginas do canal": "Channel pages", "Externa": "External", "Notificações": "Notifications",
+    "Pesquisa do YouTube": "Youtube", "Playlists": "Playlists",
+    "Publicidade no YouTube": "YouTube advertising", "Outros": "Others",
+}
+
+# Tabela 4.1 de cada artista, com o mtime dos arquivos de onde veio: carregada uma vez por processo
+_tabelas = {}
+
+
+def serie(nome, valores, cor):
+    """Série do gráfico: valores na ordem das categorias (NaN vira ponto vazio) e cor em hex."""
+    return {'nome': nome, 'valores': [None if pd.isna(v) else float(v) for v in valores], 'cor': cor}
+
+
+def linha_da_tabela(tabela_4_1, nome):
+    """
+    Valores mês a mês da métrica nome, procurada pelo rótulo da linha (o nome declarado em
+    METRICAS_TABELA_4_1 do report.py), e não pela posição: a tabela pode ganhar ou perder linhas.
+    """
+    resultado = tabela_4_1['Resultado']
+    linhas = resultado.index[resultado.iloc[:, 0] == nome]
+    if len(linhas) == 0:
+        raise KeyError(f"métrica '{nome}' não está na tabela 4.1")
+    return pd.to_numeric(resultado.loc[linhas[0]].iloc[2:], errors='coerce')
+
+
+def meses(tabela_4_1, formato='%b'):
+    colunas = tabela_4_1['Resultado'].columns[2:]
+    return list(pd.to_datetime(colunas, errors='coerce').dropna().strftime(formato))
+
+
+def monetizacao(artista, tabela_4_1, ingles):
+    t = lambda nome: linha_da_tabela(tabela_4_1, nome)
+    return {
+        'titulo': 'VOD and Live Revenue (New vs Old)' if ingles else 'Receita de VODs e Lives (Novo vs Velho)',
+        'categorias': meses(tabela_4_1),
+        'empilhado': True,
+        'barras': [
+            serie('Old VOD Revenue' if ingles else 'Receita VOD Velho', t("Receita VOD's Velho"), CORES['vod_velho']),
+            serie('New VOD Revenue' if ingles else 'Receita VOD Novo', t("Receita VOD Novo"), CORES['vod_novo']),
+            serie('Old Live Revenue' if ingles else 'Receita Live Velho', t("Receita Lives Velho"), CORES['lives_velho']),
+            serie('New Live Revenue' if ingles else 'Receita Live Novo', t("Receita Live Novo"), CORES['lives_novo']),
+        ],
+        'linhas': [serie('Total Revenue (USD)' if ingles else 'Receita Total (USD)', t("Receita Sem Shorts"), CORES['verde'])],
+        'formato_rotulos': FORMATO_DOLAR, 'formato_eixo': FORMATO_MIL, 'formato_eixo_linhas': FORMATO_MIL,
+    }
+
+
+def receita_por_formato(artista, tabela_4_1, ingles):
+    t = lambda nome: linha_da_tabela(tabela_4_1, nome)
+    return {
+        'titulo': 'New RPM and Revenue by Content Type' if ingles else 'RPM Novo e Receita por Tipo de Conteúdo',
+        'categorias': meses(tabela_4_1),
+        'empilhado': False,
+        'barras': [
+            serie('RPM VOD', t("RPM VOD's Novo"), CORES['vod']),
+            serie('RPM Live', t("RPM Lives Novo"), CORES['verde']),
+            serie('RPM Shorts', t("RPM Shorts Novo"), CORES['shorts']),
+        ],
+        'linhas': [
+            serie('VOD Revenue' if ingles else 'Receita VOD', t("Receita VOD's"), CORES['vod']),
+            serie('Live Revenue' if ingles else 'Receita Live', t("Receita Lives "), CORES['verde']),
+            serie('Shorts Revenue' if ingles else 'Receita Shorts', t("Receita Shorts"), CORES['shorts']),
+        ],
+        'formato_rotulos': FORMATO_DOLAR_CENTAVOS, 'formato_eixo': '"$"0', 'formato_eixo_linhas': FORMATO_MIL,
+    }
+
+
+def conversao(artista, tabela_4_1, ingles):
+    t = lambda nome: linha_da_tabela(tabela_4_1, nome)
+    return {
+        'titulo': 'Click-Through Rate (CTR) and Views' if ingles else 'Taxa de Cliques (CTR) e Visualizações',
+        'categorias': meses(tabela_4_1, '%b/%Y'),
+        'empilhado': False,
+        'barras': [
+            serie('CTR (%) New VOD' if ingles else 'CTR (%) VOD Novo', t("CTR VOD's Novo"), CORES['vod']),
+            serie('CTR (%) New Live' if ingles else 'CTR (%) Live Novo', t("CTR Lives Novo"), CORES['live']),
+        ],
+        'linhas': [
+            serie('Views without Shorts' if ingles else 'Views sem Shorts', t("Visualizações sem Shorts"), CORES['positive']),
+            serie('VOD Views' if ingles else 'Views VOD', t("Visualizações VOD's"), CORES['primary_blue']),
+            serie('Live Views' if ingles else 'Views Lives', t("Visualizações Lives"), CORES['primary_yellow']),
+        ],
+        'formato_rotulos': FORMATO_PERCENTUAL, 'formato_eixo': '0"%"', 'formato_eixo_linhas': FORMATO_MIL,
+    }
+
+
+def views_novo_velho(artista, tabela_4_1, ingles):
+    t = lambda nome: linha_da_tabela(tabela_4_1, nome)
+    return {
+        'titulo': 'Views Old vs New' if ingles else 'Visualizações Velho vs Novo',
+        'categorias': meses(tabela_4_1),
+        'empilhado': True,
+        'barras': [
+            serie('Old VOD Views' if ingles else 'Views VOD Velho', t("Visualizações VOD's Velho"), CORES['vod_velho']),
+            serie('New VOD Views' if ingles else 'Views VOD Novo', t("Visualizações VOD's Novo"), CORES['vod_novo']),
+            serie('Old Live Views' if ingles else 'Views Live Velho', t("Visualizações Lives Velho"), CORES['lives_velho']),
+            serie('New Live Views' if ingles else 'Views Live Novo', t("Visualizações Lives Novo"), CORES['lives_novo']),
+            serie('Old Shorts Views' if ingles else 'Views Shorts Velho', t("Visualizações Shorts Velho"), CORES['primary_purple']),
+            serie('New Shorts Views' if ingles else 'Views Shorts Novo', t("Visualizações Shorts Novo"), CORES['accent_purple']),
+        ],
+        'linhas': [serie('Total Views' if ingles else 'Views Totais', t("Visualizações Total"), CORES['verde'])],
+        'formato_rotulos': FORMATO_ROTULO_MIL, 'formato_eixo': FORMATO_MIL, 'formato_eixo_linhas': FORMATO_MIL,
+    }
+
+
+def inscricoes_por_tipo(artista, tabela_4_1, ingles):
+    t = lambda nome: linha_da_tabela(tabela_4_1, nome)
+    return {
+        'titulo': 'Subscribers by Content Type' if ingles else 'Inscrições por Tipo de Conteúdo',
+        'categorias': meses(tabela_4_1),
+        'empilhado': True,
+        'barras': [
+            serie('New VOD' if ingles else 'VOD Novo', t("Número de Inscritos VOD Novo"), CORES['vod']),
+            serie('Old VOD' if ingles else 'VOD Velho', t("Número de Inscritos vods Velho"), CORES['secondary_blue']),
+            serie('New Live' if ingles else 'Live Novo', t("Número de Inscritos Live Novo"), CORES['live']),
+            serie('Old Live' if ingles else 'Live Velho', t("Número de Inscritos Lives Velho"), CORES['accent_purple']),
+            serie('New Shorts' if ingles else 'Shorts Novo', t("Número de Inscritos Shorts Novo"), CORES['shorts']),
+            serie('Old Shorts' if ingles else 'Shorts Velho', t("Número de Inscritos Shorts Velho"), CORES['shorts_claro']),
+        ],
+        'linhas': [serie('Total Subscribers' if ingles else 'Total de Inscrições', t("Número de Inscritos Total"), CORES['positive'])],
+        'formato_rotulos': FORMATO_ROTULO_MIL, 'formato_eixo': FORMATO_MIL, 'formato_eixo_linhas': FORMATO_MIL,
+    }
+
+
+def origem_do_trafego(artista, tabela_4_1, ingles):
+    """Views por origem do tráfego (VODs + lives) em cada mês, com as origens menores somadas em 'Outros'."""
+    df = pd.concat([armazem_canal.ler_tabela(artista, 'origem_lives'), armazem_canal.ler_tabela(artista, 'origem_vods')], ignore_index=True)
+    df['Mês'] = df['Data'].dt.strftime('%Y-%m')
+    df.loc[~df['Origem do tráfego'].isin(ORIGENS_IMPORTANTES), 'Origem do tráfego'] = 'Outros'
+    tabela = df.pivot_table(index='Mês', columns='Origem do tráfego', values='Visualizações', aggfunc='sum', fill_value=0).sort_index()
+    # Origens na ordem do total, da maior para a menor
+    origens = tabela.sum().sort_values(ascending=False, kind='stable').index
+    return {
+        'titulo': 'Views By Traffic Source',
+        'categorias': list(tabela.index),
+        'empilhado': True,
+        'barras': [
+            serie(ORIGENS_INGLES.get(origem, origem) if ingles else origem, tabela[origem], CORES_ORIGEM[n % len(CORES_ORIGEM)])
+            for n, origem in enumerate(origens)
+        ],
+        'linhas': [],
+        'formato_rotulos': None, 'formato_eixo': FORMATO_MIL, 'legenda': XL_LEGEND_POSITION.RIGHT,
+    }
+
+
+# PNG que o gráfico nativo substitui -> (função que descreve o gráfico, em inglês)
+GRAFICOS = {
+    '8 - Monetizacao_v2.png': (monetizacao, False),
+    '8 - Monetization_v2.png': (monetizacao, True),
+    '9 - Monetização por formatos.png': (receita_por_formato, False),
+    '9 - Monetization by formats.png': (receita_por_formato, True),
+    '10 - Conversao.png': (conversao, False),
+    '10 - Conversion.png': (conversao, True),
+    '19 - Views_Novo_vs_Velho.png': (views_novo_velho, False),
+    '19 - Views_New_vs_Old.png': (views_novo_velho, True),
+    '14 - Inscricoes_por_Tipo_de_Conteudo.png': (inscricoes_por_tipo, False),
+    '14 - Subscribers_by_Content_Type.png': (inscricoes_por_tipo, True),
+    '13 - Origem_do_trafego.png': (origem_do_trafego, False),
+    '13 - Traffic_Source.png': (origem_do_trafego, True),
+}
+
+
+def carregar_tabela_4_1(artista):
+    """Tabela 4.1 do artista, lida uma vez por processo enquanto o .pkl e o .xlsx não mudarem."""
+    versao = tuple(
+        os.path.getmtime(caminho) if os.path.exists(caminho) else None
+        for caminho in (armazem_canal.caminho_tabela_4_1(artista), armazem_canal.caminho_excel_4_1(artista))
+    )
+    em_cache = _tabelas.get(artista)
+    if em_cache and em_cache[0] == versao:
+        return em_cache[1]
+    tabela_4_1 = armazem_canal.carregar_tabela_4_1(artista)
+    _tabelas[artista] = (versao, tabela_4_1)
+    return tabela_4_1
+
+
+def mover_linhas_para_eixo_secundario(grafico, quantidade_barras, formato_eixo):
+    """
+    Passa as séries depois das quantidade_barras primeiras do c:barChart para um c:lineChart com eixos
+    próprios (categorias ocultas e valores à direita). As séries continuam apontando para as mesmas
+    colunas da planilha embutida, então o "Editar dados" do PowerPoint segue funcionando.
+    """
+    area = grafico._chartSpace.chart.plotArea
+    barras = area.find(qn('c:barChart'))
+    linhas = parse_xml(
+        f'<c:lineChart {nsdecls("c")}><c:grouping val="standard"/><c:varyColors val="0"/>'
+        f'<c:marker val="1"/><c:axId val="{EIXO_X_SECUNDARIO}"/><c:axId val="{EIXO_Y_SECUNDARIO}"/></c:lineChart>'
+    )
+    marcador = linhas.find(qn('c:marker'))
+    for ser in barras.findall(qn('c:ser'))[quantidade_barras:]:
+        barras.remove(ser)
+        # invertIfNegative só existe nas séries de barra
+        for filho in ser.findall(qn('c:invertIfNegative')):
+            ser.remove(filho)
+        marcador.addprevious(ser)
+    barras.addnext(linhas)
+
+    eixo_x = parse_xml(
+        f'<c:catAx {nsdecls("c")}><c:axId val="{EIXO_X_SECUNDARIO}"/><c:scaling><c:orientation val="minMax"/></c:scaling>'
+        f'<c:delete val="1"/><c:axPos val="b"/><c:majorTickMark val="none"/><c:minorTickMark val="none"/>'
+        f'<c:tickLblPos val="nextTo"/><c:crossAx val="{EIXO_Y_SECUNDARIO}"/><c:crosses val="autoZero"/>'
+        f'<c:auto val="1"/><c:lblAlgn val="ctr"/><c:lblOffset val="100"/><c:noMultiLvlLbl val="0"/></c:catAx>'
+    )
+    eixo_y = parse_xml(
+        f'<c:valAx {nsdecls("c")}><c:axId val="{EIXO_Y_SECUNDARIO}"/><c:scaling><c:orientation val="minMax"/></c:scaling>'
+        f'<c:delete val="0"/><c:axPos val="r"/><c:numFmt formatCode="" sourceLinked="0"/>'
+        f'<c:majorTickMark val="out"/><c:minorTickMark val="none"/><c:tickLblPos val="nextTo"/>'
+        f'<c:crossAx val="{EIXO_X_SECUNDARIO}"/><c:crosses val="max"/><c:crossBetween val="between"/></c:valAx>'
+    )
+    eixo_y.find(qn('c:numFmt')).set('formatCode', formato_eixo)
+    ultimo_eixo = area.findall(qn('c:valAx'))[-1]
+    ultimo_eixo.addnext(eixo_x)
+    eixo_x.addnext(eixo_y)
+
+
+def formatar_grafico(grafico, descricao):
+    grafico.font.name = FONTE
+    grafico.font.size = Pt(10)
+
+    grafico.has_title = True
+    quadro = grafico.chart_title.text_frame
+    quadro.text = descricao['titulo']
+    fonte = quadro.paragraphs[0].font
+    fonte.size, fonte.bold, fonte.color.rgb = Pt(16), True, RGBColor.from_string(COR_TITULO)
+
+    grafico.has_legend = True
+    grafico.legend.position = descricao.get('legenda', XL_LEGEND_POSITION.BOTTOM)
+    grafico.legend.include_in_layout = False
+    grafico.legend.font.size = Pt(9)
+
+    # Eixo de valores das barras; com o eixo secundário, o value_axis do python-pptx devolveria o da direita
+    eixo = ValueAxis(grafico._chartSpace.valAx_lst[0])
+    eixo.tick_labels.number_format = descricao['formato_eixo']
+    eixo.tick_labels.number_format_is_linked = False
+    eixo.major_gridlines.format.line.color.rgb = RGBColor.from_string(COR_GRADE)
+    eixo.format.line.fill.background()
+
+    barras = grafico.plots[0]
+    barras.gap_width = 60
+    if not descricao['empilhado']:
+        barras.overlap = -10
+    for serie_barra, dados in zip(barras.series, descricao['barras']):
+        serie_barra.format.fill.solid()
+        serie_barra.format.fill.fore_color.rgb = RGBColor.from_string(dados['cor'])
+    if descricao['formato_rotulos']:
+        barras.has_data_labels = True
+        rotulos = barras.data_labels
+        rotulos.number_format = descricao['formato_rotulos']
+        rotulos.number_format_is_linked = False
+        rotulos.font.size = Pt(9)
+        rotulos.font.bold = True
+        if descricao['empilhado']:
+            rotulos.position = XL_LABEL_POSITION.CENTER
+            rotulos.font.color.rgb = RGBColor.from_string('FFFFFF')
+        else:
+            rotulos.position = XL_LABEL_POSITION.OUTSIDE_END
+
+    if descricao['linhas']:
+        for serie_linha, dados in zip(grafico.plots[1].series, descricao['linhas']):
+            cor_linha = RGBColor.from_string(dados['cor'])
+            serie_linha.smooth = False
+            serie_linha.format.line.color.rgb = cor_linha
+            serie_linha.format.line.width = Pt(2.5)
+            serie_linha.marker.style = XL_MARKER_STYLE.CIRCLE
+            serie_linha.marker.size = 7
+            serie_linha.marker.format.fill.solid()
+            serie_linha.marker.format.fill.fore_color.rgb = cor_linha
+            serie_linha.marker.format.line.color.rgb = cor_linha
+
+
+def descrever_grafico(nome, artista):
+    """Descrição do gráfico que substitui o PNG nome (ver GRAFICOS), ou None se ele não puder ser montado."""
+    funcao, ingles = GRAFICOS[nome]
+    try:
+        return funcao(artista, carregar_tabela_4_1(artista), ingles)
+    except Exception as e:
+        print(f"⚠️ Gráfico nativo '{nome}' indisponível para '{artista}'. Erro: {e}")
+        return None
+
+
+def montar_grafico(shapes, descricao, left, top, width, height):
+    dados = CategoryChartData()
+    dados.categories = descricao['categorias']
+    for s in descricao['barras'] + descricao['linhas']:
+        dados.add_series(s['nome'], s['valores'])
+    tipo = XL_CHART_TYPE.COLUMN_STACKED if descricao['empilhado'] else XL_CHART_TYPE.COLUMN_CLUSTERED
+    quadro = shapes.add_chart(tipo, left, top, width, height, dados)
+    if descricao['linhas']:
+        mover_linhas_para_eixo_secundario(quadro.chart, len(descricao['barras']), descricao['formato_eixo_linhas'])
+    formatar_grafico(quadro.chart, descricao)
+    return quadro
+
+
+def adicionar_grafico(shapes, nome, artista, left, top, width, height):
+    """
+    Adiciona no slide o gráfico nativo que substitui o PNG nome, com os dados do artista, no retângulo
+    que a imagem ocuparia. Retorna False, sem adicionar nada, se o gráfico não puder ser montado
+    (tabela ausente, por exemplo): o slide fica com o PNG.
+    """
+    descricao = descrever_grafico(nome, artista)
+    if descricao is None:
+        return False
+    montar_grafico(shapes, descricao, left, top, width, height)
+    return True
+
+
+def mesmos_dados(grafico, descricao):
+    """True quando o gráfico já mostra as categorias e as séries (nomes e valores) da descrição."""
+    series = [(s.name, list(s.values)) for plot in grafico.plots for s in plot.series]
+    esperadas = [(s['nome'], s['valores']) for s in descricao['barras'] + descricao['linhas']]
+    return list(grafico.plots[0].categories) == descricao['categorias'] and series == esperadas
+
+
+def trocar_grafico(shapes, forma, nome, artista):
+    """
+    Refaz o gráfico nativo forma, já existente no slide, quando os dados do artista mudaram; o novo
+    gráfico fica no mesmo lugar e na mesma posição da ordem das formas. Retorna True se trocou.
+    """
+    descricao = descrever_grafico(nome, artista)
+    if descricao is None or mesmos_dados(forma.chart, descricao):
+        return False
+    novo = montar_grafico(shapes, descricao, forma.left, forma.top, forma.width, forma.height)
+    # O novo gráfico entra no fim da árvore de formas; move o elemento dele para o lugar do antigo
+    antigo = forma.element
+    antigo.addprevious(novo.element)
+    antigo.getparent().remove(antigo)
+    forma.part.drop_rel(antigo.chart_rId)
+    return True
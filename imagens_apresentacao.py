@@ -0,0 +1,291 @@
+import io
+import os
+import math
+import weakref
+import hashlib
+
+import numpy as np
+import pandas as pd
+from PIL import Image
+import pptx
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.parts.image import Image as ImagemPptx, ImagePart
+
+import perfil_render
+
+# Etapa de imagem entre os gráficos e as apresentações: cada PNG é reduzido ao tamanho em que é
+# posicionado no slide (no dpi efetivo do perfil) e regravado como PNG otimizado, sem perda, em vez
+# de embutir o arquivo de 300 dpi inteiro. Imagens que não são PNG, ou cuja versão otimizada não fica
+# menor, entram como estão.
+#
+# O resultado fica em cache_apresentacao/, endereçado pelo conteúdo do PNG de origem e pelo tamanho
+# alvo: as apresentações report, cluster e midias do mesmo artista (e os fundos e logos repetidos em
+# todos os slides) preparam cada imagem uma vez só, mesmo rodando em subprocessos separados.
+#
+# Dentro de um processo, as imagens também ficam em memória: cada arquivo é preparado, lido e tem o
+# sha1 calculado uma vez só (validado pelo tamanho e mtime), e cada apresentação cria uma única parte
+# de imagem por conteúdo. Um worker que monta report, cluster e midias de vários canais em sequência
+# não relê os fundos, logos e ícones do template a cada slide nem a cada deck.
+
+# adicionar_imagem, trocar_imagem e os layouts do motor_apresentacao usam partes internas do python-pptx
+# sem equivalente na API pública: a figura é criada direto na árvore de formas, ligada a uma parte de
+# imagem que a apresentação já tem, e a figura existente passa a apontar para outra parte. Elas mudam
+# entre versões, então o requirements.txt fixa a versão testada e este módulo recusa as outras ao ser
+# importado, em vez de deixar cada deck quebrar no meio da montagem.
+VERSOES_PPTX_SUPORTADAS = ('1.0.2',)
+
+EMU_POR_POLEGADA = 914400
+CORES_PALETA = 256
+# Entra na chave do cache: mudar a forma de otimizar invalida as imagens já preparadas
+VERSAO_OTIMIZACAO = 2
+
+PASTA_CACHE = 'cache_apresentacao'
+LIMITE_CACHE_BYTES = 512 * 1024 * 1024
+# Vezes que uma imagem é preparada de novo quando o arquivo do cache some antes de ser lido
+TENTATIVAS_CACHE = 3
+
+# O cache é aparado uma vez por processo, na primeira imagem preparada. Com --workers, outro processo
+# pode apagar um arquivo que este acabou de preparar: quem usa o cache passa por imagem_preparada(),
+# que prepara a imagem de novo nesse caso.
+_cache_limitado = False
+
+# Por processo: caminho preparado de cada (imagem, tamanho, dpi) e imagens já carregadas para o
+# python-pptx (bytes e sha1), cada um com o (tamanho, mtime) do arquivo de onde veio
+_preparadas = {}
+_carregadas = {}
+# Partes de imagem de cada apresentação em montagem, por sha1; somem junto com a apresentação
+_partes_por_pacote = weakref.WeakKeyDictionary()
+
+
+def verificar_versao_pptx():
+    if pptx.__version__ not in VERSOES_PPTX_SUPORTADAS:
+        raise ImportError(
+            f"python-pptx {pptx.__version__} não é suportado na montagem das apresentações "
+            f"(versões testadas: {', '.join(VERSOES_PPTX_SUPORTADAS)}). Instale a versão do requirements.txt."
+        )
+
+
+verificar_versao_pptx()
+
+
+def tamanho_alvo(imagem, largura, altura, dpi):
+    """Tamanho em pixels da imagem posicionada com largura x altura (EMU); sem uma delas, mantém a proporção."""
+    if largura is None and altura is None:
+        return imagem.size
+    if largura is None:
+        largura = altura * imagem.width / imagem.height
+    if altura is None:
+        altura = largura * imagem.height / imagem.width
+    return (
+        min(imagem.width, math.ceil(largura / EMU_POR_POLEGADA * dpi)),
+        min(imagem.height, math.ceil(altura / EMU_POR_POLEGADA * dpi)),
+    )
+
+
+def quantizar(imagem):
+    """
+    Imagem de paleta (P) com as mesmas cores da imagem RGBA, ou None se ela tiver mais de CORES_PALETA
+    cores. Não há perda: as imagens com mais cores (antialiasing dos gráficos, gradientes dos fundos do
+    template) não são quantizadas, porque mesmo com o erro médio baixo alguns pixels mudam de forma visível.
+    """
+    pixels = np.asarray(imagem)
+    # Cada pixel RGBA como um uint32; o factorize do pandas (hash) é bem mais rápido que o np.unique (ordenação)
+    chaves = pixels.reshape(-1, 4).view(np.uint32).ravel()
+    inverso, cores = pd.factorize(chaves)
+    if len(cores) > CORES_PALETA:
+        return None
+    quantizada = Image.fromarray(inverso.astype(np.uint8).reshape(pixels.shape[:2]), 'P')
+    quantizada.putpalette(cores.view(np.uint8).tobytes(), 'RGBA')
+    return quantizada
+
+
+def otimizar(imagem):
+    """PNG otimizado da imagem, sem perda: de paleta quando ela tem até CORES_PALETA cores, senão RGBA."""
+    imagem = imagem.convert('RGBA')
+    quantizada = quantizar(imagem)
+    saida = io.BytesIO()
+    (imagem if quantizada is None else quantizada).save(saida, format='png', optimize=True)
+    return saida.getvalue()
+
+
+def limitar_cache():
+    """Descarta as imagens preparadas usadas há mais tempo até o cache caber no limite."""
+    if not os.path.isdir(PASTA_CACHE):
+        return
+    entradas = []
+    for nome in os.listdir(PASTA_CACHE):
+        try:
+            info = os.stat(os.path.join(PASTA_CACHE, nome))
+        except FileNotFoundError:
+            continue
+        entradas.append((info.st_mtime, info.st_size, nome))
+    total = sum(tamanho for _, tamanho, _ in entradas)
+    for _, tamanho, nome in sorted(entradas):
+        if total <= LIMITE_CACHE_BYTES:
+            break
+        try:
+            os.remove(os.path.join(PASTA_CACHE, nome))
+        except FileNotFoundError:
+            pass
+        total -= tamanho
+
+
+def assinatura(caminho):
+    info = os.stat(caminho)
+    return info.st_size, info.st_mtime_ns
+
+
+def preparar_imagem(caminho, largura=None, altura=None):
+    """
+    Retorna o caminho que deve ir para o add_picture: o PNG reduzido e otimizado no cache ou o próprio
+    caminho, quando a etapa está desligada (dpi 0), a imagem não é PNG ou a versão otimizada não fica menor.
+    """
+    dpi = perfil_render.dpi_apresentacao()
+    if not dpi:
+        return caminho
+
+    chave = (caminho, largura, altura, dpi)
+    origem = assinatura(caminho)
+    em_cache = _preparadas.get(chave)
+    if em_cache and em_cache[0] == origem and os.path.exists(em_cache[1]):
+        return em_cache[1]
+    preparado = preparar_no_cache(caminho, largura, altura, dpi)
+    _preparadas[chave] = (origem, preparado)
+    return preparado
+
+
+def preparar_no_cache(caminho, largura, altura, dpi):
+    """Procura a imagem no cache_apresentacao/ e, se ainda não estiver lá, reduz, otimiza e grava."""
+    global _cache_limitado
+    with open(caminho, 'rb') as f:
+        original = f.read()
+    with Image.open(io.BytesIO(original)) as imagem:
+        if imagem.format != 'PNG':
+            return caminho
+        alvo = tamanho_alvo(imagem, largura, altura, dpi)
+
+        sha = hashlib.sha256(original)
+        sha.update(f'{alvo[0]}x{alvo[1]}|{VERSAO_OTIMIZACAO}'.encode('utf-8'))
+        destino = os.path.join(PASTA_CACHE, f'{sha.hexdigest()}.png')
+        try:
+            os.utime(destino)
+            existe = True
+        except FileNotFoundError:
+            existe = False
+        if not existe:
+            if not _cache_limitado:
+                limitar_cache()
+                _cache_limitado = True
+            if alvo != imagem.size:
+                imagem = imagem.resize(alvo, Image.LANCZOS)
+            dados = otimizar(imagem)
+            os.makedirs(PASTA_CACHE, exist_ok=True)
+            temporario = f'{destino}.{os.getpid()}.tmp'
+            with open(temporario, 'wb') as f:
+                # Arquivo vazio marca as imagens em que a versão otimizada não compensa
+                f.write(dados if len(dados) < len(original) else b'')
+            os.replace(temporario, destino)
+
+    return destino if os.path.getsize(destino) else caminho
+
+
+def imagem_preparada(caminho, largura=None, altura=None):
+    """
+    Imagem do python-pptx já preparada para largura x altura (EMU). Se o arquivo preparado sumir do
+    cache_apresentacao/ antes de ser lido (aparado por outro processo), ele é preparado de novo.
+    """
+    for tentativa in range(TENTATIVAS_CACHE):
+        try:
+            return carregar_imagem(preparar_imagem(caminho, largura, altura))
+        except FileNotFoundError:
+            # Sem a imagem de origem não há o que refazer: o erro é de quem chamou
+            if tentativa == TENTATIVAS_CACHE - 1 or not os.path.exists(caminho):
+                raise
+
+
+def carregar_imagem(caminho):
+    """Imagem do python-pptx (bytes e sha1) do arquivo, lida uma vez por processo enquanto ele não mudar."""
+    versao = assinatura(caminho)
+    em_cache = _carregadas.get(caminho)
+    if em_cache and em_cache[0] == versao:
+        return em_cache[1]
+    imagem = ImagemPptx.from_file(caminho)
+    _carregadas[caminho] = (versao, imagem)
+    return imagem
+
+
+def parte_da_imagem(pacote, imagem):
+    """
+    Parte de imagem da apresentação com esse conteúdo, criada na primeira vez. Substitui a busca do
+    python-pptx, que percorre todas as partes do pacote a cada figura para comparar os sha1 e de novo a
+    cada parte nova para achar o próximo /ppt/media/imageN livre.
+    """
+    estado = _partes_por_pacote.get(pacote)
+    if estado is None:
+        # Uma única passada pelas partes que o pacote já tem (as do template, se houver)
+        partes, indices = {}, set()
+        for parte in pacote.iter_parts():
+            if parte.partname.startswith('/ppt/media/image') and parte.partname.idx is not None:
+                indices.add(parte.partname.idx)
+            if isinstance(parte, ImagePart):
+                partes.setdefault(parte.sha1, parte)
+        estado = _partes_por_pacote[pacote] = {'partes': partes, 'indices': indices}
+
+    parte = estado['partes'].get(imagem.sha1)
+    if parte is None:
+        # Mesmo nome que o next_image_partname daria: o menor índice livre
+        indice = next(i for i in range(1, len(estado['indices']) + 2) if i not in estado['indices'])
+        estado['indices'].add(indice)
+        nome = PackURI(f'/ppt/media/image{indice}.{imagem.ext}')
+        parte = ImagePart(nome, imagem.content_type, pacote, imagem.blob, imagem.filename)
+        estado['partes'][imagem.sha1] = parte
+    return parte
+
+
+def relacionar_imagem(parte_origem, caminho, largura=None, altura=None):
+    """
+    Liga a imagem, preparada para largura x altura (EMU), à parte que vai usá-la (slide ou layout).
+    Retorna a parte de imagem e o rId da relação.
+    """
+    parte = parte_da_imagem(parte_origem.package, imagem_preparada(caminho, largura, altura))
+    return parte, parte_origem.relate_to(parte, RT.IMAGE)
+
+
+def adicionar_imagem(shapes, caminho, left, top, width=None, height=None):
+    """
+    slide.shapes.add_picture com a imagem já preparada para o espaço que ocupa no slide, carregada do
+    cache do processo e ligada à parte de imagem que a apresentação já tiver com o mesmo conteúdo.
+    """
+    parte, rId = relacionar_imagem(shapes.part, caminho, width, height)
+    # Mesmos passos do SlideShapes.add_picture (internos, ver VERSOES_PPTX_SUPORTADAS); com largura e
+    # altura dadas, sem abrir a imagem para calcular o tamanho nativo, que o ImagePart.scale faz antes
+    # de olhar os argumentos
+    largura, altura = (width, height) if width and height else parte.scale(width, height)
+    id_forma = shapes._next_shape_id
+    pic = shapes._grpSp.add_pic(id_forma, f'Picture {id_forma - 1}', parte.desc, rId, left, top, largura, altura)
+    shapes._recalculate_extents()
+    return shapes._shape_factory(pic)
+
+
+def trocar_imagem(forma, caminho):
+    """
+    Aponta a figura já existente no slide para a versão atual da imagem, preparada para o tamanho da
+    figura. Retorna False, sem mexer no slide, quando o conteúdo embutido já é o mesmo.
+
+    O python-pptx não troca a imagem de uma figura pela API pública: o r:embed do blip é reescrito
+    aqui, contando com a versão fixada (VERSOES_PPTX_SUPORTADAS).
+    """
+    parte_slide = forma.part
+    imagem = imagem_preparada(caminho, forma.width, forma.height)
+    if imagem.sha1 == forma.image.sha1:
+        return False
+    blip = forma.element.blipFill.blip
+    antigo = blip.rEmbed
+    blip.rEmbed = parte_slide.relate_to(parte_da_imagem(parte_slide.package, imagem), RT.IMAGE)
+    # A relação antiga sai quando nenhuma outra figura do slide usa a mesma imagem; a parte sem
+    # relações nem é gravada no .pptx. O drop_rel só conta as referências r:id, não as r:embed das
+    # figuras, por isso a conferência fica aqui.
+    if antigo not in parte_slide.slide.element.xpath('//@r:embed'):
+        parte_slide.drop_rel(antigo)
+    return True
@@ -0,0 +1,27 @@
+import os
+import shutil
+import zipfile
+import unicodedata
+
+
+def localizar_membro(zip_ref: zipfile.ZipFile, nome_membro: str) -> zipfile.ZipInfo:
+    """
+    Procura o membro pelo nome base, ignorando pastas internas e diferenças de
+    normalização Unicode (ex.: 'gráfico' gravado em NFD por zips gerados no macOS).
+    """
+    alvo = unicodedata.normalize('NFC', nome_membro)
+    for info in zip_ref.infolist():
+        if unicodedata.normalize('NFC', os.path.basename(info.filename)) == alvo:
+            return info
+    raise FileNotFoundError(f"'{nome_membro}' não encontrado em '{zip_ref.filename}'")
+
+
+def extrair_membro_para(zip_ref: zipfile.ZipFile, nome_membro: str, caminho_destino: str) -> None:
+    """
+    Copia um único membro do .zip direto para o arquivo de destino, em streaming.
+    Nenhum outro membro é gravado em disco e não há arquivo intermediário em raw_data/,
+    então arquivos .zip diferentes nunca disputam o mesmo nome de extração.
+    """
+    info = localizar_membro(zip_ref, nome_membro)
+    with zip_ref.open(info) as origem, open(caminho_destino, 'wb') as destino:
+        shutil.copyfileobj(origem, destino, 1024 * 1024)
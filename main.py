@@ -1,7 +1,24 @@
 import os
+import io
 import json
+import time
+import argparse
+import importlib
+import functools
+import traceback
+import tempfile
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout, redirect_stderr
+
+import cache_etapas
+import perfil_render
+import narrativas
+import metricas_etapas
+
+# Módulos de etapa já importados no modo em processo (um import por execução do main.py)
+_MODULOS_CARREGADOS = {}
 
 def buscar_lista_artistas():
     try:
@@ -23,27 +40,264 @@ def carregar_configuracao(filepath):
         print(f"ERRO: O arquivo '{filepath}' contém um erro de sintaxe. Retornando configuração vazia.")
         return {}
 
-def executar_script(script_name, artista):
+def executar_script(script_name, artista, registro=None):
+    """
+    Executa a etapa em um subprocesso. O script roda dentro do metricas_etapas, que mede CPU, memória
+    e arquivos do próprio subprocesso; a saída da etapa vai para o log da execução.
+    """
+    registro = {} if registro is None else registro
     if not os.path.exists(script_name):
         print(f"    -> AVISO: O script '{script_name}' não foi encontrado. Pulando.")
+        registro['status'] = 'ausente'
         return False
     print(f"    -> Executando '{script_name}'...")
+    descritor, destino_metricas = tempfile.mkstemp(prefix='metricas_', suffix='.json')
+    os.close(descritor)
+    inicio = time.perf_counter()
     try:
-        subprocess.run(
-            [sys.executable, script_name, artista], 
+        resultado = subprocess.run(
+            metricas_etapas.comando_medido(script_name, artista, destino_metricas),
             check=True, text=True, capture_output=True, encoding='utf-8'
         )
+        metricas_etapas.gravar_log(registro, resultado.stdout + resultado.stderr)
         print(f"    -> SUCESSO: '{script_name}' finalizado.")
+        registro['status'] = 'sucesso'
         return True
     except subprocess.CalledProcessError as e:
+        metricas_etapas.gravar_log(registro, (e.stdout or '') + (e.stderr or ''))
         print(f"    -> ERRO na execução de '{script_name}':\n{e.stderr}")
+        registro.update(status='erro', codigo_saida=e.returncode)
         return False
     except Exception as e:
         print(f"    -> Um erro inesperado ocorreu ao executar '{script_name}': {e}")
+        registro['status'] = 'erro'
         return False
+    finally:
+        registro.update(metricas_etapas.ler_metricas_do_subprocesso(destino_metricas))
+        # Tempo visto pelo main.py, incluindo a subida do interpretador e os imports do script
+        registro['tempo_s'] = round(time.perf_counter() - inicio, 3)
+
+def carregar_nomes_display():
+    """Lê o comparacoes.json do mesmo jeito que os scripts de apresentação fazem no __main__."""
+    try:
+        with open('comparacoes.json', encoding='latin-1') as json_file:
+            return json.load(json_file)
+    except FileNotFoundError:
+        print("[AVISO] Arquivo 'comparacoes.json' não encontrado. Usando nome do arquivo como display.")
+        return {}
+    except Exception as e:
+        print(f"[AVISO] Erro ao ler 'comparacoes.json': {e}. Usando nome do arquivo como display.")
+        return {}
+
+def montar_argumento_run(script_name, artista, nomes_display):
+    """
+    Monta o argumento que o `run` do script espera. Os scripts de apresentação recebem a
+    tupla (nome_arquivo, nome_display); os demais recebem apenas o nome do artista.
+    """
+    if os.path.basename(script_name).startswith('apresentacao_'):
+        return (artista, nomes_display.get(artista, artista))
+    return artista
+
+def carregar_modulo_etapa(script_name):
+    """Importa o módulo da etapa uma única vez e o reaproveita nas chamadas seguintes."""
+    if script_name not in _MODULOS_CARREGADOS:
+        nome_modulo = os.path.splitext(os.path.basename(script_name))[0]
+        _MODULOS_CARREGADOS[script_name] = importlib.import_module(nome_modulo)
+    return _MODULOS_CARREGADOS[script_name]
+
+def executar_script_em_processo(script_name, artista, nomes_display, registro=None):
+    """
+    Executa a etapa chamando `run` diretamente no processo atual, sem abrir um novo interpretador.
+    Assim como no modo subprocesso, a saída da etapa só é exibida quando ela falha (e sempre vai para o log).
+    """
+    registro = {} if registro is None else registro
+    if not os.path.exists(script_name):
+        print(f"    -> AVISO: O script '{script_name}' não foi encontrado. Pulando.")
+        registro['status'] = 'ausente'
+        return False
+    print(f"    -> Executando '{script_name}' (em processo)...")
+    saida = io.StringIO()
+    erro = ''
+    with metricas_etapas.medir_etapa() as metricas:
+        try:
+            with redirect_stdout(saida), redirect_stderr(saida):
+                modulo = carregar_modulo_etapa(script_name)
+                modulo.run(montar_argumento_run(script_name, artista, nomes_display))
+        except (Exception, SystemExit):
+            erro = traceback.format_exc()
+    registro.update(metricas, status='erro' if erro else 'sucesso')
+    metricas_etapas.gravar_log(registro, saida.getvalue() + erro)
+    if erro:
+        print(f"    -> ERRO na execução de '{script_name}':\n{saida.getvalue()}{erro}")
+        return False
+    print(f"    -> SUCESSO: '{script_name}' finalizado.")
+    return True
+
+def processar_artista(artista, config_artista, tipos_desejados, em_processo=False, nomes_display=None, incremental=False, registros=None):
+    """
+    Executa os grupos 1 a 5 para um único artista.
+    Retorna uma lista de tuplas (script, sucesso) na ordem em que as etapas rodaram.
+    No modo incremental, uma etapa cujas entradas não mudaram desde a última execução
+    bem-sucedida é pulada, desde que nenhuma etapa anterior tenha precisado rodar.
+    As métricas de cada etapa (ver metricas_etapas) são acrescentadas a registros, quando informada.
+    """
+    if em_processo:
+        executar_script_escolhido = functools.partial(executar_script_em_processo, nomes_display=nomes_display or {})
+    else:
+        executar_script_escolhido = executar_script
+
+    estado = cache_etapas.carregar_estado(artista)
+    anterior_executado = False
+
+    def executar(script, grupo):
+        nonlocal anterior_executado
+        registro = metricas_etapas.novo_registro(artista, grupo, script, 'em_processo' if em_processo else 'subprocesso')
+        if registros is not None:
+            registros.append(registro)
+        inicio = time.perf_counter()
+        if incremental and not anterior_executado and cache_etapas.etapa_atualizada(script, grupo, artista, config_artista, estado):
+            print(f"    -> ATUALIZADO: '{script}' sem mudanças desde a última execução. Pulando.")
+            registro.update(status='atualizado', tempo_s=round(time.perf_counter() - inicio, 3))
+            return True
+        sucesso = executar_script_escolhido(script, artista, registro=registro)
+        if grupo != 'grupo_5_apresentacao':
+            # As apresentações são independentes entre si; as demais etapas invalidam as seguintes
+            anterior_executado = True
+        if sucesso:
+            cache_etapas.registrar_sucesso(script, grupo, artista, config_artista, estado)
+        return sucesso
+
+    resultados = []
+    tipo_proc = config_artista.get("tipo_processamento", "padrao").upper()
+
+    # Define e executa os scripts para os grupos 1 a 4
+    if tipo_proc == "CA":
+        scripts_base = {"grupo_1_extracao": "extraindo_renomeando_CA.py", "grupo_2_tratamento": "tratamento_CA.py", "grupo_3_report": "report_CA.py"}
+    else:
+        scripts_base = {"grupo_1_extracao": "extraindo_renomeando.py", "grupo_2_tratamento": "tratamento.py", "grupo_3_report": "report.py"}
+    
+    scripts_a_executar = {**scripts_base, **config_artista}
+    
+    for i in range(1, 5):
+        nome_grupo = f"grupo_{i}_{['extracao', 'tratamento', 'report', 'graficos'][i-1]}"
+        print(f"\n  [GRUPO: {nome_grupo.upper()}]")
+        script = scripts_a_executar.get(nome_grupo)
+        if script:
+            resultados.append((script, executar(script, nome_grupo)))
+        else:
+            print(f"    -> Nenhum script definido para este grupo. Pulando.")
+
+    # --- Lógica Final para o Grupo 5 (Apresentação) ---
+    print("\n  [GRUPO: GRUPO_5_APRESENTACAO]")
+    print(f"    -> Apresentações definidas em 'presentation_config.json': {tipos_desejados}")
+
+    # 1. Pega o "cardápio" de scripts de apresentação possíveis do 'config.json'
+    apresentacoes_possiveis = config_artista.get("grupo_5_apresentacao", [])
+    if not isinstance(apresentacoes_possiveis, list):
+        apresentacoes_possiveis = [apresentacoes_possiveis]
+
+    # 2. Filtra o "cardápio" com base no "pedido"
+    scripts_para_rodar_hoje = []
+    for tipo in tipos_desejados:
+        for script_possivel in apresentacoes_possiveis:
+            if tipo in script_possivel:
+                scripts_para_rodar_hoje.append(script_possivel)
+
+    if not scripts_para_rodar_hoje:
+        print("    -> Nenhum script de apresentação corresponde à seleção para hoje.")
+    else:
+        print(f"    -> Scripts a serem executados: {list(set(scripts_para_rodar_hoje))}")
+        for script in set(scripts_para_rodar_hoje): # `set` evita rodar o mesmo script duas vezes
+            resultados.append((script, executar(script, 'grupo_5_apresentacao')))
+
+    return resultados
+
+def _processar_artista_em_worker(artista, config_artista, tipos_desejados, em_processo, nomes_display, incremental):
+    """
+    Ponto de entrada dos workers do pool. Toda a saída do artista é acumulada em memória e
+    devolvida de uma vez, para que o log de um canal não se misture com o de outro.
+    """
+    saida = io.StringIO()
+    registros = []
+    with redirect_stdout(saida):
+        try:
+            resultados = processar_artista(artista, config_artista, tipos_desejados, em_processo, nomes_display, incremental, registros)
+        except Exception:
+            print(f"    -> ERRO inesperado ao processar '{artista}':\n{traceback.format_exc()}")
+            resultados = [("(worker)", False)]
+    return saida.getvalue(), resultados, registros
+
+def cabecalho_artista(artista):
+    return (
+        "-------------------------------------------------------\n"
+        f"PROCESSANDO ARTISTA: {artista}\n"
+        "-------------------------------------------------------"
+    )
+
+def imprimir_resumo(lista_de_artistas, resumo):
+    """Imprime o resultado de cada artista na mesma ordem do exports.txt."""
+    print("\n=======================================================")
+    print("                  RESUMO POR ARTISTA                   ")
+    print("=======================================================")
+    for artista in lista_de_artistas:
+        resultados = resumo.get(artista)
+        if resultados is None:
+            print(f"  {artista}: PULADO (não encontrado no config.json)")
+            continue
+        falhas = [script for script, sucesso in resultados if not sucesso]
+        status = "OK" if not falhas else "FALHA"
+        linha = f"  {artista}: {status} - {len(resultados) - len(falhas)}/{len(resultados)} etapas com sucesso"
+        if falhas:
+            linha += f" | falhas: {', '.join(falhas)}"
+        print(linha)
+
+def parse_argumentos():
+    parser = argparse.ArgumentParser(description="Orquestrador do fluxo de processamento e relatórios.")
+    parser.add_argument(
+        '--em-processo', action='store_true',
+        help="Importa cada script uma única vez e chama seu run(artista) diretamente, em vez de abrir um subprocesso por etapa."
+    )
+    parser.add_argument(
+        '--workers', type=int, default=1,
+        help="Número de artistas processados em paralelo (pool de processos). Padrão: 1 (sequencial)."
+    )
+    parser.add_argument(
+        '--workers-graficos', type=int, default=None,
+        help="Processos usados para renderizar os gráficos de cada artista. Padrão: um por CPU, ou 1 quando --workers > 1."
+    )
+    parser.add_argument(
+        '--cache-graficos-mb', type=int, default=None,
+        help="Liga o cache de gráficos compartilhado por todos os artistas (cache_graficos/), com este tamanho máximo em MB. Padrão: desligado."
+    )
+    parser.add_argument(
+        '--perfil-render', choices=sorted(perfil_render.PERFIS), default=perfil_render.PERFIL_PADRAO,
+        help="Perfil de renderização dos gráficos e apresentações: 'final' (300 dpi, entrega) ou 'draft' (rascunho rápido). Padrão: final."
+    )
+    parser.add_argument(
+        '--dpi-apresentacao', type=int, default=None,
+        help="Dpi efetivo das imagens nas apresentações: cada PNG é reduzido ao tamanho em que aparece no slide. 0 embute os PNGs originais. Padrão: o do perfil (220 no final, 96 no draft)."
+    )
+    parser.add_argument(
+        '--graficos-nativos', action='store_true',
+        help="Monta os gráficos de séries mensais (monetização, receita por formato, conversão, views, inscrições e origem do tráfego) nas apresentações como gráficos nativos do PowerPoint, com os dados da tabela 4.1, em vez de embutir os PNGs. Os PNGs continuam sendo gerados e entram no slide quando um gráfico nativo não pode ser montado."
+    )
+    parser.add_argument(
+        '--atualizar-apresentacoes', action='store_true',
+        help="Abre o .pptx já gerado de cada apresentação e troca só as imagens, gráficos nativos e textos que mudaram, em vez de remontar o deck. Se a descrição do deck mudou (slides, opções ou código do motor), ele é remontado."
+    )
+    parser.add_argument(
+        '--pasta-narrativas', default=None,
+        help="Pasta raiz das análises narrativas e dos gráficos do cluster (uma subpasta <artista>/exports por artista). Padrão: a pasta dos relatórios da API na máquina Windows."
+    )
+    parser.add_argument(
+        '--incremental', action='store_true',
+        help="Pula as etapas cujas entradas (zips, CSVs, config.json e o próprio script) não mudaram desde a última execução bem-sucedida."
+    )
+    return parser.parse_args()
 
 def main():
     """Função principal que orquestra todo o fluxo de execução."""
+    args = parse_argumentos()
     config_principal = carregar_configuracao('config.json').get('artistas', {})
     mapa_de_apresentacao = carregar_configuracao('presentation_config.json')
     lista_de_artistas = buscar_lista_artistas()
@@ -57,61 +311,69 @@ def main():
     print(f"Artistas a serem processados: {', '.join(lista_de_artistas)}")
     print("=======================================================\n")
 
-    for artista in lista_de_artistas:
-        print(f"-------------------------------------------------------")
-        print(f"PROCESSANDO ARTISTA: {artista}")
-        print(f"-------------------------------------------------------")
+    # Lido pelos scripts de gráficos, tanto em subprocesso quanto em processo
+    if args.workers_graficos is not None:
+        os.environ[perfil_render.VARIAVEL_WORKERS_GRAFICOS] = str(args.workers_graficos)
+    elif args.workers > 1:
+        # Os artistas já rodam em paralelo: os gráficos de cada um ficam sequenciais
+        os.environ[perfil_render.VARIAVEL_WORKERS_GRAFICOS] = '1'
+    if args.cache_graficos_mb is not None:
+        os.environ[perfil_render.VARIAVEL_LIMITE_CACHE_GRAFICOS] = str(args.cache_graficos_mb)
+    # Lido pelos gráficos (dpi, bbox, compressão) e pelas apresentações (nome do .pptx)
+    os.environ[perfil_render.VARIAVEL_PERFIL] = args.perfil_render
+    if args.dpi_apresentacao is not None:
+        os.environ[perfil_render.VARIAVEL_DPI_APRESENTACAO] = str(args.dpi_apresentacao)
+    # Lido só pelas apresentações: os gráficos continuam gerando os PNGs, que ficam de reserva
+    os.environ[perfil_render.VARIAVEL_GRAFICOS_NATIVOS] = '1' if args.graficos_nativos else ''
+    os.environ[perfil_render.VARIAVEL_ATUALIZAR_APRESENTACOES] = '1' if args.atualizar_apresentacoes else ''
+    # Lido pelos decks de cluster
+    if args.pasta_narrativas is not None:
+        os.environ[narrativas.VARIAVEL_PASTA] = args.pasta_narrativas
+    # Relatório de tempo, CPU, memória e arquivos de cada etapa (a pasta dos logs também vai para os workers)
+    execucao = metricas_etapas.iniciar_execucao(sys.argv[1:])
 
+    nomes_display = carregar_nomes_display() if args.em_processo else {}
+    resumo = {}
+    artistas_validos = []
+    for artista in lista_de_artistas:
         if artista not in config_principal:
+            print(cabecalho_artista(artista))
             print(f"AVISO: O artista '{artista}' não foi encontrado no config.json. Pulando.")
             continue
+        artistas_validos.append(artista)
 
-        config_artista = config_principal[artista]
-        tipo_proc = config_artista.get("tipo_processamento", "padrao").upper()
-
-        # Define e executa os scripts para os grupos 1 a 4
-        if tipo_proc == "CA":
-            scripts_base = {"grupo_1_extracao": "extraindo_renomeando_CA.py", "grupo_2_tratamento": "tratamento_CA.py", "grupo_3_report": "report_CA.py"}
-        else:
-            scripts_base = {"grupo_1_extracao": "extraindo_renomeando.py", "grupo_2_tratamento": "tratamento.py", "grupo_3_report": "report.py"}
-        
-        scripts_a_executar = {**scripts_base, **config_artista}
-        
-        for i in range(1, 5):
-            nome_grupo = f"grupo_{i}_{['extracao', 'tratamento', 'report', 'graficos'][i-1]}"
-            print(f"\n  [GRUPO: {nome_grupo.upper()}]")
-            script = scripts_a_executar.get(nome_grupo)
-            if script:
-                executar_script(script, artista)
-            else:
-                print(f"    -> Nenhum script definido para este grupo. Pulando.")
-
-        # --- Lógica Final para o Grupo 5 (Apresentação) ---
-        print("\n  [GRUPO: GRUPO_5_APRESENTACAO]")
-        
-        # 1. Pega a lista de apresentações a serem geradas do 'presentation_config.json'
-        #    Se o artista não estiver lá, o padrão é ['report']
+    def argumentos_do_artista(artista):
+        # Se o artista não estiver no 'presentation_config.json', o padrão é ['report']
         tipos_desejados = mapa_de_apresentacao.get(artista, ["report"])
-        print(f"    -> Apresentações definidas em 'presentation_config.json': {tipos_desejados}")
-
-        # 2. Pega o "cardápio" de scripts de apresentação possíveis do 'config.json'
-        apresentacoes_possiveis = config_artista.get("grupo_5_apresentacao", [])
-        if not isinstance(apresentacoes_possiveis, list):
-            apresentacoes_possiveis = [apresentacoes_possiveis]
-
-        # 3. Filtra o "cardápio" com base no "pedido"
-        scripts_para_rodar_hoje = []
-        for tipo in tipos_desejados:
-            for script_possivel in apresentacoes_possiveis:
-                if tipo in script_possivel:
-                    scripts_para_rodar_hoje.append(script_possivel)
-
-        if not scripts_para_rodar_hoje:
-            print("    -> Nenhum script de apresentação corresponde à seleção para hoje.")
-        else:
-            print(f"    -> Scripts a serem executados: {list(set(scripts_para_rodar_hoje))}")
-            for script in set(scripts_para_rodar_hoje): # `set` evita rodar o mesmo script duas vezes
-                executar_script(script, artista)
+        return (artista, config_principal[artista], tipos_desejados, args.em_processo, nomes_display, args.incremental)
+
+    if args.workers > 1 and len(artistas_validos) > 1:
+        # Os canais são independentes: cada um só escreve em dados_full/{artista}/,
+        # exports_tabelas/tabela_4.1_{artista}.xlsx e export_teste/
+        n_workers = min(args.workers, len(artistas_validos))
+        print(f"Executando {len(artistas_validos)} artistas com {n_workers} workers em paralelo.\n")
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            futuros = {pool.submit(_processar_artista_em_worker, *argumentos_do_artista(a)): a for a in artistas_validos}
+            for futuro in as_completed(futuros):
+                artista = futuros[futuro]
+                try:
+                    log, resultados, registros = futuro.result()
+                except Exception as e:
+                    log, resultados, registros = f"    -> ERRO: o worker do artista '{artista}' foi encerrado: {e}\n", [("(worker)", False)], []
+                print(cabecalho_artista(artista))
+                print(log, end='')
+                resumo[artista] = resultados
+                metricas_etapas.registrar_etapas(execucao, registros)
+    else:
+        for artista in artistas_validos:
+            print(cabecalho_artista(artista))
+            registros = []
+            resumo[artista] = processar_artista(*argumentos_do_artista(artista), registros)
+            metricas_etapas.registrar_etapas(execucao, registros)
+
+    metricas_etapas.finalizar_execucao(execucao)
+    imprimir_resumo(lista_de_artistas, resumo)
+    metricas_etapas.imprimir_resumo_metricas(execucao)
 
     print("\n=======================================================")
     print("            FLUXO DE PROCESSAMENTO FINALIZADO            ")
@@ -0,0 +1,422 @@
+import os
+import sys
+import json
+import time
+import runpy
+import traceback
+import platform
+from datetime import datetime
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Medição de cada etapa executada pelo main.py: tempo de parede, tempo de CPU, pico de memória (RSS),
+# arquivos lidos e gravados (com tamanho) e status. Cada etapa vira uma linha de
+# relatorios_execucao/execucao_<data>.jsonl, e a saída completa da etapa fica em
+# relatorios_execucao/execucao_<data>/<artista>/<script>.log (antes era descartada quando a etapa dava certo).
+PASTA_RELATORIOS = 'relatorios_execucao'
+# Pasta dos logs da execução atual, repassada aos workers do pool de artistas
+VARIAVEL_PASTA_LOGS = 'METRICAS_PASTA_LOGS'
+
+# Quantas etapas e quantos canais aparecem no resumo do console
+QUANTIDADE_NO_RESUMO = 10
+
+# Arquivos do próprio Python (imports, bytecode, bibliotecas) não entram na lista de arquivos da etapa
+EXTENSOES_IGNORADAS = ('.py', '.pyc', '.pyd', '.so', '.dll')
+# (nem os do sistema, como /etc/mime.types lido pelo mimetypes)
+PASTAS_IGNORADAS = tuple(sorted(
+    {os.path.normcase(os.path.abspath(p)) + os.sep for p in (sys.prefix, sys.base_prefix, sys.exec_prefix)}
+    | ({'/etc/', '/proc/', '/sys/', '/dev/', '/usr/'} if os.name == 'posix' else set())
+))
+FLAGS_ESCRITA = os.O_WRONLY | os.O_RDWR
+
+# Arquivos abertos pela etapa em andamento neste processo ({'lidos': set, 'gravados': set}), preenchidos pelo
+# hook; None quando nenhuma etapa está sendo medida
+_medicao_atual = None
+_hook_instalado = False
+
+
+def _registrar_abertura(evento, argumentos):
+    # Chamado em todo evento de auditoria do processo, até o fim dele: precisa ser barato e nunca levantar
+    # exceção. Fora de uma medição, só faz esta comparação.
+    if _medicao_atual is None or (evento != 'open' and evento != 'os.rename'):
+        return
+    if evento == 'os.rename':
+        # Gravações em arquivo temporário seguidas de os.replace contam como gravação do destino
+        try:
+            origem, destino = os.fsdecode(argumentos[0]), os.fsdecode(argumentos[1])
+        except TypeError:
+            return
+        if origem in _medicao_atual['gravados']:
+            _medicao_atual['gravados'].discard(origem)
+            _medicao_atual['gravados'].add(destino)
+        return
+    caminho, _, flags = argumentos
+    if isinstance(caminho, int):
+        return
+    try:
+        caminho = os.fsdecode(caminho)
+    except TypeError:
+        return
+    escrita = isinstance(flags, int) and flags & FLAGS_ESCRITA
+    _medicao_atual['gravados' if escrita else 'lidos'].add(caminho)
+
+
+def _esquecer_medicao_no_filho():
+    # Processos criados por fork durante uma etapa (workers dos gráficos) herdam o hook e a medição do pai;
+    # as anotações deles nunca voltariam para a etapa, então o filho começa sem medição
+    global _medicao_atual
+    _medicao_atual = None
+
+
+def anotar_arquivo(caminho, gravado=False):
+    """
+    Anota na etapa em medição neste processo um arquivo lido ou gravado fora do open do Python, que o hook
+    não vê (ex.: o armazém Feather, aberto em C++ pelo pyarrow). Sem etapa em medição, não faz nada.
+    """
+    if _medicao_atual is not None:
+        _medicao_atual['gravados' if gravado else 'lidos'].add(os.fspath(caminho))
+
+
+def instalar_hook():
+    """
+    Instala o hook que anota os arquivos abertos, uma única vez por processo. Um hook de auditoria não pode
+    ser removido (sys.addaudithook): ele fica ativo até o processo acabar e é chamado em todos os eventos,
+    inclusive nas etapas seguintes do modo --em-processo e nos workers criados por fork. Fora de uma
+    medição (_medicao_atual é None), ele retorna na primeira comparação.
+    """
+    global _hook_instalado
+    if not _hook_instalado:
+        sys.addaudithook(_registrar_abertura)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=_esquecer_medicao_no_filho)
+        _hook_instalado = True
+
+
+def normalizar_caminho(caminho):
+    """Caminho relativo à pasta do projeto (ou absoluto, se estiver fora dela); None para arquivos do Python."""
+    absoluto = os.path.abspath(caminho)
+    if absoluto.endswith(EXTENSOES_IGNORADAS) or '__pycache__' in absoluto:
+        return None
+    if os.path.normcase(absoluto).startswith(PASTAS_IGNORADAS):
+        return None
+    try:
+        relativo = os.path.relpath(absoluto)
+    except ValueError:  # Outra unidade no Windows
+        return absoluto
+    return absoluto if relativo.startswith('..') else relativo
+
+
+def listar_arquivos(caminhos):
+    """Lista ordenada de {'caminho', 'bytes'}, com o tamanho do arquivo ao final da etapa; arquivos que não existem ficam de fora."""
+    arquivos = {}
+    for caminho in caminhos:
+        caminho = normalizar_caminho(caminho)
+        if caminho is None:
+            continue
+        # Diretórios também passam pelo evento 'open' (ex.: O_TMPFILE do tempfile no Linux)
+        if os.path.isfile(caminho):
+            arquivos[caminho] = os.path.getsize(caminho)
+    return [{'caminho': caminho, 'bytes': arquivos[caminho]} for caminho in sorted(arquivos)]
+
+
+def ler_proc(nome):
+    """Campos 'chave: valor' de /proc/self/<nome> (Linux); dicionário vazio nos outros sistemas."""
+    try:
+        with open(f'/proc/self/{nome}', 'r') as f:
+            linhas = f.read().splitlines()
+    except OSError:
+        return {}
+    campos = {}
+    for linha in linhas:
+        chave, _, valor = linha.partition(':')
+        campos[chave.strip()] = valor.strip()
+    return campos
+
+
+def zerar_pico_rss():
+    """
+    Zera o pico de RSS do processo (VmHWM) para medir só a etapa que vai começar. Só existe no Linux;
+    retorna False quando não dá para zerar e o pico medido é o do processo inteiro.
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def pico_rss_bytes():
+    """Pico de RSS do próprio processo, em bytes, ou None se o sistema não informar."""
+    vm_hwm = ler_proc('status').get('VmHWM')
+    if vm_hwm:
+        return int(vm_hwm.split()[0]) * 1024
+    if resource is not None:
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss vem em KB no Linux e em bytes no macOS
+        return pico if sys.platform == 'darwin' else pico * 1024
+    if sys.platform == 'win32':
+        import ctypes
+        from ctypes import wintypes
+
+        class ContadoresMemoria(ctypes.Structure):
+            _fields_ = [
+                ('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t),
+            ]
+
+        contadores = ContadoresMemoria()
+        contadores.cb = ctypes.sizeof(contadores)
+        processo = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(processo, ctypes.byref(contadores), contadores.cb):
+            return contadores.PeakWorkingSetSize
+    return None
+
+
+def pico_rss_filhos_bytes():
+    """Maior pico de RSS entre os processos filhos já encerrados (pool de gráficos), ou None no Windows."""
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return pico if sys.platform == 'darwin' else pico * 1024
+
+
+def amostra():
+    tempos = os.times()
+    io = ler_proc('io')
+    return {
+        'parede': time.perf_counter(),
+        'cpu_usuario': tempos.user,
+        'cpu_sistema': tempos.system,
+        # Processos filhos já encerrados (sempre zero no Windows)
+        'cpu_filhos': tempos.children_user + tempos.children_system,
+        'pico_rss_filhos': pico_rss_filhos_bytes(),
+        'io_lidos': int(io['rchar']) if 'rchar' in io else None,
+        'io_gravados': int(io['wchar']) if 'wchar' in io else None,
+    }
+
+
+def em_mb(valor):
+    return None if valor is None else round(valor / (1024 * 1024), 1)
+
+
+def diferenca(inicio, fim, chave):
+    if inicio[chave] is None or fim[chave] is None:
+        return None
+    return fim[chave] - inicio[chave]
+
+
+@contextmanager
+def medir_etapa():
+    """
+    Mede o bloco (uma etapa) e preenche o dicionário devolvido ao sair dele, mesmo se a etapa falhar.
+
+    O tempo de CPU soma o do processo e o dos filhos encerrados durante a etapa (workers dos gráficos).
+    Os arquivos são os abertos pelo Python do próprio processo (open e os.open, pelo hook) e os anotados
+    com anotar_arquivo (o armazém colunar);
+    os gravados dentro dos workers do pool de gráficos não aparecem aqui.
+
+    A anotação dos arquivos usa o hook de auditoria de instalar_hook(), que fica instalado até o fim do
+    processo; depois da etapa, ele continua sendo chamado, mas só compara _medicao_atual com None.
+    """
+    global _medicao_atual
+    instalar_hook()
+    escopo_rss = 'etapa' if zerar_pico_rss() else 'processo'
+    inicio = amostra()
+    medicao = {'lidos': set(), 'gravados': set()}
+    anterior, _medicao_atual = _medicao_atual, medicao
+    metricas = {}
+    try:
+        yield metricas
+    finally:
+        _medicao_atual = anterior
+        fim = amostra()
+        gravados = listar_arquivos(medicao['gravados'])
+        # Um arquivo lido e depois regravado (ex.: os CSVs no tratamento) aparece nas duas listas
+        lidos = listar_arquivos(medicao['lidos'])
+        cpu_usuario = fim['cpu_usuario'] - inicio['cpu_usuario']
+        cpu_sistema = fim['cpu_sistema'] - inicio['cpu_sistema']
+        cpu_filhos = fim['cpu_filhos'] - inicio['cpu_filhos']
+        metricas.update({
+            'tempo_s': round(fim['parede'] - inicio['parede'], 3),
+            'cpu_s': round(cpu_usuario + cpu_sistema + cpu_filhos, 3),
+            'cpu_usuario_s': round(cpu_usuario, 3),
+            'cpu_sistema_s': round(cpu_sistema, 3),
+            'cpu_filhos_s': round(cpu_filhos, 3),
+            'pico_rss_mb': em_mb(pico_rss_bytes()),
+            'pico_rss_escopo': escopo_rss,
+            # O pico dos filhos é o maior desde o início do processo: só vale para a etapa se ela teve filhos
+            'pico_rss_filhos_mb': em_mb(fim['pico_rss_filhos']) if cpu_filhos > 0 or fim['pico_rss_filhos'] != inicio['pico_rss_filhos'] else None,
+            'io_bytes_lidos': diferenca(inicio, fim, 'io_lidos'),
+            'io_bytes_gravados': diferenca(inicio, fim, 'io_gravados'),
+            'arquivos_lidos': lidos,
+            'arquivos_gravados': gravados,
+            'bytes_lidos': sum(a['bytes'] for a in lidos),
+            'bytes_gravados': sum(a['bytes'] for a in gravados),
+        })
+
+
+def comando_medido(script_name, artista, destino_metricas):
+    """Linha de comando do modo subprocesso: o script roda dentro deste módulo, que grava as métricas em destino_metricas."""
+    return [sys.executable, os.path.abspath(__file__), destino_metricas, script_name, artista]
+
+
+def ler_metricas_do_subprocesso(destino_metricas):
+    """Métricas gravadas pelo subprocesso; dicionário vazio se ele morreu antes de gravá-las."""
+    try:
+        with open(destino_metricas, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    finally:
+        if os.path.exists(destino_metricas):
+            os.remove(destino_metricas)
+
+
+def executar_script_medido(destino_metricas, script_name, argumentos):
+    """
+    Roda o script como __main__ (com o mesmo sys.argv de 'python script artista') e grava as métricas
+    em destino_metricas. O código de saída do script é preservado.
+    """
+    sys.argv = [script_name] + argumentos
+    codigo = 0
+    with medir_etapa() as metricas:
+        try:
+            runpy.run_path(script_name, run_name='__main__')
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                codigo = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                codigo = 1
+        except BaseException:
+            traceback.print_exc()
+            codigo = 1
+    metricas['codigo_saida'] = codigo
+    with open(destino_metricas, 'w', encoding='utf-8') as f:
+        json.dump(metricas, f, ensure_ascii=False)
+    return codigo
+
+
+def novo_registro(artista, grupo, script, modo):
+    return {
+        'tipo': 'etapa',
+        'artista': artista,
+        'grupo': grupo,
+        'script': script,
+        'modo': modo,
+        'inicio': datetime.now().isoformat(timespec='seconds'),
+        'status': None,
+    }
+
+
+def pasta_logs():
+    return os.environ.get(VARIAVEL_PASTA_LOGS)
+
+
+def gravar_log(registro, conteudo):
+    """Grava a saída da etapa em <pasta de logs>/<artista>/<script>.log e anota o caminho no registro."""
+    pasta = pasta_logs()
+    if not pasta or not conteudo:
+        return
+    destino = os.path.join(pasta, registro['artista'], os.path.splitext(os.path.basename(registro['script']))[0] + '.log')
+    os.makedirs(os.path.dirname(destino), exist_ok=True)
+    with open(destino, 'w', encoding='utf-8', errors='replace') as f:
+        f.write(conteudo)
+    registro['log'] = destino
+
+
+def iniciar_execucao(argumentos):
+    """Cria o relatório da execução (e a pasta dos logs) e devolve o dicionário que o identifica."""
+    inicio = datetime.now()
+    nome = f"execucao_{inicio.strftime('%Y%m%d_%H%M%S')}"
+    os.makedirs(PASTA_RELATORIOS, exist_ok=True)
+    execucao = {
+        'caminho': os.path.join(PASTA_RELATORIOS, f'{nome}.jsonl'),
+        'inicio': inicio,
+        'parede': time.perf_counter(),
+        'registros': [],
+    }
+    os.environ[VARIAVEL_PASTA_LOGS] = os.path.join(PASTA_RELATORIOS, nome)
+    gravar_linhas(execucao, [{
+        'tipo': 'inicio',
+        'inicio': inicio.isoformat(timespec='seconds'),
+        'argumentos': argumentos,
+        'python': sys.version.split()[0],
+        'plataforma': platform.platform(),
+        'cpus': os.cpu_count(),
+    }])
+    return execucao
+
+
+def gravar_linhas(execucao, linhas):
+    with open(execucao['caminho'], 'a', encoding='utf-8') as f:
+        for linha in linhas:
+            f.write(json.dumps(linha, ensure_ascii=False) + '\n')
+
+
+def registrar_etapas(execucao, registros):
+    """Acrescenta ao relatório as etapas de um artista assim que ele termina (o relatório sobrevive a uma execução interrompida)."""
+    execucao['registros'].extend(registros)
+    gravar_linhas(execucao, registros)
+
+
+def tempos_por_canal(registros):
+    tempos = {}
+    for registro in registros:
+        tempos[registro['artista']] = tempos.get(registro['artista'], 0) + (registro.get('tempo_s') or 0)
+    return sorted(tempos.items(), key=lambda item: item[1], reverse=True)
+
+
+def finalizar_execucao(execucao):
+    """Grava a linha final do relatório, com os totais e os canais mais lentos."""
+    registros = execucao['registros']
+    gravar_linhas(execucao, [{
+        'tipo': 'fim',
+        'fim': datetime.now().isoformat(timespec='seconds'),
+        'tempo_s': round(time.perf_counter() - execucao['parede'], 3),
+        'etapas': len(registros),
+        'etapas_com_erro': sum(1 for r in registros if r['status'] == 'erro'),
+        'cpu_s': round(sum(r.get('cpu_s') or 0 for r in registros), 3),
+        'tempo_por_canal_s': {artista: round(tempo, 3) for artista, tempo in tempos_por_canal(registros)},
+    }])
+
+
+def formatar_mb(valor):
+    return '-' if valor is None else f'{valor:.0f} MB'
+
+
+def imprimir_resumo_metricas(execucao):
+    """Resumo no console: canais e etapas mais lentos da execução."""
+    registros = [r for r in execucao['registros'] if r['status'] != 'atualizado']
+    print("\n=======================================================")
+    print("                 TEMPO POR CANAL E ETAPA               ")
+    print("=======================================================")
+    if not registros:
+        print("  Nenhuma etapa executada.")
+    else:
+        print("  Canais mais lentos:")
+        for artista, tempo in tempos_por_canal(registros)[:QUANTIDADE_NO_RESUMO]:
+            print(f"    {tempo:9.1f} s  {artista}")
+        print("  Etapas mais lentas:")
+        for r in sorted(registros, key=lambda r: r.get('tempo_s') or 0, reverse=True)[:QUANTIDADE_NO_RESUMO]:
+            print(
+                f"    {r.get('tempo_s') or 0:9.1f} s  CPU {r.get('cpu_s') or 0:8.1f} s  "
+                f"pico {formatar_mb(r.get('pico_rss_mb')):>8}  {r['artista']} / {r['script']} ({r['status']})"
+            )
+    print(f"  Relatório completo: {execucao['caminho']}")
+
+
+if __name__ == '__main__':
+    # Uso (pelo main.py): python metricas_etapas.py <destino das métricas> <script> <artista>
+    # Rodando como __main__, um 'import metricas_etapas' no script (armazem_canal) criaria outra cópia do
+    # módulo, sem a medição em andamento: o script usa esta
+    sys.modules.setdefault('metricas_etapas', sys.modules['__main__'])
+    sys.exit(executar_script_medido(sys.argv[1], sys.argv[2], sys.argv[3:]))
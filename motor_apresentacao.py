@@ -0,0 +1,336 @@
+import os
+import copy
+import json
+import hashlib
+from functools import lru_cache
+
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_CONNECTOR
+from pptx.enum.text import MSO_AUTO_SIZE, PP_ALIGN
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.oxml.xmlchemy import OxmlElement
+from pptx.parts.slide import SlideLayoutPart
+from pptx.util import Cm, Inches, Pt
+
+import perfil_render
+import graficos_nativos
+import imagens_apresentacao
+
+# Motor das apresentações: cada script (report, cluster, midias e as versões em inglês) descreve o
+# deck como uma lista de slides, e cada slide como um fundo e uma lista de elementos posicionados em
+# cm (cabeçalho, texto, linha, imagem). Este módulo monta o .pptx a partir dessa descrição.
+#
+# Fundo e logo não entram em cada slide: o motor gera no slide master um layout para cada fundo
+# usado pelo deck (com o logo do cabeçalho, quando os slides daquele fundo têm cabeçalho), e os
+# slides feitos a partir dele só recebem o que muda.
+#
+# Com --graficos-nativos, os gráficos de séries mensais que graficos_nativos.py sabe montar entram
+# como gráficos do PowerPoint, no mesmo retângulo do PNG, em vez da imagem.
+#
+# Com --atualizar-apresentacoes, o .pptx já gerado é aberto e só recebe o que mudou: figuras cuja
+# imagem de origem mudou, gráficos nativos com dados novos e textos com outro conteúdo. A
+# apresentação guarda a impressão digital da descrição do deck (slides, opções e código do motor);
+# se ela mudou, o deck é remontado do zero.
+#
+# Textos e caminhos podem ter campos do contexto do deck ({artista}, {artist}, {mes_foco},
+# {textos[0]}, {graficos}...), preenchidos com str.format na hora de montar.
+
+PASTA_TEMPLATE = 'resources/Imagens Template Relatório Mensal'
+PASTA_GRAFICOS = 'dados_full/{artista}/plots'
+
+# Widescreen 16:9
+LARGURA_SLIDE = Inches(13.333)
+ALTURA_SLIDE = Inches(7.5)
+LAYOUT_EM_BRANCO = 5
+LOGO = 'image1.png'
+POSICAO_LOGO = (0.53, 0.77, 0.63, 0.83)
+
+FONTE = 'DM Sans'
+ESPESSURA_LINHA_PT = 3
+
+# tamanho em pt, negrito (None deixa o padrão do tema) e cor do texto
+ESTILOS = {
+    'capa_titulo': {'tamanho': 56, 'negrito': True, 'cor': 'FFFFFF'},
+    'capa_subtitulo': {'tamanho': 24, 'negrito': True, 'cor': 'FFFFFF'},
+    'capa_artista': {'tamanho': 30, 'negrito': True, 'cor': 'FFFFFF'},
+    'secao': {'tamanho': 50, 'negrito': True, 'cor': 'FFFFFF'},
+    'titulo': {'tamanho': 30, 'negrito': True, 'cor': '3157F7'},
+    'subtitulo': {'tamanho': 20, 'negrito': True, 'cor': '192E68'},
+    'destaque': {'tamanho': 100, 'negrito': True, 'cor': '3157F7'},
+    'corpo': {'tamanho': 14, 'negrito': None, 'cor': '000000'},
+    'rotulo': {'tamanho': 14, 'negrito': True, 'cor': '192E68'},
+    'rotulo_branco': {'tamanho': 14, 'negrito': True, 'cor': 'FFFFFF'},
+    'rotulo_cinza': {'tamanho': 14, 'negrito': True, 'cor': '999999'},
+    'rotulo_termometro': {'tamanho': 14, 'negrito': True, 'cor': 'E3FF3E'},
+    'nota': {'tamanho': 10, 'negrito': False, 'cor': '192E68'},
+    'nota_media': {'tamanho': 11, 'negrito': False, 'cor': '192E68'},
+}
+
+
+def cabecalho(titulo, fim_linha, largura=18):
+    """Título do slide e linha azul embaixo dele até fim_linha (cm); o logo do canto vem do layout."""
+    return {'tipo': 'cabecalho', 'titulo': titulo, 'fim_linha': fim_linha, 'largura': largura}
+
+
+def texto(conteudo, x, y, largura, altura, estilo, quebrar=False, ajustar=False,
+          centralizar=False, rotacao=0, entrelinha=None):
+    """
+    Caixa de texto com um único trecho no estilo dado. quebrar liga a quebra de linha, ajustar
+    faz a caixa crescer com o texto e entrelinha é o espaçamento entre linhas em pt.
+    """
+    return {
+        'tipo': 'texto', 'conteudo': conteudo, 'posicao': (x, y, largura, altura), 'estilo': estilo,
+        'quebrar': quebrar, 'ajustar': ajustar, 'centralizar': centralizar, 'rotacao': rotacao,
+        'entrelinha': entrelinha,
+    }
+
+
+def linha(x1, y1, x2, y2, cor='3157F7'):
+    return {'tipo': 'linha', 'pontos': (x1, y1, x2, y2), 'cor': cor}
+
+
+def imagem(caminho, x, y, largura, altura):
+    return {'tipo': 'imagem', 'caminho': caminho, 'posicao': (x, y, largura, altura)}
+
+
+def recurso(nome, x, y, largura, altura):
+    """Imagem da pasta do template (logos, ícones, molduras)."""
+    return imagem(f'{PASTA_TEMPLATE}/{nome}', x, y, largura, altura)
+
+
+def grafico(nome, x, y, largura, altura):
+    """Gráfico gerado para o artista, pelo nome do PNG em dados_full/<artista>/plots."""
+    return dict(imagem(f'{PASTA_GRAFICOS}/{nome}', x, y, largura, altura), grafico=nome)
+
+
+@lru_cache(maxsize=None)
+def fonte_do_estilo(nome):
+    """Tamanho, negrito e cor do estilo já convertidos para os tipos do python-pptx (uma vez por processo)."""
+    estilo = ESTILOS[nome]
+    return Pt(estilo['tamanho']), estilo['negrito'], RGBColor.from_string(estilo['cor'])
+
+
+@lru_cache(maxsize=None)
+def cor(hexadecimal):
+    return RGBColor.from_string(hexadecimal)
+
+
+def adicionar_texto(shapes, elemento, contexto):
+    x, y, largura, altura = elemento['posicao']
+    caixa = shapes.add_textbox(Cm(x), Cm(y), Cm(largura), Cm(altura))
+    if elemento['rotacao']:
+        caixa.rotation = elemento['rotacao']
+    quadro = caixa.text_frame
+    if elemento['quebrar']:
+        quadro.word_wrap = True
+    if elemento['ajustar']:
+        quadro.auto_size = MSO_AUTO_SIZE.SHAPE_TO_FIT_TEXT
+    paragrafo = quadro.paragraphs[0]
+    if elemento['centralizar']:
+        paragrafo.alignment = PP_ALIGN.CENTER
+    trecho = paragrafo.add_run()
+    trecho.text = elemento['conteudo'].format(**contexto)
+
+    tamanho, negrito, cor_texto = fonte_do_estilo(elemento['estilo'])
+    fonte = trecho.font
+    fonte.size = tamanho
+    if negrito is not None:
+        fonte.bold = negrito
+    fonte.name = FONTE
+    fonte.color.rgb = cor_texto
+    if elemento['entrelinha']:
+        paragrafo.line_spacing = Pt(elemento['entrelinha'])
+
+
+def adicionar_linha(shapes, elemento):
+    x1, y1, x2, y2 = elemento['pontos']
+    conector = shapes.add_connector(MSO_CONNECTOR.STRAIGHT, Cm(x1), Cm(y1), Cm(x2), Cm(y2))
+    conector.line.color.rgb = cor(elemento['cor'])
+    conector.line.width = Pt(ESPESSURA_LINHA_PT)
+
+
+def adicionar_imagem(shapes, elemento, contexto):
+    x, y, largura, altura = elemento['posicao']
+    nome = elemento.get('grafico')
+    if nome in graficos_nativos.GRAFICOS and perfil_render.graficos_nativos():
+        if graficos_nativos.adicionar_grafico(shapes, nome, contexto['artista'], Cm(x), Cm(y), Cm(largura), Cm(altura)):
+            return
+    imagens_apresentacao.adicionar_imagem(
+        shapes, elemento['caminho'].format(**contexto), Cm(x), Cm(y), width=Cm(largura), height=Cm(altura),
+    )
+
+
+def adicionar_elemento(shapes, elemento, contexto):
+    if elemento['tipo'] == 'cabecalho':
+        adicionar_texto(shapes, texto(elemento['titulo'], 1.21, 0.42, elemento['largura'], 1.54, 'titulo'), contexto)
+        adicionar_linha(shapes, linha(-0.01, 2.1, elemento['fim_linha'], 2.1))
+    elif elemento['tipo'] == 'texto':
+        adicionar_texto(shapes, elemento, contexto)
+    elif elemento['tipo'] == 'linha':
+        adicionar_linha(shapes, elemento)
+    elif elemento['tipo'] == 'imagem':
+        adicionar_imagem(shapes, elemento, contexto)
+    else:
+        raise ValueError(f"tipo de elemento desconhecido: '{elemento['tipo']}'")
+
+
+def criar_layout(prs, fundo, com_logo):
+    """
+    Novo layout no slide master, cópia do layout em branco com a imagem fundo (da pasta do template)
+    como plano de fundo e, com com_logo, o logo do cabeçalho na posição de sempre.
+
+    O python-pptx não cria layouts pela API pública: a parte do layout, o p:bg e o registro no master
+    são montados aqui no XML, contando com a versão fixada (imagens_apresentacao.VERSOES_PPTX_SUPORTADAS).
+    """
+    base = prs.slide_layouts[LAYOUT_EM_BRANCO]
+    master = prs.slide_master
+    pacote = master.part.package
+
+    elemento = copy.deepcopy(base.element)
+    elemento.cSld.set('name', f"{base.name} - {fundo}{' com logo' if com_logo else ''}")
+    parte = SlideLayoutPart(
+        pacote.next_partname('/ppt/slideLayouts/slideLayout%d.xml'), CT.PML_SLIDE_LAYOUT, pacote, elemento,
+    )
+    parte.relate_to(master.part, RT.SLIDE_MASTER)
+
+    # Plano de fundo do layout (p:bg vem antes da árvore de formas), esticado no slide inteiro
+    _, rId = imagens_apresentacao.relacionar_imagem(parte, f'{PASTA_TEMPLATE}/{fundo}', prs.slide_width, prs.slide_height)
+    for antigo in elemento.cSld.findall(qn('p:bg')):
+        elemento.cSld.remove(antigo)
+    elemento.cSld.insert(0, parse_xml(
+        f'<p:bg {nsdecls("p", "a", "r")}><p:bgPr><a:blipFill rotWithShape="1"><a:blip r:embed="{rId}"/>'
+        f'<a:stretch><a:fillRect/></a:stretch></a:blipFill><a:effectLst/></p:bgPr></p:bg>'
+    ))
+
+    if com_logo:
+        x, y, largura, altura = (Cm(v) for v in POSICAO_LOGO)
+        imagem, rId = imagens_apresentacao.relacionar_imagem(parte, f'{PASTA_TEMPLATE}/{LOGO}', largura, altura)
+        arvore = elemento.cSld.spTree
+        id_forma = max(int(i) for i in arvore.xpath('.//p:cNvPr/@id')) + 1
+        arvore.add_pic(id_forma, 'Logo', imagem.desc, rId, x, y, largura, altura)
+
+    # Registra o layout no master; o id não pode repetir o de nenhum master ou layout da apresentação
+    ids = prs.element.xpath('//p:sldMasterId/@id') + master.element.xpath('//p:sldLayoutId/@id')
+    entrada = OxmlElement('p:sldLayoutId')
+    entrada.set('id', str(max(int(i) for i in ids) + 1))
+    entrada.set(qn('r:id'), master.part.relate_to(parte, RT.SLIDE_LAYOUT))
+    master.element.get_or_add_sldLayoutIdLst().append(entrada)
+    return parte.slide_layout
+
+
+def assinatura_do_deck(slides):
+    """
+    Impressão digital de tudo o que define o deck além do conteúdo das imagens e dos textos já
+    preenchidos: a lista de slides, o dpi das imagens, os gráficos nativos, o código do motor e os
+    fundos e o logo dos layouts.
+    """
+    sha = hashlib.sha256()
+    sha.update(json.dumps(slides, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+    sha.update(f'{perfil_render.dpi_apresentacao()}|{perfil_render.graficos_nativos()}'.encode('utf-8'))
+    for modulo in (__file__, imagens_apresentacao.__file__, graficos_nativos.__file__):
+        with open(modulo, 'rb') as f:
+            sha.update(f.read())
+    for nome in sorted({descricao['fundo'] for descricao in slides} | {LOGO}):
+        sha.update(repr(imagens_apresentacao.assinatura(f'{PASTA_TEMPLATE}/{nome}')).encode('utf-8'))
+    return sha.hexdigest()
+
+
+def atualizar_texto(forma, elemento, contexto):
+    trecho = forma.text_frame.paragraphs[0].runs[0]
+    conteudo = elemento['conteudo'].format(**contexto)
+    if trecho.text == conteudo:
+        return False
+    trecho.text = conteudo
+    return True
+
+
+def atualizar_slide(slide, descricao, contexto):
+    """
+    Percorre as formas do slide junto com os elementos da descrição (o placeholder de título do
+    layout fica de fora) e troca o que mudou. Retorna quantas formas foram trocadas, ou None se as
+    formas não correspondem aos elementos.
+    """
+    formas = [forma for forma in slide.shapes if not forma.is_placeholder]
+    esperadas = sum(2 if elemento['tipo'] == 'cabecalho' else 1 for elemento in descricao['elementos'])
+    if len(formas) != esperadas:
+        return None
+
+    trocadas = 0
+    formas = iter(formas)
+    for elemento in descricao['elementos']:
+        forma = next(formas)
+        if elemento['tipo'] == 'cabecalho':
+            trocadas += atualizar_texto(forma, texto(elemento['titulo'], 0, 0, 0, 0, 'titulo'), contexto)
+            next(formas)
+        elif elemento['tipo'] == 'texto':
+            trocadas += atualizar_texto(forma, elemento, contexto)
+        elif elemento['tipo'] == 'imagem':
+            if getattr(forma, 'has_chart', False):
+                trocadas += graficos_nativos.trocar_grafico(slide.shapes, forma, elemento['grafico'], contexto['artista'])
+            else:
+                trocadas += imagens_apresentacao.trocar_imagem(forma, elemento['caminho'].format(**contexto))
+    return trocadas
+
+
+def atualizar_apresentacao(slides, contexto, destino, assinatura):
+    """
+    Atualiza no lugar o deck já gravado em destino. Retorna False, sem gravar nada, quando ele não
+    existe ou foi montado com outra descrição (assinatura): nesse caso o deck precisa ser remontado.
+    """
+    if not os.path.exists(destino):
+        return False
+    prs = Presentation(destino)
+    if prs.core_properties.identifier != assinatura or len(prs.slides) != len(slides):
+        print(f"ℹ️ '{destino}' foi gerado com outra descrição do deck; remontando do zero.")
+        return False
+
+    trocadas = 0
+    for slide, descricao in zip(prs.slides, slides):
+        resultado = atualizar_slide(slide, descricao, contexto)
+        if resultado is None:
+            print(f"ℹ️ As formas de '{destino}' não batem com a descrição do deck; remontando do zero.")
+            return False
+        trocadas += resultado
+
+    if trocadas:
+        prs.save(destino)
+    print(f"✅ '{destino}' atualizado: {trocadas} forma(s) trocada(s).")
+    return True
+
+
+def construir_apresentacao(slides, contexto, caminho):
+    """
+    Monta e grava o deck descrito em slides: cada slide é um dict com 'fundo' (imagem da pasta do
+    template que cobre o slide inteiro) e 'elementos', na ordem em que entram no slide. contexto
+    preenche os campos dos textos e caminhos; caminho é o .pptx de saída, antes do sufixo do perfil.
+    Com --atualizar-apresentacoes, só atualiza o .pptx existente quando ele foi montado da mesma descrição.
+    """
+    destino = perfil_render.caminho_apresentacao(caminho.format(**contexto))
+    assinatura = assinatura_do_deck(slides)
+    if perfil_render.atualizar_apresentacoes() and atualizar_apresentacao(slides, contexto, destino, assinatura):
+        return
+
+    prs = Presentation()
+    prs.slide_width = LARGURA_SLIDE
+    prs.slide_height = ALTURA_SLIDE
+
+    layouts = {}
+    for descricao in slides:
+        com_logo = any(elemento['tipo'] == 'cabecalho' for elemento in descricao['elementos'])
+        chave = (descricao['fundo'], com_logo)
+        if chave not in layouts:
+            layouts[chave] = criar_layout(prs, *chave)
+        slide = prs.slides.add_slide(layouts[chave])
+        for elemento in descricao['elementos']:
+            adicionar_elemento(slide.shapes, elemento, contexto)
+
+    # Os layouts padrão do python-pptx ficam sem uso e só aumentariam o arquivo
+    for layout in list(prs.slide_layouts):
+        if not layout.used_by_slides:
+            prs.slide_layouts.remove(layout)
+
+    prs.core_properties.identifier = assinatura
+    prs.save(destino)
@@ -0,0 +1,139 @@
+import os
+import re
+import json
+import hashlib
+
+# Textos de análise narrativa de cada artista (analise_narrativa_<artista>.txt, .md ou .docx), usados
+# pelos decks de cluster. O arquivo é dividido em seções numeradas ("1. Título" seguido do texto) e
+# o resultado fica em cache_narrativas/, endereçado pelo conteúdo do arquivo: builds repetidos, e
+# os outros decks do mesmo artista, não refazem o parse nem abrem o .docx de novo.
+#
+# A pasta raiz (com uma subpasta <artista>/exports por artista) vem do main.py (--pasta-narrativas);
+# sem ela, vale a pasta de sempre, na máquina Windows onde os relatórios da API são gerados.
+VARIAVEL_PASTA = 'NARRATIVAS_PASTA'
+PASTA_PADRAO = r'C:\Users\samuj\OneDrive\Área de Trabalho\1bmg\projeto_cluster_API\relatorios_api'
+
+PASTA_CACHE = 'cache_narrativas'
+# Entra na chave do cache: mude quando o parse mudar, para não reaproveitar seções antigas
+VERSAO_PARSE = 1
+EXTENSOES = ('.txt', '.md', '.docx')
+
+# Título numerado em um dos três formatos ("### 1. Título", "**1. Título**" ou "1. Título") e o bloco
+# de texto até o próximo título ou o fim do arquivo
+PADRAO_SECAO = re.compile(
+    r"^(?:###\s+|\*\*\s*)?"
+    r"(\d+\.\s+.*?)"
+    r"(?:\*\*|$)"
+    r"[\r\n]+"
+    r"([\s\S]*?)"
+    r"(?=^(?:###\s+|\*\*\s*)?\d+\.|\Z)",
+    re.MULTILINE
+)
+
+# Seções já carregadas neste processo, com o (tamanho, mtime) do arquivo de onde vieram
+_carregadas = {}
+
+
+def pasta_raiz():
+    return os.environ.get(VARIAVEL_PASTA) or PASTA_PADRAO
+
+
+def pasta_exports(artista):
+    """Pasta com a análise narrativa e os gráficos do cluster do artista (termina com separador)."""
+    return os.path.join(pasta_raiz(), artista, 'exports', '')
+
+
+def caminho_narrativa(artista, sufixo=''):
+    """Primeiro analise_narrativa_<artista><sufixo> que existir (.txt, .md ou .docx), ou None."""
+    base = os.path.join(pasta_exports(artista), f'analise_narrativa_{artista}{sufixo}')
+    for extensao in EXTENSOES:
+        if os.path.exists(base + extensao):
+            return base + extensao
+    return None
+
+
+def arquivos_de_entrada(artista):
+    """Arquivos da pasta de exports do artista (narrativas e gráficos), para a impressão digital das apresentações."""
+    pasta = pasta_exports(artista)
+    if not os.path.isdir(pasta):
+        return []
+    return sorted(os.path.join(pasta, nome) for nome in os.listdir(pasta))
+
+
+def limpar_titulo(titulo):
+    return re.sub(r'^\d+\.\s*', '', titulo.strip().strip('*#').strip())
+
+
+def secoes_do_texto(conteudo):
+    return [{'titulo': limpar_titulo(titulo), 'texto': texto.strip()} for titulo, texto in PADRAO_SECAO.findall(conteudo)]
+
+
+def secoes_do_docx(caminho):
+    """Parágrafos não vazios do .docx, divididos nos títulos "N. " (python-docx só é importado aqui)."""
+    import docx
+
+    paragrafos = [p.text for p in docx.Document(caminho).paragraphs if p.text.strip()]
+    secoes = []
+    for bloco in re.split(r'(?=\d\.\s)', "\n".join(paragrafos)):
+        bloco = bloco.strip()
+        if not bloco:
+            continue
+        partes = bloco.split('\n', 1)
+        secoes.append({'titulo': limpar_titulo(partes[0]), 'texto': partes[1].strip() if len(partes) > 1 else ''})
+    return secoes
+
+
+def ler_secoes(caminho, dados):
+    if caminho.endswith('.docx'):
+        return secoes_do_docx(caminho)
+    # Os .txt antigos vêm em latin-1; os gerados no Linux, em UTF-8
+    try:
+        conteudo = dados.decode('utf-8')
+    except UnicodeDecodeError:
+        conteudo = dados.decode('latin-1')
+    return secoes_do_texto(conteudo)
+
+
+def carregar_secoes(caminho):
+    """
+    Seções (lista de dicts com 'titulo' e 'texto') do arquivo de narrativa. Vêm da memória do processo
+    enquanto o arquivo não muda, senão de cache_narrativas/ pelo sha256 do conteúdo; só arquivos
+    novos ou editados passam pelo parse.
+    """
+    info = os.stat(caminho)
+    versao = (info.st_size, info.st_mtime_ns)
+    em_cache = _carregadas.get(caminho)
+    if em_cache and em_cache[0] == versao:
+        return em_cache[1]
+
+    with open(caminho, 'rb') as f:
+        dados = f.read()
+    sha = hashlib.sha256(dados)
+    sha.update(f'{os.path.splitext(caminho)[1]}|{VERSAO_PARSE}'.encode('utf-8'))
+    destino = os.path.join(PASTA_CACHE, f'{sha.hexdigest()}.json')
+    try:
+        with open(destino, 'r', encoding='utf-8') as f:
+            secoes = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        secoes = ler_secoes(caminho, dados)
+        os.makedirs(PASTA_CACHE, exist_ok=True)
+        temporario = f'{destino}.{os.getpid()}.tmp'
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(secoes, f, ensure_ascii=False)
+        os.replace(temporario, destino)
+
+    _carregadas[caminho] = (versao, secoes)
+    return secoes
+
+
+def textos_do_artista(artista, sufixo=''):
+    """Textos das seções da narrativa do artista, na ordem do arquivo; lista vazia se não houver narrativa."""
+    caminho = caminho_narrativa(artista, sufixo)
+    if caminho is None:
+        print(f"Erro: Narrativa não encontrada em: {os.path.join(pasta_exports(artista), f'analise_narrativa_{artista}{sufixo}')}.(txt|md|docx)")
+        return []
+    try:
+        return [secao['texto'] for secao in carregar_secoes(caminho)]
+    except Exception as e:
+        print(f"Ocorreu um erro inesperado ao ler a narrativa '{caminho}': {e}")
+        return []
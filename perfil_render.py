@@ -0,0 +1,72 @@
+import os
+
+# Perfil de renderização usado pelos gráficos e pelas apresentações.
+# Definido pelo main.py (--perfil-render); sem ele, vale o perfil final.
+VARIAVEL_PERFIL = 'PERFIL_RENDER'
+PERFIL_PADRAO = 'final'
+# Sobrescreve o dpi efetivo das imagens nas apresentações (main.py --dpi-apresentacao); 0 embute os PNGs originais
+VARIAVEL_DPI_APRESENTACAO = 'DPI_APRESENTACAO'
+# Liga os gráficos nativos do PowerPoint no lugar dos PNGs de séries mensais (main.py --graficos-nativos)
+VARIAVEL_GRAFICOS_NATIVOS = 'GRAFICOS_NATIVOS'
+# Atualiza o .pptx já gerado em vez de remontar o deck inteiro (main.py --atualizar-apresentacoes)
+VARIAVEL_ATUALIZAR_APRESENTACOES = 'ATUALIZAR_APRESENTACOES'
+# Lidas pelo agendador_graficos: processos que renderizam os gráficos de um canal (main.py --workers-graficos;
+# sem ela, um por CPU) e limite em MB do cache de PNGs (main.py --cache-graficos-mb; sem ela, desligado).
+# Ficam aqui para o main.py não importar o matplotlib só para saber o nome das variáveis.
+VARIAVEL_WORKERS_GRAFICOS = 'GRAFICOS_WORKERS'
+VARIAVEL_LIMITE_CACHE_GRAFICOS = 'GRAFICOS_CACHE_MB'
+
+PERFIS = {
+    # Entrega: 300 dpi, bbox justo e compressão PNG padrão, como sempre foi. Nas apresentações,
+    # as imagens são reduzidas para 220 dpi no tamanho em que aparecem no slide
+    'final': {
+        'dpi': 300,
+        'bbox_inches': 'tight',
+        'pil_kwargs': None,
+        'sufixo_apresentacao': '',
+        'dpi_apresentacao': 220,
+    },
+    # Iteração no texto das apresentações: resolução de tela, compressão PNG mínima e sem o
+    # passe extra de desenho do bbox justo. As apresentações saem com sufixo para não
+    # sobrescrever a versão final.
+    'draft': {
+        'dpi': 100,
+        'bbox_inches': None,
+        'pil_kwargs': {'compress_level': 1},
+        'sufixo_apresentacao': ' (rascunho)',
+        'dpi_apresentacao': 96,
+    },
+}
+
+
+def nome_perfil():
+    nome = os.environ.get(VARIAVEL_PERFIL) or PERFIL_PADRAO
+    if nome not in PERFIS:
+        raise ValueError(f"perfil de renderização desconhecido: '{nome}' (use {', '.join(PERFIS)})")
+    return nome
+
+
+def perfil_atual():
+    return PERFIS[nome_perfil()]
+
+
+def caminho_apresentacao(caminho):
+    """Caminho do .pptx para o perfil atual: no rascunho, ganha o sufixo antes da extensão."""
+    base, extensao = os.path.splitext(caminho)
+    return f"{base}{perfil_atual()['sufixo_apresentacao']}{extensao}"
+
+
+def dpi_apresentacao():
+    """Dpi efetivo das imagens embutidas nas apresentações (0 = sem redução)."""
+    valor = os.environ.get(VARIAVEL_DPI_APRESENTACAO)
+    return int(valor) if valor else perfil_atual()['dpi_apresentacao']
+
+
+def graficos_nativos():
+    """True quando as apresentações montam os gráficos de graficos_nativos.GRAFICOS como gráficos do PowerPoint."""
+    return os.environ.get(VARIAVEL_GRAFICOS_NATIVOS, '') not in ('', '0')
+
+
+def atualizar_apresentacoes():
+    """True quando as apresentações trocam só as imagens, gráficos e textos que mudaram no .pptx existente."""
+    return os.environ.get(VARIAVEL_ATUALIZAR_APRESENTACOES, '') not in ('', '0')
@@ -0,0 +1,43 @@
+import pandas as pd
+
+import armazem_canal
+
+# Meses que o tratamento garante em todas as tabelas: o mês de referência e os 6 anteriores
+QUANTIDADE_MESES_ESPERADOS = 7
+# Janela usada pelo report e pelos gráficos: o mês de referência e os 5 anteriores
+QUANTIDADE_MESES_ANALISE = 6
+
+
+def montar_contexto_periodo(df_total: pd.DataFrame) -> dict:
+    """
+    Monta o contexto de período do canal a partir do total.csv (com a linha 'Total' no topo).
+    O mês de referência é o mais recente do arquivo; tratamento, report e gráficos usam
+    este mesmo contexto em vez de recalcular as datas cada um do seu jeito.
+
+    Retorna um dict com:
+        mes_referencia (pd.Period): mês mais recente do total.csv
+        meses_esperados (list[str]): 7 meses 'AAAA-MM', do mais recente para o mais antigo
+        meses_analise (pd.PeriodIndex): 6 meses da janela de análise, em ordem crescente
+        inicio_janela / fim_janela (pd.Timestamp): primeiro e último dia da janela de análise
+    """
+    meses = df_total['Data'].iloc[1:]
+    if not isinstance(meses.dtype, pd.PeriodDtype):
+        meses = armazem_canal.converter_meses(meses)
+
+    mes_referencia = meses.max()
+    if pd.isna(mes_referencia):
+        raise ValueError("o total.csv não tem nenhum mês válido para definir o período de análise")
+
+    meses_analise = pd.period_range(end=mes_referencia, periods=QUANTIDADE_MESES_ANALISE, freq='M')
+    return {
+        'mes_referencia': mes_referencia,
+        'meses_esperados': [str(mes_referencia - i) for i in range(QUANTIDADE_MESES_ESPERADOS)],
+        'meses_analise': meses_analise,
+        'inicio_janela': meses_analise[0].start_time,
+        'fim_janela': meses_analise[-1].end_time.normalize(),
+    }
+
+
+def carregar_contexto_periodo(artista: str) -> dict:
+    """Monta o contexto de período a partir do total.csv tratado do artista (via armazém)."""
+    return montar_contexto_periodo(armazem_canal.ler_tabela(artista, 'total'))
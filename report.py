@@ -4,9 +4,14 @@ import numpy as np
 import pandas as pd
 from typing import List
 
+import armazem_canal
+import periodo_canal
+
 # Obtém o caminho do diretório onde o script está sendo executado
 path = os.getcwd()
 
+TIPOS_CONTEUDO = ['videos', 'lives', 'shorts']
+
 def divisao_segura(numerador, denominador):
     """
     Realiza divisão segura elemento a elemento para escalares, arrays NumPy ou objetos pandas.
@@ -32,19 +37,18 @@ def divisao_segura(numerador, denominador):
     return resultado
 
 
-def carregar_e_processar_dados(caminho_arquivo: str, tipo_conteudo: str) -> pd.DataFrame:
+def carregar_e_processar_dados(artista: str, tipo_conteudo: str) -> pd.DataFrame:
     """
-    Carrega e pré-processa um arquivo CSV de dados do YouTube.
+    Carrega e pré-processa uma tabela de dados do YouTube a partir do armazém do artista.
+    No armazém, 'Data' já é período mensal e a duração média já está em segundos.
     """
-    df = pd.read_csv(caminho_arquivo)
+    df = armazem_canal.ler_tabela(artista, tipo_conteudo)
     if df.empty:
         return pd.DataFrame()
 
     df = df.drop(df.index[0])
-    # Linha corrigida com o formato explícito
-    df['Data'] = pd.to_datetime(df['Data'], format='%Y-%m').dt.to_period('M')
     
-    duracao_timedelta = pd.to_timedelta(df['Duração média da visualização'], errors='coerce')
+    duracao_timedelta = pd.to_timedelta(df['Duração média da visualização'], unit='s')
     minutos = duracao_timedelta.dt.components['minutes'].astype(str).str.zfill(2)
     segundos = duracao_timedelta.dt.components['seconds'].astype(str).str.zfill(2)
     df['Duração média da visualização'] = minutos + ':' + segundos
@@ -65,91 +69,31 @@ def carregar_e_processar_dados(caminho_arquivo: str, tipo_conteudo: str) -> pd.D
     return df.T
 
 
-def carregar_dados_mensais(artista: str, tipo: str) -> pd.DataFrame:
+def carregar_dados_mensais(artista: str, contexto: dict) -> dict:
     """
-    Carrega e concatena dados mensais de um determinado tipo (videos, lives, shorts).
-    O intervalo de 6 meses é determinado automaticamente a partir do último mês presente no arquivo total.csv.
-    """
-    # 1. Ler o arquivo total.csv para encontrar a última data
-    caminho_total = f'dados_full/{artista}/total.csv'
-    if not os.path.exists(caminho_total):
-        print(f"Erro: Arquivo 'total.csv' não encontrado para o artista {artista}.")
-        return pd.DataFrame()
-        
-    df_total = pd.read_csv(caminho_total)
-
-    # Adicionando a linha para remover a primeira linha do DataFrame,
-    # que provavelmente contém a string "Total".
-    # Isso evita o erro de conversão de data.
-    if not df_total.empty:
-      df_total = df_total.drop(df_total.index[0])
-
-    # Usando errors='coerce' para lidar com valores não-data (que agora devem ter sido removidos)
-    # e format='%Y-%m' para evitar o UserWarning anterior e melhorar a performance.
-    df_total['Data'] = pd.to_datetime(df_total['Data'], format='%Y-%m', errors='coerce')
-    # Removendo quaisquer linhas que não puderam ser convertidas para data (serão NaT)
-    df_total.dropna(subset=['Data'], inplace=True)
-    
-    ultima_data = df_total['Data'].max()
-    
-    # ... o restante da função é o mesmo ...
-
-    # 2. Calcular os 6 meses anteriores à última data encontrada
-    meses_para_analise = []
-    data_atual = ultima_data
-    for _ in range(6):
-        meses_para_analise.insert(0, data_atual.strftime('%Y-%m'))
-        if data_atual.month == 1:
-            data_atual = data_atual.replace(year=data_atual.year - 1, month=12)
-        else:
-            data_atual = data_atual.replace(month=data_atual.month - 1)
-
-    # 3. Processar os arquivos mensais com o novo intervalo
-    dfs = []
-    for i, mes_str_analise in enumerate(meses_para_analise):
-        nome_arquivo_mes = str(i + 1).zfill(2)
-        caminho_arquivo = f'dados_full/{artista}/{tipo}_{nome_arquivo_mes}.csv'
-
-        if os.path.exists(caminho_arquivo):
-            df_mes = pd.read_csv(caminho_arquivo)
-            df_mes = df_mes[df_mes['Data'] == mes_str_analise]
-            dfs.append(df_mes)
-
-    # O restante da função para concatenar e processar os DataFrames permanece o mesmo
-    if not dfs:
-        return pd.DataFrame()
-        
-    df_concatenado = pd.concat(dfs, ignore_index=True)
-
-    df_concatenado['Duração média da visualização'] = pd.to_timedelta(
-        df_concatenado['Duração média da visualização'], errors='coerce'
-    ).apply(lambda x: x.total_seconds()) / 60
-
-    df_concatenado['Data'] = pd.to_datetime(df_concatenado['Data'], format='%Y-%m').dt.to_period('M')
-    df_concatenado.set_index('Data', inplace=True)
-    
-    return df_concatenado.T
+    Carrega numa única leitura os 18 arquivos mensais ({tipo}_01..06 de videos, lives e shorts).
+    O intervalo de 6 meses vem do contexto de período do canal (periodo_canal):
+    o arquivo {tipo}_01 corresponde ao mês mais antigo da janela e o {tipo}_06 ao mais recente.
 
-
-def calcular_metricas_por_publicacao(df_metricas, df_publicacoes, metrica_prefixo, metrica_col_idx, pub_col_idx):
-    """
-    Calcula uma métrica por número de publicações de forma segura.
+    Retorna um dict tipo -> DataFrame (métricas nas linhas, meses nas colunas).
     """
-    if df_metricas.empty or df_publicacoes.empty:
-        return pd.DataFrame()
-        
-    metricas = df_metricas.iloc[[metrica_col_idx]]
-    pubs = df_publicacoes.iloc[[pub_col_idx]]
-    
-    metricas_valores = metricas.values.flatten().astype(float)
-    pubs_valores = pubs.values.flatten().astype(float)
-
-    resultados = [divisao_segura(m, p) for m, p in zip(metricas_valores, pubs_valores)]
+    mensais = armazem_canal.ler_tabelas_mensais(artista, TIPOS_CONTEUDO, len(contexto['meses_analise']))
+    if not mensais.empty:
+        # Duração já está em segundos no armazém
+        mensais['Duração média da visualização'] = mensais['Duração média da visualização'] / 60
+    mes_do_arquivo = dict(enumerate(contexto['meses_analise'], start=1))
+
+    dados_mensais = {}
+    for tipo in TIPOS_CONTEUDO:
+        df_tipo = armazem_canal.separar_tipo(mensais, tipo)
+        if df_tipo.empty:
+            dados_mensais[tipo] = pd.DataFrame()
+            continue
+        # De cada arquivo fica só a linha do mês que ele representa
+        df_tipo = df_tipo[df_tipo['Data'] == df_tipo['Arquivo'].map(mes_do_arquivo)]
+        dados_mensais[tipo] = df_tipo.drop(columns='Arquivo').set_index('Data').T
+    return dados_mensais
 
-    df_resultado = pd.DataFrame([resultados], columns=metricas.columns)
-    nome_da_metrica = df_publicacoes.index[pub_col_idx].replace('Número de', '').replace('Números de','').strip()
-    df_resultado.index = [f"{metrica_prefixo} por {nome_da_metrica} Novo"]
-    return df_resultado
 
 def processar_fontes_de_trafego(artista: str) -> pd.DataFrame:
     """
@@ -167,7 +111,7 @@ def processar_fontes_de_trafego(artista: str) -> pd.DataFrame:
     def pivot_origem(path):
         if not os.path.exists(path): return pd.DataFrame()
         try:
-            df = pd.read_csv(path)
+            df = armazem_canal.ler_tabela(artista, os.path.splitext(os.path.basename(path))[0])
             if df.empty or not all(col in df.columns for col in ['Data', 'Origem do tráfego', 'Visualizações']):
                 return pd.DataFrame()
             pivot = df.pivot_table(index='Data', columns='Origem do tráfego', values='Visualizações', aggfunc='first').fillna(0)
@@ -196,299 +140,320 @@ def processar_fontes_de_trafego(artista: str) -> pd.DataFrame:
     perc_origem = divisao_segura(origem_total.mul(100), divisor)
 
     perc_origem.reset_index(inplace=True)
-    perc_origem['Data'] = pd.to_datetime(perc_origem['Data']).dt.to_period('M')
     perc_origem.rename(columns={'Publicidade no YouTube': 'Tráfego Pago', 'index': 'Data'}, inplace=True)
     
     return perc_origem.set_index('Data').T
 
-def subtract_and_reindex(df1, df1_row_idx, df2, df2_row_idx, new_index_name):
+# --- Registro de métricas da tabela 4.1 ---
+# Colunas das tabelas do YouTube Studio usadas pelas métricas
+RECEITA = "Receita estimada (USD)"
+IMPRESSOES = "Impressões"
+VISUALIZACOES = "Visualizações"
+WATCHTIME = "Tempo de exibição (horas)"
+RPM = "RPM (USD)"
+CPM = "CPM (USD)"
+CPM_EXIBICAO = "CPM baseado em exibição (USD)"
+PUBLICACOES = "Vídeos publicados"
+INSCRITOS = "Inscritos"
+CTR = "Taxa de cliques de impressões (%)"
+PORCENTAGEM_ASSISTIDA = "Porcentagem visualizada média (%)"
+DURACAO = "Duração média da visualização"
+COMENTARIOS = "Comentários adicionados"
+GOSTEI = 'Marcações "Gostei"'
+COMPARTILHAMENTOS = "Compartilhamentos"
+
+ORIGENS_TRAFEGO = [
+    'Recursos de navegação', 'Vídeos sugeridos', 'Feed dos Shorts', 'Externa',
+    'Notificações', 'Pesquisa do YouTube', 'Playlists', 'Tráfego Pago', 'Outros'
+]
+
+
+def metrica(nome, formula, *termos, fator=1, formato='numero'):
     """
-    Subtrai duas linhas de DataFrames ignorando seus índices e retorna um novo DataFrame
-    de uma linha com o índice especificado.
+    Declara uma linha da tabela 4.1. Cada termo é um par (fonte, coluna) e a fórmula
+    é uma das chaves de FORMULAS. Linhas com formato 'tempo' saem como MM:SS no Excel.
     """
-    cols = df1.columns
-    df2_aligned = df2.reindex(columns=cols).fillna(0)
-
-    row1_values = df1.iloc[[df1_row_idx]].values.astype(float)
-    row2_values = df2_aligned.iloc[[df2_row_idx]].values.astype(float)
+    return {'nome': nome, 'formula': formula, 'termos': list(termos), 'fator': fator, 'formato': formato}
+
+
+# Fontes: 'total', 'videos', 'lives' e 'shorts' (tudo o que o canal teve no mês),
+# 'videos_novos', 'lives_novos', 'shorts_novos' e 'total_novo' (só o que foi publicado no mês)
+# e 'trafego' (% de visualizações por origem). A ordem da lista é a ordem das linhas no Excel.
+METRICAS_TABELA_4_1 = [
+    metrica("Receita Sem Shorts", 'diferenca', ('total', RECEITA), ('shorts', RECEITA)),
+    metrica("Receita VOD's", 'valor', ('videos', RECEITA)),
+    metrica("Receita Lives ", 'valor', ('lives', RECEITA)),
+    metrica("Receita Shorts", 'valor', ('shorts', RECEITA)),
+    metrica("Impressões sem shorts", 'diferenca', ('total', IMPRESSOES), ('shorts', IMPRESSOES)),
+    metrica("Impressões VOD's", 'valor', ('videos', IMPRESSOES)),
+    metrica("Impressões Lives", 'valor', ('lives', IMPRESSOES)),
+    metrica("Visualizações sem Shorts", 'diferenca', ('total', VISUALIZACOES), ('shorts', VISUALIZACOES)),
+    metrica("Visualizações Shorts", 'valor', ('shorts', VISUALIZACOES)),
+    metrica("Visualizações VOD's", 'valor', ('videos', VISUALIZACOES)),
+    metrica("Visualizações Lives", 'valor', ('lives', VISUALIZACOES)),
+    metrica("Número de VOD's", 'valor', ('videos', PUBLICACOES)),
+    metrica("Números de Lives ", 'valor', ('lives', PUBLICACOES)),
+    metrica("Números de Shorts", 'valor', ('shorts', PUBLICACOES)),
+    metrica("Watch Time Total", 'valor', ('total', WATCHTIME)),
+    metrica("Impressões por VOD's Novo", 'por_publicacao', ('videos_novos', IMPRESSOES), ('videos', PUBLICACOES)),
+    metrica("Impressões por Lives Novo", 'por_publicacao', ('lives_novos', IMPRESSOES), ('lives', PUBLICACOES)),
+    metrica("Impressões por Shorts Novo", 'por_publicacao', ('shorts_novos', IMPRESSOES), ('shorts', PUBLICACOES)),
+    metrica("RPM Velho", 'razao_diferencas', ('total', RECEITA), ('total_novo', RECEITA),
+            ('total', VISUALIZACOES), ('total_novo', VISUALIZACOES), fator=1000),
+    metrica("RPM Novo", 'razao', ('total_novo', RECEITA), ('total_novo', VISUALIZACOES), fator=1000),
+    metrica("RPM sem Short", 'rpm_ponderado', ('videos', RPM), ('lives', RPM), ('videos', IMPRESSOES), ('lives', IMPRESSOES)),
+    metrica("RPM VOD's Novo", 'valor', ('videos_novos', RPM)),
+    metrica("RPM Lives Novo", 'valor', ('lives_novos', RPM)),
+    metrica("RPM Shorts Novo", 'valor', ('shorts_novos', RPM)),
+    metrica("CTR VOD's Novo", 'valor', ('videos_novos', CTR)),
+    metrica("CTR Lives Novo", 'valor', ('lives_novos', CTR)),
+    metrica("Porcentagem Média Assistirda VOD's Novo", 'valor', ('videos_novos', PORCENTAGEM_ASSISTIDA)),
+    metrica("Porcentagem Média Assistirda Live Novo", 'valor', ('lives_novos', PORCENTAGEM_ASSISTIDA)),
+    metrica("Tamanhos de VOD's Novo", 'razao', ('videos_novos', DURACAO), ('videos_novos', PORCENTAGEM_ASSISTIDA),
+            fator=100, formato='tempo'),
+    metrica("Tamanho de Lives Novo", 'razao', ('lives_novos', DURACAO), ('lives_novos', PORCENTAGEM_ASSISTIDA),
+            fator=100, formato='tempo'),
+    metrica("Tempo Médio Assistido VOD's Novo", 'valor', ('videos_novos', DURACAO), formato='tempo'),
+    metrica("Tempo Médio Assistido Lives Novo", 'valor', ('lives_novos', DURACAO), formato='tempo'),
+    *[metrica(origem, 'valor', ('trafego', origem)) for origem in ORIGENS_TRAFEGO],
+    metrica("Número de Inscritos VOD Novo", 'valor', ('videos_novos', INSCRITOS)),
+    metrica("Número de Inscritos Live Novo", 'valor', ('lives_novos', INSCRITOS)),
+    metrica("Número de Inscritos Shorts Novo", 'valor', ('shorts_novos', INSCRITOS)),
+    metrica("Número de Inscritos vods Velho", 'diferenca', ('videos', INSCRITOS), ('videos_novos', INSCRITOS)),
+    metrica("Número de Inscritos Lives Velho", 'diferenca', ('lives', INSCRITOS), ('lives_novos', INSCRITOS)),
+    metrica("Número de Inscritos Shorts Velho", 'diferenca', ('shorts', INSCRITOS), ('shorts_novos', INSCRITOS)),
+    metrica("Número de Inscritos VOD's ", 'valor', ('videos', INSCRITOS)),
+    metrica("Número de Inscritos LIves", 'valor', ('lives', INSCRITOS)),
+    metrica("Número de Inscritos Shorts", 'valor', ('shorts', INSCRITOS)),
+    metrica("Número de Inscritos Total", 'acumulado', ('total', INSCRITOS)),
+    metrica("Número de Inscritos Sem Shorts", 'diferenca', ('total', INSCRITOS), ('shorts', INSCRITOS)),
+    metrica("Receita por VOD's Novo", 'por_publicacao', ('videos_novos', RECEITA), ('videos', PUBLICACOES)),
+    metrica("Receita por Lives Novo", 'por_publicacao', ('lives_novos', RECEITA), ('lives', PUBLICACOES)),
+    metrica("Receita por Shorts Novo", 'por_publicacao', ('shorts_novos', RECEITA), ('shorts', PUBLICACOES)),
+    metrica("Receita VOD Novo", 'valor', ('videos_novos', RECEITA)),
+    metrica("Receita Live Novo", 'valor', ('lives_novos', RECEITA)),
+    metrica("CPM (USD)", 'valor', ('total', CPM)),
+    metrica("Receita VOD's Velho", 'diferenca', ('videos', RECEITA), ('videos_novos', RECEITA)),
+    metrica("Receita Shorts Velho", 'diferenca', ('shorts', RECEITA), ('shorts_novos', RECEITA)),
+    metrica("Receita Lives Velho", 'diferenca', ('lives', RECEITA), ('lives_novos', RECEITA)),
+    metrica("Receita Shorts Novo", 'valor', ('shorts_novos', RECEITA)),
+    metrica("Taxa de Preenchimento", 'razao', ('total', CPM_EXIBICAO), ('total', CPM)),
+    metrica("Engajamento VOD", 'engajamento', ('videos_novos', COMENTARIOS), ('videos_novos', GOSTEI),
+            ('videos_novos', COMPARTILHAMENTOS), ('videos', PUBLICACOES)),
+    metrica("Engajamento Lives", 'engajamento', ('lives_novos', COMENTARIOS), ('lives_novos', GOSTEI),
+            ('lives_novos', COMPARTILHAMENTOS), ('lives', PUBLICACOES)),
+    metrica("Impressões Shorts", 'valor', ('shorts', IMPRESSOES)),
+    metrica("WatchTime VOD's", 'valor', ('videos', WATCHTIME)),
+    metrica("WatchTime Lives", 'valor', ('lives', WATCHTIME)),
+    metrica("WatchTime Shorts", 'valor', ('shorts', WATCHTIME)),
+    metrica("RPM VOD's", 'valor', ('videos', RPM)),
+    metrica("RPM Lives", 'valor', ('lives', RPM)),
+    metrica("RPM Shorts", 'valor', ('shorts', RPM)),
+    metrica("RPM Total", 'valor', ('total', RPM)),
+    # Estas duas linhas sempre saíram com o nome da própria coluna do total.csv
+    metrica("Inscrições obtidas", 'valor', ('total', "Inscrições obtidas")),
+    metrica("Inscrições perdidas", 'valor', ('total', "Inscrições perdidas")),
+    metrica("Saldo de Inscritos", 'valor', ('total', INSCRITOS)),
+    metrica("Engajamento Shorts", 'engajamento', ('shorts_novos', COMENTARIOS), ('shorts_novos', GOSTEI),
+            ('shorts_novos', COMPARTILHAMENTOS), ('shorts', PUBLICACOES)),
+    metrica("Tamanhos de Shorts Novo", 'razao', ('shorts_novos', DURACAO), ('shorts_novos', PORCENTAGEM_ASSISTIDA),
+            fator=100, formato='tempo'),
+    metrica("Porcentagem Média Assistirda Shorts Novo", 'valor', ('shorts_novos', PORCENTAGEM_ASSISTIDA)),
+    metrica("Tempo Médio Assistido Shorts Novo", 'valor', ('shorts_novos', DURACAO), formato='tempo'),
+    metrica("Visualizações VOD's Novo", 'valor', ('videos_novos', VISUALIZACOES)),
+    metrica("Visualizações Lives Novo", 'valor', ('lives_novos', VISUALIZACOES)),
+    metrica("Visualizações Shorts Novo", 'valor', ('shorts_novos', VISUALIZACOES)),
+    metrica("Visualizações VOD's Velho", 'diferenca', ('videos', VISUALIZACOES), ('videos_novos', VISUALIZACOES)),
+    metrica("Visualizações Lives Velho", 'diferenca', ('lives', VISUALIZACOES), ('lives_novos', VISUALIZACOES)),
+    metrica("Visualizações Shorts Velho", 'diferenca', ('shorts', VISUALIZACOES), ('shorts_novos', VISUALIZACOES)),
+    metrica("Visualizações Total", 'valor', ('total', VISUALIZACOES)),
+]
+
+
+# Cada fórmula recebe os termos de todas as linhas que a usam de uma vez:
+# termos[linha, termo, mês], fator[linha, 1] e os parâmetros do canal.
+def formula_valor(termos, fator, parametros):
+    return termos[:, 0]
+
+
+def formula_diferenca(termos, fator, parametros):
+    return termos[:, 0] - termos[:, 1]
+
+
+def formula_razao(termos, fator, parametros):
+    return divisao_segura(termos[:, 0] * fator, termos[:, 1])
+
+
+def formula_razao_diferencas(termos, fator, parametros):
+    return divisao_segura((termos[:, 0] - termos[:, 1]) * fator, termos[:, 2] - termos[:, 3])
+
+
+def formula_por_publicacao(termos, fator, parametros):
+    return divisao_segura(termos[:, 0], termos[:, 1])
+
+
+def formula_engajamento(termos, fator, parametros):
+    interacoes = abs(termos[:, 0]) + abs(termos[:, 1]) + abs(termos[:, 2])
+    return divisao_segura(interacoes, termos[:, 3])
+
+
+def formula_rpm_ponderado(termos, fator, parametros):
+    """RPM de VODs e Lives ponderado pelas impressões de cada um."""
+    rpm_a, rpm_b, impressoes_a, impressoes_b = (termos[:, i] for i in range(4))
+    impressoes_total = impressoes_a + impressoes_b
+    return rpm_a * divisao_segura(impressoes_a, impressoes_total) + rpm_b * divisao_segura(impressoes_b, impressoes_total)
+
+
+def formula_acumulado(termos, fator, parametros):
+    """Saldo acumulado de inscritos, partindo do total do sub.txt (inscritos ao fim do último mês)."""
+    valores = termos[:, 0]
+    acumulado = np.nancumsum(valores, axis=1) + (parametros['inscritos_anteriores'] - np.nansum(valores, axis=1, keepdims=True))
+    acumulado[np.isnan(valores)] = np.nan
+    return acumulado
+
+
+FORMULAS = {
+    'valor': formula_valor,
+    'diferenca': formula_diferenca,
+    'razao': formula_razao,
+    'razao_diferencas': formula_razao_diferencas,
+    'por_publicacao': formula_por_publicacao,
+    'engajamento': formula_engajamento,
+    'rpm_ponderado': formula_rpm_ponderado,
+    'acumulado': formula_acumulado,
+}
+
+
+def avaliar_metricas(metricas: list, fontes: dict, parametros: dict):
+    """
+    Avalia o registro de métricas de uma só vez. Todas as linhas de origem usadas pelas métricas
+    vão para uma única matriz termo x mês, e cada fórmula é aplicada a todas as suas linhas
+    numa única operação NumPy.
 
-    result_values = row1_values - row2_values
-    
-    return pd.DataFrame(result_values, columns=cols, index=[new_index_name])
+    Métricas que dependem de uma fonte vazia (ex.: canal sem origem de tráfego) são omitidas.
 
-def gerar_relatorio_para_artista(artista: str):
-    """
-    Função principal que orquestra todo o processo de geração de relatório para um artista.
+    Retorna:
+        tabela (pd.DataFrame): uma linha por métrica, uma coluna por mês
+        metricas (list): as métricas que entraram na tabela, na mesma ordem
     """
-    print(f"Iniciando o processamento para o artista: {artista}...")
+    metricas = [m for m in metricas if all(not fontes[fonte].empty for fonte, _ in m['termos'])]
 
-    # --- 1. Carregar e Processar Dados Base ---
-    base_path = f'dados_full/{artista}/'
-    df = carregar_e_processar_dados(f'{base_path}total.csv', 'total')
-    df_videos = carregar_e_processar_dados(f'{base_path}videos.csv', 'videos')
-    df_shorts = carregar_e_processar_dados(f'{base_path}shorts.csv', 'shorts')
-    df_lives = carregar_e_processar_dados(f'{base_path}lives.csv', 'lives')
-    
-    # As chamadas são atualizadas para não passarem o argumento 'meses_range'
-    videos_novos = carregar_dados_mensais(artista, 'videos')
-    lives_novos = carregar_dados_mensais(artista, 'lives')
-    shorts_novos = carregar_dados_mensais(artista, 'shorts')
-    
-    cols = df.columns
-    videos_novos = videos_novos.reindex(columns=cols).fillna(0)
-    lives_novos = lives_novos.reindex(columns=cols).fillna(0)
-    shorts_novos = shorts_novos.reindex(columns=cols).fillna(0)
-    
-    total_novo = videos_novos.add(lives_novos, fill_value=0).add(shorts_novos, fill_value=0)
+    # Meses na ordem em que aparecem nas fontes, como o pd.concat das linhas faria
+    meses = None
+    for m in metricas:
+        for fonte, _ in m['termos']:
+            colunas = fontes[fonte].columns
+            meses = colunas if meses is None else meses.union(colunas, sort=False)
 
-    # --- 2. Cálculos e Definições de Métricas ---
-    receita_shorts_calc = df_shorts.iloc[[13]]
-    receita_sem_shorts = subtract_and_reindex(df, 16, receita_shorts_calc, 0, "Receita Sem Shorts")
-    
-    impress_shorts_calc = df_shorts.iloc[[6]]
-    impress_sem_shorts = subtract_and_reindex(df, 9, impress_shorts_calc, 0, "Impressões sem shorts")
+    colunas_por_fonte = {}
+    for m in metricas:
+        for fonte, coluna in m['termos']:
+            colunas_por_fonte.setdefault(fonte, {})[coluna] = None
 
-    views_shorts_calc = df_shorts.iloc[[10]]
-    views_sem_shorts = subtract_and_reindex(df, 13, views_shorts_calc, 0, "Visualizações sem Shorts")
-    
-    receita_vod = df_videos.iloc[[13]].rename(index={"Receita estimada (USD)":"Receita VOD's"})
-    receita_lives = df_lives.iloc[[13]].rename(index={"Receita estimada (USD)":"Receita Lives "})
-    receita_shorts = df_shorts.iloc[[13]].rename(index={"Receita estimada (USD)":"Receita Shorts"})
-    
-    impress_vods = df_videos.iloc[[6]].rename(index={"Impressões":"Impressões VOD's"})
-    impress_lives = df_lives.iloc[[6]].rename(index={"Impressões":"Impressões Lives"})
-    impressoes_shorts = df_shorts.iloc[[6]].rename(index={"Impressões": "Impressões Shorts"})
-    
-    views_vod = df_videos.iloc[[10]].rename(index={"Visualizações":"Visualizações VOD's"})
-    views_lives = df_lives.iloc[[10]].rename(index={"Visualizações":"Visualizações Lives"})
-    views_shorts = df_shorts.iloc[[10]].rename(index={"Visualizações": "Visualizações Shorts"})
-
-    # Definição das novas métricas de WatchTime
-    watchtime_vod = df_videos.iloc[[11]].rename(index={"Tempo de exibição (horas)": "WatchTime VOD's"})
-    watchtime_lives = df_lives.iloc[[11]].rename(index={"Tempo de exibição (horas)": "WatchTime Lives"})
-    watchtime_shorts = df_shorts.iloc[[11]].rename(index={"Tempo de exibição (horas)": "WatchTime Shorts"})
-
-    inscritos_ganhos = df.iloc[[20]].rename(index={"Inscritos":"Número de Inscritos Ganhos"})
-    inscritos_perdidos = df.iloc[[21]].rename(index={"Inscritos":"Número de Inscritos Perdidos"})
-    saldo_inscritos = df.iloc[[11]].rename(index={"Inscritos":"Saldo de Inscritos"})
-
-    rpm_total_vod = df_videos.iloc[[4]].rename(index={"RPM (USD)": "RPM VOD's"})
-    rpm_total_lives = df_lives.iloc[[4]].rename(index={"RPM (USD)": "RPM Lives"})
-    rpm_total_shorts = df_shorts.iloc[[4]].rename(index={"RPM (USD)": "RPM Shorts"})
-    rpm_total = df.iloc[[7]].rename(index={"RPM (USD)": "RPM Total"})
-
-
-    vods_pubs = df_videos.iloc[[7]]; vods_pubs.index = ["Número de VOD's"]
-    lives_pubs = df_lives.iloc[[7]]; lives_pubs.index = ["Números de Lives "]
-    shorts_pubs = df_shorts.iloc[[7]]; shorts_pubs.index = ["Números de Shorts"]
-    watchtime = df.iloc[[14]]; watchtime.index = ["Watch Time Total"]
-    cpm = df.iloc[[17]]; cpm.index = ["CPM (USD)"]
-
-    impress_vods_calc = df_videos.iloc[[6]].astype(float)
-    impress_lives_calc = df_lives.iloc[[6]].astype(float)
-    total_impress_sem_shorts = impress_vods_calc.values + impress_lives_calc.values
-    
-    peso_videos = divisao_segura(impress_vods_calc.values, total_impress_sem_shorts)
-    peso_lives = divisao_segura(impress_lives_calc.values, total_impress_sem_shorts)
-    
-    rpm_vod_vals = df_videos.iloc[[4]].values.astype(float)
-    rpm_lives_vals = df_lives.iloc[[4]].values.astype(float)
-    
-    rpm_sem_short_vals = (rpm_vod_vals * peso_videos) + (rpm_lives_vals * peso_lives)
-    rpm_sem_shorts = pd.DataFrame(rpm_sem_short_vals, columns=df.columns, index=['RPM sem Short'])
+    posicoes, blocos = {}, []
+    for fonte, colunas in colunas_por_fonte.items():
+        for coluna in colunas:
+            posicoes[(fonte, coluna)] = len(posicoes)
+        blocos.append(fontes[fonte].reindex(index=list(colunas), columns=meses).to_numpy(dtype=float))
+    base = np.vstack(blocos)
 
-    views_velho = subtract_and_reindex(df, 13, total_novo, 9, "temp_index")
-    receita_velho = subtract_and_reindex(df, 16, total_novo, 12, "temp_index")
-    rpm_velho_vals = divisao_segura(receita_velho.values.astype(float) * 1000, views_velho.values.astype(float))
-    rpm_velho = pd.DataFrame(rpm_velho_vals, columns=df.columns, index=['RPM Velho'])
+    resultado = np.full((len(metricas), len(meses)), np.nan)
+    linhas_por_formula = {}
+    for i, m in enumerate(metricas):
+        linhas_por_formula.setdefault(m['formula'], []).append(i)
 
-    views_novo_vod = videos_novos.iloc[[9]].rename(index={"Visualizações":"Visualizações VOD's Novo"})
-    views_novo_live = lives_novos.iloc[[9]].rename(index={"Visualizações":"Visualizações Lives Novo"})
-    views_novo_shorts = shorts_novos.iloc[[9]].rename(index={"Visualizações":"Visualizações Shorts Novo"})
+    for formula, linhas in linhas_por_formula.items():
+        indices = np.array([[posicoes[termo] for termo in metricas[i]['termos']] for i in linhas])
+        fator = np.array([metricas[i]['fator'] for i in linhas], dtype=float).reshape(-1, 1)
+        resultado[linhas] = FORMULAS[formula](base[indices], fator, parametros)
 
-    views_velho_vod = subtract_and_reindex(df_videos, 10, videos_novos, 9, "Visualizações VOD's Velho")
-    views_velho_live = subtract_and_reindex(df_lives, 10, lives_novos, 9, "Visualizações Lives Velho")
-    views_velho_shorts = subtract_and_reindex(df_shorts, 10, shorts_novos, 9, "Visualizações Shorts Velho")
+    tabela = pd.DataFrame(resultado, index=[m['nome'] for m in metricas], columns=meses)
+    return tabela, metricas
 
-    views_total = df.iloc[[13]].rename(index={"Visualizações":"Visualizações Total"})
 
-    rpm_novo_vals = divisao_segura(total_novo.iloc[[12]].values.astype(float) * 1000, total_novo.iloc[[9]].values.astype(float))
-    rpm_novo = pd.DataFrame(rpm_novo_vals, columns=total_novo.columns, index=['RPM Novo'])
+def gerar_relatorio_para_artista(artista: str):
+    """
+    Função principal que orquestra todo o processo de geração de relatório para um artista.
+    """
+    print(f"Iniciando o processamento para o artista: {artista}...")
 
-    taxa_preenchimento_vals = divisao_segura(df.iloc[[18]].values.astype(float), cpm.values.astype(float))
-    taxa_preenchimento = pd.DataFrame(taxa_preenchimento_vals, columns=df.columns, index=['Taxa de Preenchimento'])
+    # --- 1. Carregar e Processar Dados Base ---
+    contexto = periodo_canal.carregar_contexto_periodo(artista)
+    df = carregar_e_processar_dados(artista, 'total')
 
+    cols = df.columns
+    dados_mensais = carregar_dados_mensais(artista, contexto)
+    videos_novos = dados_mensais['videos'].reindex(columns=cols).fillna(0)
+    lives_novos = dados_mensais['lives'].reindex(columns=cols).fillna(0)
+    shorts_novos = dados_mensais['shorts'].reindex(columns=cols).fillna(0)
+
+    fontes = {
+        'total': df,
+        'videos': carregar_e_processar_dados(artista, 'videos'),
+        'lives': carregar_e_processar_dados(artista, 'lives'),
+        'shorts': carregar_e_processar_dados(artista, 'shorts'),
+        'videos_novos': videos_novos,
+        'lives_novos': lives_novos,
+        'shorts_novos': shorts_novos,
+        'total_novo': videos_novos.add(lives_novos, fill_value=0).add(shorts_novos, fill_value=0),
+        'trafego': processar_fontes_de_trafego(artista),
+    }
 
-    minutagem_videos_vals = divisao_segura(videos_novos.iloc[[11]].values.astype(float) * 100, videos_novos.iloc[[8]].values.astype(float)) 
-    minutagem_videos = pd.DataFrame(minutagem_videos_vals, columns=videos_novos.columns, index=["Tamanhos de VOD's Novo"])
-    
-    minutagem_lives_vals = divisao_segura(lives_novos.iloc[[11]].values.astype(float) * 100, lives_novos.iloc[[8]].values.astype(float))
-    minutagem_lives = pd.DataFrame(minutagem_lives_vals, columns=lives_novos.columns, index=["Tamanho de Lives Novo"])
-
-    minutagem_shorts_vals = divisao_segura(shorts_novos.iloc[[11]].values.astype(float) * 100, shorts_novos.iloc[[8]].values.astype(float)) 
-    minutagem_shorts = pd.DataFrame(minutagem_shorts_vals, columns=shorts_novos.columns, index=["Tamanhos de Shorts Novo"])
-
-
-    def calcular_engajamento_novo(df_novo, df_pubs, content_type):
-        if df_novo.empty or df_pubs.empty: return pd.DataFrame()
-        engaj_novo_total = (abs(df_novo.T['Comentários adicionados'].astype(float)) + abs(df_novo.T['Marcações \"Gostei\"'].astype(float)) + abs(df_novo.T['Compartilhamentos'].astype(float)))
-        engaj_por_pub = divisao_segura(engaj_novo_total.values, df_pubs.iloc[0].T.values.astype(float))
-        df_out = pd.DataFrame(engaj_por_pub.reshape(1, -1), columns=df_pubs.columns)
-        df_out.index = [f"Engajamento {content_type}"]
-        return df_out
-    engajamento_vod_novo = calcular_engajamento_novo(videos_novos, vods_pubs, 'VOD')
-    engajamento_lives_novo = calcular_engajamento_novo(lives_novos, lives_pubs, 'Lives')
-    engajamento_shorts_novo = calcular_engajamento_novo(shorts_novos, shorts_pubs, 'Shorts')
-    
-    # --- 3. Montagem da Tabela Final ---
-    df_geral_1 = pd.concat([
-        receita_sem_shorts, receita_vod, receita_lives, receita_shorts,
-        impress_sem_shorts, impress_vods, impress_lives, 
-        views_sem_shorts, views_shorts, views_vod, views_lives,
-        vods_pubs, lives_pubs, shorts_pubs, watchtime
-    ])
-    
     with open(f"dados_full/{artista}/sub.txt", "r") as f: insc_ant = int(''.join((f.readline()).split('.')))
-    inscritos_totais = pd.DataFrame((df.T['Inscritos'].astype(float).cumsum() + (insc_ant - df.T['Inscritos'].astype(float).sum()))).T.rename(index={"Inscritos":"Número de Inscritos Total"})
-    inscritos_sem_shorts = subtract_and_reindex(df, 11, df_shorts, 8, "Número de Inscritos Sem Shorts")
-    df_geral_2 = pd.concat([
-        df_videos.iloc[[8]].rename(index={"Inscritos":"Número de Inscritos VOD's "}), df_lives.iloc[[8]].rename(index={"Inscritos":"Número de Inscritos LIves"}),
-        df_shorts.iloc[[8]].rename(index={"Inscritos":"Número de Inscritos Shorts"}), inscritos_totais, inscritos_sem_shorts
-    ])
-    
-    lista_dfs_finais = [
-        df_geral_1,
-        calcular_metricas_por_publicacao(videos_novos, vods_pubs, 'Impressões', 6, 0),
-        calcular_metricas_por_publicacao(lives_novos, lives_pubs, 'Impressões', 6, 0),
-        calcular_metricas_por_publicacao(shorts_novos, shorts_pubs, 'Impressões', 6, 0),
-        rpm_velho, rpm_novo, rpm_sem_shorts, videos_novos.iloc[[4]].rename(index={"RPM (USD)":"RPM VOD's Novo"}),
-        lives_novos.iloc[[4]].rename(index={"RPM (USD)":"RPM Lives Novo"}), shorts_novos.iloc[[4]].rename(index={"RPM (USD)":"RPM Shorts Novo"}),
-        videos_novos.iloc[[5]].rename(index={"Taxa de cliques de impressões (%)":"CTR VOD's Novo"}),
-        lives_novos.iloc[[5]].rename(index={"Taxa de cliques de impressões (%)":"CTR Lives Novo"}),
-        videos_novos.iloc[[8]].rename(index={"Porcentagem visualizada média (%)":"Porcentagem Média Assistirda VOD's Novo"}),
-        lives_novos.iloc[[8]].rename(index={"Porcentagem visualizada média (%)":"Porcentagem Média Assistirda Live Novo"}),
-        minutagem_videos, minutagem_lives,
-        videos_novos.iloc[[11]].rename(index={"Duração média da visualização":"Tempo Médio Assistido VOD's Novo"}),
-        lives_novos.iloc[[11]].rename(index={"Duração média da visualização":"Tempo Médio Assistido Lives Novo"}),
-        processar_fontes_de_trafego(artista),
-        videos_novos.iloc[[7]].rename(index={"Inscritos":"Número de Inscritos VOD Novo"}),
-        lives_novos.iloc[[7]].rename(index={"Inscritos":"Número de Inscritos Live Novo"}),
-        shorts_novos.iloc[[7]].rename(index={"Inscritos":"Número de Inscritos Shorts Novo"}),
-        subtract_and_reindex(df_videos, 8, videos_novos, 7, "Número de Inscritos vods Velho"),
-        subtract_and_reindex(df_lives, 8, lives_novos, 7, "Número de Inscritos Lives Velho"),
-        subtract_and_reindex(df_shorts, 8, shorts_novos, 7, "Número de Inscritos Shorts Velho"),
-        df_geral_2,
-        calcular_metricas_por_publicacao(videos_novos, vods_pubs, "Receita", 12, 0),
-        calcular_metricas_por_publicacao(lives_novos, lives_pubs, "Receita", 12, 0),
-        calcular_metricas_por_publicacao(shorts_novos, shorts_pubs, "Receita", 12, 0),
-        videos_novos.iloc[[12]].rename(index={"Receita estimada (USD)":"Receita VOD Novo"}),
-        lives_novos.iloc[[12]].rename(index={"Receita estimada (USD)":"Receita Live Novo"}),
-        cpm,
-        subtract_and_reindex(df_videos, 13, videos_novos, 12, "Receita VOD's Velho"),
-        subtract_and_reindex(df_shorts, 13, shorts_novos, 12, "Receita Shorts Velho"),
-        subtract_and_reindex(df_lives, 13, lives_novos, 12, "Receita Lives Velho"),
-        shorts_novos.iloc[[12]].rename(index={"Receita estimada (USD)":"Receita Shorts Novo"}),
-        taxa_preenchimento, engajamento_vod_novo, engajamento_lives_novo,
-        impressoes_shorts,
-        # Adicionando as novas métricas de Watch Time ao final da lista
-        watchtime_vod,
-        watchtime_lives,
-        watchtime_shorts,
-        rpm_total_vod,
-        rpm_total_lives,
-        rpm_total_shorts,
-        rpm_total,
-        inscritos_ganhos,
-        inscritos_perdidos,
-        saldo_inscritos,
-        engajamento_shorts_novo,
-        minutagem_shorts,
-        shorts_novos.iloc[[8]].rename(index={"Porcentagem visualizada média (%)":"Porcentagem Média Assistirda Shorts Novo"}),
-        shorts_novos.iloc[[11]].rename(index={"Duração média da visualização":"Tempo Médio Assistido Shorts Novo"}),
-        views_novo_vod,
-        views_novo_live,
-        views_novo_shorts,
-        views_velho_vod,
-        views_velho_live,
-        views_velho_shorts,
-        views_total
 
-    ]
+    # --- 2. Cálculo de todas as métricas declaradas em METRICAS_TABELA_4_1 ---
+    tabela, metricas = avaliar_metricas(METRICAS_TABELA_4_1, fontes, {'inscritos_anteriores': insc_ant})
 
-    lista_dfs_validos = [df for df in lista_dfs_finais if df is not None and not df.empty]
-    tabela = pd.concat(lista_dfs_validos)
-    
     # --- Pós-processamento e Exportação ---
     colunas_de_meses = tabela.columns.tolist()
-    
-    tabela_calc = tabela.copy()
-    for col in colunas_de_meses:
-        tabela_calc[col] = pd.to_numeric(tabela_calc[col], errors='coerce')
-    tabela_calc.fillna(0, inplace=True)
+
+    tabela_calc = tabela.fillna(0)
 
     media_series = tabela_calc[colunas_de_meses].mean(axis=1)
+    # object: as linhas de tempo recebem texto MM:SS logo abaixo
+    tabela = tabela.astype(object)
     tabela.insert(0, 'Média', media_series)
     tabela.index.name = "Data"
 
     tabela_numerica_sem_media = tabela_calc[colunas_de_meses]
-    
+
     resultado_array = divisao_segura(tabela_numerica_sem_media.sub(media_series, axis=0), media_series.values)
-    tabela_desvio_media = pd.DataFrame(resultado_array, 
-                                       index=tabela_numerica_sem_media.index, 
+    tabela_desvio_media = pd.DataFrame(resultado_array,
+                                       index=tabela_numerica_sem_media.index,
                                        columns=tabela_numerica_sem_media.columns)
     tabela_desvio_media.index.name = "Data"
-    
+
     df_shifted = tabela_numerica_sem_media.shift(1, axis=1)
     numerador_pct = tabela_numerica_sem_media.sub(df_shifted)
     tabela_desvio_anterior = divisao_segura(numerador_pct, df_shifted)
     tabela_desvio_anterior.index.name = "Data"
-    
-    # 1. Identifique as linhas que serão formatadas como strings de tempo mais tarde.
-    linhas_de_tempo = [
-        "Tamanhos de VOD's Novo", "Tempo Médio Assistido VOD's Novo",
-        "Tamanho de Lives Novo", "Tempo Médio Assistido Lives Novo",
-        "Tamanhos de Shorts Novo", "Tempo Médio Assistido Shorts Novo",
-    ]
 
-    # 2. Identifique TODAS as outras linhas que devem ser puramente numéricas.
-    # Usamos 'index.difference' para pegar todos os índices EXCETO os de tempo.
-    linhas_numericas = tabela.index.difference(linhas_de_tempo)
-
-    # 3. Converta APENAS as linhas numéricas para float.
-    # Isso resolve o problema original (inteiros no Excel) sem criar o novo erro.
-    # Usamos .loc para garantir que estamos modificando o DataFrame original.
-    for col in colunas_de_meses:
-        tabela.loc[linhas_numericas, col] = pd.to_numeric(tabela.loc[linhas_numericas, col], errors='coerce')
-    
-    # Garante que, após a conversão, o tipo seja float.
-    tabela.loc[linhas_numericas] = tabela.loc[linhas_numericas].astype(float)
-
-
-    # 4. AGORA, com os tipos numéricos já corrigidos, aplique a formatação de tempo.
-    # Este código agora opera de forma segura, sem ser sobrescrito depois.
-    for metrica in linhas_de_tempo:
-        if metrica in tabela.index:
-            # Garante que estamos trabalhando com números antes de formatar
-            valores_numericos = pd.to_numeric(tabela.loc[metrica, colunas_de_meses], errors='coerce').fillna(0)
-            
-            # Aplica a formatação para MM:SS ou HH:MM:SS
-            tabela.loc[metrica, colunas_de_meses] = valores_numericos.apply(
-                lambda minutos: 
-                    # SE o valor de minutos for 60 ou mais, usa o formato HH:MM:SS
-                    f"{int(minutos // 60):02d}:{int(minutos % 60):02d}:00" 
-                    if minutos >= 60 
-                    # SENÃO, usa o formato MM:SS para minutos decimais
-                    else f"{int(minutos):02d}:{int((minutos % 1) * 60):02d}"
-            )
-    
-    output_filename = f'exports_tabelas/tabela_4.1_{artista}.xlsx'
+    # Linhas declaradas com formato 'tempo' saem como MM:SS ou HH:MM:SS
+    linhas_de_tempo = [m['nome'] for m in metricas if m['formato'] == 'tempo']
+    for metrica_tempo in linhas_de_tempo:
+        valores_numericos = tabela_calc.loc[metrica_tempo, colunas_de_meses]
+        tabela.loc[metrica_tempo, colunas_de_meses] = valores_numericos.apply(
+            lambda minutos:
+                # SE o valor de minutos for 60 ou mais, usa o formato HH:MM:SS
+                f"{int(minutos // 60):02d}:{int(minutos % 60):02d}:00"
+                if minutos >= 60
+                # SENÃO, usa o formato MM:SS para minutos decimais
+                else f"{int(minutos):02d}:{int((minutos % 1) * 60):02d}"
+        )
+
+    output_filename = armazem_canal.caminho_excel_4_1(artista)
     os.makedirs('exports_tabelas', exist_ok=True)
-    
+
     with pd.ExcelWriter(output_filename, engine='openpyxl') as writer:
         tabela.to_excel(writer, sheet_name='Resultado', index=True)
         tabela_desvio_media.to_excel(writer, sheet_name='Desvio', index=True)
         tabela_desvio_anterior.to_excel(writer, sheet_name='Mês Anterior', index=True)
 
+    # Cópia tipada das mesmas abas, lida uma única vez pela etapa de gráficos
+    armazem_canal.gravar_tabela_4_1(artista, {
+        'Resultado': tabela, 'Desvio': tabela_desvio_media, 'Mês Anterior': tabela_desvio_anterior,
+    })
+
     print(f"Relatório para {artista} salvo com sucesso")
 
 
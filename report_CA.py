@@ -3,11 +3,15 @@ import sys
 import pandas as pd
 import numpy as np
 from typing import List
-from dateutil.relativedelta import relativedelta
+
+import armazem_canal
+import periodo_canal
 
 # Obtém o caminho do diretório onde o script está sendo executado
 path = os.getcwd()
 
+TIPOS_CONTEUDO = ['videos', 'lives', 'shorts']
+
 def divisao_segura(numerador, denominador):
     if isinstance(denominador, (pd.Series, pd.DataFrame)):
         denominador_seguro = denominador.replace(0, np.nan)
@@ -22,13 +26,11 @@ def divisao_segura(numerador, denominador):
     np.divide(numerador, denominador, out=resultado, where=mascara_valida)
     return resultado
 
-def carregar_e_processar_dados(caminho_arquivo: str) -> pd.DataFrame:
-    if not os.path.exists(caminho_arquivo): return pd.DataFrame().T
-    df = pd.read_csv(caminho_arquivo)
+def carregar_e_processar_dados(artista: str, nome_tabela: str) -> pd.DataFrame:
+    if not os.path.exists(armazem_canal.caminho_csv(artista, nome_tabela)): return pd.DataFrame().T
+    df = armazem_canal.ler_tabela(artista, nome_tabela)
     if df.empty: return pd.DataFrame().T
-    if 'Total' in df.iloc[0].values:
-        df = df.drop(df.index[0])
-    df['Data'] = pd.to_datetime(df['Data'], format='%Y-%m').dt.to_period('M')
+    df = armazem_canal.remover_linha_total(df)
     for col in ['Taxa de cliques de impressões (%)', 'Porcentagem visualizada média (%)']:
         if col in df.columns:
             df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0) / 100
@@ -36,37 +38,18 @@ def carregar_e_processar_dados(caminho_arquivo: str) -> pd.DataFrame:
     df.set_index('Data', inplace=True)
     return df.T
 
-def carregar_dados_mensais(artista: str, tipo: str) -> pd.DataFrame:
-    caminho_total = f'dados_full/{artista}/total.csv'
-    if not os.path.exists(caminho_total): return pd.DataFrame()
-    df_total = pd.read_csv(caminho_total)
-    if not df_total.empty and 'Total' in df_total.iloc[0].values:
-        df_total = df_total.drop(df_total.index[0])
-    df_total['Data'] = pd.to_datetime(df_total['Data'], format='%Y-%m', errors='coerce')
-    df_total.dropna(subset=['Data'], inplace=True)
-    if df_total.empty: return pd.DataFrame()
-    ultima_data = df_total['Data'].max()
-    meses_para_analise = []
-    for i in range(5, -1, -1):
-        mes_alvo = ultima_data - relativedelta(months=i)
-        meses_para_analise.append(mes_alvo.strftime('%Y-%m'))
-    coluna_data_publicacao = 'Horário de publicação do vídeo'
-    dfs = []
-    for i in range(1, 13):
-        nome_arquivo_mes = str(i).zfill(2)
-        caminho_arquivo = f'dados_full/{artista}/{tipo}_{nome_arquivo_mes}.csv'
-        if os.path.exists(caminho_arquivo):
-            df_mes = pd.read_csv(caminho_arquivo)
-            if coluna_data_publicacao in df_mes.columns:
-                datas_convertidas = pd.to_datetime(df_mes[coluna_data_publicacao], format='%b %d, %Y', errors='coerce')
-                df_mes['mes_publicacao'] = datas_convertidas.dt.strftime('%Y-%m')
-                df_filtrado = df_mes[df_mes['mes_publicacao'].isin(meses_para_analise)].copy()
-                dfs.append(df_filtrado)
-    if not dfs: return pd.DataFrame()
-    df_concatenado = pd.concat(dfs, ignore_index=True)
+def carregar_dados_mensais(artista: str, contexto: dict) -> dict:
+    """Agrupa por mês de publicação os vídeos dos 36 arquivos mensais ({tipo}_01..12), lidos numa única chamada."""
+    meses_para_analise = [str(mes) for mes in contexto['meses_analise']]
+    mensais = armazem_canal.ler_tabelas_mensais(artista, TIPOS_CONTEUDO, 12)
+    return {tipo: agrupar_por_mes_publicacao(armazem_canal.separar_tipo(mensais, tipo), meses_para_analise) for tipo in TIPOS_CONTEUDO}
 
-    if 'Duração média da visualização' in df_concatenado.columns:
-        df_concatenado['Duração média da visualização'] = pd.to_timedelta(df_concatenado['Duração média da visualização'], errors='coerce').dt.total_seconds()
+def agrupar_por_mes_publicacao(df_tipo: pd.DataFrame, meses_para_analise: List[str]) -> pd.DataFrame:
+    coluna_data_publicacao = 'Horário de publicação do vídeo'
+    if coluna_data_publicacao not in df_tipo.columns: return pd.DataFrame()
+    df_tipo = df_tipo.drop(columns='Arquivo')
+    df_tipo['mes_publicacao'] = df_tipo[coluna_data_publicacao].dt.strftime('%Y-%m')
+    df_concatenado = df_tipo[df_tipo['mes_publicacao'].isin(meses_para_analise)].reset_index(drop=True)
 
     numeric_cols = ['Receita estimada (USD)', 'Porcentagem visualizada média (%)', 'Impressões', 'Taxa de cliques de impressões (%)', 'RPM (USD)', 'Marcações "Gostei"', 'Compartilhamentos', 'Comentários adicionados', 'Espectadores únicos', 'Visualizações', 'Tempo de exibição (horas)', 'Inscritos', 'Duração média da visualização', 'Duração']
     for col in numeric_cols:
@@ -107,7 +90,7 @@ def processar_fontes_de_trafego(artista: str, meses_desejados: pd.PeriodIndex) -
     colunas_desejadas = ['Recursos de navegação', 'Vídeos sugeridos', 'Feed dos Shorts', 'Externa', 'Notificações', 'Pesquisa do YouTube', 'Playlists', 'Publicidade no YouTube']
     def pivot_origem(path):
         if not os.path.exists(path): return pd.DataFrame()
-        df = pd.read_csv(path)
+        df = armazem_canal.ler_tabela(artista, os.path.splitext(os.path.basename(path))[0])
         if df.empty or not all(col in df.columns for col in ['Data', 'Origem do tráfego', 'Visualizações']): return pd.DataFrame()
         pivot = df.pivot_table(index='Data', columns='Origem do tráfego', values='Visualizações', aggfunc='first').fillna(0)
         for col in colunas_desejadas:
@@ -119,7 +102,6 @@ def processar_fontes_de_trafego(artista: str, meses_desejados: pd.PeriodIndex) -
     origem_lives = pivot_origem(origem_lives_path)
     origem_total = origem_vods.add(origem_lives, fill_value=0)
     if origem_total.empty: return pd.DataFrame()
-    origem_total.index = pd.to_datetime(origem_total.index).to_period('M')
     origem_total = origem_total[origem_total.index.isin(meses_desejados)]
     if origem_total.empty: return pd.DataFrame()
     soma_total_por_linha = origem_total.sum(axis=1)
@@ -133,38 +115,27 @@ def processar_fontes_de_trafego(artista: str, meses_desejados: pd.PeriodIndex) -
 def gerar_relatorio_para_artista(artista: str):
     print(f"Iniciando o processamento para o artista: {artista}...")
 
-    base_path = f'dados_full/{artista}/'
-
-    caminho_total_ref = f'{base_path}total.csv'
-    if not os.path.exists(caminho_total_ref):
+    if not os.path.exists(armazem_canal.caminho_csv(artista, 'total')):
         print(f"Arquivo 'total.csv' não encontrado para determinar o período. Saindo.")
         return
 
-    df_ref_data = pd.read_csv(caminho_total_ref)
-    if not df_ref_data.empty and 'Total' in df_ref_data.iloc[0].values:
-        df_ref_data = df_ref_data.drop(df_ref_data.index[0])
-    df_ref_data['Data'] = pd.to_datetime(df_ref_data['Data'], format='%Y-%m', errors='coerce')
-    df_ref_data.dropna(subset=['Data'], inplace=True)
-    ultima_data = df_ref_data['Data'].max()
-    meses_para_analise_dt = []
-    for i in range(5, -1, -1):
-        mes_alvo = ultima_data - relativedelta(months=i)
-        meses_para_analise_dt.append(mes_alvo)
-    colunas_de_meses_desejadas = pd.to_datetime(meses_para_analise_dt).to_period('M')
+    contexto = periodo_canal.carregar_contexto_periodo(artista)
+    colunas_de_meses_desejadas = contexto['meses_analise']
 
-    df = carregar_e_processar_dados(f'{base_path}total.csv')
-    df_videos = carregar_e_processar_dados(f'{base_path}videos.csv')
-    df_shorts = carregar_e_processar_dados(f'{base_path}shorts.csv')
-    df_lives = carregar_e_processar_dados(f'{base_path}lives.csv')
+    df = carregar_e_processar_dados(artista, 'total')
+    df_videos = carregar_e_processar_dados(artista, 'videos')
+    df_shorts = carregar_e_processar_dados(artista, 'shorts')
+    df_lives = carregar_e_processar_dados(artista, 'lives')
     
     df = df[df.columns.intersection(colunas_de_meses_desejadas)]
     df_videos = df_videos[df_videos.columns.intersection(colunas_de_meses_desejadas)]
     df_shorts = df_shorts[df_shorts.columns.intersection(colunas_de_meses_desejadas)]
     df_lives = df_lives[df_lives.columns.intersection(colunas_de_meses_desejadas)]
     
-    videos_novos = carregar_dados_mensais(artista, 'videos')
-    lives_novos = carregar_dados_mensais(artista, 'lives')
-    shorts_novos = carregar_dados_mensais(artista, 'shorts')
+    dados_mensais = carregar_dados_mensais(artista, contexto)
+    videos_novos = dados_mensais['videos']
+    lives_novos = dados_mensais['lives']
+    shorts_novos = dados_mensais['shorts']
     
     cols = df.columns
     all_new_metrics = pd.concat([videos_novos, lives_novos, shorts_novos]).index.unique()
@@ -333,7 +304,7 @@ def gerar_relatorio_para_artista(artista: str):
     df_shifted = tabela_numerica_sem_media.shift(1, axis=1)
     tabela_desvio_anterior = divisao_segura(tabela_numerica_sem_media.sub(df_shifted), df_shifted)
     
-    output_filename = f'exports_tabelas/tabela_4.1_{artista}.xlsx'
+    output_filename = armazem_canal.caminho_excel_4_1(artista)
     os.makedirs('exports_tabelas', exist_ok=True)
     
     with pd.ExcelWriter(output_filename, engine='openpyxl') as writer:
@@ -341,6 +312,11 @@ def gerar_relatorio_para_artista(artista: str):
         tabela_desvio_media.to_excel(writer, sheet_name='Desvio', index=True)
         tabela_desvio_anterior.to_excel(writer, sheet_name='Mês Anterior', index=True)
 
+    # Cópia tipada das mesmas abas, lida uma única vez pela etapa de gráficos
+    armazem_canal.gravar_tabela_4_1(artista, {
+        'Resultado': tabela, 'Desvio': tabela_desvio_media, 'Mês Anterior': tabela_desvio_anterior,
+    })
+
     print(f"Relatório para {artista} salvo com sucesso")
 
 
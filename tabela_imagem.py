@@ -0,0 +1,120 @@
+from PIL import Image, ImageDraw
+
+from cards_big_number import FONTE_NEGRITO, carregar_fonte
+
+# Motor de tabelas em imagem: recebe a grade já estilizada (textos, cores, setas de tendência,
+# zebra e cabeçalho) e desenha tudo com Pillow de uma vez, sem montar um ax.table célula por célula.
+# A geometria reproduz a das tabelas antigas do matplotlib: figura em polegadas, tight_layout,
+# coluna de rótulos com largura automática e recorte justo com 0.1 polegada de folga.
+
+TAMANHO_FONTE = 14
+# Folga interna do texto nas células, em fração da largura (Cell.PAD do matplotlib)
+FOLGA_CELULA = 0.1
+# Altura base das linhas: 1.2 x o corpo de 10 pt, multiplicada por escala_altura (tabela.scale)
+ALTURA_BASE_LINHA_POL = 1.2 * 10 / 72
+# Margem do tight_layout (1.08 x 10 pt) e folga do recorte justo
+MARGEM_LAYOUT_POL = 1.08 * 10 / 72
+FOLGA_RECORTE_POL = 0.1
+# Altura do eixo antes do tight_layout (margens padrão 0.11-0.88), base das alturas relativas
+FRACAO_ALTURA_EIXO_INICIAL = 0.77
+
+COR_ROTULO = '#F0F4FF'
+COR_BORDA_ROTULO = '#E5E7EB'
+COR_TEXTO_CABECALHO = 'white'
+SETAS = {'up': '↑ ', 'down': '↓ '}
+
+
+def celula(texto, cor, tendencia=None):
+    """Uma célula de dados da grade: texto já formatado, cor do texto e tendência ('up', 'down' ou None)."""
+    return {'texto': texto, 'cor': cor, 'tendencia': tendencia}
+
+
+def desenhar_tabela(grade, output_filename, figsize, dpi=300, recortar=True, pil_kwargs=None):
+    """
+    Desenha a tabela descrita em grade e grava o PNG (fundo transparente).
+
+    grade:
+        colunas (list[str]): cabeçalho das colunas de dados
+        linhas (list[dict]): cada uma com 'rotulo' e 'celulas' (ver celula())
+        cor_cabecalho (str): fundo do cabeçalho
+        cor_texto_rotulo (str): cor dos rótulos das linhas
+        zebra (tuple[str, str]): fundo das linhas de dados ímpares e pares (1, 3, ... e 2, 4, ...)
+        escala_altura (float): multiplicador da altura das linhas, como em tabela.scale(1, n)
+        altura_cabecalho (float | None): altura do cabeçalho em fração do eixo; None usa a das linhas
+        topo (float): limite superior do tight_layout (rect[3])
+
+    figsize e dpi são os da figura antiga. Com recortar=True o PNG é cortado na tabela mais a folga,
+    como o bbox_inches='tight' fazia; senão, sai com a figura inteira.
+    """
+    fonte = carregar_fonte(FONTE_NEGRITO, TAMANHO_FONTE * dpi / 72)
+    largura_fig, altura_fig = figsize[0] * dpi, figsize[1] * dpi
+    margem = MARGEM_LAYOUT_POL * dpi
+
+    # Coluna de rótulos: largura automática pelo maior texto, como o auto_set_column_width
+    rotulos = [f"  {linha['rotulo']}" for linha in grade['linhas']]
+    largura_rotulo = max(fonte.getlength(r) for r in rotulos) * (1 + 2 * FOLGA_CELULA)
+
+    # Eixo depois do tight_layout: os dados ocupam a largura do eixo, os rótulos ficam à esquerda dele
+    eixo_x0 = margem + largura_rotulo
+    eixo_x1 = largura_fig - margem
+    eixo_topo = altura_fig * (1 - grade.get('topo', 1)) + 2 * margem
+    eixo_base = altura_fig - margem
+    altura_eixo = eixo_base - eixo_topo
+
+    altura_linha = ALTURA_BASE_LINHA_POL * dpi * grade['escala_altura'] * altura_eixo / (FRACAO_ALTURA_EIXO_INICIAL * altura_fig)
+    altura_cabecalho = grade['altura_cabecalho'] * altura_eixo if grade.get('altura_cabecalho') else altura_linha
+    largura_coluna = (eixo_x1 - eixo_x0) / len(grade['colunas'])
+
+    # Tabela centralizada verticalmente no eixo (loc='center')
+    altura_tabela = altura_cabecalho + altura_linha * len(grade['linhas'])
+    tabela_topo = (eixo_topo + eixo_base) / 2 - altura_tabela / 2
+
+    if recortar:
+        folga = FOLGA_RECORTE_POL * dpi
+        esquerda = min(margem, eixo_x0 - largura_rotulo) - folga
+        topo = min(eixo_topo, tabela_topo) - folga
+        direita = eixo_x1 + folga
+        base = max(eixo_base, tabela_topo + altura_tabela) + folga
+    else:
+        esquerda, topo, direita, base = 0, 0, largura_fig, altura_fig
+
+    imagem = Image.new('RGBA', (round(direita - esquerda), round(base - topo)), (0, 0, 0, 0))
+    desenho = ImageDraw.Draw(imagem)
+
+    def caixa(x0, y0, largura, altura):
+        return [round(x0 - esquerda), round(y0 - topo), round(x0 + largura - esquerda) - 1, round(y0 + altura - topo) - 1]
+
+    def texto(x0, y0, largura, altura, conteudo, cor, alinhamento):
+        y = y0 + altura / 2 - topo
+        if alinhamento == 'right':
+            desenho.text((x0 + largura * (1 - FOLGA_CELULA) - esquerda, y), conteudo, font=fonte, fill=cor, anchor='rm')
+        elif alinhamento == 'left':
+            desenho.text((x0 + largura * FOLGA_CELULA - esquerda, y), conteudo, font=fonte, fill=cor, anchor='lm')
+        else:
+            desenho.text((x0 + largura / 2 - esquerda, y), conteudo, font=fonte, fill=cor, anchor='mm')
+
+    # Cabeçalho
+    for j, coluna in enumerate(grade['colunas']):
+        x0 = eixo_x0 + j * largura_coluna
+        desenho.rectangle(caixa(x0, tabela_topo, largura_coluna, altura_cabecalho), fill=grade['cor_cabecalho'])
+        texto(x0, tabela_topo, largura_coluna, altura_cabecalho, coluna, COR_TEXTO_CABECALHO, 'center')
+
+    # Linhas: rótulo com borda e células de dados em zebra
+    espessura_borda = max(1, round(dpi / 72))
+    for i, (linha, rotulo) in enumerate(zip(grade['linhas'], rotulos)):
+        y0 = tabela_topo + altura_cabecalho + i * altura_linha
+        x_rotulo = eixo_x0 - largura_rotulo
+        borda = caixa(x_rotulo, y0, largura_rotulo, altura_linha)
+        meia = espessura_borda // 2
+        desenho.rectangle([borda[0] - meia, borda[1] - meia, borda[2] + meia, borda[3] + meia],
+                          fill=COR_ROTULO, outline=COR_BORDA_ROTULO, width=espessura_borda)
+        texto(x_rotulo, y0, largura_rotulo, altura_linha, rotulo, grade['cor_texto_rotulo'], 'left')
+
+        fundo = grade['zebra'][i % 2]
+        for j, dado in enumerate(linha['celulas']):
+            x0 = eixo_x0 + j * largura_coluna
+            desenho.rectangle(caixa(x0, y0, largura_coluna, altura_linha), fill=fundo)
+            conteudo = f"{SETAS.get(dado.get('tendencia'), '')}{dado['texto']}"
+            texto(x0, y0, largura_coluna, altura_linha, conteudo, dado['cor'], 'right')
+
+    imagem.save(output_filename, format='png', dpi=(dpi, dpi), **(pil_kwargs or {}))
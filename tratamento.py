@@ -1,11 +1,13 @@
+import io
 import os
 import sys
 import glob
 import pandas as pd
-import numpy as np
 from pathlib import Path
 from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
+
+import armazem_canal
+import periodo_canal
 
 
 path = os.getcwd()
@@ -22,22 +24,45 @@ def salvar_arquivo_csv_novas_colunas(colunas_a_incluir: dict, colunas_padrao: li
     df.to_csv(arquivo, index=False)
 
 
-def ajustar_padrao_colunas(artista):
+def carregar_arquivos(artista):
+    """
+    Lê uma única vez todos os CSVs do artista. Todas as etapas do tratamento trabalham
+    sobre esses DataFrames em memória, e o resultado é gravado uma única vez por salvar_arquivos.
+
+    Retorna:
+        tabelas (dict): caminho do CSV -> DataFrame, na ordem do glob
+        textos (dict): caminho -> texto bruto, só para a comunidade (corrigida linha a linha)
+    """
+    tabelas, textos = {}, {}
+    for arquivo in glob.glob(f"{path}/dados_full/{artista}/*.csv"):
+        if os.path.basename(arquivo) == 'comunidade.csv':
+            with open(arquivo, 'rb') as f:
+                dados = f.read()
+            textos[arquivo] = io.TextIOWrapper(io.BytesIO(dados), encoding='utf-8').read()
+            tabelas[arquivo] = pd.read_csv(io.BytesIO(dados))
+        else:
+            tabelas[arquivo] = pd.read_csv(arquivo)
+    return tabelas, textos
+
+
+def salvar_arquivos(tabelas):
+    for arquivo, df in tabelas.items():
+        df.to_csv(arquivo, index=False)
+
+
+def ajustar_padrao_colunas(artista, tabelas):
     """
     Ajusta e reordena as colunas dos arquivos CSV de acordo com padrões específicos
     baseados no tipo de conteúdo identificado pelo nome do arquivo.
 
     Parâmetros:
         artista (str): nome do artista ou pasta alvo dentro de /dados_full/
-        path (str): caminho base até o diretório de dados
+        tabelas (dict): DataFrames carregados por carregar_arquivos
         total_colunas (list): colunas padrão para arquivos 'total'
         conteudo_total_colunas (list): colunas padrão para vídeos, lives e shorts
         conteudo_colunas (list): colunas padrão para outros arquivos
     """
-    arquivos_csv = glob.glob(f"{path}/dados_full/{artista}/*.csv")
-
-    for arquivo in arquivos_csv:
-        df = pd.read_csv(arquivo)
+    for arquivo, df in tabelas.items():
         nome_arquivo = os.path.basename(arquivo).split('.')[0]
 
         if "Receita estimada (BRL)" in df.columns:
@@ -55,38 +80,18 @@ def ajustar_padrao_colunas(artista):
         else:
             colunas_padrao = conteudo_colunas
 
-        # Adiciona colunas ausentes com valor None
-        for col in colunas_padrao:
-            if col not in df.columns:
-                df[col] = None
-
-        # Mantém a ordem definida + quaisquer colunas extras ao final
-        colunas_presentes = [col for col in colunas_padrao if col in df.columns]
+        # Mantém a ordem definida + quaisquer colunas extras ao final.
+        # Colunas ausentes entram vazias (float NaN), como ficavam ao reler o CSV salvo.
         colunas_extras = [col for col in df.columns if col not in colunas_padrao]
-        df_reordenado = df[colunas_presentes + colunas_extras]
-
-        # Salva o arquivo sobrescrevendo o original
-        df_reordenado.to_csv(arquivo, index=False)
-
+        tabelas[arquivo] = df.reindex(columns=colunas_padrao + colunas_extras)
 
-def read_and_process_file(artista):
-    df = pd.read_csv(f"dados_full/{artista}/total.csv")
-    df.drop(index=0, inplace=True)
-    df['Data'] = pd.to_datetime(df['Data'], format='%Y-%m')
-    df = df.sort_values(by='Data', ascending=False)
-    most_recent_month = df.iloc[0]['Data']
-    months_list = []
-    for i in range(7):
-        months_list.append(most_recent_month.strftime("%Y-%m"))
-        most_recent_month -= relativedelta(months=1)
-    return months_list
 
+def process_post_data(artista, tabelas, textos):
+    arquivo = f"{path}/dados_full/{artista}/comunidade.csv"
+    if arquivo not in tabelas:
+        raise FileNotFoundError(f"Arquivo 'comunidade.csv' não encontrado para {artista}.")
 
-def process_post_data(artista):
-    arquivo = f"dados_full/{artista}/comunidade.csv"
-
-    # 🔹 Carregar o CSV garantindo que o cabeçalho seja mantido
-    df = pd.read_csv(arquivo)
+    df = tabelas[arquivo]
     # 🔹 Se o DataFrame estiver vazio (apenas cabeçalho, sem dados), adiciona uma linha padrão
     if len(df) == 1:
         # Criar a nova linha com os valores padrão, usando as colunas do próprio CSV
@@ -97,26 +102,33 @@ def process_post_data(artista):
             0, 0, 0, 0, 0  # Métricas
         ]], columns=df.columns)  # 🔹 Mantém as colunas do próprio CSV
 
-        # Adicionar a nova linha e salvar no arquivo
+        # Adicionar a nova linha; o texto passa a ser o do CSV que seria salvo
         df = pd.concat([df, nova_linha], ignore_index=True)
-        df.to_csv(arquivo, index=False)
+        tabelas[arquivo] = df
+        textos[arquivo] = df.to_csv(index=False, lineterminator='\n')
 
 
-def completar_data(artista):
-  arquivos_csv = glob.glob(path+'/dados_full/'+artista+'/*.csv')
-  for arquivo in arquivos_csv:
-    arq = pd.read_csv(arquivo)
-
-    if 'Data' in arq.columns and not 'origem_' in arquivo and not 'comunidade' in arquivo:
-        meses = arq['Data'].to_list()
-        meses_esperados = read_and_process_file(artista)
-        meses_faltantes = [m for m in meses_esperados if m not in meses]
+def acrescentar_faltantes(arq: pd.DataFrame, esperadas: pd.DataFrame, chave: str) -> pd.DataFrame:
+    """
+    Acrescenta ao final de `arq`, numa única concatenação, as linhas de `esperadas` cuja
+    chave ainda não aparece em `arq` (anti-join vetorizado, sem varrer a tabela a cada linha).
+    As colunas que `esperadas` não traz entram vazias (NaN). Usada para completar os meses
+    (chave 'Data') e as origens de tráfego (chave 'Origem do tráfego').
+    """
+    faltantes = esperadas[~esperadas[chave].isin(arq[chave])]
+    if faltantes.empty:
+        return arq
+    return pd.concat([arq, faltantes], ignore_index=True)
 
-        if meses_faltantes:
-            for mes in meses_faltantes:
-                arq.loc[len(arq)] = [mes] + [''] * (len(arq.columns) - 1)
 
-        arq.to_csv(arquivo, index=False)
+def completar_data(artista, tabelas, contexto):
+  # Uma linha por mês esperado; só as que faltarem em cada tabela são acrescentadas
+  meses_esperados = pd.DataFrame({'Data': contexto['meses_esperados']})
+  for arquivo, arq in tabelas.items():
+    if 'Data' in arq.columns and not 'origem_' in arquivo and not 'comunidade' in arquivo:
+        # Meses faltantes entram ao final com as demais colunas vazias; infer_objects reproduz
+        # os tipos que o pandas daria ao reler o CSV com essas linhas em branco
+        tabelas[arquivo] = acrescentar_faltantes(arq, meses_esperados, 'Data').infer_objects()
     
     else:
         continue
@@ -124,19 +136,22 @@ def completar_data(artista):
 
 def corrigir_csv_por_prefixo(
     artista: str,
+    tabelas: dict,
+    textos: dict,
     prefixo: str = "Ug"
 ) -> None:
     """
-    Lê um arquivo CSV, une linhas que não começam com o prefixo à linha anterior que começa com ele,
-    e salva o resultado em um novo arquivo.
+    Une as linhas do texto da comunidade que não começam com o prefixo à linha anterior
+    que começa com ele, e recarrega o DataFrame da comunidade a partir do texto corrigido.
 
     Args:
-        caminho_entrada (str): Caminho para o arquivo CSV de entrada.
-        caminho_saida (str): Caminho onde o arquivo corrigido será salvo.
+        artista (str): nome do artista ou pasta alvo dentro de /dados_full/
+        tabelas (dict): DataFrames carregados por carregar_arquivos
+        textos (dict): texto bruto da comunidade, carregado por carregar_arquivos
         prefixo (str): Prefixo que identifica o início de uma nova entrada. Padrão: "Ug"
     """
-    with open(f'dados_full/{artista}/comunidade.csv', "r", encoding="utf-8") as f:
-        linhas = f.readlines()
+    arquivo = f"{path}/dados_full/{artista}/comunidade.csv"
+    linhas = io.StringIO(textos[arquivo]).readlines()
 
         # Preservar as duas primeiras linhas
     linhas_corrigidas = linhas[:2]
@@ -153,76 +168,60 @@ def corrigir_csv_por_prefixo(
     if linha_corrente:
         linhas_corrigidas.append(linha_corrente)
 
-    with open(f'dados_full/{artista}/comunidade.csv', "w", encoding="utf-8") as f:
-        for linha in linhas_corrigidas:
-            f.write(linha + "\n")
-
+    texto_corrigido = "".join(linha + "\n" for linha in linhas_corrigidas)
+    textos[arquivo] = texto_corrigido
+    tabelas[arquivo] = pd.read_csv(io.StringIO(texto_corrigido))
 
-def preencher_colunas_vazias(artista):
-    arquivos_csv = glob.glob(path+'/dados_full/'+artista+'/*.csv')
 
-    for arquivo in arquivos_csv:
-        arq = pd.read_csv(arquivo)
-        
+def preencher_colunas_vazias(artista, tabelas):
+    for arquivo, arq in tabelas.items():
         if 'Duração média da visualização' in arq.columns:
-            arq['Duração média da visualização'] = arq['Duração média da visualização'].apply(lambda x: '0:00:00' if pd.isna(x) else '0:00:00' if x == '0.0' else x)
-            arq.to_csv(arquivo, index=False)
+            duracao = arq['Duração média da visualização'].apply(lambda x: '0:00:00' if pd.isna(x) else '0:00:00' if x == '0.0' else x)
+            tabelas[arquivo] = arq.assign(**{'Duração média da visualização': duracao})
     
-    for arquivo in arquivos_csv:
-        arq = pd.read_csv(arquivo)
-        arq = arq.fillna(0)
-        arq.to_csv(arquivo, index=False)
+    for arquivo, arq in tabelas.items():
+        tabelas[arquivo] = arq.fillna(0)
+
 
+def origens_esperadas(origens: list[str], meses) -> pd.DataFrame:
+    """Uma linha para cada origem x mês, com 0 visualizações, na ordem das origens."""
+    linhas = pd.MultiIndex.from_product([origens, meses], names=['Origem do tráfego', 'Data']).to_frame(index=False)
+    linhas['Visualizações'] = 0
+    return linhas[['Data', 'Origem do tráfego', 'Visualizações']]
 
-def update_traffic_source(artista):
-    base_path = f'{path}/dados_full/{artista}'
-    arquivos_csv = glob.glob(f'{base_path}/*.csv')
+
+def update_traffic_source(artista, tabelas, contexto):
     origem_trafego = ['Recursos de navegação', 'Vídeos sugeridos', 'Feed dos Shorts', 
                       'Externa', 'Notificações', 'Pesquisa do YouTube', 'Playlists', 
                       'Publicidade no YouTube']
     
-    # Passo 1: Encontrar e processar 'total.csv' para definir 'unique_months'
-    total_file_path = f'{base_path}/total.csv'
-    unique_months = []  # Inicializa como uma lista vazia para segurança
-    try:
-        arq_total = pd.read_csv(total_file_path)
-        unique_months_all = arq_total['Data'].unique()
-        unique_months_sorted = np.sort(unique_months_all)
-        unique_months = unique_months_sorted[1:7]  # Pega do 2º ao 7º mês
-    except FileNotFoundError:
-        print(f"Aviso: Arquivo 'total.csv' não encontrado para {artista}. Não é possível atualizar as origens de tráfego.")
-        return  # Sai da função se 'total.csv' não for encontrado
-    except Exception as e:
-        print(f"Erro ao processar 'total.csv' para {artista}: {e}")
-        return
-
-    # Passo 2: Iterar por todos os arquivos CSV e atualizar aqueles com "origem_"
-    for arquivo in arquivos_csv:
+    # Passo 1: Meses da janela de análise, do contexto de período (como 'AAAA-MM', igual aos CSVs)
+    unique_months = [str(m) for m in contexto['meses_analise']]
+
+    # Passo 2: Montar de uma vez as linhas de cada origem (todos os meses, 0 visualizações)
+    linhas_origens = origens_esperadas(origem_trafego, unique_months)
+
+    # Passo 3: Acrescentar às tabelas "origem_" as origens que não aparecem nelas
+    for arquivo, arq in tabelas.items():
         if "origem_" in arquivo:
-            arq = pd.read_csv(arquivo)
-            for origem in origem_trafego:
-                if origem not in arq['Origem do tráfego'].values:
-                    # Cria novas linhas apenas se 'unique_months' não estiver vazio
-                    if len(unique_months) > 0:
-                        new_rows = pd.DataFrame({
-                            'Data': unique_months,
-                            'Origem do tráfego': [origem] * len(unique_months),
-                            'Visualizações': [0] * len(unique_months)
-                        })
-                        arq = pd.concat([arq, new_rows], ignore_index=True)
-            
-            arq.to_csv(arquivo, index=False)
+            tabelas[arquivo] = acrescentar_faltantes(arq, linhas_origens, 'Origem do tráfego')
 
 
 def run(artista_para_processar):
     # O loop 'for' foi removido
     print(f'Tratando: {artista_para_processar}')
-    ajustar_padrao_colunas(artista_para_processar)
-    completar_data(artista_para_processar)
-    process_post_data(artista_para_processar)
-    corrigir_csv_por_prefixo(str(artista_para_processar))
-    preencher_colunas_vazias(artista_para_processar)
-    update_traffic_source(artista_para_processar)
+    # Cada CSV é lido uma vez, todas as etapas rodam em memória e cada arquivo é gravado uma vez
+    tabelas, textos = carregar_arquivos(artista_para_processar)
+    ajustar_padrao_colunas(artista_para_processar, tabelas)
+    contexto = periodo_canal.montar_contexto_periodo(tabelas[f"{path}/dados_full/{artista_para_processar}/total.csv"])
+    completar_data(artista_para_processar, tabelas, contexto)
+    process_post_data(artista_para_processar, tabelas, textos)
+    corrigir_csv_por_prefixo(str(artista_para_processar), tabelas, textos)
+    preencher_colunas_vazias(artista_para_processar, tabelas)
+    update_traffic_source(artista_para_processar, tabelas, contexto)
+    salvar_arquivos(tabelas)
+    # Última etapa que reescreve os CSVs: grava a versão tipada lida pelo report e pelos gráficos
+    armazem_canal.gravar_armazem(artista_para_processar)
 
 if __name__ == '__main__':
     # Verifica se o main.py passou o nome do artista